@@ -0,0 +1,202 @@
+"""Benchmark transmissionpy against a synthetic, in-process Transmission RPC server.
+
+Each torrent set size gets its own deterministic set of torrents (realistic files, trackers &
+piece bitfields), served over HTTP by `FakeTransmissionServer`. Every benchmark runs in a
+temporary working directory, so snapshots never touch `.data/`.
+
+Results are saved to `benchmarks/results/<commit>.json`, and compared with the most recent
+result from a different commit (or the file passed with `--compare`).
+
+Usage:
+    uv run benchmarks/run_benchmarks.py
+    uv run benchmarks/run_benchmarks.py --sizes 1000 --sizes 10000 --sizes 100000 --repeats 5
+    nox -s benchmarks -- --sizes 1000
+"""
+
+from __future__ import annotations
+
+import contextlib
+from datetime import datetime, timezone
+import io
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+
+from transmissionpy import rpc_client
+from transmissionpy.cli import torrent as torrent_cli
+from transmissionpy.core.transmission_lib import transmission_settings
+from transmissionpy.rpc_client.snapshot import SnapshotManager
+
+from cyclopts import App, Parameter
+from loguru import logger as log
+
+## The stand-in server lives with the tests, outside the installed package
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests.fake_server import FakeTransmissionServer, generate_torrents  # noqa: E402
+
+RESULTS_DIR: Path = Path(__file__).parent / "results"
+DEFAULT_SIZES: list[int] = [1_000, 10_000]
+
+app = App(name="run_benchmarks", help="Run the transmissionpy benchmark suite.")
+
+
+def git_commit() -> str:
+    try:
+        sha: str = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+        dirty: bool = bool(subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no"], text=True).strip())
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{sha}-dirty" if dirty else sha
+
+
+def time_runs(func: t.Callable[[], t.Any], repeats: int, setup: t.Callable[[], t.Any] | None = None) -> dict[str, float]:
+    """Call `func` `repeats` times (running `setup` untimed before each call) and summarize."""
+    runs: list[float] = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+
+        start: float = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+
+    return {
+        "min_s": round(min(runs), 5),
+        "median_s": round(statistics.median(runs), 5),
+        "mean_s": round(statistics.fmean(runs), 5),
+        "repeats": repeats,
+    }
+
+
+def point_settings_at(server: FakeTransmissionServer) -> None:
+    ## The CLI & rpc_client read the shared settings object, so point it at the fake server
+    transmission_settings.host = server.host
+    transmission_settings.port = server.port
+    transmission_settings.rpc_url = server.path
+    transmission_settings.protocol = "http"
+    transmission_settings.username = "benchmark"
+    transmission_settings.password = "benchmark"
+    transmission_settings.cache_ttl = 0
+
+
+def bench_size(size: int, repeats: int, seed: int) -> dict[str, dict[str, float]]:
+    log.info(f"Generating {size:,} synthetic torrents")
+    template: list[dict] = generate_torrents(n=size, seed=seed)
+    results: dict[str, dict[str, float]] = {}
+
+    with FakeTransmissionServer(torrents=[dict(torrent) for torrent in template]) as server, tempfile.TemporaryDirectory() as workdir:
+        point_settings_at(server)
+        previous_cwd: str = os.getcwd()
+        os.chdir(workdir)
+
+        def reset_server() -> None:
+            server.torrents = {torrent["id"]: dict(torrent) for torrent in template}
+
+        try:
+            torrents = rpc_client.list_all_torrents()
+            torrents_df = torrent_cli.torrents_to_df(torrents=torrents)
+
+            results["list_all_torrents"] = time_runs(rpc_client.list_all_torrents, repeats)
+            results["torrents_to_df"] = time_runs(lambda: torrent_cli.torrents_to_df(torrents=torrents), repeats)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                results["print_torrent_df"] = time_runs(lambda: torrent_cli.print_torrent_df(torrent_df=torrents_df), repeats)
+
+            results["snapshot_torrents"] = time_runs(rpc_client.snapshot_torrents, repeats)
+
+            snapshot_manager: SnapshotManager = SnapshotManager(snapshot_filename="all_torrents_snapshot")
+            results["get_snapshots"] = time_runs(snapshot_manager.get_snapshots, repeats)
+
+            ## Mutating: restore the full torrent set before every run
+            results["rm_status_finished"] = time_runs(lambda: torrent_cli.remove_torrent(status="finished"), repeats, setup=reset_server)
+        finally:
+            os.chdir(previous_cwd)
+
+    return results
+
+
+def latest_result(exclude_commit: str) -> Path | None:
+    if not RESULTS_DIR.exists():
+        return None
+
+    candidates: list[Path] = [p for p in RESULTS_DIR.glob("*.json") if p.stem != exclude_commit]
+
+    return max(candidates, key=lambda p: p.stat().st_mtime, default=None)
+
+
+def print_results(results: dict, baseline: dict | None = None) -> None:
+    header: str = f"{'benchmark':<22} {'size':>8} {'median s':>10} {'min s':>10}"
+    if baseline:
+        header += f" {'baseline s':>11} {'change':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for size, benches in results["results"].items():
+        for name, stats in benches.items():
+            line: str = f"{name:<22} {int(size):>8,} {stats['median_s']:>10.4f} {stats['min_s']:>10.4f}"
+
+            base: dict | None = (baseline or {}).get("results", {}).get(size, {}).get(name)
+            if base:
+                change: float = (stats["median_s"] - base["median_s"]) / base["median_s"] * 100 if base["median_s"] else 0.0
+                line += f" {base['median_s']:>11.4f} {change:>+7.1f}%"
+            print(line)
+
+
+@app.default
+def run(
+    sizes: t.Annotated[list[int] | None, Parameter(name=["--sizes"])] = None,
+    repeats: t.Annotated[int, Parameter(name=["--repeats"])] = 3,
+    seed: t.Annotated[int, Parameter(name=["--seed"])] = 42,
+    compare: t.Annotated[Path | None, Parameter(name=["--compare"])] = None,
+    save: t.Annotated[bool, Parameter(name=["--save"])] = True,
+):
+    """Run the benchmarks.
+
+    Params:
+        sizes (list[int]): Torrent set sizes. Repeat for multiple sizes. Default: 1,000 & 10,000.
+        repeats (int): Timed runs per benchmark.
+        seed (int): Seed for the synthetic torrents. Keep it fixed to compare commits.
+        compare (Path): Result file to compare with. Default: latest result from another commit.
+        save (bool): Save results to benchmarks/results/<commit>.json.
+    """
+    log.remove()
+    log.add(sys.stderr, level="WARNING")
+
+    commit: str = git_commit()
+    results: dict[str, t.Any] = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": {},
+    }
+
+    for size in sizes or DEFAULT_SIZES:
+        print(f"Running benchmarks for {size:,} torrents...", file=sys.stderr)
+        results["results"][str(size)] = bench_size(size=size, repeats=repeats, seed=seed)
+
+    baseline_path: Path | None = compare or latest_result(exclude_commit=commit)
+    baseline: dict | None = json.loads(baseline_path.read_text()) if baseline_path and baseline_path.exists() else None
+    if baseline:
+        print(f"Comparing with {baseline['commit']} ({baseline['timestamp']})", file=sys.stderr)
+
+    print_results(results, baseline)
+
+    if save:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output: Path = RESULTS_DIR / f"{commit}.json"
+        output.write_text(json.dumps(results, indent=2))
+        print(f"Saved results to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    app()
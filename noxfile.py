@@ -393,3 +393,32 @@ def do_alembic_upgrade(session: nox.Session):
 
     log.info("Doing alembic upgrade to apply latest migrations")
     session.run("uv", "run", "alembic", "upgrade", "head")
+
+
+#########
+# Tests #
+#########
+
+@nox.session(python=[DEFAULT_PYTHON], name="tests", tags=["test"])
+def run_tests(session: nox.Session):
+    """Run the pytest suite against the local stand-in Transmission server."""
+    install_uv_project(session)
+
+    log.info("Running tests")
+    session.run("uv", "run", "pytest", *session.posargs)
+
+
+##############
+# Benchmarks #
+##############
+
+@nox.session(python=[DEFAULT_PYTHON], name="benchmarks", tags=["benchmark"])
+def run_benchmarks(session: nox.Session):
+    """Run the benchmark suite against a synthetic Transmission RPC server.
+
+    Pass options to the benchmark script after `--`, i.e. `nox -s benchmarks -- --sizes 100000`.
+    """
+    install_uv_project(session)
+
+    log.info("Running benchmarks")
+    session.run("uv", "run", "benchmarks/run_benchmarks.py", *session.posargs)
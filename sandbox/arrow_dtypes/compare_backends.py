@@ -0,0 +1,94 @@
+"""Compare the default NumPy/object torrent DataFrame pipeline against the Arrow-backed one.
+
+Builds synthetic torrent RPC payloads (no Transmission daemon needed), then measures the
+time to build a normalized DataFrame, its deep memory usage, and the time to write it to
+Parquet for each dtype backend.
+
+Usage:
+    uv run sandbox/arrow_dtypes/compare_backends.py [torrent_count]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from transmissionpy.rpc_client import utils as rpc_utils
+
+import pandas as pd
+import pyarrow as pa
+from transmission_rpc import Torrent
+
+def make_torrents(count: int, seed: int = 42) -> list[Torrent]:
+    rand = random.Random(seed)
+    dirs = [f"/downloads/{d}" for d in ["movies", "tv", "music", "books", "software"]]
+    now = int(time.time())
+
+    torrents: list[Torrent] = []
+    for i in range(1, count + 1):
+        info_hash = f"{rand.getrandbits(160):040x}"
+        name = f"Some.Torrent.Name.{i}.{rand.choice(['1080p', '720p', '2160p'])}.WEB-DL.x264-GROUP"
+        torrents.append(
+            Torrent(
+                fields={
+                    "id": i,
+                    "name": name,
+                    "hashString": info_hash,
+                    "magnetLink": f"magnet:?xt=urn:btih:{info_hash}&dn={name}&tr=udp://tracker.example.org:1337/announce",
+                    "downloadDir": rand.choice(dirs),
+                    "errorString": rand.choice(["", "", "", "Tracker gave HTTP response code 404 (Not Found)"]),
+                    "activityDate": now - rand.randint(0, 10**6),
+                    "addedDate": now - rand.randint(10**6, 10**7),
+                    "doneDate": now if rand.random() < 0.5 else 0,
+                    "startDate": now - 10**6,
+                    "percentDone": rand.random(),
+                    "uploadRatio": rand.random() * 4,
+                    "secondsDownloading": rand.randint(0, 10**5),
+                    "secondsSeeding": rand.randint(0, 10**6),
+                    "totalSize": rand.randint(10**6, 10**11),
+                    "status": rand.choice([0, 4, 6]),
+                    "isFinished": rand.random() < 0.5,
+                    "isStalled": rand.random() < 0.2,
+                }
+            )
+        )
+
+    return torrents
+
+
+def measure(torrents: list[Torrent], dtype_backend: str) -> dict:
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    df: pd.DataFrame = rpc_utils.convert_torrents_to_df(torrents=torrents, normalize=True, dtype_backend=dtype_backend)
+    build_secs = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    ## tracemalloc only sees the Python heap; Arrow buffers live in the Arrow memory pool
+    arrow_mb = (pa.total_allocated_bytes() - arrow_before) / 1024**2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        df.to_parquet(f"{tmp}/torrents.parquet", engine="pyarrow")
+        write_secs = time.perf_counter() - start
+
+    return {
+        "backend": dtype_backend,
+        "build_secs": round(build_secs, 3),
+        "parquet_write_secs": round(write_secs, 3),
+        "df_memory_mb": round(df.memory_usage(deep=True).sum() / 1024**2, 2),
+        "python_heap_peak_mb": round(peak / 1024**2, 2),
+        "arrow_pool_mb": round(arrow_mb, 2),
+    }
+
+
+if __name__ == "__main__":
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    torrents: list[Torrent] = make_torrents(count)
+
+    results = pd.DataFrame([measure(torrents, backend) for backend in ["numpy", "pyarrow"]])
+    print(f"{count} torrents")
+    print(results.to_string(index=False))
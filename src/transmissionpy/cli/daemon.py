@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import replace
+import typing as t
+
+from transmissionpy.core.transmission_lib import (
+    get_transmission_controller,
+    transmission_settings,
+)
+from transmissionpy.daemon import DaemonScheduler, build_jobs, daemon_settings
+
+from cyclopts import App, Parameter
+from loguru import logger as log
+
+daemon_app = App(name="daemon", help="Run snapshot, cleanup & free-space jobs on a schedule.")
+
+
+@daemon_app.default
+def run_daemon(
+    snapshot_interval: t.Annotated[int | None, Parameter(name=["--snapshot-interval"])] = None,
+    cleanup_interval: t.Annotated[int | None, Parameter(name=["--cleanup-interval"])] = None,
+    cleanup_status: t.Annotated[list[str] | None, Parameter(name=["--cleanup-status"])] = None,
+    remove_files: t.Annotated[bool | None, Parameter(name=["--remove-files"])] = None,
+    free_space_interval: t.Annotated[int | None, Parameter(name=["--free-space-interval"])] = None,
+    free_space_path: t.Annotated[str | None, Parameter(name=["--free-space-path"])] = None,
+    queue_interval: t.Annotated[int | None, Parameter(name=["--queue-interval"])] = None,
+    bandwidth_interval: t.Annotated[int | None, Parameter(name=["--bandwidth-interval"])] = None,
+    once: t.Annotated[bool, Parameter(name=["--once"])] = False,
+):
+    """Run scheduled jobs over one long-lived Transmission connection.
+
+    Defaults come from the [daemon] section of settings.toml (or DAEMON_* env vars). Set an
+    interval to 0 to disable a job.
+
+    Params:
+        snapshot_interval (int): Seconds between torrent snapshots.
+        cleanup_interval (int): Seconds between cleanup runs.
+        cleanup_status (list[str]): Remove torrents with this status ("finished", "stalled", "paused"). Repeat for multiple statuses.
+        remove_files (bool): Also delete data of torrents removed by cleanup.
+        free_space_interval (int): Seconds between free space checks.
+        free_space_path (str): Path on the Transmission host to check free space for.
+        queue_interval (int): Seconds between download queue reorders (see `torrent queue`). 0 (default) disables it.
+        bandwidth_interval (int): Seconds between per-torrent speed limit updates (see `torrent bandwidth`), with the daemon_bandwidth_* budgets. 0 (default) disables it.
+        once (bool): Run every job once, then exit.
+    """
+    overrides: dict[str, t.Any] = {
+        "snapshot_interval": snapshot_interval,
+        "cleanup_interval": cleanup_interval,
+        "cleanup_statuses": cleanup_status,
+        "cleanup_remove_files": remove_files,
+        "free_space_interval": free_space_interval,
+        "free_space_path": free_space_path,
+        "queue_interval": queue_interval,
+        "bandwidth_interval": bandwidth_interval,
+    }
+    settings = replace(daemon_settings, **{k: v for k, v in overrides.items() if v is not None})
+
+    jobs = build_jobs(settings)
+    if not jobs:
+        log.warning("All daemon jobs are disabled, nothing to do.")
+        return
+
+    with get_transmission_controller(transmission_settings=transmission_settings) as controller:
+        scheduler = DaemonScheduler(controller=controller, jobs=jobs, settings=settings)
+
+        if once:
+            scheduler.run_tick(force=True)
+            scheduler.log_stats()
+        else:
+            scheduler.run()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import typing as t
+
+from transmissionpy import rpc_client
+
+from cyclopts import App, Parameter
+from loguru import logger as log
+
+label_app = App(name="label", help="List labels, and add/remove them on many torrents at once.")
+
+
+@label_app.command(name="ls")
+def list_labels(fresh: t.Annotated[bool, Parameter(name=["--fresh"])] = False):
+    """List labels and the number of torrents with each.
+
+    Params:
+        fresh (bool): Ignore the cached torrent list (when TRANSMISSION_CACHE_TTL is set) and ask Transmission.
+    """
+    index = rpc_client.get_label_index(fresh=fresh)
+    counts = index.counts()
+
+    if not counts:
+        log.warning(f"None of the [{len(index.all_ids)}] torrent(s) have labels")
+        return
+
+    log.info(f"[{len(counts)}] label(s) across [{len(index.all_ids)}] torrent(s):")
+    width: int = max(len(label) for label in counts)
+    for label, count in counts.most_common():
+        print(f"  {label:<{width}}  {count}")
+
+
+def _change_labels(selector: list[str], add: list[str] | None = None, remove: list[str] | None = None, replace: list[str] | None = None) -> None:
+    index = rpc_client.get_label_index(fresh=True)
+    torrent_ids = index.select(selector)
+
+    if not torrent_ids:
+        log.warning(f"No torrents found with label(s): {' AND '.join(selector)}")
+        return
+
+    changed: int = rpc_client.set_torrent_labels(index=index, torrent_ids=sorted(torrent_ids), add=add, remove=remove, replace=replace)
+    log.success(f"Updated labels on [{changed}] of [{len(torrent_ids)}] matching torrent(s)")
+
+
+@label_app.command(name="add")
+def add_labels(labels: list[str], selector: t.Annotated[list[str], Parameter(name=["--label"])]):
+    """Add labels to every torrent matching --label selectors.
+
+    Params:
+        labels (list[str]): Labels to add.
+        selector (list[str]): Torrents to change. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+    """
+    _change_labels(selector=selector, add=labels)
+
+
+@label_app.command(name="remove")
+def remove_labels(labels: list[str], selector: t.Annotated[list[str], Parameter(name=["--label"])]):
+    """Remove labels from every torrent matching --label selectors.
+
+    Params:
+        labels (list[str]): Labels to remove.
+        selector (list[str]): Torrents to change. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+    """
+    _change_labels(selector=selector, remove=labels)
+
+
+@label_app.command(name="set")
+def set_labels(labels: list[str], selector: t.Annotated[list[str], Parameter(name=["--label"])]):
+    """Replace the labels of every torrent matching --label selectors.
+
+    Params:
+        labels (list[str]): The new labels.
+        selector (list[str]): Torrents to change. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+    """
+    _change_labels(selector=selector, replace=labels)
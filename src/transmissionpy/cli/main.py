@@ -3,8 +3,14 @@ from __future__ import annotations
 import sys
 import typing as t
 
-from transmissionpy.core.utils import df_utils
+from transmissionpy.core.transmission_lib import transmission_settings
+from transmissionpy.core.utils import df_utils, profile_utils
 
+from .daemon import daemon_app
+from .label import label_app
+from .metrics import metrics_app
+from .session import session_app
+from .snapshot import snapshot_app
 from .torrent import torrent_app
 
 from cyclopts import App, Group, Parameter
@@ -17,9 +23,28 @@ app.meta.group_parameters = Group("Session Parameters", sort_key=0)
 
 ## Mount torrent app
 app.command(torrent_app)
+## Mount label app
+app.command(label_app)
+## Mount snapshot app
+app.command(snapshot_app)
+## Mount daemon app
+app.command(daemon_app)
+## Mount metrics app
+app.command(metrics_app)
+## Mount session app
+app.command(session_app)
 
 @app.meta.default
-def cli_launcher(*tokens: t.Annotated[str, Parameter(show=False, allow_leading_hyphen=True, help="Enable debug logging")], debug: bool = False):
+def cli_launcher(
+    *tokens: t.Annotated[str, Parameter(show=False, allow_leading_hyphen=True, help="Enable debug logging")],
+    debug: bool = False,
+    profile: t.Annotated[bool, Parameter(name=["--profile"], help="Print a per-stage timing breakdown when the command finishes")] = False,
+    profile_output: t.Annotated[str | None, Parameter(name=["--profile-output"], help="With --profile, also write cProfile stats to this file")] = None,
+    profile_memory: t.Annotated[bool, Parameter(name=["--profile-memory"], help="With --profile, track peak memory per stage (slower)")] = False,
+    record: t.Annotated[str | None, Parameter(name=["--record"], help="Record Transmission RPC traffic to this file (.jsonl.gz)")] = None,
+    replay: t.Annotated[str | None, Parameter(name=["--replay"], help="Answer RPCs from a recording made with --record, instead of Transmission")] = None,
+    replay_speed: t.Annotated[float, Parameter(name=["--replay-speed"], help="With --replay, 1.0 replays at recorded latency, 0 as fast as possible")] = 0.0,
+):
     log.remove(0)
     
     if debug:
@@ -28,8 +53,27 @@ def cli_launcher(*tokens: t.Annotated[str, Parameter(show=False, allow_leading_h
         log.add(sys.stderr, format="{time:YYYY-MM-DD HH:mm:ss} [{level}] : {message}", level="INFO")
         
     log.debug("START transmissionpy CLI")
-    
-    app(tokens)
+
+    if record and replay:
+        log.error("--record and --replay can't be used together")
+        return
+    if record or replay:
+        ## Every controller the command creates reads the shared settings object
+        transmission_settings.record_path = record
+        transmission_settings.replay_path = replay
+        transmission_settings.replay_speed = replay_speed
+
+    if not profile:
+        app(tokens)
+        return
+
+    profiler = profile_utils.enable_profiling(trace_memory=profile_memory, pstats_path=profile_output)
+    try:
+        with profile_utils.profile_stage("total"):
+            app(tokens)
+    finally:
+        profiler.stop()
+        profiler.print_report()
     
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import replace
+import signal
+import sys
+import threading
+import typing as t
+
+from transmissionpy.core.transmission_lib import (
+    get_transmission_controller,
+    transmission_settings,
+)
+from transmissionpy.metrics import MetricsCollector, MetricsServer, metrics_settings
+
+from cyclopts import App, Parameter
+from loguru import logger as log
+
+metrics_app = App(name="metrics", help="Export Transmission metrics for Prometheus/Grafana.")
+
+
+@metrics_app.command(name="serve")
+def serve_metrics(
+    host: t.Annotated[str | None, Parameter(name=["--host"])] = None,
+    port: t.Annotated[int | None, Parameter(name=["--port", "-p"])] = None,
+    poll_interval: t.Annotated[float | None, Parameter(name=["--poll-interval"])] = None,
+    free_space_path: t.Annotated[list[str] | None, Parameter(name=["--free-space-path"])] = None,
+    once: t.Annotated[bool, Parameter(name=["--once"])] = False,
+):
+    """Serve an OpenMetrics endpoint, backed by one background poll of Transmission.
+
+    Scrapes are answered from the result of the last poll, so adding scrapers doesn't add
+    load on Transmission. Defaults come from the [metrics] section of settings.toml (or
+    METRICS_* env vars).
+
+    Params:
+        host (str): Address to listen on.
+        port (int): Port to listen on.
+        poll_interval (float): Seconds between polls of Transmission.
+        free_space_path (list[str]): Path on the Transmission host to report free space for. Repeat for multiple paths.
+        once (bool): Poll once, print the metrics and exit, instead of serving them.
+    """
+    overrides: dict[str, t.Any] = {
+        "listen_host": host,
+        "listen_port": port,
+        "poll_interval": poll_interval,
+        "free_space_paths": free_space_path,
+    }
+    settings = replace(metrics_settings, **{k: v for k, v in overrides.items() if v is not None})
+
+    with get_transmission_controller(transmission_settings=transmission_settings) as controller:
+        collector = MetricsCollector(controller=controller, settings=settings)
+
+        if once:
+            collector.poll()
+            sys.stdout.write(collector.scrape(openmetrics=True).decode("utf-8"))
+            return
+
+        try:
+            server = MetricsServer(collector=collector, host=settings.listen_host, port=settings.listen_port)
+        except OSError as exc:
+            msg = f"({type(exc)}) Unable to listen on {settings.listen_host}:{settings.listen_port}. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+        stop_event = threading.Event()
+        previous_handler = signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+        collector.start()
+        server.start()
+        log.info(f"Serving metrics on {server.url}, polling Transmission every {settings.poll_interval}s")
+
+        try:
+            stop_event.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            log.info("Stopping metrics exporter")
+            server.stop()
+            collector.stop()
+            signal.signal(signal.SIGTERM, previous_handler)
+            log.info(f"Served [{collector.scrapes}] scrape(s) from [{collector.polls}] poll(s)")
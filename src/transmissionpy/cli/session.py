@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import typing as t
+
+from transmissionpy import rpc_client
+
+from cyclopts import App, Parameter
+from loguru import logger as log
+
+session_app = App(name="session", help="Show Transmission's session settings & statistics, or change settings.")
+
+
+def _flatten(values: dict[str, t.Any], prefix: str = "") -> dict[str, t.Any]:
+    ## session-stats nests cumulative-stats & current-stats, show them as dotted keys
+    flat: dict[str, t.Any] = {}
+    for key, value in values.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, prefix=f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+
+    return flat
+
+
+def _print_values(title: str, values: dict[str, t.Any]) -> None:
+    flat: dict[str, t.Any] = _flatten(values)
+    print(f"{title}:")
+    if not flat:
+        print("  (none)")
+        return
+
+    width: int = max(len(key) for key in flat)
+    for key in sorted(flat):
+        print(f"  {key:<{width}}  {flat[key]}")
+
+
+@session_app.default
+def show_session(
+    field: t.Annotated[list[str] | None, Parameter(name=["--field", "-f"])] = None,
+    stats: t.Annotated[bool, Parameter(name=["--stats"], negative="--no-stats")] = True,
+    as_json: t.Annotated[bool, Parameter(name=["--json"])] = False,
+    fresh: t.Annotated[bool, Parameter(name=["--fresh"])] = False,
+):
+    """Show session settings (session-get) and statistics (session-stats).
+
+    Results are cached for TRANSMISSION_SESSION_CACHE_TTL seconds (default 5), shared between
+    invocations, so a dashboard polling this command asks Transmission at most once per TTL.
+
+    Params:
+        field (list[str]): Only show these session settings, i.e. download-dir. Repeat for multiple fields.
+        stats (bool): Also show session statistics.
+        as_json (bool): Print one JSON object with "session" & "stats" keys.
+        fresh (bool): Ignore cached values and ask Transmission.
+    """
+    session, session_stats = rpc_client.get_session_info(fields=field, fresh=fresh, stats=stats)
+
+    for name in field or []:
+        if not {name, name.replace("_", "-"), name.replace("-", "_")} & set(session):
+            log.warning(f"Transmission did not return session field: {name}")
+
+    if as_json:
+        print(json.dumps({"session": session, "stats": session_stats}, default=str))
+        return
+
+    _print_values("Session", session)
+    if session_stats is not None:
+        _print_values("Stats", session_stats)
+
+
+@session_app.command(name="set")
+def set_session(
+    changes: t.Annotated[list[str], Parameter(help="Settings to change, as name=value (i.e. speed-limit-down=500 speed-limit-down-enabled=true)")],
+):
+    """Change session settings.
+
+    Values are parsed as JSON where possible (numbers, true/false), else used as strings.
+    Cached session values are cleared, so the next `session` shows the change.
+
+    Params:
+        changes (list[str]): Settings to change, as name=value.
+    """
+    parsed: dict[str, t.Any] = {}
+    for change in changes:
+        name, sep, raw = change.partition("=")
+        if not sep or not name:
+            log.error(f"Invalid setting '{change}'. Use name=value, i.e. speed-limit-down=500")
+            return
+        try:
+            value: t.Any = json.loads(raw)
+        except ValueError:
+            value = raw
+        parsed[name.strip().replace("-", "_")] = value
+
+    updated: dict[str, t.Any] = rpc_client.set_session_values(parsed)
+    _print_values("Updated session", updated)
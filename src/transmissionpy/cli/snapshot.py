@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import typing as t
+
+from transmissionpy import rpc_client
+from transmissionpy.core.constants import SNAPSHOT_DIR
+from transmissionpy.rpc_client.snapshot import (
+    SnapshotManager,
+    iter_snapshot_query,
+    write_snapshot_query,
+)
+
+from cyclopts import App, Group, Parameter, validators
+from loguru import logger as log
+import pandas as pd
+import pyarrow as pa
+
+snapshot_app = App(name="snapshot", help="Torrent snapshot commands.")
+
+
+@snapshot_app.command(name="save")
+def save_snapshot():
+    """Save a snapshot of all torrents."""
+    torrents = rpc_client.snapshot_torrents()
+
+    log.info(f"Snapshotted [{len(torrents)}] torrent(s)")
+
+
+@snapshot_app.command(name="backfill")
+def backfill_history(name: t.Annotated[str, Parameter(name=["-n", "--name"])] = "all_torrents_snapshot"):
+    """Build the queryable snapshot history from snapshots saved by older versions.
+
+    Params:
+        name (str): Name of the snapshot to backfill.
+    """
+    SnapshotManager(snapshot_dir=SNAPSHOT_DIR, snapshot_filename=name).backfill_history()
+
+
+@snapshot_app.command(name="query")
+def query_snapshots(
+    select: t.Annotated[list[str] | None, Parameter(name=["-s", "--select"])] = None,
+    where: t.Annotated[list[str] | None, Parameter(name=["-w", "--where"])] = None,
+    group_by: t.Annotated[list[str] | None, Parameter(name=["-g", "--group-by"])] = None,
+    agg: t.Annotated[list[str] | None, Parameter(name=["-a", "--agg"])] = None,
+    since: t.Annotated[str | None, Parameter(name=["--since"])] = None,
+    until: t.Annotated[str | None, Parameter(name=["--until"])] = None,
+    order_by: t.Annotated[list[str] | None, Parameter(name=["-o", "--order-by"])] = None,
+    limit: t.Annotated[int | None, Parameter(name=["-l", "--limit"])] = None,
+    output: t.Annotated[str | None, Parameter(name=["--output"])] = None,
+    preview: t.Annotated[int, Parameter(name=["-p", "--preview"])] = 100,
+    name: t.Annotated[str, Parameter(name=["-n", "--name"])] = "all_torrents_snapshot",
+):
+    """Run an aggregation query over the snapshot history.
+
+    Example: average ratio per tracker over the last 30 days:
+        transmissionpy snapshot query -g trackerHost -a "mean(uploadRatio)" -a "count(*)" --since 30d
+
+    Params:
+        select (list[str]): Columns to return when not aggregating. Repeat for multiple columns.
+        where (list[str]): Filters like "uploadRatio >= 1", "status in (4, 6)", "name contains 1080p". Repeated filters are combined with AND.
+        group_by (list[str]): Columns to group by.
+        agg (list[str]): Aggregations like "mean(uploadRatio)", "max(uploadedEver) as uploaded", "count(*)".
+        since (str): Only include snapshots newer than this, i.e. "30d", "12h", "2w" or an ISO date.
+        until (str): Only include snapshots older than this.
+        order_by (list[str]): Columns to sort by. Append ":desc" for descending, i.e. "uploadRatio_mean:desc".
+        limit (int): Max number of rows to return.
+        output (str): Write results to this Parquet file instead of printing them.
+        preview (int): Max number of rows to print. 0=all (output will be slow with many results). Use --output for the full result.
+        name (str): Name of the snapshot to query.
+    """
+    query: dict = {
+        "select": select,
+        "where": where,
+        "group_by": group_by,
+        "aggregations": agg,
+        "since": since,
+        "until": until,
+        "order_by": order_by,
+    }
+
+    try:
+        if output:
+            write_snapshot_query(output=output, snapshot_dir=SNAPSHOT_DIR, snapshot_filename=name, limit=limit, **query)
+            return
+
+        rows: int = 0
+        shown: list[pa.RecordBatch] = []
+        ## Only batches within the preview are kept; the rest are counted and dropped
+        for batch in iter_snapshot_query(snapshot_dir=SNAPSHOT_DIR, snapshot_filename=name, limit=limit, **query):
+            if not preview or rows < preview:
+                shown.append(batch)
+            rows += batch.num_rows
+
+        if shown:
+            table: pa.Table = pa.Table.from_batches(shown)
+            ## Printed as one table, so columns line up and the header is printed once
+            print(table.slice(0, preview or None).to_pandas().to_string(index=False))
+
+        log.info(f"Query returned [{rows}] row(s){f', showing the first [{preview}]' if preview and rows > preview else ''}")
+
+    except (FileNotFoundError, ValueError) as exc:
+        log.error(exc)
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from datetime import timedelta
+import json
+from pathlib import Path
 import typing as t
 
-from transmissionpy import rpc_client
-from transmissionpy.core.utils import df_utils, time_utils
-from transmissionpy.domain.Transmission import (
-    TorrentMetadataIn,
-    torrent_df_dtypes_mapping,
-)
+from transmissionpy import rpc_client, verify
+from transmissionpy.core.constants import MOVES_DIR
+from transmissionpy.core.utils import df_utils, profile_utils
+from transmissionpy.domain.Transmission import TorrentMetadataIn
 
 from cyclopts import App, Group, Parameter, validators
 from loguru import logger as log
@@ -16,12 +16,14 @@ import pandas as pd
 
 torrent_app = App(name="torrent", help="Torrent management commands.")
 
-def torrents_to_df(torrents: list[TorrentMetadataIn], dtype_mapping: dict = torrent_df_dtypes_mapping, col_rename_mapping: dict | None = None) -> pd.DataFrame:
+def torrents_to_df(torrents: list[TorrentMetadataIn], dtype_mapping: dict | None = None, col_rename_mapping: dict | None = None, dtype_backend: str = "numpy") -> pd.DataFrame:
     try:
         converted_torrents: list[TorrentMetadataIn] = rpc_client.utils.convert_multiple_torrents_to_torrentmetadata(torrents=torrents)
-        torrents_df: pd.DataFrame = rpc_client.utils.convert_torrents_to_df(torrents=converted_torrents)
+        ## Normalized once here; datetime, float, timedelta & categorical columns are ready to use
+        torrents_df: pd.DataFrame = rpc_client.utils.convert_torrents_to_df(torrents=converted_torrents, normalize=True, dtype_backend=dtype_backend)
     
-        torrents_df = df_utils.convert_df_col_dtypes(df=torrents_df, dtype_mapping=dtype_mapping)
+        if dtype_mapping:
+            torrents_df = df_utils.convert_df_col_dtypes(df=torrents_df, dtype_mapping=dtype_mapping)
         
         if col_rename_mapping:
             try:
@@ -46,6 +48,23 @@ def df_float_to_percent(df: pd.DataFrame, col_name: str) -> pd.DataFrame:
     return df_copy
 
 
+def describe_selectors(tracker: list[str] | None = None, label: list[str] | None = None) -> str:
+    parts: list[str] = []
+    if tracker:
+        parts.append(f"tracker(s): {', '.join(tracker)}")
+    if label:
+        parts.append(f"label(s): {' AND '.join(label)}")
+
+    return ", ".join(parts)
+
+
+def list_selected_torrents(tracker: list[str] | None = None, label: list[str] | None = None, status: str = "all", fresh: bool = False) -> list:
+    """Return summary torrents matching --tracker/--label selectors and a status."""
+    torrents = rpc_client.list_selected_torrents(trackers=tracker, labels=label, fresh=fresh)
+
+    return rpc_client.utils.filter_torrents_by_status(torrents, status=status)
+
+
 def select_df_cols(df: pd.DataFrame, cols: list[str] | None = None):
     if not cols:
         return df
@@ -56,25 +75,55 @@ def select_df_cols(df: pd.DataFrame, cols: list[str] | None = None):
     return df_copy
 
 
+def validate_output_format(output_format: str) -> None:
+    if output_format not in rpc_client.OUTPUT_FORMATS:
+        raise ValueError(f"Invalid format: {output_format}. Must be one of {list(rpc_client.OUTPUT_FORMATS)}")
+
+
+def write_output_df(df: pd.DataFrame, output_format: str, output: str | None = None, chunk_size: int = rpc_client.DEFAULT_EXPORT_CHUNK_SIZE) -> bool:
+    """Stream a command's result in a machine-readable --format. Returns `False` for `table`, which the command prints itself."""
+    if output_format == "table":
+        return False
+
+    rows: int = rpc_client.stream_frame(df, fmt=output_format, output=output, chunk_size=chunk_size)
+    if output:
+        log.info(f"Wrote [{rows}] row(s) to {output}")
+
+    return True
+
+
 @torrent_app.command(name="count")
-def count_torrents(status: t.Annotated[str, Parameter(name="status", show_default=True)] = "all"):
+def count_torrents(status: t.Annotated[str, Parameter(name="status", show_default=True)] = "all", fresh: t.Annotated[bool, Parameter(name=["--fresh"])] = False, tracker: t.Annotated[list[str] | None, Parameter(name=["--tracker"])] = None, label: t.Annotated[list[str] | None, Parameter(name=["--label"])] = None):
     """Count torrents by status.
     
     Params:
         status (str): Status of torrents to count. default: 'all'. Options: ["all", "finished", "stalled"]
+        fresh (bool): Ignore the cached torrent list (when TRANSMISSION_CACHE_TTL is set) and ask Transmission.
+        tracker (list[str]): Only count torrents announcing to this tracker host (or domain). Repeat for multiple trackers.
+        label (list[str]): Only count torrents with these labels. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
     """    
     if status not in ["all", "finished", "stalled"]:
         raise ValueError(f"Invalid status: {status}. Must be one of ['all', 'finished', 'stalled']")
 
     log.info(f"Counting {status} torrents...")
     
+    if tracker or label:
+        ## Ids come straight from the indexes, no torrents are fetched for "all"
+        if status == "all":
+            count = len(rpc_client.select_torrent_ids(trackers=tracker, labels=label, fresh=fresh))
+        else:
+            count = len(list_selected_torrents(tracker=tracker, label=label, status=status, fresh=fresh))
+        log.info(f"Found {count} {'' if status == 'all' else status + ' '}torrent(s) with {describe_selectors(tracker, label)}")
+
+        return
+
     match status:
         case "all":
-            count = len(rpc_client.list_all_torrents()) or 0
+            count = len(rpc_client.list_all_torrents(fresh=fresh)) or 0
         case "finished":
-            count = len(rpc_client.list_finished_torrents()) or 0
+            count = len(rpc_client.list_finished_torrents(fresh=fresh)) or 0
         case "stalled":
-            count = len(rpc_client.list_stalled_torrents()) or 0
+            count = len(rpc_client.list_stalled_torrents(fresh=fresh)) or 0
     
     if status == "all":
         log.info(f"Found {count} torrent(s)")
@@ -82,16 +131,19 @@ def count_torrents(status: t.Annotated[str, Parameter(name="status", show_defaul
         log.info(f"Found {count} {status} torrent(s)")
 
 
-def print_torrent_df(torrent_df: pd.DataFrame, dtype_mapping: dict = torrent_df_dtypes_mapping, rename_columns: t.Mapping[str, str] | None = {"id": "torrentId", "name": "torrent", "isFinished": "finished", "isStalled": "stalled", "addedDate": "date added", "activityDate": "last active", "percentDone": "done", "timeDownloading": "download time"}, status: str = "all", max_print_rows: int = 300, df_preview_rows: int = 5,  show_columns: list[str] = ["id", "name", "isFinished", "isStalled", "addedDate", "activityDate", "downloadedEver", "error", "percentDone", "timeDownloading"]):
+@profile_utils.profiled("render")
+def print_torrent_df(torrent_df: pd.DataFrame, dtype_mapping: dict | None = None, rename_columns: t.Mapping[str, str] | None = {"id": "torrentId", "name": "torrent", "isFinished": "finished", "isStalled": "stalled", "addedDate": "date added", "activityDate": "last active", "percentDone": "done", "timeDownloading": "download time"}, status: str = "all", max_print_rows: int = 300, df_preview_rows: int = 5,  show_columns: list[str] = ["id", "name", "isFinished", "isStalled", "addedDate", "activityDate", "downloadedEver", "error", "percentDone", "timeDownloading"]):
     print_df: pd.DataFrame = torrent_df.copy(deep=True)
     
     ## Hide pandas index so transmission ID is less confusing
     print_df = df_utils.hide_df_index(df=print_df)
     
-    ## Convert datatypes
-    print_df: pd.DataFrame = df_utils.convert_df_col_dtypes(df=print_df, dtype_mapping=dtype_mapping)
-    ## Convert secondsDownloading column to timedelta
-    print_df["timeDownloading"] = print_df["secondsDownloading"].apply(time_utils.convert_seconds_to_timedelta)
+    ## Convert datatypes, unless torrents_to_df() already normalized the DataFrame
+    print_df = rpc_client.utils.normalize_torrents_df(df=print_df)
+    if dtype_mapping:
+        print_df: pd.DataFrame = df_utils.convert_df_col_dtypes(df=print_df, dtype_mapping=dtype_mapping)
+    ## secondsDownloading is a timedelta column after normalization
+    print_df["timeDownloading"] = print_df["secondsDownloading"]
     
     ## Select subset of columns to display
     print_df = select_df_cols(df=print_df, cols=show_columns)
@@ -114,33 +166,63 @@ def print_torrent_df(torrent_df: pd.DataFrame, dtype_mapping: dict = torrent_df_
     
 
 @torrent_app.command(name="list")
-def list_torrents(status: t.Annotated[str, Parameter(name="status", show_default=True)] = "all", preview: t.Annotated[int, Parameter(name=["-p", "--preview"])] = 5, limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 300):
+def list_torrents(
+    status: t.Annotated[str, Parameter(name="status", show_default=True)] = "all",
+    preview: t.Annotated[int, Parameter(name=["-p", "--preview"])] = 5,
+    limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 300,
+    arrow: t.Annotated[bool, Parameter(name=["--arrow"])] = False,
+    fresh: t.Annotated[bool, Parameter(name=["--fresh"])] = False,
+    tracker: t.Annotated[list[str] | None, Parameter(name=["--tracker"])] = None,
+    label: t.Annotated[list[str] | None, Parameter(name=["--label"])] = None,
+    output_format: t.Annotated[str, Parameter(name=["--format", "-F"])] = "table",
+    output: t.Annotated[str | None, Parameter(name=["--output", "-o"])] = None,
+    field: t.Annotated[list[str] | None, Parameter(name=["--field", "-f"])] = None,
+    chunk_size: t.Annotated[int, Parameter(name=["--chunk-size"], validator=validators.Number(gte=1))] = rpc_client.DEFAULT_EXPORT_CHUNK_SIZE,
+):
     """List torrents by status.
     
     Params:
         status (str): Status of torrents to list. Options: ["all", "finished", "stalled"].
         preview (int): Number of torrents to preview. 0=all results (output will be slow with many results, and may push parts out of the terminal history).
         limit (int): Max number of DataFrame rows to print when displaying in CLI. 0=unlimited (output will be slow with many results, and may push parts out of the terminal history).
+        arrow (bool): Use Arrow-backed (pd.ArrowDtype) DataFrame columns instead of NumPy/object columns.
+        fresh (bool): Ignore the cached torrent list (when TRANSMISSION_CACHE_TTL is set) and ask Transmission.
+        tracker (list[str]): Only list torrents announcing to this tracker host (or domain). Repeat for multiple trackers.
+        label (list[str]): Only list torrents with these labels. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+        output_format (str): table (default) prints a preview. jsonl, csv, parquet or arrow (IPC stream) write every torrent's RPC fields, without building the display DataFrame.
+        output (str): With a --format other than table, write to this file instead of stdout.
+        field (list[str]): With a --format other than table, only write these fields. Repeat for multiple fields.
+        chunk_size (int): With a --format other than table, torrents converted & written at once (bounds output memory).
     """    
     if status not in ["all", "finished", "stalled"]:
         raise ValueError(f"Invalid status: {status}. Must be one of ['all', 'finished', 'stalled']")
+    validate_output_format(output_format)
 
     log.info(f"Listing {status.title()} torrents...")
     
     match status.lower():
+        case _ if tracker or label:
+            torrents = list_selected_torrents(tracker=tracker, label=label, status=status, fresh=fresh)
         case "all":
-            torrents = rpc_client.list_all_torrents()
+            torrents = rpc_client.list_all_torrents(fresh=fresh)
         case "finished":
-            torrents = rpc_client.list_finished_torrents()
+            torrents = rpc_client.list_finished_torrents(fresh=fresh)
         case "stalled":
-            torrents = rpc_client.list_stalled_torrents()
+            torrents = rpc_client.list_stalled_torrents(fresh=fresh)
     
     if torrents is None or len(torrents) == 0:
         log.warning("No torrents found at remote")
 
         return
+
+    if output_format != "table":
+        count: int = rpc_client.stream_torrents(torrents, fmt=output_format, output=output, columns=field, chunk_size=chunk_size)
+        if output:
+            log.info(f"Wrote [{count}] torrent(s) to {output}")
+
+        return
     
-    torrents_df: pd.DataFrame = torrents_to_df(torrents=torrents)
+    torrents_df: pd.DataFrame = torrents_to_df(torrents=torrents, dtype_backend="pyarrow" if arrow else "numpy")
     
     if isinstance(torrents_df, pd.DataFrame) and torrents_df.empty:
         if status == "all": 
@@ -155,12 +237,15 @@ def list_torrents(status: t.Annotated[str, Parameter(name="status", show_default
     return torrents_df
 
 @torrent_app.command(name=["rm", "remove"])
-def remove_torrent(torrent_id: t.Annotated[int, Parameter(name=["--id"])] | None = None, status: t.Annotated[str, Parameter(name=["-s", "--status"])] | None = None):
-    """Remove a torrent, or multiple torrents by state.
+def remove_torrent(torrent_id: t.Annotated[int, Parameter(name=["--id"])] | None = None, status: t.Annotated[str, Parameter(name=["-s", "--status"])] | None = None, tracker: t.Annotated[list[str] | None, Parameter(name=["--tracker"])] = None, label: t.Annotated[list[str] | None, Parameter(name=["--label"])] = None, remove_files: t.Annotated[bool, Parameter(name=["--remove-files"])] = False):
+    """Remove a torrent, or multiple torrents by state, tracker and/or label.
     
     Params:
         torrent_id (int): ID of torrent to remove.
         status (str): State of torrents to remove. Options: ["all", "finished", "stalled"]
+        tracker (list[str]): Remove torrents announcing to this tracker host (or domain). Combine with --status to narrow it down. Repeat for multiple trackers.
+        label (list[str]): Remove torrents with these labels. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+        remove_files (bool): With --tracker/--label, also delete the torrents' data.
     """
     if torrent_id:
         try:
@@ -182,16 +267,39 @@ def remove_torrent(torrent_id: t.Annotated[int, Parameter(name=["--id"])] | None
             
             raise exc
         
+    if tracker or label:
+        ## Without a status, the ids from the indexes are enough
+        if status:
+            torrent_ids = [torrent.id for torrent in list_selected_torrents(tracker=tracker, label=label, status=status, fresh=True)]
+        else:
+            torrent_ids = rpc_client.select_torrent_ids(trackers=tracker, labels=label, fresh=True)
+        if not torrent_ids:
+            log.warning(f"No {status + ' ' if status else ''}torrents found with {describe_selectors(tracker, label)}")
+            return
+
+        log.info(f"Deleting [{len(torrent_ids)}] torrent(s) with {describe_selectors(tracker, label)}")
+        try:
+            rpc_client.delete_torrents_by_transmission_id(torrent_ids=torrent_ids, remove_files=remove_files)
+            log.success(f"Deleted [{len(torrent_ids)}] torrent(s)")
+        except Exception as exc:
+            msg = f"({type(exc)} Error deleting torrents with {describe_selectors(tracker, label)}. Details: {exc})"
+            log.error(msg)
+            
+            raise exc
+
+        return
+
     if status:
         log.info(f"Getting list of {status.title()} torrents...")
         
+        ## Always decide what to delete from a fresh list, never from the cache
         match status.lower():
             case "all":
-                torrents = rpc_client.list_all_torrents()
+                torrents = rpc_client.list_all_torrents(fresh=True)
             case "finished":
-                torrents = rpc_client.list_finished_torrents()
+                torrents = rpc_client.list_finished_torrents(fresh=True)
             case "stalled":
-                torrents = rpc_client.list_stalled_torrents()
+                torrents = rpc_client.list_stalled_torrents(fresh=True)
 
         if torrents is None or len(torrents) == 0:
             log.warning("No torrents found at remote")
@@ -207,3 +315,582 @@ def remove_torrent(torrent_id: t.Annotated[int, Parameter(name=["--id"])] | None
                 log.error(msg)
                 
                 raise exc
+
+
+@torrent_app.command(name="files")
+def list_torrent_files(
+    torrent_ids: t.Annotated[list[int], Parameter(name=["--id"])],
+    limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 300,
+    output_format: t.Annotated[str, Parameter(name=["--format", "-F"])] = "table",
+    output: t.Annotated[str | None, Parameter(name=["--output", "-o"])] = None,
+):
+    """List the files of one or more torrents.
+
+    File lists are only fetched for the requested torrents, in a single request.
+
+    Params:
+        torrent_ids (list[int]): ID of a torrent to list files for. Repeat for multiple torrents.
+        limit (int): Max number of files to print per torrent. 0=unlimited.
+        output_format (str): table (default), or jsonl, csv, parquet or arrow to write every row to stdout or --output.
+        output (str): With a --format other than table, write to this file instead of stdout.
+    """
+    validate_output_format(output_format)
+    details = rpc_client.utils.convert_torrent_details(rpc_client.get_torrent_details(torrents=torrent_ids))
+
+    if not details:
+        log.warning(f"No torrents found with ID(s): {torrent_ids}")
+        return
+
+    if output_format != "table":
+        files_df: pd.DataFrame = pd.DataFrame(
+            [{"id": torrent.id, **file.model_dump()} for torrent in sorted(details.values(), key=lambda d: d.id) for file in torrent.files],
+            columns=["id", "name", "length", "bytesCompleted"],
+        )
+        write_output_df(files_df, output_format=output_format, output=output)
+        return
+
+    for torrent in sorted(details.values(), key=lambda d: d.id):
+        files_df: pd.DataFrame = pd.DataFrame([file.model_dump() for file in torrent.files], columns=["name", "length", "bytesCompleted"])
+        files_df["done"] = (files_df["bytesCompleted"] / files_df["length"].where(files_df["length"] > 0)).fillna(1.0).map("{:.2%}".format)
+
+        log.info(f"Torrent [id: {torrent.id}] has {len(torrent.files)} file(s) in {torrent.pieceCount} piece(s)")
+        with pd.option_context("display.max_rows", limit or None, "display.max_colwidth", 120):
+            print(df_utils.hide_df_index(df=files_df.rename(columns={"bytesCompleted": "completed"})))
+
+
+@torrent_app.command(name="search")
+def search_torrents(query: list[str], refresh: t.Annotated[bool, Parameter(name=["--refresh"])] = False, names_only: t.Annotated[bool, Parameter(name=["--names-only"])] = False, limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 50):
+    """Search torrent & file names in the local search index, without contacting Transmission.
+
+    Every term must appear (case-insensitive) in the torrent name or in one of its file paths.
+
+    Params:
+        query (list[str]): Search terms.
+        refresh (bool): Sync the index with Transmission first. Only new or changed torrents have their file lists fetched.
+        names_only (bool): Only match torrent names, not file paths.
+        limit (int): Max number of torrents to print.
+    """
+    hits = rpc_client.search_torrents(query=" ".join(query), limit=limit, names_only=names_only, refresh=refresh)
+
+    if not hits:
+        log.warning(f"No torrents match '{' '.join(query)}'")
+        return
+
+    log.info(f"Found [{len(hits)}] torrent(s){' (limit reached)' if len(hits) >= limit else ''}")
+    for hit in hits:
+        print(f"{hit.torrent_id:>8}  {hit.name}")
+        for path in hit.files:
+            print(f"{'':>8}    {path}")
+
+
+@torrent_app.command(name="dupes")
+def find_duplicates(
+    min_size_mb: t.Annotated[float, Parameter(name=["--min-size-mb"])] = 0,
+    plan: t.Annotated[str | None, Parameter(name=["--plan"])] = None,
+    apply: t.Annotated[bool, Parameter(name=["--apply"])] = False,
+    remove_files: t.Annotated[bool, Parameter(name=["--remove-files"])] = False,
+    limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 20,
+    fresh: t.Annotated[bool, Parameter(name=["--fresh"])] = False,
+):
+    """Find torrents with the same content (same relative file paths & lengths), and what removing the extra copies reclaims.
+
+    Each group keeps its best copy: complete before incomplete, then most seeders, then most uploaded.
+
+    Params:
+        min_size_mb (float): Ignore torrents smaller than this many MiB.
+        plan (str): Write the removal plan (JSON) to this path.
+        apply (bool): Remove every duplicate except the kept copy, in batched requests.
+        remove_files (bool): With --apply, also delete duplicates' data. Data at the kept copy's path is never deleted.
+        limit (int): Max number of groups to print. 0=unlimited.
+        fresh (bool): Ignore the cached torrent list (when TRANSMISSION_CACHE_TTL is set) and ask Transmission.
+    """
+    groups = rpc_client.find_duplicate_torrents(min_size=int(min_size_mb * 1024**2), fresh=fresh)
+
+    if not groups:
+        log.info("No duplicate torrents found")
+        return
+
+    reclaimable: int = sum(group.reclaimable_bytes for group in groups)
+    log.info(f"Found [{len(groups)}] duplicate group(s), [{sum(len(group.duplicates) for group in groups)}] extra cop(ies), {reclaimable / 1024**3:.2f} GiB reclaimable")
+
+    for group in groups[:limit or None]:
+        print(f"{group.total_size / 1024**3:.2f} GiB x {len(group.torrents)} (reclaim {group.reclaimable_bytes / 1024**3:.2f} GiB)")
+        for fields in group.torrents:
+            marker: str = "keep" if fields is group.keep else "dupe"
+            print(f"  {marker} {fields['id']:>8}  seeders={rpc_client.duplicates.best_seeders(fields):<5} {fields.get('percentDone', 0):>7.2%}  {fields.get('downloadDir')}/{fields.get('name')}")
+
+    removals: list[dict] = rpc_client.removal_plan(groups)
+
+    if plan:
+        plan_path: Path = Path(plan)
+        plan_path.parent.mkdir(parents=True, exist_ok=True)
+        plan_path.write_text(json.dumps(removals, indent=2))
+        log.info(f"Wrote removal plan for [{len(removals)}] torrent(s) to {plan_path}")
+
+    if apply:
+        removed: int = rpc_client.remove_duplicate_torrents(plan=removals, remove_files=remove_files)
+        log.success(f"Removed [{removed}] duplicate torrent(s)")
+
+
+@torrent_app.command(name="verify-local")
+def verify_local(
+    torrent_id: t.Annotated[int | None, Parameter(name=["--id"])] = None,
+    data_dir: t.Annotated[str | None, Parameter(name=["--data-dir"])] = None,
+    torrent_file: t.Annotated[str | None, Parameter(name=["--torrent-file"])] = None,
+    workers: t.Annotated[int | None, Parameter(name=["-w", "--workers"])] = None,
+    max_mb_per_second: t.Annotated[float | None, Parameter(name=["--max-mb-per-second"])] = None,
+    restart: t.Annotated[bool, Parameter(name=["--restart"])] = False,
+):
+    """Verify a torrent's data on a locally mounted download dir, without asking Transmission to re-check it.
+
+    Piece hashes are read from the .torrent file and compared to SHA-1 hashes of memory-mapped
+    file data, across a process pool. Progress is checkpointed, so an interrupted run resumes.
+
+    Params:
+        torrent_id (int): Torrent to verify. Its downloadDir & torrentFile are mapped to local paths with VERIFY_PATH_MAP.
+        data_dir (str): Local download dir, overrides the torrent's downloadDir.
+        torrent_file (str): Local .torrent file, overrides the torrent's torrentFile. With --data-dir, Transmission is not contacted.
+        workers (int): Hashing processes. 0 = one per CPU. Default: VERIFY_WORKERS.
+        max_mb_per_second (float): Average read throughput cap in MiB/s. 0 = unlimited. Default: VERIFY_MAX_MB_PER_SECOND.
+        restart (bool): Ignore a saved checkpoint and verify every piece.
+    """
+    if not (torrent_file and data_dir):
+        if torrent_id is None:
+            log.error("Pass --id, or both --torrent-file and --data-dir")
+            return
+
+        torrent = rpc_client.get_torrent_by_id(torrent_id=torrent_id)
+        torrent_file = torrent_file or verify.map_path(torrent.fields["torrentFile"], verify.verify_settings.path_map)
+        data_dir = data_dir or verify.map_path(torrent.fields["downloadDir"], verify.verify_settings.path_map)
+
+    try:
+        layout = verify.TorrentLayout.from_file(torrent_file)
+    except (OSError, verify.BencodeError) as exc:
+        msg = f"({type(exc)}) Error reading torrent file '{torrent_file}'. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    checkpoint = verify.VerifyCheckpoint(path=Path(verify.verify_settings.checkpoint_dir) / f"{layout.info_hash}.json", layout=layout, data_dir=data_dir)
+    if restart:
+        checkpoint.clear()
+
+    log.info(f"Verifying '{layout.name}': {layout.piece_count} piece(s), {layout.total_size / 1024**3:.2f} GiB in {data_dir}")
+    try:
+        result = verify.verify_torrent_data(
+            layout=layout,
+            data_dir=data_dir,
+            workers=verify.verify_settings.workers if workers is None else workers,
+            max_bytes_per_second=(verify.verify_settings.max_mb_per_second if max_mb_per_second is None else max_mb_per_second) * 1024**2,
+            batch_bytes=verify.verify_settings.batch_mb * 1024**2,
+            checkpoint=checkpoint,
+            checkpoint_interval=verify.verify_settings.checkpoint_interval,
+        )
+    except KeyboardInterrupt:
+        log.warning("Interrupted. Run the same command again to resume.")
+        return
+
+    log.info(f"Checked {result.checked_pieces} piece(s) in {result.seconds:.1f}s ({result.bytes_per_second / 1024**2:.1f} MiB/s)")
+    if result.ok:
+        log.success(f"All {result.piece_count} piece(s) of '{result.name}' are valid")
+        return
+
+    log.warning(f"'{result.name}': {len(result.bad_pieces)} bad and {len(result.missing_pieces)} missing piece(s) of {result.piece_count}")
+    for path, count in sorted(result.bad_files.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {count:>8}  {path}")
+
+
+@torrent_app.command(name="pieces")
+def piece_availability(
+    torrent_id: t.Annotated[int | None, Parameter(name=["--id"])] = None,
+    stuck: t.Annotated[bool, Parameter(name=["--stuck"])] = False,
+    nearly_done: t.Annotated[float, Parameter(name=["--nearly-done"])] = 0.95,
+    stuck_after_minutes: t.Annotated[float, Parameter(name=["--stuck-after-minutes"])] = 60,
+    limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 50,
+    fresh: t.Annotated[bool, Parameter(name=["--fresh"])] = False,
+    output_format: t.Annotated[str, Parameter(name=["--format", "-F"])] = "table",
+    output: t.Annotated[str | None, Parameter(name=["--output", "-o"])] = None,
+):
+    """Show piece completion of incomplete torrents: completed ranges, complete files, and nearly done torrents that stopped progressing.
+
+    Params:
+        torrent_id (int): Print the completed piece ranges of one torrent.
+        stuck (bool): Only show nearly done torrents with no download and no activity for --stuck-after-minutes.
+        nearly_done (float): Fraction of pieces above which an incomplete torrent counts as nearly done.
+        stuck_after_minutes (float): Minutes without activity before a nearly done torrent is stuck.
+        limit (int): Max number of torrents (or ranges, with --id) to print. 0=unlimited.
+        fresh (bool): Ignore the cached torrent list (when TRANSMISSION_CACHE_TTL is set) and ask Transmission.
+        output_format (str): table (default), or jsonl, csv, parquet or arrow to write every row to stdout or --output.
+        output (str): With a --format other than table, write to this file instead of stdout.
+    """
+    validate_output_format(output_format)
+    if torrent_id is not None:
+        torrent = rpc_client.get_torrent_by_id(torrent_id=torrent_id)
+        ranges = rpc_client.completed_ranges(torrent.fields.get("pieces", ""), torrent.fields.get("pieceCount", 0))
+        log.info(f"Torrent [id: {torrent.id}] has {int((ranges[:, 1] - ranges[:, 0]).sum())}/{torrent.fields.get('pieceCount', 0)} piece(s) in {len(ranges)} range(s)")
+        for start, end in ranges[:limit or None].tolist():
+            print(f"  {start:>8} - {end - 1:<8} ({end - start} piece(s))")
+        return
+
+    stats = rpc_client.get_piece_stats(nearly_done=nearly_done, stuck_after=stuck_after_minutes * 60, fresh=fresh)
+    incomplete = stats[stats["fraction"] < 1]
+    log.info(f"[{len(incomplete)}] of [{len(stats)}] torrent(s) are incomplete, [{int(stats['stuck'].sum())}] nearly done and stuck")
+
+    shown = incomplete[incomplete["stuck"]] if stuck else incomplete
+    if shown.empty:
+        return
+
+    shown = shown.sort_values("fraction", ascending=False)[["id", "name", "pieceCount", "have", "fraction", "ranges", "longestRange", "firstMissing", "completeFileFraction", "stuck"]]
+    if write_output_df(shown, output_format=output_format, output=output):
+        return
+    with pd.option_context("display.max_rows", limit or None, "display.max_columns", None, "display.width", 200):
+        print(df_utils.hide_df_index(df=shown.head(limit) if limit else shown))
+
+
+@torrent_app.command(name="bandwidth")
+def rebalance_bandwidth(
+    down_kbps: t.Annotated[int, Parameter(name=["--down-kbps"], validator=validators.Number(gte=0))] = 0,
+    up_kbps: t.Annotated[int, Parameter(name=["--up-kbps"], validator=validators.Number(gte=0))] = 0,
+    label_weight: t.Annotated[list[str] | None, Parameter(name=["--label-weight"])] = None,
+    min_kbps: t.Annotated[int, Parameter(name=["--min-kbps"], validator=validators.Number(gte=1))] = 10,
+    apply: t.Annotated[bool, Parameter(name=["--apply"])] = False,
+    limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 20,
+):
+    """Split global speed budgets into per-torrent limits & priorities, from current rates, peer counts and label weights.
+
+    Only torrents whose limits change are updated, and torrents getting the same settings share one request.
+
+    Params:
+        down_kbps (int): Total download budget in KB/s. 0 leaves download limits alone.
+        up_kbps (int): Total upload budget in KB/s. 0 leaves upload limits alone.
+        label_weight (list[str]): LABEL=WEIGHT, i.e. tv=2. Weights above 1 also get high priority, below 1 low. Repeat for multiple labels.
+        min_kbps (int): Lowest limit an active torrent gets.
+        apply (bool): Push the changed settings to Transmission. Without it, only print them.
+        limit (int): Max number of setting groups to print. 0=unlimited.
+    """
+    if not (down_kbps or up_kbps):
+        log.error("Pass --down-kbps and/or --up-kbps")
+        return
+
+    weights: dict[str, float] = {}
+    for spec in label_weight or []:
+        name, sep, value = spec.rpartition("=")
+        try:
+            weights[name] = float(value)
+        except ValueError:
+            sep = ""
+        if not (sep and name):
+            log.error(f"Invalid --label-weight '{spec}', use LABEL=WEIGHT, i.e. tv=2")
+            return
+
+    budget = rpc_client.BandwidthBudget(download_kbps=down_kbps, upload_kbps=up_kbps, label_weights=weights, min_kbps=min_kbps)
+    alloc, calls = rpc_client.rebalance_bandwidth(budget=budget, apply=apply)
+
+    log.info(
+        f"Allocated {alloc['downloadLimit'].sum()} KB/s down to [{alloc['downloadLimit'].notna().sum()}] and "
+        f"{alloc['uploadLimit'].sum()} KB/s up to [{alloc['uploadLimit'].notna().sum()}] active torrent(s)"
+    )
+    for changes, torrent_ids in calls[:limit or None]:
+        print(f"  {len(torrent_ids):>6} torrent(s): {', '.join(f'{key}={value}' for key, value in changes.items())}")
+
+    changed: int = sum(len(torrent_ids) for _, torrent_ids in calls)
+    log.info(f"[{changed}] torrent(s) {'updated' if apply else 'would change'} in [{len(calls)}] request(s)")
+    if calls and not apply:
+        log.info("Run with --apply to push the new settings")
+
+
+@torrent_app.command(name="queue")
+def optimize_queue(
+    apply: t.Annotated[bool, Parameter(name=["--apply"])] = False,
+    eta_weight: t.Annotated[float, Parameter(name=["--eta-weight"])] = 1.0,
+    availability_weight: t.Annotated[float, Parameter(name=["--availability-weight"])] = 1.0,
+    stall_weight: t.Annotated[float, Parameter(name=["--stall-weight"])] = 1.0,
+    limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 30,
+    output_format: t.Annotated[str, Parameter(name=["--format", "-F"])] = "table",
+    output: t.Annotated[str | None, Parameter(name=["--output", "-o"])] = None,
+):
+    """Score queued & downloading torrents and reorder the download queue, so likely finishers go first.
+
+    Scores favor a short expected time to completion and peers having the missing data, and
+    penalize long inactivity & stalling. Only the torrents out of order are moved (one request each).
+
+    Params:
+        apply (bool): Send the new queue order to Transmission. Without it, only print the plan.
+        eta_weight (float): Weight of the expected time to completion.
+        availability_weight (float): Weight of the share of missing data available from peers.
+        stall_weight (float): Weight of the inactivity/stall penalty.
+        limit (int): Max number of queue rows to print. 0=unlimited.
+        output_format (str): table (default), or jsonl, csv, parquet or arrow to write every row to stdout or --output.
+        output (str): With a --format other than table, write to this file instead of stdout.
+    """
+    validate_output_format(output_format)
+    weights = rpc_client.QueueWeights(eta=eta_weight, availability=availability_weight, stall=stall_weight)
+    plan = rpc_client.optimize_queue(weights=weights, apply=apply)
+
+    if plan.order.empty:
+        log.info("Download queue is empty")
+        return
+
+    view = plan.order[["id", "name", "status", "queuePosition", "score", "expected_seconds", "availability", "stall"]].copy()
+    if write_output_df(plan.order, output_format=output_format, output=output):
+        log.info(f"[{len(plan.moves)}] of [{len(plan.order)}] queued torrent(s) {'moved' if apply else 'would move'}")
+        return
+    view["expected"] = pd.to_timedelta(view.pop("expected_seconds").round(), unit="s")
+    print(df_utils.hide_df_index(df=view.head(limit) if limit else view))
+
+    log.info(f"[{len(plan.moves)}] of [{len(plan.order)}] queued torrent(s) {'moved' if apply else 'would move'}")
+    if plan.moves and not apply:
+        log.info("Run with --apply to reorder the queue")
+
+
+@torrent_app.command(name=["move", "mv"])
+def move_torrents(
+    dest: t.Annotated[str | None, Parameter(name=["--dest"])] = None,
+    torrent_ids: t.Annotated[list[int] | None, Parameter(name=["--id"])] = None,
+    status: t.Annotated[str, Parameter(name=["-s", "--status"])] = "all",
+    tracker: t.Annotated[list[str] | None, Parameter(name=["--tracker"])] = None,
+    label: t.Annotated[list[str] | None, Parameter(name=["--label"])] = None,
+    reserve_gb: t.Annotated[float, Parameter(name=["--reserve-gb"])] = 5,
+    chunk_size: t.Annotated[int, Parameter(name=["--chunk-size"], validator=validators.Number(gte=1))] = 50,
+    concurrency: t.Annotated[int, Parameter(name=["-c", "--concurrency"], validator=validators.Number(gte=1))] = 2,
+    max_gb_in_flight: t.Annotated[float, Parameter(name=["--max-gb-in-flight"])] = 100,
+    poll_seconds: t.Annotated[float, Parameter(name=["--poll-seconds"])] = 5,
+    state: t.Annotated[str, Parameter(name=["--state"])] = f"{MOVES_DIR}/move_state.json",
+    resume: t.Annotated[bool, Parameter(name=["--resume"])] = False,
+    dry_run: t.Annotated[bool, Parameter(name=["--dry-run"])] = False,
+    limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 20,
+):
+    """Move torrents' data to another directory on the Transmission host, in throttled batches.
+
+    Moves are planned per destination against its free space (smallest torrents first), then run
+    in chunked requests. A batch counts as moving until Transmission reports its new location.
+    Progress is saved to --state; after an interruption, run again with --resume.
+
+    Params:
+        dest (str): Destination directory. "{label}" is replaced with each torrent's first label.
+        torrent_ids (list[int]): Move these torrents. Repeat for multiple ids.
+        status (str): Only move torrents with this status. Options: ["all", "finished", "stalled", "paused"]
+        tracker (list[str]): Move torrents announcing to this tracker host (or domain). Repeat for multiple trackers.
+        label (list[str]): Move torrents with these labels. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+        reserve_gb (float): Free space (GiB) to leave on every destination.
+        chunk_size (int): Max torrents per move request.
+        concurrency (int): Max batches moving at once.
+        max_gb_in_flight (float): Max GiB moving at once. 0=unlimited.
+        poll_seconds (float): Seconds between progress checks.
+        state (str): Path of the resume state file.
+        resume (bool): Continue the moves saved in --state, instead of planning new ones.
+        dry_run (bool): Print the plan without moving anything.
+        limit (int): Max number of planned moves to print. 0=unlimited.
+    """
+    if resume:
+        if not Path(state).exists():
+            log.error(f"No move state found at {state}")
+            return
+        plan = rpc_client.MovePlan.load(state)
+        log.info(f"Resuming moves from {state}: {plan.summary()}")
+    else:
+        if not dest:
+            log.error("Pass --dest, or --resume to continue saved moves")
+            return
+
+        selected_ids: list[int] | None = torrent_ids
+        if tracker or label:
+            selected_ids = rpc_client.select_torrent_ids(trackers=tracker, labels=label, fresh=True)
+            if torrent_ids:
+                selected_ids = sorted(set(selected_ids) & set(torrent_ids))
+            if not selected_ids:
+                log.warning(f"No torrents found with {describe_selectors(tracker, label)}")
+                return
+
+        plan = rpc_client.plan_torrent_moves(dest=dest, torrent_ids=selected_ids, status=status, reserve_bytes=int(reserve_gb * 1024**3), fresh=True)
+
+    if not plan.items:
+        log.info("Nothing to move")
+        return
+
+    for path, free in plan.free_space.items():
+        log.info(f"{path}: {'unknown' if free is None else f'{free / 1024**3:.1f} GiB'} free")
+    for item in plan.items[:limit or None]:
+        print(f"  {item.state:<9} {item.id:>8} {item.size / 1024**3:>8.2f} GiB  {item.source} -> {item.dest}  {item.name}")
+
+    moving = plan.by_state(rpc_client.moves.PENDING, rpc_client.moves.IN_FLIGHT)
+    deferred = plan.by_state(rpc_client.moves.DEFERRED)
+    log.info(f"[{len(moving)}] move(s) planned ({sum(item.size for item in moving) / 1024**3:.1f} GiB), [{len(deferred)}] deferred for lack of space")
+
+    if dry_run or not moving:
+        return
+
+    try:
+        summary = rpc_client.run_torrent_moves(
+            plan=plan,
+            state_path=state,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            max_bytes_in_flight=int(max_gb_in_flight * 1024**3),
+            poll_interval=poll_seconds,
+        )
+    except KeyboardInterrupt:
+        log.warning(f"Interrupted, progress saved to {state}. Continue with --resume")
+        return
+
+    for item in plan.by_state(rpc_client.moves.FAILED):
+        log.error(f"Failed to move [{item.id}] {item.name}: {item.error}")
+    log.success(f"Moves finished: {summary}")
+
+
+@torrent_app.command(name="trackers")
+def tracker_health(
+    fresh: t.Annotated[bool, Parameter(name=["--fresh"])] = False,
+    limit: t.Annotated[int, Parameter(name=["-l", "--limit"])] = 50,
+    output_format: t.Annotated[str, Parameter(name=["--format", "-F"])] = "table",
+    output: t.Annotated[str | None, Parameter(name=["--output", "-o"])] = None,
+):
+    """Show announce health per tracker host, worst success rate first.
+
+    Params:
+        fresh (bool): Ignore the cached torrent list (when TRANSMISSION_CACHE_TTL is set) and ask Transmission.
+        limit (int): Max number of trackers to print. 0=unlimited.
+        output_format (str): table (default), or jsonl, csv, parquet or arrow to write every row to stdout or --output.
+        output (str): With a --format other than table, write to this file instead of stdout.
+    """
+    validate_output_format(output_format)
+    index = rpc_client.get_tracker_index(fresh=fresh)
+    if not len(index):
+        log.warning("No trackers found at remote")
+        return
+
+    stats: pd.DataFrame = index.host_stats()
+    ## Machine-readable formats keep raw rates & ages in seconds
+    if write_output_df(stats, output_format=output_format, output=output):
+        return
+    stats["successRate"] = stats["successRate"].map(lambda rate: "-" if pd.isna(rate) else f"{rate:.1%}")
+    for col in ["lastAnnounceAge", "oldestAnnounceAge"]:
+        stats[col] = pd.to_timedelta(stats[col], unit="s").dt.floor("s")
+
+    log.info(f"Announce health for [{len(index)}] tracker(s):")
+    with pd.option_context("display.max_rows", limit or None, "display.max_columns", None, "display.width", 200):
+        print(df_utils.hide_df_index(df=stats.head(limit) if limit else stats))
+
+
+def resolve_bulk_ids(ids: list[str] | None, status: str | None, tracker: list[str] | None, label: list[str] | None) -> list[int]:
+    """Resolve bulk command selectors to ids, or an empty list (with the reason logged)."""
+    if not (ids or status or tracker or label):
+        log.error("Pass torrent ids/ranges, --status, --tracker or --label. Use --status all for every torrent")
+        return []
+    if status and status not in rpc_client.utils.TORRENT_STATUS_CHOICES:
+        log.error(f"Invalid status: {status}. Must be one of {rpc_client.utils.TORRENT_STATUS_CHOICES}")
+        return []
+
+    try:
+        torrent_ids = rpc_client.resolve_torrent_ids(ids=ids, status=status, trackers=tracker, labels=label, fresh=True)
+    except ValueError as exc:
+        log.error(exc)
+        return []
+
+    if not torrent_ids:
+        log.warning(f"No torrents found with {describe_selectors(tracker, label) or 'the given selectors'}{f', status: {status}' if status else ''}{f', ids: {ids}' if ids else ''}")
+
+    return torrent_ids
+
+
+@torrent_app.command(name="start")
+def start_torrents(
+    ids: list[str] | None = None,
+    status: t.Annotated[str | None, Parameter(name=["-s", "--status"])] = None,
+    tracker: t.Annotated[list[str] | None, Parameter(name=["--tracker"])] = None,
+    label: t.Annotated[list[str] | None, Parameter(name=["--label"])] = None,
+    bypass_queue: t.Annotated[bool, Parameter(name=["--now"])] = False,
+):
+    """Start every torrent matching ids/ranges, --status, --tracker & --label selectors, in batched requests.
+
+    Params:
+        ids (list[str]): Torrent ids & ranges, i.e. 12 1-50,77.
+        status (str): Start torrents with this status. Options: ["all", "finished", "stalled", "paused", "downloading", "seeding", "checking", "error"]
+        tracker (list[str]): Start torrents announcing to this tracker host (or domain). Repeat for multiple trackers.
+        label (list[str]): Start torrents with these labels. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+        bypass_queue (bool): Start immediately, ignoring the download queue.
+    """
+    torrent_ids = resolve_bulk_ids(ids=ids, status=status, tracker=tracker, label=label)
+    if not torrent_ids:
+        return
+
+    calls = rpc_client.start_torrents_by_id(torrent_ids=torrent_ids, bypass_queue=bypass_queue)
+    log.success(f"Started [{len(torrent_ids)}] torrent(s) in [{calls}] request(s)")
+
+
+@torrent_app.command(name="stop")
+def stop_torrents(
+    ids: list[str] | None = None,
+    status: t.Annotated[str | None, Parameter(name=["-s", "--status"])] = None,
+    tracker: t.Annotated[list[str] | None, Parameter(name=["--tracker"])] = None,
+    label: t.Annotated[list[str] | None, Parameter(name=["--label"])] = None,
+):
+    """Stop every torrent matching ids/ranges, --status, --tracker & --label selectors, in batched requests.
+
+    Params:
+        ids (list[str]): Torrent ids & ranges, i.e. 12 1-50,77.
+        status (str): Stop torrents with this status. Options: ["all", "finished", "stalled", "paused", "downloading", "seeding", "checking", "error"]
+        tracker (list[str]): Stop torrents announcing to this tracker host (or domain). Repeat for multiple trackers.
+        label (list[str]): Stop torrents with these labels. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+    """
+    torrent_ids = resolve_bulk_ids(ids=ids, status=status, tracker=tracker, label=label)
+    if not torrent_ids:
+        return
+
+    calls = rpc_client.stop_torrents_by_id(torrent_ids=torrent_ids)
+    log.success(f"Stopped [{len(torrent_ids)}] torrent(s) in [{calls}] request(s)")
+
+
+@torrent_app.command(name="verify")
+def verify_torrents(
+    ids: list[str] | None = None,
+    status: t.Annotated[str | None, Parameter(name=["-s", "--status"])] = None,
+    tracker: t.Annotated[list[str] | None, Parameter(name=["--tracker"])] = None,
+    label: t.Annotated[list[str] | None, Parameter(name=["--label"])] = None,
+    max_checking: t.Annotated[int, Parameter(name=["-n", "--max-checking"], validator=validators.Number(gte=0))] = 2,
+    poll_seconds: t.Annotated[float, Parameter(name=["--poll-seconds"])] = 5,
+):
+    """Ask Transmission to hash check every matching torrent, only a few at a time.
+
+    Params:
+        ids (list[str]): Torrent ids & ranges, i.e. 12 1-50,77.
+        status (str): Verify torrents with this status. Options: ["all", "finished", "stalled", "paused", "downloading", "seeding", "checking", "error"]
+        tracker (list[str]): Verify torrents announcing to this tracker host (or domain). Repeat for multiple trackers.
+        label (list[str]): Verify torrents with these labels. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+        max_checking (int): Max torrents checking (or queued for a check) at once. 0=queue all at once.
+        poll_seconds (float): Seconds between checks of the verifying torrents.
+    """
+    torrent_ids = resolve_bulk_ids(ids=ids, status=status, tracker=tracker, label=label)
+    if not torrent_ids:
+        return
+
+    try:
+        calls = rpc_client.verify_torrents_by_id(torrent_ids=torrent_ids, max_checking=max_checking, poll_interval=poll_seconds)
+    except KeyboardInterrupt:
+        log.warning("Interrupted. Torrents already sent keep checking in Transmission")
+        return
+
+    log.success(f"Verified [{len(torrent_ids)}] torrent(s) in [{calls}] request(s)")
+
+
+@torrent_app.command(name="reannounce")
+def reannounce_torrents(
+    ids: list[str] | None = None,
+    status: t.Annotated[str | None, Parameter(name=["-s", "--status"])] = None,
+    tracker: t.Annotated[list[str] | None, Parameter(name=["--tracker"])] = None,
+    label: t.Annotated[list[str] | None, Parameter(name=["--label"])] = None,
+):
+    """Ask trackers for more peers for every matching torrent, in batched requests.
+
+    Params:
+        ids (list[str]): Torrent ids & ranges, i.e. 12 1-50,77.
+        status (str): Reannounce torrents with this status. Options: ["all", "finished", "stalled", "paused", "downloading", "seeding", "checking", "error"]
+        tracker (list[str]): Reannounce torrents announcing to this tracker host (or domain). Repeat for multiple trackers.
+        label (list[str]): Reannounce torrents with these labels. Comma-separated labels match ANY, repeated --label must ALL match, a leading "!" negates.
+    """
+    torrent_ids = resolve_bulk_ids(ids=ids, status=status, tracker=tracker, label=label)
+    if not torrent_ids:
+        return
+
+    calls = rpc_client.reannounce_torrents_by_id(torrent_ids=torrent_ids)
+    log.success(f"Reannounced [{len(torrent_ids)}] torrent(s) in [{calls}] request(s)")
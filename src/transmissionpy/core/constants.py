@@ -6,3 +6,5 @@ JSON_OUTPUT_DIR: str = f"{OUTPUT_DIR}/json"
 PQ_OUTPUT_DIR: str = f"{OUTPUT_DIR}/parquet"
 CSV_OUTPUT_DIR: str = f"{OUTPUT_DIR}/csv"
 SNAPSHOT_DIR: str = f"{DATA_DIR}/snapshots"
+CACHE_DIR: str = f"{DATA_DIR}/cache"
+MOVES_DIR: str = f"{DATA_DIR}/moves"
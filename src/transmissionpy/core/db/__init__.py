@@ -3,4 +3,5 @@ from __future__ import annotations
 from . import annotated
 from .__methods import create_base_metadata, get_db_uri, get_engine, get_session_pool
 from .base import Base
+from .search import SearchHit, TorrentSearchIndex
 from .utils import backup_sqlite_db, dump_sqlite_db_schema
@@ -0,0 +1,294 @@
+"""Local full-text index over torrent & file names, in the app's SQLite database.
+
+One row per torrent (`torrent_search`) remembers what was indexed for each hashString, and
+`torrent_search_text` holds one row per name or file path. An FTS5 table with the trigram
+tokenizer mirrors `torrent_search_text` through triggers, so substring queries are answered
+from the index instead of scanning names.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import time
+import typing as t
+
+import sqlalchemy as sa
+
+log = logging.getLogger(__name__)
+
+## torrent_search_text.kind values
+KIND_NAME: int = 0
+KIND_FILE: int = 1
+
+## Trigram queries need at least 3 characters per term, shorter terms fall back to LIKE
+TRIGRAM_MIN_TERM: int = 3
+
+SEARCH_SCHEMA: list[str] = [
+    """CREATE TABLE IF NOT EXISTS torrent_search (
+        hash_string TEXT PRIMARY KEY,
+        torrent_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        total_size INTEGER NOT NULL DEFAULT 0,
+        file_count INTEGER NOT NULL DEFAULT -1,
+        updated_at REAL NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS torrent_search_text (
+        id INTEGER PRIMARY KEY,
+        hash_string TEXT NOT NULL,
+        kind INTEGER NOT NULL,
+        text TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_torrent_search_text_hash ON torrent_search_text (hash_string)",
+    """CREATE TRIGGER IF NOT EXISTS torrent_search_text_ai AFTER INSERT ON torrent_search_text BEGIN
+        INSERT INTO torrent_search_fts (rowid, text) VALUES (new.id, new.text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS torrent_search_text_ad AFTER DELETE ON torrent_search_text BEGIN
+        INSERT INTO torrent_search_fts (torrent_search_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    END""",
+]
+
+
+@dataclass
+class SearchHit:
+    torrent_id: int
+    hash_string: str
+    name: str
+    ## Matching file paths, best match first. Empty when only the torrent name matched.
+    files: list[str] = field(default_factory=list)
+    rank: float = field(default=0.0)
+
+
+class TorrentSearchIndex:
+    """Maintain & query the torrent name/file search index.
+
+    Rows are keyed by hashString, so the index survives torrent id changes between
+    Transmission restarts, and `diff()` tells callers which torrents need (re)indexing.
+
+    Params:
+        engine (sqlalchemy.Engine): Engine for a SQLite database with the FTS5 extension.
+    """
+
+    def __init__(self, engine: sa.Engine) -> None:
+        self.engine: sa.Engine = engine
+        self.trigram: bool = True
+
+        self.create()
+
+    def create(self) -> None:
+        """Create the search tables if they don't exist yet."""
+        with self.engine.begin() as conn:
+            try:
+                conn.exec_driver_sql(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS torrent_search_fts USING fts5("
+                    "text, content='torrent_search_text', content_rowid='id', tokenize='trigram')"
+                )
+            except sa.exc.OperationalError as exc:
+                ## SQLite < 3.34 has no trigram tokenizer, use word tokens with prefix queries
+                log.warning(f"FTS5 trigram tokenizer unavailable, falling back to word search. Details: {exc}")
+                conn.exec_driver_sql(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS torrent_search_fts USING fts5("
+                    "text, content='torrent_search_text', content_rowid='id')"
+                )
+
+            for statement in SEARCH_SCHEMA:
+                conn.exec_driver_sql(statement)
+
+            fts_sql: str = conn.exec_driver_sql(
+                "SELECT sql FROM sqlite_master WHERE name = 'torrent_search_fts'"
+            ).scalar_one()
+            self.trigram = "trigram" in fts_sql
+
+    def __len__(self) -> int:
+        with self.engine.connect() as conn:
+            return conn.exec_driver_sql("SELECT count(*) FROM torrent_search").scalar_one()
+
+    def stamps(self) -> dict[str, tuple[int, str, int, int]]:
+        """Return `hashString -> (torrent_id, name, total_size, file_count)` for every indexed torrent."""
+        with self.engine.connect() as conn:
+            rows = conn.exec_driver_sql("SELECT hash_string, torrent_id, name, total_size, file_count FROM torrent_search")
+
+            return {row[0]: tuple(row[1:]) for row in rows}
+
+    def diff(self, torrents: t.Iterable[dict], prune: bool = True) -> tuple[list[dict], list[dict], list[str]]:
+        """Compare summary torrents (id, hashString, name, totalSize) with the index.
+
+        Params:
+            torrents (Iterable[dict]): Torrent field dicts.
+            prune (bool): `torrents` is the complete list, so indexed hashes missing from it were removed.
+
+        Returns:
+            (tuple[list[dict], list[dict], list[str]]): Torrents whose row changed but whose files
+                are still indexed, torrents that need their files (re)indexed, and removed hashStrings.
+
+        """
+        indexed: dict[str, tuple[int, str, int, int]] = self.stamps()
+        seen: set[str] = set()
+        changed: list[dict] = []
+        needs_files: list[dict] = []
+
+        for fields in torrents:
+            hash_string: str = fields["hashString"]
+            seen.add(hash_string)
+            total_size: int = fields.get("totalSize") or 0
+            current: tuple[int, str, int, int] | None = indexed.get(hash_string)
+
+            ## A magnet link's files appear (and totalSize changes) once metadata arrives
+            if current is None or current[3] < 0 or current[2] != total_size:
+                needs_files.append(fields)
+            elif current[0] != fields["id"] or current[1] != fields["name"]:
+                changed.append(fields)
+
+        removed: list[str] = [hash_string for hash_string in indexed if hash_string not in seen] if prune else []
+
+        return changed, needs_files, removed
+
+    def upsert(self, torrents: t.Iterable[dict]) -> int:
+        """Index torrents by hashString.
+
+        Torrents with a "files" field get their file rows replaced, torrents without one only get
+        their name row updated (existing file rows are kept).
+
+        Returns:
+            (int): Number of torrents written.
+
+        """
+        now: float = time.time()
+        torrent_rows: list[dict] = []
+        text_rows: list[dict] = []
+        with_files: list[str] = []
+
+        for fields in torrents:
+            hash_string: str = fields["hashString"]
+            files: list[dict] | None = fields.get("files")
+            torrent_rows.append(
+                {
+                    "hash_string": hash_string,
+                    "torrent_id": fields["id"],
+                    "name": fields.get("name") or "",
+                    "total_size": fields.get("totalSize") or 0,
+                    "file_count": -1 if files is None else len(files),
+                    "updated_at": now,
+                }
+            )
+            text_rows.append({"hash_string": hash_string, "kind": KIND_NAME, "text": fields.get("name") or ""})
+
+            if files is not None:
+                with_files.append(hash_string)
+                text_rows.extend({"hash_string": hash_string, "kind": KIND_FILE, "text": file["name"]} for file in files)
+
+        if not torrent_rows:
+            return 0
+
+        hashes: list[dict] = [{"hash_string": row["hash_string"]} for row in torrent_rows]
+        with self.engine.begin() as conn:
+            conn.execute(
+                sa.text(
+                    "DELETE FROM torrent_search_text WHERE hash_string = :hash_string AND kind = :kind"
+                ),
+                [{**row, "kind": KIND_NAME} for row in hashes],
+            )
+            if with_files:
+                conn.execute(
+                    sa.text("DELETE FROM torrent_search_text WHERE hash_string = :hash_string AND kind = :kind"),
+                    [{"hash_string": hash_string, "kind": KIND_FILE} for hash_string in with_files],
+                )
+            conn.execute(
+                sa.text(
+                    "INSERT INTO torrent_search (hash_string, torrent_id, name, total_size, file_count, updated_at) "
+                    "VALUES (:hash_string, :torrent_id, :name, :total_size, :file_count, :updated_at) "
+                    "ON CONFLICT (hash_string) DO UPDATE SET torrent_id = excluded.torrent_id, name = excluded.name, "
+                    "total_size = excluded.total_size, updated_at = excluded.updated_at, "
+                    ## Name-only updates keep the previously indexed file count
+                    "file_count = CASE WHEN excluded.file_count < 0 THEN torrent_search.file_count ELSE excluded.file_count END"
+                ),
+                torrent_rows,
+            )
+            conn.execute(
+                sa.text("INSERT INTO torrent_search_text (hash_string, kind, text) VALUES (:hash_string, :kind, :text)"),
+                text_rows,
+            )
+
+        log.debug(f"Indexed [{len(torrent_rows)}] torrent(s), [{len(text_rows) - len(torrent_rows)}] file(s)")
+
+        return len(torrent_rows)
+
+    def remove(self, hash_strings: t.Iterable[str]) -> int:
+        """Drop torrents from the index. Returns the number of torrents removed."""
+        rows: list[dict] = [{"hash_string": hash_string} for hash_string in hash_strings]
+        if not rows:
+            return 0
+
+        with self.engine.begin() as conn:
+            conn.execute(sa.text("DELETE FROM torrent_search_text WHERE hash_string = :hash_string"), rows)
+            conn.execute(sa.text("DELETE FROM torrent_search WHERE hash_string = :hash_string"), rows)
+
+        return len(rows)
+
+    def _match_clause(self, terms: list[str]) -> tuple[str | None, list[str]]:
+        ## Returns an FTS5 MATCH expression, and terms that must be matched with LIKE instead
+        if self.trigram:
+            indexed: list[str] = [term for term in terms if len(term) >= TRIGRAM_MIN_TERM]
+            like: list[str] = [term for term in terms if len(term) < TRIGRAM_MIN_TERM]
+            match: str = " AND ".join('"{}"'.format(term.replace('"', '""')) for term in indexed)
+        else:
+            like = []
+            match = " AND ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+        return match or None, like
+
+    def search(self, query: str, limit: int = 50, names_only: bool = False, max_files: int = 5) -> list[SearchHit]:
+        """Find torrents whose name or file paths contain every whitespace-separated term in `query`.
+
+        Matching is case-insensitive. Torrents are ordered by their best-ranked match.
+
+        Params:
+            query (str): Search terms.
+            limit (int): Maximum number of torrents to return.
+            names_only (bool): Only match torrent names, not file paths.
+            max_files (int): Maximum number of matching file paths to return per torrent.
+
+        Returns:
+            (list[SearchHit]): Matching torrents, best first.
+
+        """
+        terms: list[str] = query.split()
+        if not terms:
+            return []
+
+        match, like = self._match_clause(terms)
+        conditions: list[str] = []
+        params: dict[str, t.Any] = {}
+
+        if match:
+            conditions.append("torrent_search_fts MATCH :match")
+            params["match"] = match
+        for i, term in enumerate(like):
+            conditions.append(f"x.text LIKE :like_{i} ESCAPE '\\'")
+            params[f"like_{i}"] = "%{}%".format(term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_"))
+        if names_only:
+            conditions.append(f"x.kind = {KIND_NAME}")
+
+        if match:
+            sql: str = (
+                "SELECT s.torrent_id, s.hash_string, s.name, x.kind, x.text, bm25(torrent_search_fts) AS rank "
+                "FROM torrent_search_fts JOIN torrent_search_text x ON x.id = torrent_search_fts.rowid "
+            )
+        else:
+            ## Only short terms: no FTS lookup possible, scan the text table
+            sql = "SELECT s.torrent_id, s.hash_string, s.name, x.kind, x.text, 0.0 AS rank FROM torrent_search_text x "
+        sql += f"JOIN torrent_search s ON s.hash_string = x.hash_string WHERE {' AND '.join(conditions)} ORDER BY rank"
+
+        hits: dict[str, SearchHit] = {}
+        with self.engine.connect() as conn:
+            ## Rows stream best-first, stop reading once enough torrents were found
+            for torrent_id, hash_string, name, kind, text, rank in conn.execute(sa.text(sql), params):
+                hit: SearchHit | None = hits.get(hash_string)
+                if hit is None:
+                    if len(hits) >= limit:
+                        break
+                    hit = hits[hash_string] = SearchHit(torrent_id=torrent_id, hash_string=hash_string, name=name, rank=rank)
+                if kind == KIND_FILE and len(hit.files) < max_files:
+                    hit.files.append(text)
+
+        return list(hits.values())
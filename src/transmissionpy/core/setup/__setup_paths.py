@@ -4,6 +4,7 @@ from pathlib import Path
 import typing as t
 
 from transmissionpy.core.constants import (
+    CACHE_DIR,
     CSV_OUTPUT_DIR,
     DATA_DIR,
     JSON_OUTPUT_DIR,
@@ -12,7 +13,7 @@ from transmissionpy.core.constants import (
     SNAPSHOT_DIR,
 )
 
-ALL_PATHS: list = [DATA_DIR, OUTPUT_DIR, PQ_OUTPUT_DIR, JSON_OUTPUT_DIR, CSV_OUTPUT_DIR]
+ALL_PATHS: list = [DATA_DIR, OUTPUT_DIR, PQ_OUTPUT_DIR, JSON_OUTPUT_DIR, CSV_OUTPUT_DIR, CACHE_DIR]
 
 def create_app_paths(paths: list = ALL_PATHS):
     for p in paths:
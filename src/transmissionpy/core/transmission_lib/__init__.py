@@ -1,6 +1,47 @@
 from __future__ import annotations
 
-from .constants import TORRENT_STATES
+from .cache import TORRENT_CACHE_DIR, TorrentListCache
+from .coalesce import IdSetBatcher, SingleFlight, get_id_batcher, get_single_flight
+from .constants import (
+    DEFAULT_ID_CHUNK_SIZE,
+    TORRENT_DETAIL_FIELDS,
+    TORRENT_STATES,
+    TORRENT_SUMMARY_FIELDS,
+)
 from .controllers import TransmissionRPCController
+from .details import (
+    DETAIL_STAMP_FIELDS,
+    TorrentDetailsMemo,
+    detail_stamp,
+    get_details_memo,
+)
 from .methods import get_torrents, get_transmission_client, get_transmission_controller
+from .replay import (
+    CountingAdapter,
+    RecordingAdapter,
+    ReplayAdapter,
+    ReplayTransport,
+    RpcRecorder,
+    TransportClient,
+    get_recorder,
+    get_replay_transport,
+)
+from .resilience import (
+    DEFAULT_LATENCY_BUCKETS,
+    DEFAULT_OPERATION_TIMEOUTS,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    RpcMetrics,
+    call_with_resilience,
+    get_circuit_breaker,
+    is_transient_error,
+)
+from .session import (
+    SESSION_CACHE_DIR,
+    SESSION_KINDS,
+    SessionCache,
+    get_session_cache,
+    project_fields,
+)
 from .settings import TransmissionClientSettings, transmission_settings
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import gc
+import hashlib
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+import typing as t
+
+from transmissionpy.core.constants import CACHE_DIR
+
+import msgpack
+from transmission_rpc.torrent import Torrent
+
+log = logging.getLogger(__name__)
+
+TORRENT_CACHE_DIR: str = f"{CACHE_DIR}/torrents"
+## Bump when the cached layout changes, older files are then ignored
+TORRENT_CACHE_VERSION: int = 1
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()[:16]
+
+
+class TorrentListCache:
+    """On-disk cache of the last torrent-get result, shared between CLI invocations.
+
+    Entries are msgpack files keyed by host and requested field set, and are ignored once
+    older than `ttl` seconds. Mutating RPCs should call `invalidate()` for their host.
+    """
+
+    def __init__(self, cache_dir: t.Union[str, Path] = TORRENT_CACHE_DIR, ttl: float = 30.0) -> None:
+        self.cache_dir: Path = Path(cache_dir)
+        self.ttl: float = ttl
+
+    def _path(self, host_key: str, fields: t.Iterable[str] | None = None) -> Path:
+        fields_key: str = ",".join(sorted(set(fields))) if fields else "*"
+
+        return self.cache_dir / f"{_digest(host_key)}_{_digest(fields_key)}.msgpack"
+
+    def get(self, host_key: str, fields: t.Iterable[str] | None = None) -> list[Torrent] | None:
+        """Return the cached torrents, or None on a miss or an expired/unreadable entry."""
+        path: Path = self._path(host_key, fields)
+
+        ## Unpacking creates many small containers; pausing the GC roughly halves load time
+        gc_enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            with open(path, "rb") as f:
+                entry: dict = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            log.warning(f"({type(exc)}) Ignoring unreadable torrent cache '{path}'. Details: {exc}")
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if entry.get("version") != TORRENT_CACHE_VERSION or entry.get("host") != host_key:
+            return None
+
+        age: float = time.time() - entry.get("created", 0)
+        if age > self.ttl:
+            log.debug(f"Torrent cache for '{host_key}' expired {age - self.ttl:.1f}s ago")
+            return None
+
+        log.debug(f"Using [{len(entry['torrents'])}] cached torrent(s) for '{host_key}' ({age:.1f}s old)")
+        return [Torrent(fields=fields) for fields in entry["torrents"]]
+
+    def put(self, host_key: str, torrents: list[Torrent], fields: t.Iterable[str] | None = None) -> None:
+        """Write the torrents' fields to the cache, atomically replacing any existing entry."""
+        path: Path = self._path(host_key, fields)
+        entry: dict = {
+            "version": TORRENT_CACHE_VERSION,
+            "host": host_key,
+            "created": time.time(),
+            "torrents": [torrent.fields for torrent in torrents],
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            ## Write to a temp file & rename, so a concurrent reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(msgpack.packb(entry, use_bin_type=True))
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            log.warning(f"({type(exc)}) Unable to write torrent cache '{path}'. Details: {exc}")
+
+    def invalidate(self, host_key: str | None = None) -> int:
+        """Delete cached entries for a host (or all hosts). Returns the number of files removed."""
+        if not self.cache_dir.exists():
+            return 0
+
+        pattern: str = f"{_digest(host_key)}_*.msgpack" if host_key else "*.msgpack"
+        removed: int = 0
+        for path in self.cache_dir.glob(pattern):
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+        if removed:
+            log.debug(f"Invalidated [{removed}] torrent cache file(s)")
+
+        return removed
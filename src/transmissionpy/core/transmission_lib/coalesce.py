@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+import typing as t
+
+from transmission_rpc.torrent import Torrent
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: t.Any = field(default=None)
+    error: BaseException | None = field(default=None)
+    waiters: int = field(default=0)
+
+
+class SingleFlight:
+    """Share one in-flight call between every caller asking for the same key.
+
+    The first caller for a key runs the function. Callers arriving while it runs wait for,
+    and receive, the same result (or exception). Nothing is cached once the call returns.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[t.Hashable, _Flight] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def do(self, key: t.Hashable, func: t.Callable[[], t.Any]) -> tuple[t.Any, bool]:
+        """Run `func`, or join an identical call already in flight.
+
+        Returns:
+            (tuple[Any, bool]): The result, and `True` if it was shared from another caller's call.
+
+        """
+        with self._lock:
+            flight: _Flight | None = self._flights.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                leader: bool = False
+            else:
+                flight = self._flights[key] = _Flight()
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+
+            return flight.result, True
+
+        try:
+            flight.result = func()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+        return flight.result, False
+
+
+@dataclass
+class _IdBatch:
+    ids: set[int | str] = field(default_factory=set)
+    done: threading.Event = field(default_factory=threading.Event)
+    result: dict[int | str, Torrent] = field(default_factory=dict)
+    error: BaseException | None = field(default=None)
+    requests: int = field(default=0)
+
+
+class IdSetBatcher:
+    """Merge torrent-get requests for different id sets that arrive within `window` seconds.
+
+    The first request opens a batch and waits `window` seconds for others to join. Then one
+    torrent-get is made for the union of all ids, and each caller gets back only the torrents
+    it asked for. The wait is paid even when no other request joins.
+    """
+
+    def __init__(self, window: float = 0.005) -> None:
+        self.window: float = window
+        self._batches: dict[t.Hashable, _IdBatch] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(
+        self,
+        ids: t.Iterable[int | str],
+        fetch: t.Callable[[list[int | str]], list[Torrent]],
+        key: t.Hashable = None,
+        window: float | None = None,
+    ) -> tuple[list[Torrent], bool]:
+        """Return the torrents for `ids`, fetched together with any overlapping requests.
+
+        Params:
+            ids (Iterable[int|str]): Torrent IDs or hashStrings.
+            fetch (Callable): Makes the torrent-get for a list of ids. Only the batch leader calls it.
+            key (Hashable): Only requests with the same key (i.e. the same field set) are merged.
+            window (float): Seconds to wait for other requests, when this request opens the batch.
+
+        Returns:
+            (tuple[list[Torrent], bool]): The torrents, in the order of `ids`, and `True` if the
+                request was merged into another caller's batch.
+
+        """
+        ids = list(ids)
+
+        with self._lock:
+            batch: _IdBatch | None = self._batches.get(key)
+            leader: bool = batch is None
+            if leader:
+                batch = self._batches[key] = _IdBatch()
+            batch.ids.update(ids)
+            batch.requests += 1
+
+        if leader:
+            time.sleep(self.window if window is None else window)
+            ## Close the batch, later requests start a new one
+            with self._lock:
+                self._batches.pop(key, None)
+
+            try:
+                torrents: list[Torrent] = fetch(sorted(batch.ids, key=str))
+                for torrent in torrents:
+                    batch.result[torrent.id] = torrent
+                    batch.result[torrent.hashString] = torrent
+            except BaseException as exc:
+                batch.error = exc
+            finally:
+                batch.done.set()
+
+            if batch.requests > 1:
+                log.debug(f"Merged {batch.requests} torrent-get requests into one call for {len(batch.ids)} id(s)")
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+
+        return [batch.result[i] for i in ids if i in batch.result], not leader
+
+
+## Shared per host, so controllers created by separate threads still coalesce
+_SINGLE_FLIGHTS: dict[str, SingleFlight] = {}
+_ID_BATCHERS: dict[str, IdSetBatcher] = {}
+_REGISTRY_LOCK: threading.Lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    with _REGISTRY_LOCK:
+        if name not in _SINGLE_FLIGHTS:
+            _SINGLE_FLIGHTS[name] = SingleFlight()
+
+        return _SINGLE_FLIGHTS[name]
+
+
+def get_id_batcher(name: str) -> IdSetBatcher:
+    with _REGISTRY_LOCK:
+        if name not in _ID_BATCHERS:
+            _ID_BATCHERS[name] = IdSetBatcher()
+
+        return _ID_BATCHERS[name]
@@ -1,3 +1,25 @@
 from __future__ import annotations
 
-TORRENT_STATES: list[str] = ["check pending", "checking", "downloading", "download pending", "seeding", "seed pending", "stopped"]
\ No newline at end of file
+TORRENT_STATES: list[str] = ["check pending", "checking", "downloading", "download pending", "seeding", "seed pending", "stopped"]
+## Scalar torrent-get fields, cheap to fetch & validate for every torrent. Used by list/count/rm.
+TORRENT_SUMMARY_FIELDS: list[str] = [
+    "id", "hashString", "name", "status", "error", "errorString", "labels",
+    "activityDate", "addedDate", "dateCreated", "doneDate", "editDate", "startDate",
+    "bandwidthPriority", "comment", "corruptEver", "creator", "desiredAvailable",
+    "downloadDir", "downloadLimit", "downloadLimited", "downloadedEver", "eta", "etaIdle",
+    "haveUnchecked", "haveValid", "honorsSessionLimits", "isFinished", "isPrivate", "isStalled",
+    "leftUntilDone", "magnetLink", "manualAnnounceTime", "maxConnectedPeers", "metadataPercentComplete",
+    "peer-limit", "peersConnected", "peersFrom", "peersGettingFromUs", "peersSendingToUs",
+    "percentDone", "pieceCount", "pieceSize", "queuePosition", "rateDownload", "rateUpload",
+    "recheckProgress", "secondsDownloading", "secondsSeeding", "seedIdleLimit", "seedIdleMode",
+    "seedRatioLimit", "seedRatioMode", "sizeWhenDone", "torrentFile", "totalSize",
+    "uploadLimit", "uploadLimited", "uploadRatio", "uploadedEver",
+]
+## Max torrent ids sent in one start/stop/set/remove RPC
+DEFAULT_ID_CHUNK_SIZE: int = 500
+
+## Per-file, per-tracker & per-piece fields. Large for season packs, so only fetched on demand.
+TORRENT_DETAIL_FIELDS: list[str] = [
+    "id", "hashString", "files", "fileStats", "priorities", "wanted",
+    "trackers", "trackerStats", "pieces", "pieceCount", "pieceSize",
+]
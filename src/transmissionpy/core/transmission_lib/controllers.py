@@ -4,7 +4,33 @@ from contextlib import AbstractContextManager
 import logging
 from pathlib import Path
 import typing as t
-
+import warnings
+
+from transmissionpy.core.utils.profile_utils import profile_stage, record_objects
+
+from .cache import TorrentListCache
+from .coalesce import IdSetBatcher, SingleFlight, get_id_batcher, get_single_flight
+from .constants import DEFAULT_ID_CHUNK_SIZE, TORRENT_DETAIL_FIELDS
+from .details import TorrentDetailsMemo, detail_stamp, get_details_memo
+from .replay import (
+    CountingAdapter,
+    RecordingAdapter,
+    ReplayAdapter,
+    TransportClient,
+    get_recorder,
+    get_replay_transport,
+)
+from .resilience import (
+    DEFAULT_OPERATION_TIMEOUTS,
+    CircuitBreaker,
+    RetryPolicy,
+    RpcMetrics,
+    call_with_resilience,
+    get_circuit_breaker,
+)
+from .session import SessionCache, project_fields
+
+from requests.adapters import BaseAdapter, HTTPAdapter
 from transmission_rpc.client import Client
 from transmission_rpc.torrent import Torrent
 
@@ -21,6 +47,15 @@ class TransmissionRPCController(AbstractContextManager):
         path: str = None,
         protocol: str = None,
         timeout: int | float | tuple[int | float, int | float] | None = None,
+        operation_timeouts: dict[str, float] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        merge_window: float = 0.0,
+        cache: TorrentListCache | None = None,
+        session_cache: SessionCache | None = None,
+        record_path: str | Path | None = None,
+        replay_path: str | Path | None = None,
+        replay_speed: float = 0.0,
     ) -> None:
         self.host: str | None = host
         self.ip: str | None = ip
@@ -31,15 +66,67 @@ class TransmissionRPCController(AbstractContextManager):
         self.protocol: str | None = protocol
         self.timeout: int | float | tuple[int | float, int | float] | None = timeout
 
-        self.client: Client | None = None
+        self.host_key: str = f"{host or ip}:{port}{path or ''}"
+
+        ## Per-RPC timeout budgets. An explicit `timeout` caps every operation's budget.
+        self.operation_timeouts: dict[str, float] = {**DEFAULT_OPERATION_TIMEOUTS, **(operation_timeouts or {})}
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker: CircuitBreaker = (
+            circuit_breaker if circuit_breaker is not None else get_circuit_breaker(self.host_key)
+        )
+        self.metrics: RpcMetrics = RpcMetrics()
+
+        ## Concurrent identical torrent-gets share one RPC. Requests for different id sets made
+        #  within merge_window seconds are merged into one call (0 disables merging).
+        self.merge_window: float = merge_window
+        self._single_flight: SingleFlight = get_single_flight(self.host_key)
+        self._id_batcher: IdSetBatcher = get_id_batcher(self.host_key)
+        ## File/tracker/piece details fetched on demand, memoized per hashString
+        self._details: TorrentDetailsMemo = get_details_memo(self.host_key)
+        ## Record RPC traffic to a file, or answer RPCs from a recording instead of a daemon
+        self.record_path: str | Path | None = record_path
+        self.replay_path: str | Path | None = replay_path
+        self.replay_speed: float = replay_speed
+
+        ## Optional on-disk cache for get_all_torrents(), shared between processes.
+        #  Not used while recording/replaying, so every read goes through the transport.
+        self.cache: TorrentListCache | None = None if (record_path or replay_path) else cache
+        ## TTL cache for get_session() & get_session_stats(), cleared by set_session()
+        self.session_cache: SessionCache | None = None if (record_path or replay_path) else session_cache
+
+        self._client: Client | None = None
         
         self.logger: logging.Logger = log.getChild("TransmissionRPCController")
 
     def __enter__(self) -> "TransmissionRPCController":
-        self.client = self._create_client()
-
+        ## The client connects on first use, so cache hits never touch the network
         return self
 
+    @property
+    def client(self) -> Client:
+        if self._client is None:
+            self._client = self._create_client()
+
+        return self._client
+
+    @client.setter
+    def client(self, client: Client | None) -> None:
+        self._client = client
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    def invalidate_cache(self) -> None:
+        """Drop cached torrent lists for this host, after a call that changed torrents."""
+        if self.cache is not None:
+            self.cache.invalidate(self.host_key)
+
+    def invalidate_session(self) -> None:
+        """Drop cached session values for this host, after a call that changed session settings."""
+        if self.session_cache is not None:
+            self.session_cache.invalidate(self.host_key)
+
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         if traceback:
             pass
@@ -48,6 +135,42 @@ class TransmissionRPCController(AbstractContextManager):
             msg = f"Unhandled exception in TransmissionRPCController: {exc_value}"
             self.logger.error(msg)
 
+    def _timeout_for(self, operation: str) -> int | float | tuple[int | float, int | float] | None:
+        budget: float | None = self.operation_timeouts.get(operation)
+
+        if budget is None:
+            return self.timeout
+        if isinstance(self.timeout, (int, float)):
+            return min(budget, self.timeout)
+
+        return budget
+
+    def _call(self, operation: str, func: t.Callable[..., t.Any], *args: t.Any, idempotent: bool = False, **kwargs: t.Any) -> t.Any:
+        """Run an RPC with its timeout budget, through the host's circuit breaker.
+
+        Idempotent calls are retried with exponential backoff on transient errors.
+        """
+        with profile_stage(f"rpc {operation}"):
+            result = call_with_resilience(
+                operation,
+                func,
+                *args,
+                breaker=self.circuit_breaker,
+                retry_policy=self.retry_policy,
+                metrics=self.metrics,
+                idempotent=idempotent,
+                timeout=self._timeout_for(operation),
+                **kwargs,
+            )
+            if isinstance(result, list):
+                record_objects(len(result))
+
+        return result
+
+    def get_metrics(self) -> dict[str, t.Any]:
+        """Return per-operation latency/retry counters & the circuit breaker state."""
+        return {"circuit": self.circuit_breaker.state, "operations": self.metrics.snapshot()}
+
     def _create_client(self) -> Client:
         """Create and return a configured transmission_rpc.Client object."""
         _conf: dict[str, t.Union[str, int]] = {
@@ -62,8 +185,27 @@ class TransmissionRPCController(AbstractContextManager):
         # Remove keys with None values to avoid passing them to Client
         _conf = {k: v for k, v in _conf.items() if v is not None}
 
+        if self.replay_path:
+            ## Nothing is sent over the network, but requests still needs a valid URL
+            _conf["host"] = _conf.get("host") or "replay.invalid"
+            adapter: BaseAdapter = ReplayAdapter(get_replay_transport(self.replay_path, speed=self.replay_speed))
+        elif self.record_path:
+            adapter = RecordingAdapter(get_recorder(self.record_path))
+        else:
+            adapter = HTTPAdapter()
+        ## Count response sizes for --profile
+        _conf["adapter"] = CountingAdapter(adapter)
+
         try:
-            client = Client(**_conf)
+            ## Client() calls session-get, so creating it gets the same retries as other reads
+            client = self._call("session-get", lambda timeout: TransportClient(timeout=timeout, **_conf), idempotent=True)
+            ## Keep the session-get Client() just made, so a first get_session() doesn't repeat it
+            if self.session_cache is not None:
+                ## raw_session is marked deprecated in favour of get_session(), which would repeat the RPC
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", DeprecationWarning)
+                    raw_session: dict[str, t.Any] = dict(client.raw_session)
+                self.session_cache.put(self.host_key, "session-get", raw_session)
         except Exception as exc:
             raise Exception(
                 f"Unhandled exception getting Transmission RPC Client. Details: {exc}"
@@ -78,9 +220,8 @@ class TransmissionRPCController(AbstractContextManager):
         move: bool = False,
     ) -> bool:
         try:
-            self.client.move_torrent_data(
-                ids=ids, location=dest, timeout=self.timeout, move=move
-            )
+            self._call("torrent-set-location", self.client.move_torrent_data, ids=ids, location=dest, move=move)
+            self.invalidate_cache()
 
             return True
         except Exception as exc:
@@ -93,28 +234,61 @@ class TransmissionRPCController(AbstractContextManager):
 
     def get_client(self) -> Client:
         """Return the Transmission RPC client."""
-        if self.client is None:
-            self.client = self._create_client()
-
         return self.client
 
-    def get_all_torrents(self) -> list[Torrent]:
+    def _fields_key(self, arguments: list[str] | None) -> tuple[str, ...] | None:
+        return tuple(sorted(set(arguments))) if arguments else None
+
+    def get_all_torrents(self, arguments: list[str] | None = None, fresh: bool = False) -> list[Torrent]:
+        """Return all torrents, with all fields or only the fields in `arguments`.
+
+        Concurrent calls for the same field set share a single torrent-get. The returned list
+        is a copy, but the Torrent objects in it are shared with the other callers.
+
+        When the controller has a cache, a recent enough cached list is returned instead of
+        calling Transmission, unless `fresh=True`. Fetched lists are always written to the cache.
+        """
+        key = ("all", self._fields_key(arguments))
+
+        if self.cache is not None and not fresh:
+            with profile_stage("cache read"):
+                cached: list[Torrent] | None = self.cache.get(self.host_key, arguments)
+            if cached is not None:
+                return cached
+
         try:
-            _torrents: list[Torrent] = self.client.get_torrents()
+            _torrents, shared = self._single_flight.do(
+                key, lambda: self._call("torrent-get", self.client.get_torrents, arguments=arguments, idempotent=True)
+            )
+            if shared:
+                self.metrics.record_coalesced("torrent-get")
+            elif self.cache is not None:
+                self.cache.put(self.host_key, _torrents, arguments)
 
-            return _torrents
+            return list(_torrents)
         except Exception as exc:
             msg = Exception(f"Unhandled exception getting all torrents. Details: {exc}")
             self.logger.error(msg)
 
             raise exc
 
-    def get_multiple_torrents(self, ids: list[str | int] = None) -> list[Torrent]:
+    def _get_torrents_by_ids(self, ids: list[str | int], arguments: list[str] | None = None) -> list[Torrent]:
+        def fetch(batch_ids: list[str | int]) -> list[Torrent]:
+            return self._call("torrent-get", self.client.get_torrents, ids=batch_ids, arguments=arguments, idempotent=True)
+
+        if self.merge_window <= 0:
+            return fetch(ids)
+
+        _torrents, merged = self._id_batcher.get(ids, fetch, key=self._fields_key(arguments), window=self.merge_window)
+        if merged:
+            self.metrics.record_coalesced("torrent-get")
+
+        return _torrents
+
+    def get_multiple_torrents(self, ids: list[str | int] = None, arguments: list[str] | None = None) -> list[Torrent]:
 
         try:
-            _torrents: list[Torrent] = self.client.get_torrents(
-                ids=ids, timeout=self.timeout
-            )
+            _torrents: list[Torrent] = self._get_torrents_by_ids(ids=list(ids), arguments=arguments)
 
             return _torrents
         except Exception as exc:
@@ -123,11 +297,68 @@ class TransmissionRPCController(AbstractContextManager):
 
             raise exc
 
+    def get_torrent_details(self, torrents: t.Iterable[Torrent | int | str], fresh: bool = False) -> dict[str, Torrent]:
+        """Return the file, tracker & piece fields for torrents, keyed by hashString.
+
+        Details memoized for a torrent are reused while its summary (activity date, progress)
+        is unchanged. Everything else is fetched in one torrent-get, for just those ids.
+
+        Params:
+            torrents (Iterable[Torrent|int|str]): Summary `Torrent`s, or torrent IDs / hashStrings.
+                Only summaries can reuse memoized details, IDs are always fetched.
+            fresh (bool): Ignore memoized details and fetch all of them.
+
+        Returns:
+            (dict[str, Torrent]): Torrents with only `TORRENT_DETAIL_FIELDS`, by hashString.
+
+        """
+        found: dict[str, Torrent] = {}
+        ## id (or hashString) to fetch -> summary stamp it was requested with
+        missing: dict[int | str, tuple | None] = {}
+
+        for item in torrents:
+            if isinstance(item, Torrent):
+                hash_string: str | None = item.fields.get("hashString")
+                torrent_id: int | str | None = item.fields.get("id", hash_string)
+                stamp: tuple | None = detail_stamp(item)
+            else:
+                ## No summary to tell whether memoized details are stale
+                torrent_id, hash_string, stamp = item, None, None
+
+            if hash_string and stamp is not None and not fresh:
+                cached: Torrent | None = self._details.get(hash_string, stamp)
+                if cached is not None:
+                    found[hash_string] = cached
+                    continue
+
+            missing[torrent_id] = stamp
+
+        if not missing:
+            return found
+
+        try:
+            fetched: list[Torrent] = self._get_torrents_by_ids(ids=list(missing), arguments=TORRENT_DETAIL_FIELDS)
+        except Exception as exc:
+            msg = Exception(f"Unhandled exception getting details for {len(missing)} torrent(s). Details: {exc}")
+            self.logger.error(msg)
+
+            raise exc
+
+        for torrent in fetched:
+            self._details.put(torrent, missing.get(torrent.fields["id"], missing.get(torrent.fields["hashString"])))
+            found[torrent.fields["hashString"]] = torrent
+
+        return found
+
     def get_single_torrent(self, torrent_id: str | int = None):
         try:
-            _torrent: Torrent = self.client.get_torrent(
-                torrent_id=torrent_id, timeout=self.timeout
-            )
+            if self.merge_window > 0:
+                _found: list[Torrent] = self._get_torrents_by_ids(ids=[torrent_id])
+                if not _found:
+                    raise KeyError("Torrent not found in result")
+                _torrent: Torrent = _found[0]
+            else:
+                _torrent = self._call("torrent-get", self.client.get_torrent, torrent_id=torrent_id, idempotent=True)
 
             return _torrent
         except Exception as exc:
@@ -188,7 +419,7 @@ class TransmissionRPCController(AbstractContextManager):
 
     def get_free_space(self, remote_path: str = "/") -> int | None:
         try:
-            free_space: int | None = self.client.free_space(path=remote_path)
+            free_space: int | None = self._call("free-space", self.client.free_space, path=remote_path, idempotent=True)
 
             return free_space
         except Exception as exc:
@@ -199,16 +430,107 @@ class TransmissionRPCController(AbstractContextManager):
 
             raise exc
 
+    def _session_values(self, kind: str, fetch: t.Callable[[], dict[str, t.Any]], fresh: bool = False) -> dict[str, t.Any]:
+        if self.session_cache is not None and not fresh:
+            cached: dict[str, t.Any] | None = self.session_cache.get(self.host_key, kind)
+            if cached is not None:
+                return cached
+
+        ## Concurrent callers share one RPC, and only the caller that made it writes the cache
+        values, shared = self._single_flight.do((kind,), fetch)
+        if not shared and self.session_cache is not None:
+            self.session_cache.put(self.host_key, kind, values)
+
+        return values
+
+    def get_session(self, fields: t.Iterable[str] | None = None, fresh: bool = False) -> dict[str, t.Any]:
+        """Return session settings (session-get), i.e. download-dir, speed limits & queue sizes.
+
+        With a session cache, values younger than its TTL are returned without calling Transmission,
+        unless `fresh=True`.
+
+        Params:
+            fields (Iterable[str]): Only return these keys (`download_dir` or `download-dir`). None returns all.
+            fresh (bool): Skip the cache.
+
+        Returns:
+            (dict[str, Any]): Session values, keyed like the RPC response.
+
+        """
+        def fetch() -> dict[str, t.Any]:
+            if not self.connected and self.session_cache is not None:
+                ## Creating the client calls session-get and caches the result
+                self.client
+                seeded: dict[str, t.Any] | None = self.session_cache.get(self.host_key, "session-get")
+                if seeded is not None:
+                    return seeded
+
+            return dict(self._call("session-get", self.client.get_session, idempotent=True).fields)
+
+        try:
+            values: dict[str, t.Any] = self._session_values("session-get", fetch, fresh=fresh)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error getting Transmission session. Details: {exc}"
+            self.logger.error(msg)
+
+            raise exc
+
+        return project_fields(values, fields)
+
+    def get_session_stats(self, fields: t.Iterable[str] | None = None, fresh: bool = False) -> dict[str, t.Any]:
+        """Return session statistics (session-stats), i.e. torrent counts, current speeds & cumulative totals.
+
+        Cached like `get_session()`.
+
+        Params:
+            fields (Iterable[str]): Only return these keys. None returns all.
+            fresh (bool): Skip the cache.
+
+        Returns:
+            (dict[str, Any]): Session statistics, keyed like the RPC response.
+
+        """
+        try:
+            values: dict[str, t.Any] = self._session_values(
+                "session-stats",
+                lambda: dict(self._call("session-stats", self.client.session_stats, idempotent=True).fields),
+                fresh=fresh,
+            )
+        except Exception as exc:
+            msg = f"({type(exc)}) Error getting Transmission session stats. Details: {exc}"
+            self.logger.error(msg)
+
+            raise exc
+
+        return project_fields(values, fields)
+
+    def set_session(self, **changes: t.Any) -> None:
+        """Change session settings, with `Client.set_session()` keyword arguments (i.e. `speed_limit_down=500`).
+
+        Cached session values are dropped afterwards, so the next read sees the change.
+        """
+        try:
+            self._call("session-set", self.client.set_session, **changes)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error setting Transmission session. Details: {exc}"
+            self.logger.error(msg)
+
+            raise exc
+        finally:
+            ## A failed call may still have been applied
+            self.invalidate_session()
+
     def get_recently_active(self) -> t.Tuple[t.List[Torrent] | t.List[int]]:
-        recently_active: t.Tuple[t.List[Torrent] | t.List[int]] = (
-            self.client.get_recently_active_torrents()
+        recently_active: t.Tuple[t.List[Torrent] | t.List[int]] = self._call(
+            "torrent-get", self.client.get_recently_active_torrents, idempotent=True
         )
 
         return recently_active
     
     def start_torrent(self, torrent: Torrent):
         try:
-            self.client.start_torrent(torrent.id)
+            self._call("torrent-start", self.client.start_torrent, torrent.id)
+            self.invalidate_cache()
         except Exception as exc:
             msg = f"({type(exc)}) Error starting torrent '{torrent.name}'. Details: {exc}"
             log.error(msg)
@@ -217,7 +539,8 @@ class TransmissionRPCController(AbstractContextManager):
         
     def start_torrent_by_id(self, torrent_id: int):
         try:
-            self.client.start_torrent(torrent_id)
+            self._call("torrent-start", self.client.start_torrent, torrent_id)
+            self.invalidate_cache()
         except Exception as exc:
             msg = f"({type(exc)}) Error starting torrent '{torrent_id}'. Details: {exc}"
             log.error(msg)
@@ -226,7 +549,8 @@ class TransmissionRPCController(AbstractContextManager):
         
     def stop_torrent(self, torrent: Torrent):
         try:
-            self.client.stop_torrent(torrent.id)
+            self._call("torrent-stop", self.client.stop_torrent, torrent.id)
+            self.invalidate_cache()
         except Exception as exc:
             msg = f"({type(exc)}) Error stopping torrent '{torrent.name}'. Details: {exc}"
             log.error(msg)
@@ -235,13 +559,100 @@ class TransmissionRPCController(AbstractContextManager):
         
     def stop_torrent_by_id(self, torrent_id: int):
         try:
-            self.client.stop_torrent(torrent_id)
+            self._call("torrent-stop", self.client.stop_torrent, torrent_id)
+            self.invalidate_cache()
         except Exception as exc:
             msg = f"({type(exc)}) Error stopping torrent '{torrent_id}'. Details: {exc}"
             log.error(msg)
             
             raise exc
         
+    def _call_for_id_chunks(self, operation: str, func: t.Callable[..., t.Any], torrent_ids: t.Iterable[int | str], chunk_size: int = DEFAULT_ID_CHUNK_SIZE, idempotent: bool = False, **kwargs: t.Any) -> int:
+        """Call an RPC that takes a list of ids once per `chunk_size` ids.
+
+        Returns:
+            (int): Number of RPCs made.
+
+        """
+        torrent_ids = list(torrent_ids)
+        chunk_size = max(1, chunk_size)
+        calls: int = 0
+
+        try:
+            for start in range(0, len(torrent_ids), chunk_size):
+                self._call(operation, func, torrent_ids[start:start + chunk_size], idempotent=idempotent, **kwargs)
+                calls += 1
+        finally:
+            if calls:
+                self.invalidate_cache()
+
+        return calls
+
+    def start_torrents(self, torrent_ids: t.Iterable[int | str], bypass_queue: bool = False, chunk_size: int = DEFAULT_ID_CHUNK_SIZE) -> int:
+        """Start many torrents with one torrent-start per `chunk_size` ids. Returns the number of RPCs made."""
+        try:
+            return self._call_for_id_chunks("torrent-start", self.client.start_torrent, torrent_ids, chunk_size=chunk_size, idempotent=True, bypass_queue=bypass_queue)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error starting torrents. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    def stop_torrents(self, torrent_ids: t.Iterable[int | str], chunk_size: int = DEFAULT_ID_CHUNK_SIZE) -> int:
+        """Stop many torrents with one torrent-stop per `chunk_size` ids. Returns the number of RPCs made."""
+        try:
+            return self._call_for_id_chunks("torrent-stop", self.client.stop_torrent, torrent_ids, chunk_size=chunk_size, idempotent=True)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error stopping torrents. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    def verify_torrents(self, torrent_ids: t.Iterable[int | str], chunk_size: int = DEFAULT_ID_CHUNK_SIZE) -> int:
+        """Queue many torrents for a hash check with one torrent-verify per `chunk_size` ids. Returns the number of RPCs made."""
+        try:
+            return self._call_for_id_chunks("torrent-verify", self.client.verify_torrent, torrent_ids, chunk_size=chunk_size, idempotent=True)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error verifying torrents. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    def reannounce_torrents(self, torrent_ids: t.Iterable[int | str], chunk_size: int = DEFAULT_ID_CHUNK_SIZE) -> int:
+        """Ask trackers for more peers with one torrent-reannounce per `chunk_size` ids. Returns the number of RPCs made."""
+        try:
+            return self._call_for_id_chunks("torrent-reannounce", self.client.reannounce_torrent, torrent_ids, chunk_size=chunk_size, idempotent=True)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error reannouncing torrents. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    def set_torrents(self, torrent_ids: t.Iterable[int | str], chunk_size: int = DEFAULT_ID_CHUNK_SIZE, **changes: t.Any) -> int:
+        """Apply the same torrent-set `changes` (`Client.change_torrent()` keyword arguments, i.e. `labels=[...]`) to many torrents.
+
+        Returns:
+            (int): Number of RPCs made.
+
+        """
+        try:
+            return self._call_for_id_chunks("torrent-set", self.client.change_torrent, torrent_ids, chunk_size=chunk_size, idempotent=True, **changes)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error changing torrents ({', '.join(changes)}). Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    def delete_torrents(self, torrent_ids: t.Iterable[int | str], remove_files: bool = False, chunk_size: int = DEFAULT_ID_CHUNK_SIZE) -> int:
+        """Remove many torrents with one torrent-remove per `chunk_size` ids. Returns the number of RPCs made."""
+        try:
+            return self._call_for_id_chunks("torrent-remove", self.client.remove_torrent, torrent_ids, chunk_size=chunk_size, delete_data=remove_files)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error deleting torrents. Details: {exc}"
+            self.logger.error(msg)
+
+            raise exc
+
     def delete_torrent(self, torrent: Torrent, remove_files: bool = False) -> bool:
         """Delete a torrent by passing the Torrent object."""
         try:
@@ -263,14 +674,12 @@ class TransmissionRPCController(AbstractContextManager):
 
             # Assuming `self.client.remove_torrent()` is the method to delete torrents
             # If 'remove_files' is True, pass that flag to remove the data
-            result = self.client.remove_torrent(torrent_id, delete_data=remove_files)
-            
-            if result:
-                self.logger.info(f"Successfully deleted torrent with ID '{torrent_id}'")
-                return True
-            else:
-                self.logger.error(f"Failed to delete torrent with ID '{torrent_id}'")
-                return False
+            ## remove_torrent() returns None, failures are raised as TransmissionError
+            self._call("torrent-remove", self.client.remove_torrent, torrent_id, delete_data=remove_files)
+            self.invalidate_cache()
+
+            self.logger.info(f"Successfully deleted torrent with ID '{torrent_id}'")
+            return True
         except Exception as exc:
             msg = f"({type(exc)}) Error deleting torrent with ID '{torrent_id}'. Details: {exc}"
             self.logger.error(msg)
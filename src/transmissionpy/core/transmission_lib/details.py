@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+import threading
+import typing as t
+
+from transmission_rpc.torrent import Torrent
+
+log = logging.getLogger(__name__)
+
+## Summary fields that change whenever a torrent's files, pieces or trackers do. A memoized
+#  details entry is reused only while these still match the caller's summary torrent.
+DETAIL_STAMP_FIELDS: tuple[str, ...] = ("activityDate", "editDate", "percentDone", "haveValid")
+
+
+def detail_stamp(torrent: Torrent) -> tuple | None:
+    """Return the staleness stamp of a summary torrent, or None if it has none of the stamp fields."""
+    fields: dict = torrent.fields
+    if not any(field in fields for field in DETAIL_STAMP_FIELDS):
+        return None
+
+    return tuple(fields.get(field) for field in DETAIL_STAMP_FIELDS)
+
+
+class TorrentDetailsMemo:
+    """Least-recently-used store of per-torrent detail fields (files, trackers, pieces), keyed by hashString.
+
+    Entries remember the summary stamp they were fetched for, so a caller holding a newer
+    summary of the same torrent gets a miss instead of stale file progress. Without a stamp
+    there is no way to tell an entry is stale, so unstamped lookups always miss and unstamped
+    torrents are not stored.
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: OrderedDict[str, tuple[tuple, Torrent]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, hash_string: str, stamp: tuple | None = None) -> Torrent | None:
+        with self._lock:
+            entry: tuple[tuple, Torrent] | None = self._entries.get(hash_string)
+            if entry is None or stamp is None or entry[0] != stamp:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(hash_string)
+            self.hits += 1
+
+            return entry[1]
+
+    def put(self, torrent: Torrent, stamp: tuple | None = None) -> None:
+        if stamp is None:
+            return
+
+        hash_string: str = torrent.fields["hashString"]
+
+        with self._lock:
+            self._entries[hash_string] = (stamp, torrent)
+            self._entries.move_to_end(hash_string)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, hash_strings: t.Iterable[str]) -> None:
+        with self._lock:
+            for hash_string in hash_strings:
+                self._entries.pop(hash_string, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+## Shared per host, like the request coalescers
+_MEMOS: dict[str, TorrentDetailsMemo] = {}
+_REGISTRY_LOCK: threading.Lock = threading.Lock()
+
+
+def get_details_memo(name: str) -> TorrentDetailsMemo:
+    with _REGISTRY_LOCK:
+        if name not in _MEMOS:
+            _MEMOS[name] = TorrentDetailsMemo()
+
+        return _MEMOS[name]
@@ -3,7 +3,10 @@ from __future__ import annotations
 import random
 import typing as t
 
+from .cache import TorrentListCache
 from .controllers import TransmissionRPCController
+from .resilience import RetryPolicy, get_circuit_breaker
+from .session import get_session_cache
 from .settings import TRANSMISSION_SETTINGS, TransmissionClientSettings
 
 from dynaconf import LazySettings
@@ -60,8 +63,13 @@ def extract_fields(
     return field_objects
 
 
-def prepare_torrent_dict(torrent: Torrent = None) -> dict:
-    """Return a dict with only the values/fields I care about from a Torrent."""
+def prepare_torrent_dict(torrent: Torrent = None, details: Torrent | None = None) -> dict:
+    """Return a dict with only the values/fields I care about from a Torrent.
+
+    Files & trackers are only included when they were fetched, either on `torrent` itself or
+    on `details` (from `TransmissionRPCController.get_torrent_details()`). A summary torrent
+    without details is not expanded, so no extra RPC or per-file work happens here.
+    """
     if not torrent:
         raise ValueError("Missing Torrent value")
 
@@ -73,6 +81,12 @@ def prepare_torrent_dict(torrent: Torrent = None) -> dict:
         )
         pass
 
+    ## Detail fields come from whichever torrent has them, and are each extracted once
+    source: Torrent = details if details is not None else torrent
+    detail_fields: dict = source.fields
+    trackers: list[dict] = extract_fields(source.trackers) if detail_fields.get("trackers") else []
+    tracker_stats: list[dict] = extract_fields(source.tracker_stats) if detail_fields.get("trackerStats") else []
+
     torrent_dict = {
         "id": torrent.id,
         "name": torrent.name,
@@ -99,7 +113,7 @@ def prepare_torrent_dict(torrent: Torrent = None) -> dict:
         # "file_stats": torrent.file_stats,
         # "file_stats": extract_fields(torrent.file_stats),
         # "files": torrent.files(),
-        "files": torrent.files(),
+        "files": source.get_files() if "files" in detail_fields else [],
         "hashString": torrent.hashString,
         "have_unchecked": torrent.have_unchecked,
         "have_valid": torrent.have_valid,
@@ -125,9 +139,9 @@ def prepare_torrent_dict(torrent: Torrent = None) -> dict:
         "torrent_file": torrent.torrent_file,
         "total_size": torrent.total_size,
         # "tracker_stats": torrent.tracker_stats,
-        "tracker_stats": extract_fields(torrent.trackers),
+        "tracker_stats": tracker_stats,
         # "trackers": torrent.trackers,
-        "trackers": extract_fields(torrent.trackers),
+        "trackers": trackers,
         "upload_limit": torrent.upload_limit,
         "upload_limited": torrent.upload_limited,
         "upload_ratio": torrent.upload_ratio,
@@ -171,8 +185,31 @@ def get_transmission_controller(
             "protocol": protocol,
         }
         
+    if transmission_settings:
+        _resilience: dict[str, t.Any] = {
+            "timeout": transmission_settings.timeout,
+            "retry_policy": RetryPolicy(max_attempts=max(1, transmission_settings.max_retries)),
+            "circuit_breaker": get_circuit_breaker(
+                f"{_conf['host']}:{_conf['port']}{_conf['path']}",
+                failure_threshold=transmission_settings.circuit_failure_threshold,
+                reset_seconds=transmission_settings.circuit_reset_seconds,
+            ),
+            "merge_window": transmission_settings.merge_window,
+            "cache": TorrentListCache(ttl=transmission_settings.cache_ttl) if transmission_settings.cache_ttl else None,
+            "session_cache": (
+                get_session_cache(f"{_conf['host']}:{_conf['port']}{_conf['path']}", ttl=transmission_settings.session_cache_ttl)
+                if transmission_settings.session_cache_ttl
+                else None
+            ),
+            "record_path": transmission_settings.record_path,
+            "replay_path": transmission_settings.replay_path,
+            "replay_speed": transmission_settings.replay_speed,
+        }
+    else:
+        _resilience = {}
+
     try:
-        _controller = TransmissionRPCController(host=_conf["host"], port=_conf["port"], username=_conf["username"], password=_conf["password"], path=_conf["path"], protocol=_conf["protocol"])
+        _controller = TransmissionRPCController(host=_conf["host"], port=_conf["port"], username=_conf["username"], password=_conf["password"], path=_conf["path"], protocol=_conf["protocol"], **_resilience)
         
         return _controller
     except Exception as exc:
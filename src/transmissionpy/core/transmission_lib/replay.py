@@ -0,0 +1,287 @@
+"""Record Transmission RPC traffic to a file, and replay it without a Transmission daemon.
+
+Recordings are gzip-compressed JSON lines: a header line, then one line per request/response
+pair with the request body, response status & body, and how long the call took. Recording &
+replay both happen at the HTTP transport (a `requests` adapter), so everything above it
+(retries, coalescing, pydantic validation, DataFrames, rendering) runs exactly as it does
+against a live daemon.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import defaultdict, deque
+import gzip
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+import typing as t
+
+from transmissionpy.core.utils.profile_utils import record_bytes
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from transmission_rpc.client import Client
+
+log = logging.getLogger(__name__)
+
+RECORDING_VERSION: int = 1
+_SESSION_HEADER: str = "X-Transmission-Session-Id"
+
+
+def request_key(body: bytes | str | None) -> str:
+    """Return a canonical key for an RPC request body, used to match replayed responses."""
+    if not body:
+        return ""
+
+    try:
+        query: dict = json.loads(body)
+    except ValueError:
+        return body.decode("utf-8", "replace") if isinstance(body, bytes) else body
+
+    arguments: dict = dict(query.get("arguments") or {})
+    ## transmission_rpc builds 'fields' from a set, so its order changes with each process's hash seed
+    for name in ("fields", "ids"):
+        if isinstance(arguments.get(name), list):
+            arguments[name] = sorted(arguments[name], key=str)
+
+    return json.dumps({"method": query.get("method"), "arguments": arguments}, sort_keys=True)
+
+
+class RpcRecorder:
+    """Append request/response pairs to a gzip-compressed JSON lines file. Thread-safe."""
+
+    def __init__(self, path: t.Union[str, Path]) -> None:
+        self.path: Path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file: t.TextIO = gzip.open(self.path, "wt", encoding="utf-8")
+        self._lock: threading.Lock = threading.Lock()
+        self._start: float = time.perf_counter()
+        self.exchanges: int = 0
+
+        self._write({"version": RECORDING_VERSION, "created": time.time()})
+        log.info(f"Recording Transmission RPC traffic to '{self.path}'")
+
+    def _write(self, entry: dict) -> None:
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def record(self, request_body: bytes | str | None, status: int, response_body: str, elapsed: float, started: float) -> None:
+        if isinstance(request_body, bytes):
+            request_body = request_body.decode("utf-8", "replace")
+
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write(
+                {
+                    "offset": round(started - self._start, 6),
+                    "elapsed": round(elapsed, 6),
+                    "request": request_body,
+                    "status": status,
+                    "body": response_body,
+                }
+            )
+            self.exchanges += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+                log.info(f"Recorded [{self.exchanges}] RPC exchange(s) to '{self.path}'")
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Send requests over HTTP as usual, and record every non-409 exchange."""
+
+    def __init__(self, recorder: RpcRecorder, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.recorder: RpcRecorder = recorder
+
+    def send(self, request: requests.PreparedRequest, *args: t.Any, **kwargs: t.Any) -> requests.Response:
+        started: float = time.perf_counter()
+        response: requests.Response = super().send(request, *args, **kwargs)
+        elapsed: float = time.perf_counter() - started
+
+        ## 409s are the session-id handshake, replay answers every request directly
+        if response.status_code != 409:
+            self.recorder.record(request.body, response.status_code, response.text, elapsed, started)
+
+        return response
+
+
+class ReplayTransport:
+    """Responses from a recording, grouped by request.
+
+    Identical requests are answered in recorded order. Once a request's recorded responses
+    run out, the last one is repeated.
+    """
+
+    def __init__(self, path: t.Union[str, Path], speed: float = 0.0) -> None:
+        self.path: Path = Path(path)
+        ## 0 = as fast as possible, 1.0 = recorded latency, 2.0 = twice as fast as recorded
+        self.speed: float = speed
+
+        self._responses: dict[str, deque[dict]] = defaultdict(deque)
+        self._last: dict[str, dict] = {}
+        self._by_method: dict[str, dict] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self.exchanges: int = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"RPC recording not found: '{self.path}'")
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            header: dict = json.loads(f.readline())
+            if header.get("version") != RECORDING_VERSION:
+                raise ValueError(f"Unsupported RPC recording version: {header.get('version')}")
+
+            for line in f:
+                entry: dict = json.loads(line)
+                key: str = request_key(entry["request"])
+                self._responses[key].append(entry)
+
+                method: str | None = json.loads(entry["request"]).get("method") if entry["request"] else None
+                if method:
+                    self._by_method[method] = entry
+                self.exchanges += 1
+
+        log.info(f"Loaded [{self.exchanges}] recorded RPC exchange(s) from '{self.path}'")
+
+    def next_response(self, request_body: bytes | str | None) -> dict | None:
+        key: str = request_key(request_body)
+
+        with self._lock:
+            queue: deque[dict] | None = self._responses.get(key)
+            if queue:
+                entry: dict = queue.popleft()
+                self._last[key] = entry
+                return entry
+            if key in self._last:
+                return self._last[key]
+
+        ## session-get is sent with different arguments by different callers, any recorded one will do
+        try:
+            method: str | None = json.loads(request_body).get("method") if request_body else None
+        except ValueError:
+            method = None
+
+        return self._by_method.get(method) if method == "session-get" else None
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answer requests from a `ReplayTransport`, without touching the network."""
+
+    def __init__(self, transport: ReplayTransport) -> None:
+        super().__init__()
+        self.transport: ReplayTransport = transport
+
+    def send(self, request: requests.PreparedRequest, *args: t.Any, **kwargs: t.Any) -> requests.Response:
+        entry: dict | None = self.transport.next_response(request.body)
+
+        if entry is None:
+            status: int = 200
+            body: str = json.dumps({"result": f"no recorded response for request: {request_key(request.body)[:200]}", "arguments": {}})
+        else:
+            status = entry["status"]
+            body = entry["body"]
+            if self.transport.speed > 0:
+                time.sleep(entry["elapsed"] / self.transport.speed)
+
+        response: requests.Response = requests.Response()
+        response.status_code = status
+        response.reason = "OK" if status == 200 else ""
+        response._content = body.encode("utf-8")
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({_SESSION_HEADER: "replay", "Content-Type": "application/json"})
+        response.url = request.url
+        response.request = request
+
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class CountingAdapter(BaseAdapter):
+    """Send requests through another adapter, and count response sizes for `--profile`."""
+
+    def __init__(self, adapter: BaseAdapter | None = None) -> None:
+        super().__init__()
+        self.adapter: BaseAdapter = adapter if adapter is not None else HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, *args: t.Any, **kwargs: t.Any) -> requests.Response:
+        response: requests.Response = self.adapter.send(request, *args, **kwargs)
+        record_bytes(len(response.content))
+
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+class TransportClient(Client):
+    """A `transmission_rpc.Client` whose HTTP session uses a custom `requests` adapter.
+
+    transmission_rpc has no parameter for its HTTP session. It creates the session and calls
+    session-get inside `__init__`, so the adapter is mounted as soon as the session is
+    assigned. If a transmission_rpc release stops assigning it, creating a client fails
+    instead of silently bypassing the adapter.
+    """
+
+    def __init__(self, *, adapter: BaseAdapter, **kwargs: t.Any) -> None:
+        self._transport_adapter: BaseAdapter = adapter
+        super().__init__(**kwargs)
+
+        if "_transport_session" not in self.__dict__:
+            raise RuntimeError("transmission_rpc.Client no longer assigns _http_session, the custom transport adapter could not be mounted")
+
+    @property
+    def _http_session(self) -> requests.Session:
+        return self.__dict__["_transport_session"]
+
+    @_http_session.setter
+    def _http_session(self, session: requests.Session) -> None:
+        session.mount("http://", self._transport_adapter)
+        session.mount("https://", self._transport_adapter)
+        self.__dict__["_transport_session"] = session
+
+
+## Shared per file, so every controller in a CLI run records to (or replays from) one stream
+_RECORDERS: dict[Path, RpcRecorder] = {}
+_REPLAYS: dict[tuple[Path, float], ReplayTransport] = {}
+_REGISTRY_LOCK: threading.Lock = threading.Lock()
+
+
+def get_recorder(path: t.Union[str, Path]) -> RpcRecorder:
+    key: Path = Path(path).resolve()
+
+    with _REGISTRY_LOCK:
+        if key not in _RECORDERS:
+            _RECORDERS[key] = RpcRecorder(key)
+
+        return _RECORDERS[key]
+
+
+def get_replay_transport(path: t.Union[str, Path], speed: float = 0.0) -> ReplayTransport:
+    key: tuple[Path, float] = (Path(path).resolve(), speed)
+
+    with _REGISTRY_LOCK:
+        if key not in _REPLAYS:
+            _REPLAYS[key] = ReplayTransport(key[0], speed=speed)
+
+        return _REPLAYS[key]
+
+
+@atexit.register
+def close_recorders() -> None:
+    with _REGISTRY_LOCK:
+        for recorder in _RECORDERS.values():
+            recorder.close()
+        _RECORDERS.clear()
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import logging
+import random
+import threading
+import time
+import typing as t
+
+from transmission_rpc.error import (
+    TransmissionAuthError,
+    TransmissionConnectError,
+    TransmissionError,
+)
+
+log = logging.getLogger(__name__)
+
+## Per-RPC-method timeouts (seconds). torrent-get on a large/busy daemon is the slowest call.
+DEFAULT_OPERATION_TIMEOUTS: dict[str, float] = {
+    "session-get": 10,
+    "session-stats": 10,
+    "session-set": 10,
+    "free-space": 10,
+    "torrent-get": 60,
+    "torrent-start": 30,
+    "torrent-stop": 30,
+    "torrent-verify": 30,
+    "torrent-reannounce": 30,
+    "torrent-set": 30,
+    "torrent-remove": 60,
+    "torrent-set-location": 120,
+}
+
+## Upper bounds (seconds) of the RPC latency histogram buckets. +Inf is implied.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class CircuitOpenError(TransmissionConnectError):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True if a failed RPC is worth retrying.
+
+    Connection resets, timeouts, repeated 409 session handshakes and non-JSON (i.e. 5xx)
+    responses are transient. Auth errors and RPC results other than "success" are not.
+    """
+    if isinstance(exc, CircuitOpenError) or isinstance(exc, TransmissionAuthError):
+        return False
+    if isinstance(exc, TransmissionConnectError):
+        return True
+    if isinstance(exc, TransmissionError):
+        ## A parsed response means Transmission answered and rejected the request
+        return exc.response is None
+
+    return False
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter for idempotent calls."""
+
+    max_attempts: int = field(default=3)
+    base_delay: float = field(default=0.5)
+    max_delay: float = field(default=8.0)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number `attempt` (starting at 1)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Fail fast while a Transmission host keeps failing.
+
+    After `failure_threshold` consecutive transient failures the circuit opens and calls
+    raise `CircuitOpenError` without touching the network. After `reset_seconds` a single
+    trial call is let through (half-open); success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half-open"
+
+    def __init__(self, name: str = "transmission", failure_threshold: int = 5, reset_seconds: float = 30.0) -> None:
+        self.name: str = name
+        self.failure_threshold: int = failure_threshold
+        self.reset_seconds: float = reset_seconds
+
+        self.failures: int = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+
+        return self.OPEN
+
+    def before_call(self) -> None:
+        with self._lock:
+            state: str = self._state()
+
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+            retry_in: float = max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+
+        raise CircuitOpenError(f"Circuit for '{self.name}' is open after {self.failures} failure(s), retry in {retry_in:.1f}s")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    log.warning(f"Opening circuit for '{self.name}' after {self.failures} consecutive failure(s)")
+                self.opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+## One breaker per host, shared by every controller in the process
+_CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+_CIRCUIT_BREAKERS_LOCK: threading.Lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, failure_threshold: int = 5, reset_seconds: float = 30.0) -> CircuitBreaker:
+    """Return the shared circuit breaker for a host, creating it on first use."""
+    with _CIRCUIT_BREAKERS_LOCK:
+        breaker = _CIRCUIT_BREAKERS.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name=name, failure_threshold=failure_threshold, reset_seconds=reset_seconds)
+            _CIRCUIT_BREAKERS[name] = breaker
+
+        return breaker
+
+
+@dataclass
+class OperationStats:
+    calls: int = field(default=0)
+    failures: int = field(default=0)
+    retries: int = field(default=0)
+    rejected: int = field(default=0)
+    ## Requests answered by another caller's in-flight (or merged) RPC
+    coalesced: int = field(default=0)
+    total_seconds: float = field(default=0.0)
+    max_seconds: float = field(default=0.0)
+    ## Calls per latency bucket (not cumulative), the last entry counts calls above every bound
+    bucket_counts: list[int] = field(default_factory=list)
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+class RpcMetrics:
+    """Thread-safe latency and retry counters, per RPC operation.
+
+    Call latencies are also counted into fixed histogram buckets, for exporting.
+    """
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.operations: dict[str, OperationStats] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get(self, operation: str) -> OperationStats:
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = OperationStats(bucket_counts=[0] * (len(self.buckets) + 1))
+
+        return stats
+
+    def record_call(self, operation: str, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            stats: OperationStats = self._get(operation)
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+            if failed:
+                stats.failures += 1
+
+    def record_retry(self, operation: str) -> None:
+        with self._lock:
+            self._get(operation).retries += 1
+
+    def record_rejected(self, operation: str) -> None:
+        with self._lock:
+            self._get(operation).rejected += 1
+
+    def record_coalesced(self, operation: str) -> None:
+        with self._lock:
+            self._get(operation).coalesced += 1
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {
+                operation: {
+                    "calls": stats.calls,
+                    "failures": stats.failures,
+                    "retries": stats.retries,
+                    "rejected": stats.rejected,
+                    "coalesced": stats.coalesced,
+                    "mean_seconds": round(stats.mean_seconds, 4),
+                    "max_seconds": round(stats.max_seconds, 4),
+                    "total_seconds": round(stats.total_seconds, 4),
+                }
+                for operation, stats in self.operations.items()
+            }
+
+    def histograms(self) -> dict[str, tuple[list[int], float, int]]:
+        """Return each operation's latency histogram.
+
+        Returns:
+            (dict[str, tuple[list[int], float, int]]): Per operation, the cumulative count for each
+                bucket in `self.buckets` plus +Inf, the sum of latencies, and the call count.
+
+        """
+        with self._lock:
+            histograms: dict[str, tuple[list[int], float, int]] = {}
+            for operation, stats in self.operations.items():
+                cumulative: list[int] = []
+                running: int = 0
+                for count in stats.bucket_counts:
+                    running += count
+                    cumulative.append(running)
+                histograms[operation] = (cumulative, stats.total_seconds, stats.calls)
+
+            return histograms
+
+    def reset(self) -> None:
+        with self._lock:
+            self.operations.clear()
+
+
+def call_with_resilience(
+    operation: str,
+    func: t.Callable[..., t.Any],
+    *args: t.Any,
+    breaker: CircuitBreaker | None = None,
+    retry_policy: RetryPolicy | None = None,
+    metrics: RpcMetrics | None = None,
+    idempotent: bool = False,
+    **kwargs: t.Any,
+) -> t.Any:
+    """Call `func(*args, **kwargs)` through a circuit breaker, retrying transient failures.
+
+    Only idempotent calls are retried. Every attempt is timed and recorded in `metrics`.
+
+    Params:
+        operation (str): Name of the RPC, used for metrics & logging, i.e. "torrent-get".
+        func (Callable): The function making the RPC.
+        breaker (CircuitBreaker): Breaker for the target host.
+        retry_policy (RetryPolicy): Backoff settings. `None` disables retries.
+        metrics (RpcMetrics): Counters to record calls, retries & rejections in.
+        idempotent (bool): When `True`, transient failures are retried.
+
+    Returns:
+        (Any): Whatever `func` returns.
+
+    """
+    max_attempts: int = retry_policy.max_attempts if (retry_policy and idempotent) else 1
+    attempt: int = 0
+
+    while True:
+        attempt += 1
+
+        if breaker is not None:
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                if metrics is not None:
+                    metrics.record_rejected(operation)
+                raise
+
+        start: float = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            if metrics is not None:
+                metrics.record_call(operation, time.perf_counter() - start, failed=True)
+
+            transient: bool = is_transient_error(exc)
+            ## Only transient failures say anything about the host's health
+            if breaker is not None and transient:
+                breaker.record_failure()
+            elif breaker is not None:
+                breaker.record_success()
+
+            if not transient or attempt >= max_attempts:
+                raise
+
+            delay: float = retry_policy.delay(attempt)
+            log.warning(f"({type(exc).__name__}) {operation} failed (attempt {attempt}/{max_attempts}), retrying in {delay:.2f}s. Details: {exc}")
+            if metrics is not None:
+                metrics.record_retry(operation)
+            time.sleep(delay)
+
+            continue
+
+        if metrics is not None:
+            metrics.record_call(operation, time.perf_counter() - start)
+        if breaker is not None:
+            breaker.record_success()
+
+        return result
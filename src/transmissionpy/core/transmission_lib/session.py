@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+import typing as t
+
+from transmissionpy.core.constants import CACHE_DIR
+
+import msgpack
+
+log = logging.getLogger(__name__)
+
+SESSION_CACHE_DIR: str = f"{CACHE_DIR}/session"
+## Cached RPC results, by method
+SESSION_KINDS: tuple[str, ...] = ("session-get", "session-stats")
+
+
+def project_fields(values: dict[str, t.Any], fields: t.Iterable[str] | None = None) -> dict[str, t.Any]:
+    """Return only `fields` of session values. Names may use - or _ (`download_dir` finds `download-dir`)."""
+    if not fields:
+        return dict(values)
+
+    projected: dict[str, t.Any] = {}
+    for name in fields:
+        for key in (name, name.replace("_", "-"), name.replace("-", "_")):
+            if key in values:
+                projected[key] = values[key]
+                break
+
+    return projected
+
+
+class SessionCache:
+    """TTL cache of session-get & session-stats results, keyed by host.
+
+    Values are kept in memory and, with a `cache_dir`, in small msgpack files, so separate
+    CLI invocations (i.e. a polling dashboard) share them. Call `invalidate()` after a session-set.
+    """
+
+    def __init__(self, ttl: float = 5.0, cache_dir: t.Union[str, Path, None] = SESSION_CACHE_DIR) -> None:
+        self.ttl: float = ttl
+        self.cache_dir: Path | None = Path(cache_dir) if cache_dir else None
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: dict[tuple[str, str], tuple[float, dict[str, t.Any]]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _path(self, host_key: str, kind: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(host_key.encode('utf-8')).hexdigest()[:16]}_{kind}.msgpack"
+
+    def get(self, host_key: str, kind: str) -> dict[str, t.Any] | None:
+        """Return cached values younger than `ttl`, else None."""
+        if self.ttl <= 0:
+            return None
+
+        with self._lock:
+            entry: tuple[float, dict] | None = self._entries.get((host_key, kind))
+
+        if entry is None and self.cache_dir is not None:
+            try:
+                with open(self._path(host_key, kind), "rb") as f:
+                    stored: dict = msgpack.unpackb(f.read(), raw=False)
+                if stored.get("host") == host_key:
+                    entry = (stored["created"], stored["values"])
+            except FileNotFoundError:
+                pass
+            except Exception as exc:
+                log.warning(f"({type(exc)}) Ignoring unreadable session cache. Details: {exc}")
+
+        if entry is None or time.time() - entry[0] > self.ttl:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        with self._lock:
+            self._entries[(host_key, kind)] = entry
+
+        return entry[1]
+
+    def put(self, host_key: str, kind: str, values: dict[str, t.Any]) -> None:
+        if self.ttl <= 0:
+            return
+
+        entry: tuple[float, dict] = (time.time(), values)
+        with self._lock:
+            self._entries[(host_key, kind)] = entry
+
+        if self.cache_dir is None:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            ## Write to a temp file & rename, so a concurrent reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(msgpack.packb({"host": host_key, "created": entry[0], "values": values}, use_bin_type=True))
+            os.replace(tmp_path, self._path(host_key, kind))
+        except Exception as exc:
+            log.warning(f"({type(exc)}) Unable to write session cache. Details: {exc}")
+
+    def invalidate(self, host_key: str, kinds: t.Iterable[str] = SESSION_KINDS) -> None:
+        """Drop cached values for a host, i.e. after a session-set."""
+        for kind in kinds:
+            with self._lock:
+                self._entries.pop((host_key, kind), None)
+            if self.cache_dir is not None:
+                try:
+                    self._path(host_key, kind).unlink()
+                except FileNotFoundError:
+                    pass
+
+
+_CACHES: dict[str, SessionCache] = {}
+_REGISTRY_LOCK: threading.Lock = threading.Lock()
+
+
+def get_session_cache(name: str, ttl: float = 5.0, cache_dir: t.Union[str, Path, None] = SESSION_CACHE_DIR) -> SessionCache:
+    """Return the process-wide session cache for a host, so short-lived controllers share it."""
+    with _REGISTRY_LOCK:
+        if name not in _CACHES:
+            _CACHES[name] = SessionCache(ttl=ttl, cache_dir=cache_dir)
+        cache: SessionCache = _CACHES[name]
+        cache.ttl = ttl
+
+        return cache
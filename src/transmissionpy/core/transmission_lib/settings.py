@@ -17,6 +17,24 @@ class TransmissionClientSettings:
     rpc_url: str = field(default="/transmission/")
     username: str = field(default=None)
     password: str = field(default=None, repr=False)
+    ## Overall per-request timeout cap (seconds). Per-operation budgets still apply under it.
+    timeout: t.Optional[float] = field(default=None)
+    ## Attempts for idempotent reads (1 disables retries)
+    max_retries: int = field(default=3)
+    circuit_failure_threshold: int = field(default=5)
+    circuit_reset_seconds: float = field(default=30.0)
+    ## Merge torrent-get requests for different ids made within this many seconds (0 disables).
+    #  The first request always waits this long, so only enable it for concurrent callers (i.e. the daemon).
+    merge_window: float = field(default=0)
+    ## Seconds a cached torrent list is reused between CLI invocations (0 disables the on-disk cache)
+    cache_ttl: float = field(default=0)
+    ## Seconds session-get / session-stats results are reused, in memory & between CLI invocations (0 disables)
+    session_cache_ttl: float = field(default=5.0)
+    ## Record RPC traffic to this file, or replay it from a recording instead of connecting
+    record_path: t.Optional[str] = field(default=None)
+    replay_path: t.Optional[str] = field(default=None)
+    ## Replay at recorded latency / speed (0 = as fast as possible)
+    replay_speed: float = field(default=0.0)
 
 transmission_settings: TransmissionClientSettings = TransmissionClientSettings(
     host=TRANSMISSION_SETTINGS.get("TRANSMISSION_HOST", default=None),
@@ -25,5 +43,12 @@ transmission_settings: TransmissionClientSettings = TransmissionClientSettings(
     protocol=TRANSMISSION_SETTINGS.get("TRANSMISSION_PROTOCOL", default="http"),
     username=TRANSMISSION_SETTINGS.get("TRANSMISSION_USERNAME", default=None),
     password=TRANSMISSION_SETTINGS.get("TRANSMISSION_PASSWORD", default=None),
-    rpc_url=TRANSMISSION_SETTINGS.get("TRANSMISSION_RPC_URL", default="/transmission/")
+    rpc_url=TRANSMISSION_SETTINGS.get("TRANSMISSION_RPC_URL", default="/transmission/"),
+    timeout=TRANSMISSION_SETTINGS.get("TRANSMISSION_TIMEOUT", default=None),
+    max_retries=TRANSMISSION_SETTINGS.get("TRANSMISSION_MAX_RETRIES", default=3),
+    circuit_failure_threshold=TRANSMISSION_SETTINGS.get("TRANSMISSION_CIRCUIT_FAILURE_THRESHOLD", default=5),
+    circuit_reset_seconds=TRANSMISSION_SETTINGS.get("TRANSMISSION_CIRCUIT_RESET_SECONDS", default=30.0),
+    merge_window=TRANSMISSION_SETTINGS.get("TRANSMISSION_MERGE_WINDOW", default=0),
+    cache_ttl=TRANSMISSION_SETTINGS.get("TRANSMISSION_CACHE_TTL", default=0),
+    session_cache_ttl=TRANSMISSION_SETTINGS.get("TRANSMISSION_SESSION_CACHE_TTL", default=5.0),
 )
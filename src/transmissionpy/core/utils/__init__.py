@@ -1,3 +1,3 @@
 from __future__ import annotations
 
-from . import df_utils, hash_utils, list_utils, path_utils, time_utils
+from . import df_utils, hash_utils, list_utils, path_utils, profile_utils, time_utils
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+import os
+from pathlib import Path
+import threading
+import typing as t
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
+
+log = logging.getLogger(__name__)
+
+## Default number of threads used to scan files. Parquet/CSV decoding releases the GIL.
+DEFAULT_SCAN_WORKERS: int = min(32, (os.cpu_count() or 1) + 4)
+
+## Parquet file fragments with their footer metadata loaded, keyed by (path, mtime_ns, size).
+#  A changed file gets a new key, so stale footers are never reused.
+_PQ_FRAGMENT_CACHE: dict[tuple[str, int, int], ds.ParquetFileFragment] = {}
+_PQ_FRAGMENT_CACHE_LOCK: threading.Lock = threading.Lock()
+_PQ_FORMAT: ds.ParquetFileFormat = ds.ParquetFileFormat()
+_CSV_FORMAT: ds.CsvFileFormat = ds.CsvFileFormat()
+_LOCAL_FS: pa_fs.LocalFileSystem = pa_fs.LocalFileSystem()
+
+## A filter can be a pyarrow compute expression, or DNF tuples like [("status", "==", 6)]
+FilterType = t.Union[ds.Expression, list[tuple], list[list[tuple]], None]
+
+
+def _normalize_filetype(filetype: str) -> str:
+    if not filetype.startswith("."):
+        filetype = f".{filetype}"
+
+    if filetype not in [".parquet", ".csv"]:
+        raise ValueError(f"Invalid filetype: '{filetype}'. Must be one of ['.parquet', '.csv']")
+
+    return filetype
+
+
+def _build_filter_expression(filters: FilterType = None) -> ds.Expression | None:
+    if filters is None:
+        return None
+
+    if isinstance(filters, ds.Expression):
+        return filters
+
+    try:
+        return pq.filters_to_expression(filters)
+    except Exception as exc:
+        msg = Exception(f"Unhandled exception building filter expression from '{filters}'. Details: {exc}")
+        log.error(msg)
+
+        raise exc
+
+
+def find_data_files(search_dir: t.Union[str, Path] = None, filetype: str = ".parquet") -> list[Path]:
+    """Return a sorted list of data files in search_dir (recursive).
+
+    Params:
+        search_dir (str|Path): The directory to search for files in
+        filetype (str): The file extension to filter results by
+
+    Returns:
+        (list[Path]): Paths to each matching file, sorted by path
+
+    """
+    if search_dir is None:
+        raise ValueError("Missing a directory to search")
+
+    filetype = _normalize_filetype(filetype)
+
+    return sorted(f for f in Path(search_dir).glob(f"**/*{filetype}") if f.is_file())
+
+
+def get_pq_fragment(pq_file: t.Union[str, Path]) -> ds.ParquetFileFragment:
+    """Return a Parquet fragment for pq_file, with its footer read once and cached.
+
+    Params:
+        pq_file (str|Path): Path to a `.parquet` file
+
+    Returns:
+        (pyarrow.dataset.ParquetFileFragment): A fragment whose row group statistics are
+            used to skip row groups that cannot match a filter
+
+    """
+    path: str = str(Path(pq_file).resolve())
+    stat: os.stat_result = os.stat(path)
+    key: tuple[str, int, int] = (path, stat.st_mtime_ns, stat.st_size)
+
+    with _PQ_FRAGMENT_CACHE_LOCK:
+        fragment = _PQ_FRAGMENT_CACHE.get(key)
+    if fragment is not None:
+        return fragment
+
+    fragment = _PQ_FORMAT.make_fragment(path, filesystem=_LOCAL_FS)
+    ## Parse the footer now so later scans can prune row groups without re-reading it
+    fragment.ensure_complete_metadata()
+
+    with _PQ_FRAGMENT_CACHE_LOCK:
+        ## Drop footers cached for older versions of the same file
+        for stale_key in [k for k in _PQ_FRAGMENT_CACHE if k[0] == path]:
+            _PQ_FRAGMENT_CACHE.pop(stale_key, None)
+        _PQ_FRAGMENT_CACHE[key] = fragment
+
+    return fragment
+
+
+def clear_pq_footer_cache() -> None:
+    """Forget all cached Parquet footers."""
+    with _PQ_FRAGMENT_CACHE_LOCK:
+        _PQ_FRAGMENT_CACHE.clear()
+
+
+def read_file_to_table(
+    data_file: t.Union[str, Path] = None,
+    columns: list[str] | None = None,
+    filters: FilterType = None,
+) -> pa.Table:
+    """Read a single Parquet or CSV file into a pyarrow Table.
+
+    Params:
+        data_file (str|Path): Path to a `.parquet` or `.csv` file
+        columns (list[str]|None): Only read these columns. Columns missing from the file are skipped.
+        filters (Expression|list[tuple]|None): Row filter, pushed down to the Parquet reader
+
+    Returns:
+        (pyarrow.Table): The (projected, filtered) file contents
+
+    """
+    if data_file is None:
+        raise ValueError("Missing data_file to read")
+
+    data_file: Path = Path(data_file)
+    filter_expr: ds.Expression | None = _build_filter_expression(filters)
+
+    if data_file.suffix == ".parquet":
+        fragment: ds.ParquetFileFragment = get_pq_fragment(data_file)
+
+        if columns is not None:
+            columns = [c for c in columns if c in fragment.physical_schema.names]
+
+        ## use_threads=False: parallelism comes from scanning several files at once
+        return fragment.to_table(columns=columns, filter=filter_expr, use_threads=False)
+
+    elif data_file.suffix == ".csv":
+        ## A dataset fragment reads the filter's columns even when they aren't projected,
+        #  and treats columns=[] as "no columns" (pyarrow.csv treats include_columns=[] as "all")
+        fragment: ds.FileFragment = _CSV_FORMAT.make_fragment(str(data_file), filesystem=_LOCAL_FS)
+
+        if columns is not None:
+            columns = [c for c in columns if c in fragment.physical_schema.names]
+
+        return fragment.to_table(columns=columns, filter=filter_expr, use_threads=False)
+
+    else:
+        raise ValueError(f"Unsupported file type: '{data_file.suffix}'")
+
+
+def iter_dataset_batches(
+    search_dir: t.Union[str, Path] = None,
+    filetype: str = ".parquet",
+    columns: list[str] | None = None,
+    filters: FilterType = None,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    batch_size: int = 65_536,
+) -> t.Iterator[pd.DataFrame]:
+    """Lazily yield DataFrames from every file in search_dir, scanning files in parallel.
+
+    Only `max_workers * 2` files are read ahead of the consumer, so memory stays bounded
+    no matter how many files are in `search_dir`.
+
+    Params:
+        search_dir (str|Path): The directory to search for files in
+        filetype (str): The file extension to filter results by
+        columns (list[str]|None): Only read these columns
+        filters (Expression|list[tuple]|None): Row filter, pushed down to the Parquet reader
+        max_workers (int): Number of files to read concurrently
+        batch_size (int): Max number of rows in each yielded DataFrame
+
+    Returns:
+        (Iterator[pandas.DataFrame]): DataFrame batches, in file path order
+
+    """
+    files: list[Path] = find_data_files(search_dir=search_dir, filetype=filetype)
+    if not files:
+        log.warning(f"No {filetype} files found in '{search_dir}'")
+        return
+
+    read_ahead: int = max(1, max_workers) * 2
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        pending: deque[Future] = deque()
+        files_iter = iter(files)
+
+        for f in files_iter:
+            pending.append(executor.submit(read_file_to_table, f, columns, filters))
+            if len(pending) >= read_ahead:
+                break
+
+        while pending:
+            table: pa.Table = pending.popleft().result()
+
+            ## Keep the pool busy while the consumer works on this table
+            next_file = next(files_iter, None)
+            if next_file is not None:
+                pending.append(executor.submit(read_file_to_table, next_file, columns, filters))
+
+            for batch in table.to_batches(max_chunksize=batch_size):
+                if batch.num_rows:
+                    yield batch.to_pandas()
+
+
+def load_dataset_to_df(
+    search_dir: t.Union[str, Path] = None,
+    filetype: str = ".parquet",
+    columns: list[str] | None = None,
+    filters: FilterType = None,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+) -> pd.DataFrame:
+    """Load every file in search_dir into one DataFrame, scanning files in parallel.
+
+    Files are read into Arrow tables on a thread pool, concatenated (schemas are unified,
+    missing columns become nulls) and converted to pandas once.
+
+    Params:
+        search_dir (str|Path): The directory to search for files in
+        filetype (str): The file extension to filter results by
+        columns (list[str]|None): Only read these columns
+        filters (Expression|list[tuple]|None): Row filter, pushed down to the Parquet reader
+        max_workers (int): Number of files to read concurrently
+
+    Returns:
+        (pandas.DataFrame): A single DataFrame with the rows of all files in `search_dir`
+
+    """
+    files: list[Path] = find_data_files(search_dir=search_dir, filetype=filetype)
+    if not files:
+        log.warning(f"No {filetype} files found in '{search_dir}'")
+        return pd.DataFrame(columns=columns)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        tables: list[pa.Table] = list(
+            executor.map(lambda f: read_file_to_table(f, columns, filters), files)
+        )
+
+    try:
+        combined: pa.Table = pa.concat_tables(tables, promote_options="default")
+    except Exception as exc:
+        msg = Exception(f"Unhandled exception combining {len(tables)} file(s) from '{search_dir}'. Details: {exc}")
+        log.error(msg)
+
+        raise exc
+
+    return combined.to_pandas()
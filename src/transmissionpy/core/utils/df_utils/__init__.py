@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 from . import constants, validators
+from .__dataset import (
+    clear_pq_footer_cache,
+    find_data_files,
+    iter_dataset_batches,
+    load_dataset_to_df,
+    read_file_to_table,
+)
 from .__methods import (
+    arrow_table_to_df,
     convert_csv_to_pq,
     convert_df_col_dtypes,
     convert_df_datetimes_to_timestamp,
@@ -1,14 +1,51 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from pathlib import Path
 import typing as t
 
+from .__dataset import (
+    DEFAULT_SCAN_WORKERS,
+    FilterType,
+    find_data_files,
+    read_file_to_table,
+)
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 log = logging.getLogger(__name__)
 
 
+def _arrow_types_mapper(pa_type: pa.DataType) -> pd.ArrowDtype | None:
+    ## Dictionary-encoded columns fall back to pandas Categoricals
+    if pa.types.is_dictionary(pa_type):
+        return None
+
+    return pd.ArrowDtype(pa_type)
+
+
+def arrow_table_to_df(table: pa.Table = None) -> pd.DataFrame:
+    """Convert a pyarrow Table to a DataFrame backed by `pd.ArrowDtype` columns.
+
+    Arrow buffers are reused instead of being converted to NumPy/Python objects. Dictionary
+    encoded columns become pandas `category` columns.
+
+    Params:
+        table (pyarrow.Table): The Arrow table to convert
+
+    Returns:
+        (pandas.DataFrame): An Arrow-backed Pandas `DataFrame`
+
+    """
+    if table is None:
+        raise ValueError("Missing a pyarrow Table to convert")
+
+    return table.to_pandas(types_mapper=_arrow_types_mapper)
+
+
 def hide_df_index(df: pd.DataFrame) -> pd.DataFrame:
     """Hide the Pandas index when previewing, i.e. with .head().
     
@@ -117,43 +154,39 @@ def count_df_rows(df: pd.DataFrame = None) -> int:
 
 
 def load_pqs_to_df(
-    search_dir: str = None, filetype: str = ".parquet"
+    search_dir: str = None,
+    filetype: str = ".parquet",
+    columns: list[str] | None = None,
+    filters: FilterType = None,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
 ) -> list[pd.DataFrame]:
     """Load data export files in search_dir into list of DataFrames.
 
+    Files are read in parallel on a thread pool. Use `load_dataset_to_df()` to get a single
+    concatenated `DataFrame`, or `iter_dataset_batches()` to stream the files lazily.
+
     Params:
         search_dir (str): The directory to search for files in
         filetype (str): The file extension to filter results by
+        columns (list[str]|None): Only read these columns
+        filters (Expression|list[tuple]|None): Row filter, pushed down to the Parquet reader
+        max_workers (int): Number of files to read concurrently
 
     Returns:
         (list[pandas.DataFrame]): A list of Pandas `DataFrame`s created from files in `search_dir`
 
     """
-    if search_dir is None:
-        raise ValueError("Missing a directory to search")
-
-    if not filetype.startswith("."):
-        filetype = f".{filetype}"
-
-    files: list[Path] = []
-
-    for f in Path(search_dir).glob(f"**/*{filetype}"):
-        if f.is_file():
-            files.append(f)
-
-    dataframes: list[pd.DataFrame] = []
+    files: list[Path] = find_data_files(search_dir=search_dir, filetype=filetype)
 
-    if filetype == ".parquet":
-        for pq in files:
-            df = load_pq(pq_file=pq)
+    if not files:
+        return []
 
-            dataframes.append(df)
-
-    elif filetype == ".csv":
-        for f in files:
-            df = pd.read_csv(f)
-
-            dataframes.append(df)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        dataframes: list[pd.DataFrame] = list(
+            executor.map(
+                lambda f: read_file_to_table(f, columns, filters).to_pandas(), files
+            )
+        )
 
     return dataframes
 
@@ -294,10 +327,9 @@ def load_pq(
 
     if not pq_file.exists():
         msg = FileNotFoundError(f"Could not find Parquet file at '{pq_file}'")
-        # log.error(msg)
         log.error(msg)
 
-        raise exc
+        raise msg
 
     try:
         df = pd.read_parquet(pq_file, engine=pq_engine)
@@ -314,7 +346,7 @@ def load_pq(
 
 
 def save_pq(
-    df: pd.DataFrame = None,
+    df: pd.DataFrame | pa.Table = None,
     pq_file: t.Union[str, Path] = None,
     dedupe: bool = False,
     pq_engine: str = "pyarrow",
@@ -322,7 +354,7 @@ def save_pq(
     """Save DataFrame to a .parquet file.
 
     Params:
-        df (pandas.DataFrame): A Pandas `DataFrame` to save
+        df (pandas.DataFrame|pyarrow.Table): A Pandas `DataFrame` (or pyarrow `Table`) to save
         pq_file (str|Path): The path to a `.parquet` file where the `DataFrame` should be saved
         dedupe (bool): If `True`, deduplicate the `DataFrame` before saving
 
@@ -334,7 +366,7 @@ def save_pq(
         Exception: If file cannot be saved, an `Exception` is raised
 
     """
-    if df is None or df.empty:
+    if df is None or (isinstance(df, pa.Table) and df.num_rows == 0) or (isinstance(df, pd.DataFrame) and df.empty):
         msg = ValueError("DataFrame is None or empty")
         log.warning(msg)
 
@@ -361,6 +393,15 @@ def save_pq(
             return False
 
     try:
+        if isinstance(df, pa.Table):
+            ## Arrow tables are written as-is, without a round-trip through pandas
+            if dedupe:
+                df = pa.Table.from_pandas(arrow_table_to_df(df).drop_duplicates(), preserve_index=False)
+
+            pq.write_table(df, pq_file)
+
+            return True
+
         if dedupe:
             df = df.drop_duplicates()
 
@@ -683,11 +724,21 @@ def convert_df_datetimes_to_timestamp(df: pd.DataFrame):
     - pandas.DataFrame: The DataFrame with all datetime columns converted to timestamps.
 
     """
-    # Iterate over each column in the DataFrame
     for column in df.columns:
-        # Check if the column contains datetime-like data
-        if pd.api.types.is_datetime64_any_dtype(df[column]):
-            # Convert datetime to Unix timestamp (number of seconds since epoch)
-            df[column] = df[column].apply(lambda x: int(x.timestamp()) if pd.notnull(x) else None)
-    
-    return df
\ No newline at end of file
+        if not pd.api.types.is_datetime64_any_dtype(df[column]):
+            continue
+
+        col: pd.Series = df[column]
+        ## Timezone-aware values are converted to naive UTC, matching Timestamp.timestamp()
+        if getattr(col.dt, "tz", None) is not None:
+            col = col.dt.tz_convert("UTC").dt.tz_localize(None)
+
+        nulls = col.isna()
+        epochs: pd.Series = pd.Series(
+            col.to_numpy(dtype="datetime64[s]").astype("int64"), index=df.index
+        )
+
+        ## Null datetimes become NaN (float column), same as the old per-row conversion
+        df[column] = epochs.where(~nulls) if nulls.any() else epochs
+
+    return df
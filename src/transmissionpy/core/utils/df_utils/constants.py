@@ -4,3 +4,5 @@ PANDAS_DATETIME_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
 PANDAS_DATE_FORMAT: str = "%Y-%m-%d"
 PANDAS_TIME_FORMAT: str = "%H:%M:%S"
 PANDAS_ENGINE: str = "pyarrow"
+## "numpy" = default NumPy/object dtypes, "pyarrow" = pd.ArrowDtype columns
+PANDAS_DTYPE_BACKENDS: list[str] = ["numpy", "pyarrow"]
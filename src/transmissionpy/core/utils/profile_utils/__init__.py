@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from .__methods import (
+    Profiler,
+    StageStats,
+    disable_profiling,
+    enable_profiling,
+    get_profiler,
+    profile_stage,
+    profiled,
+    record_bytes,
+    record_objects,
+)
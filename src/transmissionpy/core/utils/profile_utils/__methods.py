@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import contextlib
+import cProfile
+from dataclasses import dataclass, field
+import functools
+import logging
+from pathlib import Path
+import sys
+import threading
+import time
+import tracemalloc
+import typing as t
+
+log = logging.getLogger(__name__)
+
+## Returned by profile_stage() while profiling is off, so a disabled stage costs one attribute check
+_NULL_STAGE: contextlib.nullcontext = contextlib.nullcontext()
+
+
+@dataclass
+class StageStats:
+    name: str
+    calls: int = field(default=0)
+    wall_seconds: float = field(default=0.0)
+    cpu_seconds: float = field(default=0.0)
+    bytes_in: int = field(default=0)
+    objects: int = field(default=0)
+    peak_bytes: int = field(default=0)
+
+
+@dataclass
+class _Frame:
+    stats: StageStats
+    wall_start: float
+    cpu_start: float
+    peak_bytes: int = field(default=0)
+
+
+class Profiler:
+    """Collect per-stage wall/CPU time, bytes received, object counts and peak memory.
+
+    Stages can be nested. Time is counted in every open stage, while bytes & objects are
+    counted in the innermost stage of the thread that records them.
+    """
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.trace_memory: bool = False
+        self.stages: dict[str, StageStats] = {}
+        self.pstats_path: Path | None = None
+
+        self._cprofile: cProfile.Profile | None = None
+        self._local: threading.local = threading.local()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _stack(self) -> list[_Frame]:
+        stack: list[_Frame] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
+
+    def _get_stats(self, name: str) -> StageStats:
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats(name=name)
+
+            return stats
+
+    def start(self, trace_memory: bool = True, pstats_path: t.Union[str, Path, None] = None) -> None:
+        self.stages.clear()
+        self.enabled = True
+        self.trace_memory = trace_memory
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        if pstats_path:
+            self.pstats_path = Path(pstats_path)
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            try:
+                self.pstats_path.parent.mkdir(parents=True, exist_ok=True)
+                self._cprofile.dump_stats(str(self.pstats_path))
+                log.info(f"Saved profile stats to '{self.pstats_path}' (view with: python -m pstats {self.pstats_path})")
+            except Exception as exc:
+                log.error(f"({type(exc)}) Error saving profile stats to '{self.pstats_path}'. Details: {exc}")
+            self._cprofile = None
+
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def _stage(self, name: str) -> t.Iterator[StageStats]:
+        stats: StageStats = self._get_stats(name)
+        stack: list[_Frame] = self._stack()
+
+        if self.trace_memory:
+            ## Hand the peak so far to the open stages before resetting it for this one
+            peak: int = tracemalloc.get_traced_memory()[1]
+            for frame in stack:
+                frame.peak_bytes = max(frame.peak_bytes, peak)
+            tracemalloc.reset_peak()
+
+        frame: _Frame = _Frame(stats=stats, wall_start=time.perf_counter(), cpu_start=time.process_time())
+        stack.append(frame)
+        try:
+            yield stats
+        finally:
+            stack.pop()
+            wall: float = time.perf_counter() - frame.wall_start
+            cpu: float = time.process_time() - frame.cpu_start
+
+            if self.trace_memory and tracemalloc.is_tracing():
+                frame.peak_bytes = max(frame.peak_bytes, tracemalloc.get_traced_memory()[1])
+                for parent in stack:
+                    parent.peak_bytes = max(parent.peak_bytes, frame.peak_bytes)
+                tracemalloc.reset_peak()
+
+            with self._lock:
+                stats.calls += 1
+                stats.wall_seconds += wall
+                stats.cpu_seconds += cpu
+                stats.peak_bytes = max(stats.peak_bytes, frame.peak_bytes)
+
+    def stage(self, name: str) -> t.ContextManager:
+        if not self.enabled:
+            return _NULL_STAGE
+
+        return self._stage(name)
+
+    def _current(self) -> StageStats:
+        stack: list[_Frame] = self._stack()
+
+        return stack[-1].stats if stack else self._get_stats("(unstaged)")
+
+    def add_bytes(self, n: int) -> None:
+        if self.enabled:
+            stats: StageStats = self._current()
+            with self._lock:
+                stats.bytes_in += n
+
+    def add_objects(self, n: int) -> None:
+        if self.enabled:
+            stats: StageStats = self._current()
+            with self._lock:
+                stats.objects += n
+
+    def report(self) -> list[dict[str, t.Any]]:
+        """Return one dict per stage, in the order stages were first entered."""
+        with self._lock:
+            return [
+                {
+                    "stage": s.name,
+                    "calls": s.calls,
+                    "wall_ms": round(s.wall_seconds * 1000, 2),
+                    "cpu_ms": round(s.cpu_seconds * 1000, 2),
+                    "bytes_in": s.bytes_in,
+                    "objects": s.objects,
+                    "peak_mib": round(s.peak_bytes / 1024**2, 2),
+                }
+                for s in self.stages.values()
+            ]
+
+    def format_report(self) -> str:
+        rows: list[dict[str, t.Any]] = self.report()
+        if not rows:
+            return "No stages were profiled."
+
+        total_wall: float = max(row["wall_ms"] for row in rows) or 1.0
+        headers: list[str] = ["stage", "calls", "wall ms", "% wall", "cpu ms", "bytes in", "objects", "peak MiB"]
+        table: list[list[str]] = [
+            [
+                row["stage"],
+                str(row["calls"]),
+                f"{row['wall_ms']:.1f}",
+                f"{100 * row['wall_ms'] / total_wall:.1f}",
+                f"{row['cpu_ms']:.1f}",
+                f"{row['bytes_in']:,}",
+                f"{row['objects']:,}",
+                f"{row['peak_mib']:.1f}" if self.trace_memory else "-",
+            ]
+            for row in rows
+        ]
+        widths: list[int] = [max(len(h), *(len(r[i]) for r in table)) for i, h in enumerate(headers)]
+
+        lines: list[str] = [
+            "  ".join(h.ljust(w) if i == 0 else h.rjust(w) for i, (h, w) in enumerate(zip(headers, widths))),
+            "  ".join("-" * w for w in widths),
+        ]
+        for r in table:
+            lines.append("  ".join(c.ljust(w) if i == 0 else c.rjust(w) for i, (c, w) in enumerate(zip(r, widths))))
+
+        return "\n".join(lines)
+
+    def print_report(self, file: t.TextIO = sys.stderr) -> None:
+        print(self.format_report(), file=file)
+
+
+_PROFILER: Profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    return _PROFILER
+
+
+def enable_profiling(trace_memory: bool = True, pstats_path: t.Union[str, Path, None] = None) -> Profiler:
+    """Start collecting stage timings on the global profiler.
+
+    Params:
+        trace_memory (bool): Track peak memory per stage with tracemalloc (slows Python allocations).
+        pstats_path (str|Path): Also run cProfile and write its stats to this file.
+
+    Returns:
+        (Profiler): The global profiler.
+
+    """
+    _PROFILER.start(trace_memory=trace_memory, pstats_path=pstats_path)
+
+    return _PROFILER
+
+
+def disable_profiling() -> None:
+    _PROFILER.stop()
+
+
+def profile_stage(name: str) -> t.ContextManager:
+    """Time a block as a named stage. A no-op unless profiling is enabled.
+
+    Usage:
+        with profile_stage("rpc"):
+            ...
+
+    """
+    return _PROFILER.stage(name)
+
+
+def profiled(name: str) -> t.Callable:
+    """Decorator version of `profile_stage()`."""
+
+    def decorator(func: t.Callable) -> t.Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _PROFILER.enabled:
+                return func(*args, **kwargs)
+
+            with _PROFILER.stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_bytes(n: int) -> None:
+    """Count bytes received in the current stage."""
+    _PROFILER.add_bytes(n)
+
+
+def record_objects(n: int) -> None:
+    """Count objects (torrents, rows, ...) produced in the current stage."""
+    _PROFILER.add_objects(n)
@@ -1,3 +1,7 @@
 from __future__ import annotations
 
-from .__methods import convert_seconds_to_readable_string, convert_seconds_to_timedelta
+from .__methods import (
+    convert_seconds_series_to_timedelta,
+    convert_seconds_to_readable_string,
+    convert_seconds_to_timedelta,
+)
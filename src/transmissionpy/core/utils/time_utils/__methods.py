@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 
 from loguru import logger as log
+import pandas as pd
 
 def convert_seconds_to_timedelta(seconds: int, as_str: bool = False) -> timedelta | str:
     td = timedelta(seconds=seconds)
@@ -33,3 +34,16 @@ def convert_seconds_to_readable_string(seconds: int) -> str:
     time_str = convert_seconds_to_timedelta(seconds=seconds, as_str=True)
     
     return time_str
+
+
+def convert_seconds_series_to_timedelta(seconds: pd.Series) -> pd.Series:
+    """Vectorized `convert_seconds_to_timedelta()` for a whole column of seconds.
+
+    Params:
+        seconds (pandas.Series): A numeric `Series` of durations in seconds.
+
+    Returns:
+        (pandas.Series): A `timedelta64[ns]` `Series`. Non-numeric values become `NaT`.
+
+    """
+    return pd.to_timedelta(pd.to_numeric(seconds, errors="coerce"), unit="s")
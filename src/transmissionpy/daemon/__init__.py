@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from .jobs import (
+    DaemonJob,
+    JobStats,
+    TickContext,
+    build_jobs,
+    make_bandwidth_job,
+    make_cleanup_job,
+    make_free_space_job,
+    make_queue_job,
+    snapshot_job,
+)
+from .scheduler import DaemonScheduler, torrents_are_idle
+from .settings import DAEMON_SETTINGS, DaemonSettings, daemon_settings
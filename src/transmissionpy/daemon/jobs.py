@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import random
+import typing as t
+
+from transmissionpy.core.db.search import TorrentSearchIndex
+from transmissionpy.core.depends import db_depends
+from transmissionpy.core.transmission_lib import TransmissionRPCController
+from transmissionpy.rpc_client.bandwidth import (
+    TORRENT_BANDWIDTH_FIELDS,
+    BandwidthBudget,
+    allocate_bandwidth,
+    bandwidth_frame,
+    diff_bandwidth,
+    push_bandwidth,
+)
+from transmissionpy.rpc_client.queue_order import (
+    TORRENT_QUEUE_FIELDS,
+    QueuePlan,
+    QueueWeights,
+    apply_queue_moves,
+    plan_queue_order,
+)
+from transmissionpy.rpc_client.search import sync_search_index
+from transmissionpy.rpc_client.snapshot import SnapshotManager
+from transmissionpy.rpc_client.utils import filter_torrents_by_status
+
+from .settings import DaemonSettings
+
+from loguru import logger as log
+from transmission_rpc import Torrent
+
+@dataclass
+class JobStats:
+    runs: int = field(default=0)
+    failures: int = field(default=0)
+    last_seconds: float = field(default=0.0)
+    total_seconds: float = field(default=0.0)
+    max_seconds: float = field(default=0.0)
+    last_error: str | None = field(default=None)
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.runs if self.runs else 0.0
+
+    def record(self, seconds: float, error: Exception | None = None) -> None:
+        self.runs += 1
+        self.last_seconds = seconds
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+        if error is not None:
+            self.failures += 1
+            self.last_error = f"({type(error).__name__}) {error}"
+
+
+@dataclass
+class TickContext:
+    """State shared by every job that runs in the same scheduler tick.
+
+    The torrent list is fetched at most once per tick, the first time a job asks for it.
+    It always comes from Transmission, never the on-disk cache, because jobs like cleanup
+    remove torrents based on it.
+    """
+
+    controller: TransmissionRPCController
+    settings: DaemonSettings
+    fetch_count: int = field(default=0)
+    _torrents: list[Torrent] | None = field(default=None, repr=False)
+
+    @property
+    def fetched(self) -> bool:
+        return self._torrents is not None
+
+    def torrents(self) -> list[Torrent]:
+        if self._torrents is None:
+            self._torrents = self.controller.get_all_torrents(fresh=True)
+            self.fetch_count += 1
+
+        return self._torrents
+
+    def forget(self, torrent_ids: t.Iterable[int]) -> None:
+        """Drop removed torrents from the shared list, so later jobs in the tick don't see them."""
+        if self._torrents is None:
+            return
+
+        removed: set[int] = set(torrent_ids)
+        self._torrents = [torrent for torrent in self._torrents if torrent.id not in removed]
+
+
+@dataclass
+class DaemonJob:
+    name: str
+    interval: float
+    run: t.Callable[[TickContext], t.Any] = field(repr=False)
+    jitter: float = field(default=0.0)
+    ## Adaptive jobs run less often while the Transmission daemon is idle
+    adaptive: bool = field(default=True)
+    next_run: float = field(default=0.0)
+    stats: JobStats = field(default_factory=JobStats)
+
+    def schedule_next(self, now: float, idle_factor: float = 1.0) -> None:
+        interval: float = self.interval * (idle_factor if self.adaptive else 1.0)
+        self.next_run = now + max(1.0, interval + random.uniform(-self.jitter, self.jitter))
+
+
+def snapshot_job(ctx: TickContext) -> int:
+    torrents: list[Torrent] = ctx.torrents()
+    SnapshotManager(snapshot_filename="all_torrents_snapshot").save_snapshot(torrents=torrents)
+
+    return len(torrents)
+
+
+def make_cleanup_job(statuses: list[str], remove_files: bool = False) -> t.Callable[[TickContext], int]:
+    def cleanup_job(ctx: TickContext) -> int:
+        remove_ids: set[int] = set()
+        for status in statuses:
+            remove_ids.update(torrent.id for torrent in filter_torrents_by_status(ctx.torrents(), status))
+
+        if not remove_ids:
+            log.debug(f"No {'/'.join(statuses)} torrents to remove")
+            return 0
+
+        log.info(f"Removing [{len(remove_ids)}] {'/'.join(statuses)} torrent(s)")
+        ## One torrent-remove call for the whole id set
+        ctx.controller.delete_torrent_by_id(torrent_id=sorted(remove_ids), remove_files=remove_files)
+        ctx.forget(remove_ids)
+
+        return len(remove_ids)
+
+    return cleanup_job
+
+
+def make_free_space_job(path: str, min_bytes: int) -> t.Callable[[TickContext], int | None]:
+    def free_space_job(ctx: TickContext) -> int | None:
+        free_bytes: int | None = ctx.controller.get_free_space(remote_path=path)
+
+        if free_bytes is not None and free_bytes < min_bytes:
+            log.warning(f"Low free space at '{path}': {free_bytes / 1024**3:.1f} GiB (minimum: {min_bytes / 1024**3:.1f} GiB)")
+        else:
+            log.debug(f"Free space at '{path}': {(free_bytes or 0) / 1024**3:.1f} GiB")
+
+        return free_bytes
+
+    return free_space_job
+
+
+def make_search_index_job(index: TorrentSearchIndex) -> t.Callable[[TickContext], dict[str, int]]:
+    def search_index_job(ctx: TickContext) -> dict[str, int]:
+        ## The shared tick list has names & sizes, only new/changed torrents need a file list fetch
+        return sync_search_index(index=index, controller=ctx.controller, torrents=ctx.torrents())
+
+    return search_index_job
+
+
+def make_queue_job(weights: QueueWeights | None = None) -> t.Callable[[TickContext], int]:
+    def queue_job(ctx: TickContext) -> int:
+        ## Refetched with only the queue fields: cleanup removals earlier in the tick shift queue positions
+        plan: QueuePlan = plan_queue_order(torrents=ctx.controller.get_all_torrents(arguments=TORRENT_QUEUE_FIELDS, fresh=True), weights=weights)
+        if plan.moves:
+            log.info(f"Reordering download queue: [{len(plan.moves)}] move(s) for [{len(plan.order)}] torrent(s)")
+
+        return apply_queue_moves(controller=ctx.controller, moves=plan.moves)
+
+    return queue_job
+
+
+def make_bandwidth_job(budget: BandwidthBudget) -> t.Callable[[TickContext], int]:
+    def bandwidth_job(ctx: TickContext) -> int:
+        ## Refetched with only the bandwidth fields: the tick list has every field, this job needs a few
+        df = bandwidth_frame(ctx.controller.get_all_torrents(arguments=TORRENT_BANDWIDTH_FIELDS, fresh=True))
+
+        return push_bandwidth(controller=ctx.controller, calls=diff_bandwidth(df, allocate_bandwidth(df, budget)))
+
+    return bandwidth_job
+
+
+def build_jobs(settings: DaemonSettings) -> list[DaemonJob]:
+    """Create the jobs enabled in settings (an interval of 0 disables a job)."""
+    jobs: list[DaemonJob] = []
+
+    if settings.snapshot_interval:
+        jobs.append(DaemonJob(name="snapshot", interval=settings.snapshot_interval, run=snapshot_job, jitter=settings.jitter_seconds))
+    if settings.cleanup_interval and settings.cleanup_statuses:
+        jobs.append(
+            DaemonJob(
+                name=f"cleanup[{','.join(settings.cleanup_statuses)}]",
+                interval=settings.cleanup_interval,
+                run=make_cleanup_job(statuses=settings.cleanup_statuses, remove_files=settings.cleanup_remove_files),
+                jitter=settings.jitter_seconds,
+            )
+        )
+    if settings.free_space_interval:
+        jobs.append(
+            DaemonJob(
+                name="free-space",
+                interval=settings.free_space_interval,
+                run=make_free_space_job(path=settings.free_space_path, min_bytes=settings.free_space_min_bytes),
+                jitter=settings.jitter_seconds,
+                ## Disk can fill from outside Transmission, so keep checking while idle
+                adaptive=False,
+            )
+        )
+
+    if settings.search_index_interval:
+        jobs.append(
+            DaemonJob(
+                name="search-index",
+                interval=settings.search_index_interval,
+                run=make_search_index_job(index=TorrentSearchIndex(engine=db_depends.get_db_engine())),
+                jitter=settings.jitter_seconds,
+            )
+        )
+    if settings.queue_interval:
+        jobs.append(DaemonJob(name="queue", interval=settings.queue_interval, run=make_queue_job(), jitter=settings.jitter_seconds))
+    if settings.bandwidth_interval and (settings.bandwidth_download_kbps or settings.bandwidth_upload_kbps):
+        budget = BandwidthBudget(
+            download_kbps=settings.bandwidth_download_kbps,
+            upload_kbps=settings.bandwidth_upload_kbps,
+            label_weights=settings.bandwidth_label_weights,
+        )
+        jobs.append(
+            DaemonJob(
+                name="bandwidth",
+                interval=settings.bandwidth_interval,
+                run=make_bandwidth_job(budget=budget),
+                jitter=settings.jitter_seconds,
+            )
+        )
+
+    return jobs
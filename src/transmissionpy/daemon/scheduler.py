@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import signal
+import threading
+import time
+import typing as t
+
+from transmissionpy.core.transmission_lib import TransmissionRPCController
+
+from .jobs import DaemonJob, TickContext
+from .settings import DaemonSettings, daemon_settings
+
+from loguru import logger as log
+from transmission_rpc import Torrent
+from transmission_rpc.error import TransmissionConnectError, TransmissionTimeoutError
+
+## Torrent statuses that count as activity, even when transfer rates are 0
+ACTIVE_STATUSES: list[str] = ["downloading", "download pending", "checking", "check pending"]
+
+
+def torrents_are_idle(torrents: list[Torrent]) -> bool:
+    """Return True when nothing is transferring, downloading or being verified."""
+    for torrent in torrents:
+        if torrent.fields.get("rateDownload", 0) or torrent.fields.get("rateUpload", 0):
+            return False
+        if "status" in torrent.fields and torrent.status in ACTIVE_STATUSES:
+            return False
+
+    return True
+
+
+class DaemonScheduler:
+    """Run jobs on their own intervals over a single, long-lived Transmission connection.
+
+    Jobs that come due in the same tick share one torrent fetch. While Transmission is idle,
+    adaptive job intervals and the tick length are stretched by `idle_backoff_factor` per
+    idle tick (up to `max_idle_factor`), and reset as soon as activity is seen.
+    """
+
+    def __init__(
+        self,
+        controller: TransmissionRPCController,
+        jobs: list[DaemonJob],
+        settings: DaemonSettings = daemon_settings,
+    ) -> None:
+        self.controller: TransmissionRPCController = controller
+        self.jobs: list[DaemonJob] = jobs
+        self.settings: DaemonSettings = settings
+
+        self.ticks: int = 0
+        self.fetches: int = 0
+        self.idle_factor: float = 1.0
+        self._reconnect: bool = False
+        self._stop_event: threading.Event = threading.Event()
+
+    def stop(self, *_: t.Any) -> None:
+        """Ask the scheduler to exit after the current tick. Safe to use as a signal handler."""
+        log.info("Stopping daemon after current tick")
+        self._stop_event.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def _ensure_connection(self) -> None:
+        if self.controller.connected and not self._reconnect:
+            return
+
+        log.info("(Re)connecting to Transmission")
+        self.controller.client = self.controller._create_client()
+        self._reconnect = False
+
+    def _run_job(self, job: DaemonJob, ctx: TickContext) -> None:
+        start: float = time.perf_counter()
+        error: Exception | None = None
+
+        try:
+            result = job.run(ctx)
+            log.debug(f"Job '{job.name}' returned: {result}")
+        except (TransmissionConnectError, TransmissionTimeoutError) as exc:
+            error = exc
+            self._reconnect = True
+            log.error(f"({type(exc)}) Lost connection to Transmission in job '{job.name}'. Details: {exc}")
+        except Exception as exc:
+            error = exc
+            log.error(f"({type(exc)}) Unhandled exception in job '{job.name}'. Details: {exc}")
+
+        job.stats.record(seconds=time.perf_counter() - start, error=error)
+
+    def _update_idle_factor(self, ctx: TickContext) -> None:
+        ## Only judge activity when a job already paid for the torrent fetch
+        if not ctx.fetched:
+            return
+
+        if torrents_are_idle(ctx.torrents()):
+            self.idle_factor = min(self.idle_factor * self.settings.idle_backoff_factor, self.settings.max_idle_factor)
+        elif self.idle_factor != 1.0:
+            log.debug("Transmission is active again, resetting job intervals")
+            self.idle_factor = 1.0
+            ## Pull stretched jobs back in, so they don't wait out their idle interval
+            now: float = time.monotonic()
+            for job in self.jobs:
+                if job.adaptive:
+                    job.next_run = min(job.next_run, now + job.interval)
+
+    def run_tick(self, force: bool = False) -> list[DaemonJob]:
+        """Run every job that is due (or all jobs, when `force=True`).
+
+        Returns:
+            (list[DaemonJob]): The jobs that ran this tick.
+
+        """
+        now: float = time.monotonic()
+        due: list[DaemonJob] = [job for job in self.jobs if force or job.next_run <= now]
+        self.ticks += 1
+
+        if not due:
+            return due
+
+        try:
+            self._ensure_connection()
+        except Exception as exc:
+            log.error(f"({type(exc)}) Unable to connect to Transmission, retrying next tick. Details: {exc}")
+            return []
+
+        ctx: TickContext = TickContext(controller=self.controller, settings=self.settings)
+        for job in due:
+            if self.stopped:
+                break
+            self._run_job(job, ctx)
+
+        self.fetches += ctx.fetch_count
+        self._update_idle_factor(ctx)
+
+        now = time.monotonic()
+        for job in due:
+            job.schedule_next(now=now, idle_factor=self.idle_factor)
+
+        return due
+
+    def seconds_until_next_tick(self) -> float:
+        max_tick: float = min(self.settings.tick_seconds * self.idle_factor, self.settings.max_tick_seconds)
+        if not self.jobs:
+            return max_tick
+
+        next_due: float = min(job.next_run for job in self.jobs) - time.monotonic()
+
+        return max(1.0, min(next_due, max_tick))
+
+    def run(self, max_ticks: int | None = None) -> None:
+        """Loop until stopped by a signal, KeyboardInterrupt or after max_ticks ticks."""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+
+        log.info(f"Starting daemon with [{len(self.jobs)}] job(s): {', '.join(job.name for job in self.jobs)}")
+
+        try:
+            while not self.stopped:
+                self.run_tick()
+
+                if self.settings.stats_every_ticks and self.ticks % self.settings.stats_every_ticks == 0:
+                    self.log_stats()
+                if max_ticks is not None and self.ticks >= max_ticks:
+                    break
+
+                self._stop_event.wait(self.seconds_until_next_tick())
+        except KeyboardInterrupt:
+            log.info("Interrupted, stopping daemon")
+        finally:
+            self.log_stats()
+
+    def stats(self) -> dict[str, dict[str, t.Any]]:
+        """Return per-job run counts and timings."""
+        return {
+            job.name: {
+                "runs": job.stats.runs,
+                "failures": job.stats.failures,
+                "last_seconds": round(job.stats.last_seconds, 4),
+                "mean_seconds": round(job.stats.mean_seconds, 4),
+                "max_seconds": round(job.stats.max_seconds, 4),
+                "last_error": job.stats.last_error,
+                "next_run_in": round(max(0.0, job.next_run - time.monotonic()), 1),
+            }
+            for job in self.jobs
+        }
+
+    def log_stats(self) -> None:
+        log.info(f"Daemon stats: ticks={self.ticks}, torrent fetches={self.fetches}, idle factor={self.idle_factor:g}")
+        for name, stats in self.stats().items():
+            log.info(
+                f"  {name}: runs={stats['runs']} failures={stats['failures']} "
+                f"mean={stats['mean_seconds']}s max={stats['max_seconds']}s next in {stats['next_run_in']}s"
+            )
+
+        if hasattr(self.controller, "get_metrics"):
+            rpc_metrics: dict[str, t.Any] = self.controller.get_metrics()
+            log.info(f"RPC stats (circuit {rpc_metrics['circuit']}):")
+            for operation, stats in rpc_metrics["operations"].items():
+                log.info(
+                    f"  {operation}: calls={stats['calls']} failures={stats['failures']} retries={stats['retries']} "
+                    f"rejected={stats['rejected']} mean={stats['mean_seconds']}s max={stats['max_seconds']}s"
+                )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import typing as t
+
+from dynaconf import Dynaconf
+
+DAEMON_SETTINGS = Dynaconf(environments=True, env="daemon", envvar_prefix="DAEMON", settings_files=["settings.toml", ".secrets.toml"])
+
+@dataclass
+class DaemonSettings:
+    """Scheduling options for `transmissionpy daemon`. Intervals are in seconds, 0 disables a job."""
+
+    ## Base & max time between scheduler ticks. The tick grows towards max_tick while the daemon is idle.
+    tick_seconds: float = field(default=30)
+    max_tick_seconds: float = field(default=600)
+    ## Multiplier applied to adaptive job intervals each idle tick, capped at max_idle_factor
+    idle_backoff_factor: float = field(default=2.0)
+    max_idle_factor: float = field(default=8.0)
+    ## Random +/- seconds added to each job's next run, so jobs don't fire in lockstep
+    jitter_seconds: float = field(default=30)
+
+    snapshot_interval: int = field(default=3600)
+    cleanup_interval: int = field(default=1800)
+    cleanup_statuses: list[str] = field(default_factory=lambda: ["finished"])
+    cleanup_remove_files: bool = field(default=False)
+    free_space_interval: int = field(default=900)
+    free_space_path: str = field(default="/")
+    free_space_min_bytes: int = field(default=50 * 1024**3)
+    search_index_interval: int = field(default=900)
+    ## Reorders the download queue, so off by default
+    queue_interval: int = field(default=0)
+    ## Per-torrent speed limits from global budgets (KB/s, 0 = leave that direction alone). Off by default.
+    bandwidth_interval: int = field(default=0)
+    bandwidth_download_kbps: int = field(default=0)
+    bandwidth_upload_kbps: int = field(default=0)
+    bandwidth_label_weights: dict[str, float] = field(default_factory=dict)
+
+    ## Log per-job timing stats every N ticks (0 = only on shutdown)
+    stats_every_ticks: int = field(default=20)
+
+daemon_settings: DaemonSettings = DaemonSettings(
+    tick_seconds=DAEMON_SETTINGS.get("DAEMON_TICK_SECONDS", default=30),
+    max_tick_seconds=DAEMON_SETTINGS.get("DAEMON_MAX_TICK_SECONDS", default=600),
+    idle_backoff_factor=DAEMON_SETTINGS.get("DAEMON_IDLE_BACKOFF_FACTOR", default=2.0),
+    max_idle_factor=DAEMON_SETTINGS.get("DAEMON_MAX_IDLE_FACTOR", default=8.0),
+    jitter_seconds=DAEMON_SETTINGS.get("DAEMON_JITTER_SECONDS", default=30),
+    snapshot_interval=DAEMON_SETTINGS.get("DAEMON_SNAPSHOT_INTERVAL", default=3600),
+    cleanup_interval=DAEMON_SETTINGS.get("DAEMON_CLEANUP_INTERVAL", default=1800),
+    cleanup_statuses=DAEMON_SETTINGS.get("DAEMON_CLEANUP_STATUSES", default=["finished"]),
+    cleanup_remove_files=DAEMON_SETTINGS.get("DAEMON_CLEANUP_REMOVE_FILES", default=False),
+    free_space_interval=DAEMON_SETTINGS.get("DAEMON_FREE_SPACE_INTERVAL", default=900),
+    free_space_path=DAEMON_SETTINGS.get("DAEMON_FREE_SPACE_PATH", default="/"),
+    free_space_min_bytes=DAEMON_SETTINGS.get("DAEMON_FREE_SPACE_MIN_BYTES", default=50 * 1024**3),
+    search_index_interval=DAEMON_SETTINGS.get("DAEMON_SEARCH_INDEX_INTERVAL", default=900),
+    queue_interval=DAEMON_SETTINGS.get("DAEMON_QUEUE_INTERVAL", default=0),
+    bandwidth_interval=DAEMON_SETTINGS.get("DAEMON_BANDWIDTH_INTERVAL", default=0),
+    bandwidth_download_kbps=DAEMON_SETTINGS.get("DAEMON_BANDWIDTH_DOWNLOAD_KBPS", default=0),
+    bandwidth_upload_kbps=DAEMON_SETTINGS.get("DAEMON_BANDWIDTH_UPLOAD_KBPS", default=0),
+    bandwidth_label_weights=dict(DAEMON_SETTINGS.get("DAEMON_BANDWIDTH_LABEL_WEIGHTS", default={})),
+    stats_every_ticks=DAEMON_SETTINGS.get("DAEMON_STATS_EVERY_TICKS", default=20),
+)
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from .constants import TORRENT_INT_DATETIME_FIELDNAMES
+from .constants import (
+    TORRENT_CATEGORICAL_FIELDNAMES,
+    TORRENT_FLOAT_FIELDNAMES,
+    TORRENT_INT_DATETIME_FIELDNAMES,
+    TORRENT_SECONDS_FIELDNAMES,
+)
+from .pa_dtypes import torrent_pa_types_mapping
 from .pd_dtypes import torrent_df_dtypes_mapping
 from .schemas import (
+    TorrentDetailsIn,
     TorrentFileStatIn,
     TorrentFileStatOut,
     TorrentMetadataIn,
     TorrentMetadataOut,
     TorrentSnapshotMetadataIn,
     TorrentSnapshotMetadataOut,
+    TorrentSummaryIn,
 )
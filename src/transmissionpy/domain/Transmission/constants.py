@@ -1,4 +1,10 @@
 ## List of values that should be converted to datetime
 from __future__ import annotations
 
-TORRENT_INT_DATETIME_FIELDNAMES: list[str] = ["activityDate", "addedDate", "dateCreated", "doneDate", "editDate", "startDate"]
\ No newline at end of file
+TORRENT_INT_DATETIME_FIELDNAMES: list[str] = ["activityDate", "addedDate", "dateCreated", "doneDate", "editDate", "startDate"]
+## Fractional values (Decimal in TorrentMetadataIn, float in the RPC response) that should be float64
+TORRENT_FLOAT_FIELDNAMES: list[str] = ["percentDone", "uploadRatio"]
+## Durations reported in seconds that should be converted to timedelta
+TORRENT_SECONDS_FIELDNAMES: list[str] = ["secondsDownloading", "secondsSeeding"]
+## String values repeated across many torrents that should be stored as categoricals
+TORRENT_CATEGORICAL_FIELDNAMES: list[str] = ["downloadDir", "errorString", "creator"]
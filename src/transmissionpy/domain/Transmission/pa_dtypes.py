@@ -0,0 +1,55 @@
+## Torrent datatype mapping for pyarrow Tables & pd.ArrowDtype DataFrame columns
+from __future__ import annotations
+
+import pyarrow as pa
+
+## Torrent fields with a fixed Arrow type. Other nested fields (files, trackerStats, ...) are inferred.
+torrent_pa_types_mapping: dict[str, pa.DataType] = {
+    "activityDate": pa.int64(),
+    "addedDate": pa.int64(),
+    "bandwidthPriority": pa.int64(),
+    "comment": pa.string(),
+    "corruptEver": pa.int64(),
+    "creator": pa.string(),
+    "dateCreated": pa.int64(),
+    "desiredAvailable": pa.int64(),
+    "doneDate": pa.int64(),
+    "downloadDir": pa.string(),
+    "downloadLimit": pa.int64(),
+    "downloadLimited": pa.bool_(),
+    "downloadedEver": pa.int64(),
+    "editDate": pa.int64(),
+    "error": pa.int64(),
+    "errorString": pa.string(),
+    "eta": pa.int64(),
+    "etaIdle": pa.int64(),
+    "hashString": pa.string(),
+    "haveUnchecked": pa.int64(),
+    "haveValid": pa.int64(),
+    "id": pa.int64(),
+    "isFinished": pa.bool_(),
+    "isPrivate": pa.bool_(),
+    "isStalled": pa.bool_(),
+    "labels": pa.list_(pa.string()),
+    "leftUntilDone": pa.int64(),
+    "magnetLink": pa.string(),
+    "name": pa.string(),
+    "percentDone": pa.float64(),
+    "pieceCount": pa.int64(),
+    "pieceSize": pa.int64(),
+    "pieces": pa.string(),
+    "queuePosition": pa.int64(),
+    "rateDownload": pa.int64(),
+    "rateUpload": pa.int64(),
+    "secondsDownloading": pa.int64(),
+    "secondsSeeding": pa.int64(),
+    "sizeWhenDone": pa.int64(),
+    "startDate": pa.int64(),
+    "status": pa.int64(),
+    "torrentFile": pa.string(),
+    "totalSize": pa.int64(),
+    "uploadLimit": pa.int64(),
+    "uploadLimited": pa.bool_(),
+    "uploadRatio": pa.float64(),
+    "uploadedEver": pa.int64(),
+}
@@ -101,7 +101,9 @@ class TorrentTrackerIn(TorrentTrackerBase):
 class TorrentTrackerOut(TorrentTrackerBase):
     db_id: int
 
-class TorrentMetadataBase(BaseModel):
+class TorrentSummaryBase(BaseModel):
+    """Scalar torrent fields. Files, trackers & pieces are in `TorrentDetailsBase`."""
+
     activityDate: int = Field(default=0)
     addedDate: int = Field(default=0)
     bandwidthPriority: int = Field(default=0)
@@ -120,8 +122,6 @@ class TorrentMetadataBase(BaseModel):
     errorString: str = Field(default="")
     eta: int = Field(default=0)
     etaIdle: int = Field(default=0)
-    fileStats: list[TorrentFileStatBase] = Field(default_factory=list())
-    files: list[TorrentFileBase] = Field(default_factory=list())
     hashString: str = Field(default="")
     haveUnchecked: int = Field(default=0)
     haveValid: int = Field(default=0)
@@ -130,7 +130,7 @@ class TorrentMetadataBase(BaseModel):
     isFinished: bool = Field(default=False)
     isPrivate: bool = Field(default=False)
     isStalled: bool = Field(default=False)
-    # labels: list = ...
+    labels: list[str] = Field(default_factory=list)
     leftUntilDone: int = Field(default=0)
     magnetLink: str = Field(default="")
     manualAnnounceTime: int = Field(default=0)
@@ -146,7 +146,6 @@ class TorrentMetadataBase(BaseModel):
     percentDone: Decimal = Field(default=Decimal(0.0))
     pieceCount: int = Field(default=0)
     pieceSize: int = Field(default=0)
-    pieces: str = Field(default="")
     queuePosition: int = Field(default=0)
     rateDownload: int = Field(default=0)
     rateUpload: int = Field(default=0)
@@ -162,28 +161,53 @@ class TorrentMetadataBase(BaseModel):
     status: int = Field(default=0)
     torrentFile: str = Field(default="")
     totalSize: int = Field(default=0)
-    trackerStats: list[TorrentTrackerStatBase] = Field(default_factory=list())
-    trackers: list[TorrentTrackerBase] = Field(default_factory=list())
     uploadLimit: int = Field(default=0)
     uploadLimited: bool = Field(default=False)
     uploadRatio: Decimal = Field(default=Decimal(0.0))
     uploadedEver: int = Field(default=0)
 
+class TorrentSummaryIn(TorrentSummaryBase):
+    peersFrom: TorrentPeersFromIn = Field(default=None)
+
+
+class TorrentDetailsBase(BaseModel):
+    """Per-file, per-tracker & per-piece torrent fields, fetched on demand."""
+
+    id: int = Field(default=0)
+    hashString: str = Field(default="")
+    fileStats: list[TorrentFileStatBase] = Field(default_factory=list)
+    files: list[TorrentFileBase] = Field(default_factory=list)
+    pieceCount: int = Field(default=0)
+    pieceSize: int = Field(default=0)
+    pieces: str = Field(default="")
+    trackerStats: list[TorrentTrackerStatBase] = Field(default_factory=list)
+    trackers: list[TorrentTrackerBase] = Field(default_factory=list)
+
+class TorrentDetailsIn(TorrentDetailsBase):
+    fileStats: list[TorrentFileStatIn] = Field(default_factory=list)
+    files: list[TorrentFileIn] = Field(default_factory=list)
+    trackerStats: list[TorrentTrackerStatIn] = Field(default_factory=list)
+    trackers: list[TorrentTrackerIn] = Field(default_factory=list)
+
+
+class TorrentMetadataBase(TorrentDetailsBase, TorrentSummaryBase):
+    pass
+
 class TorrentMetadataIn(TorrentMetadataBase):
-    fileStats: list[TorrentFileStatIn] = Field(default_factory=list())
-    files: list[TorrentFileIn] = Field(default_factory=list())
+    fileStats: list[TorrentFileStatIn] = Field(default_factory=list)
+    files: list[TorrentFileIn] = Field(default_factory=list)
     peersFrom: TorrentPeersFromIn = Field(default=None)
-    trackerStats: list[TorrentTrackerStatIn] = Field(default_factory=list())
-    trackers: list[TorrentTrackerIn] = Field(default_factory=list())
+    trackerStats: list[TorrentTrackerStatIn] = Field(default_factory=list)
+    trackers: list[TorrentTrackerIn] = Field(default_factory=list)
 
 class TorrentMetadataOut(TorrentMetadataBase):
     db_id: int
     
-    fileStats: list[TorrentFileStatOut] = Field(default_factory=list())
-    files: list[TorrentFileOut] = Field(default_factory=list())
+    fileStats: list[TorrentFileStatOut] = Field(default_factory=list)
+    files: list[TorrentFileOut] = Field(default_factory=list)
     peersFrom: TorrentPeersFromOut = Field(default=None)
-    trackerStats: list[TorrentTrackerStatOut] = Field(default_factory=list())
-    trackers: list[TorrentTrackerOut] = Field(default_factory=list())
+    trackerStats: list[TorrentTrackerStatOut] = Field(default_factory=list)
+    trackers: list[TorrentTrackerOut] = Field(default_factory=list)
 
 
 class TorrentSnapshotMetadataBase(BaseModel):
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from .collector import (
+    POLL_DURATION_BUCKETS,
+    POLL_FIELDS,
+    STATUS_NAMES,
+    MetricsCollector,
+    aggregate_torrents,
+)
+from .exposition import (
+    OPENMETRICS_CONTENT_TYPE,
+    PROMETHEUS_CONTENT_TYPE,
+    MetricFamily,
+    render,
+)
+from .server import MetricsServer
+from .settings import METRICS_SETTINGS, MetricsSettings, metrics_settings
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+
+from transmissionpy.core.transmission_lib import RpcMetrics, TransmissionRPCController
+
+from .exposition import MetricFamily, render
+from .settings import MetricsSettings, metrics_settings
+
+from loguru import logger as log
+import numpy as np
+from transmission_rpc import Torrent
+
+## Transmission status codes, indexed by the integer status in RPC responses
+STATUS_NAMES: tuple[str, ...] = ("stopped", "check pending", "checking", "download pending", "downloading", "seed pending", "seeding")
+
+## The only torrent fields a poll asks Transmission for
+POLL_FIELDS: list[str] = ["id", "status", "error", "rateDownload", "rateUpload", "leftUntilDone", "sizeWhenDone"]
+## Columns of the array built from POLL_FIELDS (minus id)
+_COLUMNS: tuple[str, ...] = ("status", "error", "rateDownload", "rateUpload", "leftUntilDone", "sizeWhenDone")
+
+## Upper bounds (seconds) of the poll duration histogram buckets
+POLL_DURATION_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def aggregate_torrents(torrents: list[Torrent]) -> dict[str, t.Any]:
+    """Aggregate torrent counts, rates & sizes, overall and per status.
+
+    The torrents' fields are copied into one integer array, then summed with numpy, so the
+    cost per torrent is a single tuple build.
+
+    Returns:
+        (dict): "count", "errored", "download_rate", "upload_rate", "left_until_done" &
+            "size_when_done" totals, and "by_status", a dict of per-status "count",
+            "left_until_done" & "size_when_done".
+
+    """
+    if torrents:
+        values: np.ndarray = np.array(
+            [tuple(torrent.fields.get(column) or 0 for column in _COLUMNS) for torrent in torrents],
+            dtype=np.int64,
+        )
+    else:
+        values = np.zeros((0, len(_COLUMNS)), dtype=np.int64)
+
+    status, error, rate_down, rate_up, left, size = values.T
+    ## Anything outside the known codes is counted as stopped rather than dropped
+    status = np.where((status >= 0) & (status < len(STATUS_NAMES)), status, 0)
+
+    n_statuses: int = len(STATUS_NAMES)
+    counts: np.ndarray = np.bincount(status, minlength=n_statuses)
+    left_by_status: np.ndarray = np.bincount(status, weights=left, minlength=n_statuses)
+    size_by_status: np.ndarray = np.bincount(status, weights=size, minlength=n_statuses)
+
+    return {
+        "count": int(values.shape[0]),
+        "errored": int(np.count_nonzero(error)),
+        "download_rate": int(rate_down.sum()),
+        "upload_rate": int(rate_up.sum()),
+        "left_until_done": int(left.sum()),
+        "size_when_done": int(size.sum()),
+        "by_status": {
+            name: {
+                "count": int(counts[i]),
+                "left_until_done": int(left_by_status[i]),
+                "size_when_done": int(size_by_status[i]),
+            }
+            for i, name in enumerate(STATUS_NAMES)
+        },
+    }
+
+
+class MetricsCollector:
+    """Poll Transmission on a fixed interval, and keep the rendered metrics between polls.
+
+    Scrapes only read the cached exposition, so any number of scrapers cost the daemon one
+    torrent-get (plus one free-space per path) per `poll_interval`.
+    """
+
+    def __init__(self, controller: TransmissionRPCController, settings: MetricsSettings = metrics_settings) -> None:
+        self.controller: TransmissionRPCController = controller
+        self.settings: MetricsSettings = settings
+
+        self.poll_metrics: RpcMetrics = RpcMetrics(buckets=POLL_DURATION_BUCKETS)
+        self.polls: int = 0
+        self.scrapes: int = 0
+        self.up: bool = False
+        self.last_success: float | None = None
+        self.aggregates: dict[str, t.Any] | None = None
+        self.free_space: dict[str, int] = {}
+
+        self._rendered: dict[bool, bytes] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def poll(self) -> bool:
+        """Fetch & aggregate torrents and free space once, then re-render the cached metrics.
+
+        Returns:
+            (bool): `True` if the torrent fetch succeeded.
+
+        """
+        start: float = time.perf_counter()
+        ok: bool = True
+
+        try:
+            torrents: list[Torrent] = self.controller.get_all_torrents(arguments=POLL_FIELDS, fresh=True)
+            aggregates: dict[str, t.Any] | None = aggregate_torrents(torrents)
+        except Exception as exc:
+            log.error(f"({type(exc)}) Error polling torrents from Transmission. Details: {exc}")
+            ok = False
+            aggregates = None
+
+        free_space: dict[str, int] = {}
+        if ok:
+            for path in self.settings.free_space_paths:
+                try:
+                    free_bytes: int | None = self.controller.get_free_space(remote_path=path)
+                except Exception as exc:
+                    log.warning(f"({type(exc)}) Error getting free space for path '{path}'. Details: {exc}")
+                    continue
+                if free_bytes is not None:
+                    free_space[path] = free_bytes
+
+        self.poll_metrics.record_call("poll", time.perf_counter() - start, failed=not ok)
+
+        with self._lock:
+            self.polls += 1
+            self.up = ok
+            if ok:
+                self.aggregates = aggregates
+                self.free_space = free_space
+                self.last_success = time.time()
+
+        self._render()
+
+        return ok
+
+    def collect(self) -> list[MetricFamily]:
+        """Build metric families from the last successful poll & the RPC/poll histograms."""
+        with self._lock:
+            aggregates: dict[str, t.Any] | None = self.aggregates
+            free_space: dict[str, int] = dict(self.free_space)
+            up: bool = self.up
+            last_success: float | None = self.last_success
+
+        families: list[MetricFamily] = [
+            MetricFamily("transmission_up", "gauge", "1 if the last poll of Transmission succeeded.").add(up),
+        ]
+        if last_success is not None:
+            families.append(
+                MetricFamily("transmission_last_poll_success_timestamp_seconds", "gauge", "Unix time of the last successful poll.", unit="seconds").add(last_success)
+            )
+
+        if aggregates is not None:
+            torrents = MetricFamily("transmission_torrents", "gauge", "Torrents, by status.")
+            left = MetricFamily("transmission_left_until_done_bytes", "gauge", "Bytes left to download, by status.", unit="bytes")
+            size = MetricFamily("transmission_size_when_done_bytes", "gauge", "Bytes wanted when done, by status.", unit="bytes")
+            for status, values in aggregates["by_status"].items():
+                torrents.add(values["count"], {"status": status})
+                left.add(values["left_until_done"], {"status": status})
+                size.add(values["size_when_done"], {"status": status})
+
+            families += [
+                torrents,
+                left,
+                size,
+                MetricFamily("transmission_torrents_errored", "gauge", "Torrents with a tracker or local error.").add(aggregates["errored"]),
+                MetricFamily("transmission_download_rate_bytes", "gauge", "Total download rate, in bytes per second.", unit="bytes").add(aggregates["download_rate"]),
+                MetricFamily("transmission_upload_rate_bytes", "gauge", "Total upload rate, in bytes per second.", unit="bytes").add(aggregates["upload_rate"]),
+            ]
+
+        if free_space:
+            free = MetricFamily("transmission_free_space_bytes", "gauge", "Free space on the Transmission host.", unit="bytes")
+            for path, free_bytes in free_space.items():
+                free.add(free_bytes, {"path": path})
+            families.append(free)
+
+        rpc_latency = MetricFamily("transmissionpy_rpc_duration_seconds", "histogram", "Latency of RPCs made by the exporter, by operation.", unit="seconds")
+        for operation, (cumulative, total, count) in self.controller.metrics.histograms().items():
+            rpc_latency.add_histogram(cumulative, self.controller.metrics.buckets, total, count, {"operation": operation})
+
+        rpc_failures = MetricFamily("transmissionpy_rpc_failures", "counter", "Failed RPC attempts, by operation.")
+        rpc_retries = MetricFamily("transmissionpy_rpc_retries", "counter", "Retried RPCs, by operation.")
+        for operation, stats in self.controller.metrics.snapshot().items():
+            rpc_failures.add(stats["failures"], {"operation": operation}, suffix="_total")
+            rpc_retries.add(stats["retries"], {"operation": operation}, suffix="_total")
+
+        poll_duration = MetricFamily("transmissionpy_poll_duration_seconds", "histogram", "Time taken by each poll of Transmission.", unit="seconds")
+        for _, (cumulative, total, count) in self.poll_metrics.histograms().items():
+            poll_duration.add_histogram(cumulative, self.poll_metrics.buckets, total, count)
+        poll_failures = MetricFamily("transmissionpy_poll_failures", "counter", "Polls where fetching torrents failed.")
+        poll_failures.add(self.poll_metrics.snapshot().get("poll", {}).get("failures", 0), suffix="_total")
+
+        families += [
+            rpc_latency,
+            rpc_failures,
+            rpc_retries,
+            poll_duration,
+            poll_failures,
+        ]
+
+        return families
+
+    def _render(self) -> None:
+        families: list[MetricFamily] = self.collect()
+        rendered: dict[bool, bytes] = {True: render(families, openmetrics=True), False: render(families, openmetrics=False)}
+
+        with self._lock:
+            self._rendered = rendered
+
+    def scrape(self, openmetrics: bool = True) -> bytes:
+        """Return the metrics rendered after the last poll. Never calls Transmission."""
+        with self._lock:
+            self.scrapes += 1
+            rendered: bytes | None = self._rendered.get(openmetrics)
+
+        if rendered is None:
+            ## Nothing polled yet
+            return render(self.collect(), openmetrics=openmetrics)
+
+        return rendered
+
+    def _loop(self) -> None:
+        while not self._stop_event.is_set():
+            start: float = time.monotonic()
+            try:
+                self.poll()
+            except Exception as exc:
+                log.error(f"({type(exc)}) Unhandled exception in metrics poll loop. Details: {exc}")
+
+            self._stop_event.wait(max(0.0, self.settings.poll_interval - (time.monotonic() - start)))
+
+    def start(self) -> "MetricsCollector":
+        """Start polling in a background thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._loop, name="transmissionpy-metrics-poll", daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
@@ -0,0 +1,90 @@
+"""Render metric families as OpenMetrics (or Prometheus 0.0.4) text."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+import typing as t
+
+OPENMETRICS_CONTENT_TYPE: str = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass
+class MetricFamily:
+    """One metric & its samples.
+
+    Samples are `(suffix, labels, value)` tuples, where suffix is appended to the family
+    name, i.e. "_total" for counters or "_bucket" for histograms.
+    """
+
+    name: str
+    type: str
+    help: str
+    unit: str | None = field(default=None)
+    samples: list[tuple[str, dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, labels: dict[str, str] | None = None, suffix: str = "") -> "MetricFamily":
+        self.samples.append((suffix, labels or {}, value))
+
+        return self
+
+    def add_histogram(self, cumulative: t.Sequence[int], bounds: t.Sequence[float], total: float, count: int, labels: dict[str, str] | None = None) -> "MetricFamily":
+        """Add a histogram's buckets, sum & count. `cumulative` has one more entry than `bounds`, for +Inf."""
+        labels = labels or {}
+        for bound, bucket_count in zip([*bounds, math.inf], cumulative):
+            self.add(bucket_count, {**labels, "le": format_value(bound)}, suffix="_bucket")
+        self.add(total, labels, suffix="_sum")
+        self.add(count, labels, suffix="_count")
+
+        return self
+
+
+def escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value.is_integer():
+        return f"{value:.1f}"
+
+    return repr(value)
+
+
+def render(families: t.Iterable[MetricFamily], openmetrics: bool = True) -> bytes:
+    """Render metric families as exposition text.
+
+    Params:
+        families (Iterable[MetricFamily]): Metrics to render.
+        openmetrics (bool): `True` for OpenMetrics 1.0, `False` for the Prometheus 0.0.4 text format.
+
+    Returns:
+        (bytes): The UTF-8 encoded exposition, ready to send to a scraper.
+
+    """
+    lines: list[str] = []
+
+    for family in families:
+        ## Prometheus 0.0.4 names counter families with their _total suffix, & has no UNIT line
+        name: str = family.name if (openmetrics or family.type != "counter") else f"{family.name}_total"
+        lines.append(f"# TYPE {name} {family.type}")
+        if openmetrics and family.unit:
+            lines.append(f"# UNIT {name} {family.unit}")
+        lines.append(f"# HELP {name} {escape_label_value(family.help)}")
+
+        for suffix, labels, value in family.samples:
+            label_str: str = ",".join(f'{key}="{escape_label_value(val)}"' for key, val in labels.items())
+            lines.append(f"{family.name}{suffix}{{{label_str}}} {format_value(value)}" if label_str else f"{family.name}{suffix} {format_value(value)}")
+
+    if openmetrics:
+        lines.append("# EOF")
+
+    return ("\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import typing as t
+
+from .collector import MetricsCollector
+from .exposition import OPENMETRICS_CONTENT_TYPE, PROMETHEUS_CONTENT_TYPE
+
+from loguru import logger as log
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server: "MetricsServer"
+
+    def log_message(self, format: str, *args: t.Any) -> None:
+        log.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+
+        ## Scrapers that don't ask for OpenMetrics get the Prometheus text format
+        openmetrics: bool = "application/openmetrics-text" in self.headers.get("Accept", "")
+        body: bytes = self.server.collector.scrape(openmetrics=openmetrics)
+
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """Serve a `MetricsCollector`'s cached metrics on `/metrics`."""
+
+    daemon_threads: bool = True
+
+    def __init__(self, collector: MetricsCollector, host: str = "127.0.0.1", port: int = 9638) -> None:
+        super().__init__((host, port), _MetricsHandler)
+        self.collector: MetricsCollector = collector
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="transmissionpy-metrics-http", daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import typing as t
+
+from dynaconf import Dynaconf
+
+METRICS_SETTINGS = Dynaconf(environments=True, env="metrics", envvar_prefix="METRICS", settings_files=["settings.toml", ".secrets.toml"])
+
+@dataclass
+class MetricsSettings:
+    """Options for `transmissionpy metrics serve`."""
+
+    listen_host: str = field(default="127.0.0.1")
+    listen_port: int = field(default=9638)
+    ## Seconds between polls of the Transmission daemon. Scrapes in between get the cached result.
+    poll_interval: float = field(default=15)
+    ## Paths on the Transmission host to report free space for
+    free_space_paths: list[str] = field(default_factory=lambda: ["/"])
+
+metrics_settings: MetricsSettings = MetricsSettings(
+    listen_host=METRICS_SETTINGS.get("METRICS_LISTEN_HOST", default="127.0.0.1"),
+    listen_port=METRICS_SETTINGS.get("METRICS_LISTEN_PORT", default=9638),
+    poll_interval=METRICS_SETTINGS.get("METRICS_POLL_INTERVAL", default=15),
+    free_space_paths=METRICS_SETTINGS.get("METRICS_FREE_SPACE_PATHS", default=["/"]),
+)
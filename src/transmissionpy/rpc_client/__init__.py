@@ -1,20 +1,101 @@
 from __future__ import annotations
 
-from . import snapshot, utils
+from . import (
+    bandwidth,
+    bulk,
+    duplicates,
+    export,
+    labels,
+    moves,
+    pieces,
+    queue_order,
+    search,
+    snapshot,
+    trackers,
+    utils,
+)
+from .bandwidth import (
+    TORRENT_BANDWIDTH_FIELDS,
+    BandwidthBudget,
+    allocate_bandwidth,
+    diff_bandwidth,
+    water_fill,
+)
+from .bulk import TORRENT_STATUS_FIELDS, parse_id_ranges, verify_throttled
+from .duplicates import (
+    DuplicateGroup,
+    content_signature,
+    find_duplicate_groups,
+    removal_plan,
+)
+from .export import (
+    DEFAULT_EXPORT_CHUNK_SIZE,
+    OUTPUT_FORMATS,
+    STREAM_FORMATS,
+    RecordStreamWriter,
+    stream_frame,
+    stream_torrents,
+)
+from .labels import TORRENT_LABEL_FIELDS, LabelIndex, parse_label_selectors
 from .methods import (
     delete_finished_torrents,
     delete_oldest_torrents,
     delete_torrent,
     delete_torrent_by_transmission_id,
     delete_torrents_by_transmission_id,
+    find_duplicate_torrents,
+    get_label_index,
+    get_piece_stats,
+    get_session_info,
     get_torrent_by_id,
+    get_torrent_details,
+    get_tracker_index,
     list_all_torrents,
     list_finished_torrents,
     list_paused_torrents,
+    list_selected_torrents,
     list_stalled_torrents,
+    optimize_queue,
+    plan_torrent_moves,
+    reannounce_torrents_by_id,
+    rebalance_bandwidth,
+    remove_duplicate_torrents,
+    resolve_torrent_ids,
+    run_torrent_moves,
+    search_torrents,
+    select_torrent_ids,
+    set_session_values,
+    set_torrent_labels,
     snapshot_torrents,
     start_torrent,
+    start_torrents_by_id,
     stop_torrent,
+    stop_torrents_by_id,
+    verify_torrents_by_id,
     write_torrent_to_json,
 )
+from .moves import (
+    TORRENT_MOVE_FIELDS,
+    MoveItem,
+    MovePlan,
+    execute_moves,
+    make_batches,
+    plan_moves,
+)
+from .pieces import (
+    TORRENT_PIECE_FIELDS,
+    completed_ranges,
+    decode_bitfields,
+    piece_stats,
+)
+from .queue_order import (
+    TORRENT_QUEUE_FIELDS,
+    QueuePlan,
+    QueueWeights,
+    minimal_queue_moves,
+    plan_queue_order,
+    score_queue,
+)
+from .search import TORRENT_SEARCH_FIELDS, sync_search_index
 from .snapshot import SnapshotManager
+from .trackers import TORRENT_TRACKER_FIELDS, TrackerIndex, announce_host
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import typing as t
+
+from transmissionpy.core.transmission_lib import TransmissionRPCController
+
+from loguru import logger as log
+import numpy as np
+import pandas as pd
+from transmission_rpc import Torrent
+
+## Fields needed to allocate bandwidth & diff against the current per-torrent settings
+TORRENT_BANDWIDTH_FIELDS: list[str] = [
+    "id",
+    "status",
+    "labels",
+    "rateDownload",
+    "rateUpload",
+    "peersSendingToUs",
+    "peersGettingFromUs",
+    "downloadLimit",
+    "downloadLimited",
+    "uploadLimit",
+    "uploadLimited",
+    "bandwidthPriority",
+]
+## RPC status codes of torrents that can use download / upload bandwidth
+DOWNLOADING_STATUS_CODES: tuple[int, ...] = (4,)
+UPLOADING_STATUS_CODES: tuple[int, ...] = (4, 6)
+
+## torrent-set argument (`Client.change_torrent()` keyword) for each allocation column
+SETTING_ARGUMENTS: dict[str, str] = {
+    "downloadLimit": "download_limit",
+    "downloadLimited": "download_limited",
+    "uploadLimit": "upload_limit",
+    "uploadLimited": "upload_limited",
+    "bandwidthPriority": "bandwidth_priority",
+}
+
+
+@dataclass
+class BandwidthBudget:
+    """Global budgets & weights for `allocate_bandwidth()`. Speeds are in KB/s (1000 bytes), like Transmission's limits."""
+
+    ## Total download / upload speed to share. 0 leaves that direction's limits alone.
+    download_kbps: int = field(default=0)
+    upload_kbps: int = field(default=0)
+    ## Label -> weight. A torrent with several weighted labels uses the largest.
+    label_weights: dict[str, float] = field(default_factory=dict)
+    default_weight: float = field(default=1.0)
+    ## Lowest limit given to an active torrent, so it can still pick up peers (lowered if the budget can't cover it)
+    min_kbps: int = field(default=10)
+    ## Limits are rounded down to a multiple of this, so small rate changes don't cause a torrent-set
+    quantum_kbps: int = field(default=16)
+    ## Demand is the current rate times this, so torrents have room to speed up
+    headroom: float = field(default=1.25)
+
+
+def water_fill(budget: float, demand: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Split `budget` by weight, never giving a torrent more than its demand until every demand is met.
+
+    Solves sum(min(demand, level * weights)) = budget for the fill level, in O(n log n). Budget
+    left after every demand is met is shared by weight on top of the demands.
+
+    Params:
+        budget (float): Amount to split.
+        demand (np.ndarray): What each torrent can use.
+        weights (np.ndarray): Positive weight of each torrent.
+
+    Returns:
+        (np.ndarray): Each torrent's share.
+
+    """
+    if demand.size == 0:
+        return np.zeros(0)
+
+    total_demand: float = float(demand.sum())
+    if total_demand <= budget:
+        return demand + (budget - total_demand) * weights / weights.sum()
+
+    ## Sorted by demand / weight, the first k torrents are capped at their demand, the rest at level * weight
+    ratio: np.ndarray = demand / weights
+    order: np.ndarray = np.argsort(ratio, kind="stable")
+    sorted_ratio: np.ndarray = ratio[order]
+    capped_demand: np.ndarray = np.concatenate(([0.0], np.cumsum(demand[order])))[:-1]
+    weight_left: np.ndarray = np.cumsum(weights[order][::-1])[::-1]
+    filled_at: np.ndarray = capped_demand + sorted_ratio * weight_left
+
+    k: int = int(np.searchsorted(filled_at, budget, side="left"))
+    level: float = (budget - capped_demand[k]) / weight_left[k]
+
+    return np.minimum(demand, level * weights)
+
+
+def bandwidth_frame(torrents: t.Iterable[t.Union[Torrent, dict]]) -> pd.DataFrame:
+    """Build a DataFrame with the `TORRENT_BANDWIDTH_FIELDS` of every torrent."""
+    return pd.DataFrame.from_records(
+        [
+            {name: fields.get(name) for name in TORRENT_BANDWIDTH_FIELDS}
+            for fields in (torrent.fields if isinstance(torrent, Torrent) else torrent for torrent in torrents)
+        ],
+        columns=TORRENT_BANDWIDTH_FIELDS,
+    )
+
+
+def label_weights(labels: pd.Series, budget: BandwidthBudget) -> np.ndarray:
+    """Return each torrent's weight: the largest weight of its labels, or the default weight."""
+    if not budget.label_weights:
+        return np.full(len(labels), budget.default_weight, dtype="float64")
+
+    exploded: pd.Series = labels.map(lambda value: value or [None]).explode()
+    weights: pd.Series = exploded.map(budget.label_weights).astype("float64")
+
+    return weights.groupby(level=0).max().reindex(labels.index).fillna(budget.default_weight).to_numpy()
+
+
+def allocate_bandwidth(df: pd.DataFrame, budget: BandwidthBudget) -> pd.DataFrame:
+    """Compute per-torrent limits & priorities from current rates, peer counts and label weights.
+
+    For each direction with a budget, active torrents share it by weight (see `water_fill()`).
+    A torrent's demand is its current rate plus headroom, or `min_kbps` without peers to
+    transfer with. Priorities follow weights: high above the default weight, low below it.
+
+    Params:
+        df (pandas.DataFrame): A `bandwidth_frame()`.
+        budget (BandwidthBudget): Budgets & weights.
+
+    Returns:
+        (pandas.DataFrame): Indexed by torrent id, with the wanted downloadLimit, downloadLimited,
+            uploadLimit, uploadLimited & bandwidthPriority (NaN/None = leave as is).
+
+    """
+    alloc = pd.DataFrame(index=pd.Index(df["id"].to_numpy(), name="id"))
+    weights: np.ndarray = label_weights(df["labels"], budget)
+    status: np.ndarray = df["status"].fillna(0).to_numpy()
+
+    directions: list[tuple[str, int, tuple[int, ...], str, str]] = [
+        ("download", budget.download_kbps, DOWNLOADING_STATUS_CODES, "rateDownload", "peersSendingToUs"),
+        ("upload", budget.upload_kbps, UPLOADING_STATUS_CODES, "rateUpload", "peersGettingFromUs"),
+    ]
+    for direction, total_kbps, status_codes, rate_field, peers_field in directions:
+        limit: np.ndarray = np.full(len(df), np.nan)
+
+        active: np.ndarray = np.isin(status, status_codes)
+        if total_kbps and active.any():
+            rate_kbps: np.ndarray = df[rate_field].fillna(0).to_numpy(dtype="float64")[active] / 1000
+            peers: np.ndarray = df[peers_field].fillna(0).to_numpy(dtype="float64")[active]
+            demand: np.ndarray = np.where(peers > 0, np.maximum(rate_kbps * budget.headroom, budget.min_kbps), budget.min_kbps)
+
+            ## With more active torrents than the budget can give min_kbps each, the floor shrinks (0 would block them)
+            floor_kbps: int = max(1, min(budget.min_kbps, total_kbps // int(active.sum())))
+            share: np.ndarray = water_fill(float(total_kbps), demand, weights[active])
+            quantum: int = max(1, budget.quantum_kbps)
+            limit[active] = np.maximum(np.floor(share / quantum) * quantum, floor_kbps)
+
+        alloc[f"{direction}Limit"] = pd.array(limit, dtype="Int64")
+        alloc[f"{direction}Limited"] = pd.array(np.where(np.isnan(limit), None, True), dtype="boolean")
+
+    any_active: np.ndarray = alloc["downloadLimit"].notna().to_numpy() | alloc["uploadLimit"].notna().to_numpy()
+    priority: np.ndarray = np.sign(weights - budget.default_weight)
+    alloc["bandwidthPriority"] = pd.array(np.where(any_active, priority, np.nan), dtype="Int64")
+
+    return alloc
+
+
+def diff_bandwidth(df: pd.DataFrame, alloc: pd.DataFrame) -> list[tuple[dict[str, t.Any], list[int]]]:
+    """Compare wanted settings against current ones, and group changed torrents by identical settings.
+
+    Changed torrents get all of their wanted settings (not only the changed ones), so torrents
+    sharing the same wanted settings share one torrent-set.
+
+    Params:
+        df (pandas.DataFrame): The `bandwidth_frame()` the allocation was computed from.
+        alloc (pandas.DataFrame): An `allocate_bandwidth()` result.
+
+    Returns:
+        (list[tuple[dict, list[int]]]): (`Client.change_torrent()` keyword arguments, torrent ids) per torrent-set.
+
+    """
+    current: pd.DataFrame = df.set_index("id")[list(SETTING_ARGUMENTS)].reindex(alloc.index)
+
+    changed: np.ndarray = np.zeros(len(alloc), dtype=bool)
+    for column in SETTING_ARGUMENTS:
+        wanted: pd.Series = alloc[column]
+        changed |= (wanted.notna() & (wanted.astype("object") != current[column].astype("object"))).to_numpy()
+
+    if not changed.any():
+        return []
+
+    ## Missing values can't be group keys, so they become a sentinel that's dropped from the arguments
+    wanted_changed: pd.DataFrame = alloc[changed].astype("object").where(alloc[changed].notna(), "-")
+    calls: list[tuple[dict[str, t.Any], list[int]]] = []
+    for key, group in wanted_changed.groupby(list(SETTING_ARGUMENTS), sort=False):
+        changes: dict[str, t.Any] = {
+            SETTING_ARGUMENTS[column]: (bool(value) if column.endswith("Limited") else int(value))
+            for column, value in zip(SETTING_ARGUMENTS, key)
+            if value != "-"
+        }
+        calls.append((changes, group.index.tolist()))
+
+    return calls
+
+
+def push_bandwidth(controller: TransmissionRPCController, calls: t.Iterable[tuple[dict[str, t.Any], list[int]]]) -> int:
+    """Send grouped settings from `diff_bandwidth()`. Returns the number of RPCs made."""
+    rpcs: int = 0
+    for changes, torrent_ids in calls:
+        rpcs += controller.set_torrents(torrent_ids=torrent_ids, **changes)
+
+    log.debug(f"Pushed bandwidth settings in [{rpcs}] torrent-set call(s)")
+
+    return rpcs
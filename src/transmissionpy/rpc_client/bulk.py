@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+import typing as t
+
+from transmissionpy.core.transmission_lib import TransmissionRPCController
+
+from loguru import logger as log
+
+## Fields needed to filter torrents by status (see `utils.filter_torrents_by_status()`)
+TORRENT_STATUS_FIELDS: list[str] = ["id", "status", "doneDate", "isStalled", "error"]
+## RPC status codes of torrents waiting for, or in, a hash check
+CHECKING_STATUS_CODES: frozenset[int] = frozenset({1, 2})
+
+
+def parse_id_ranges(specs: t.Iterable[str | int]) -> list[int]:
+    """Parse torrent id specs, i.e. `["1-50,77", "80"]`, into sorted unique ids.
+
+    Params:
+        specs (Iterable[str|int]): Ids, comma-separated ids, and inclusive `start-end` ranges.
+
+    Returns:
+        (list[int]): Sorted, de-duplicated ids.
+
+    Raises:
+        ValueError: When a spec is not an id or a range.
+
+    """
+    torrent_ids: set[int] = set()
+
+    for spec in specs:
+        for part in str(spec).split(","):
+            part = part.strip()
+            if not part:
+                continue
+
+            start, sep, end = part.partition("-")
+            try:
+                if not sep:
+                    torrent_ids.add(int(start))
+                    continue
+                first, last = int(start), int(end)
+            except ValueError:
+                raise ValueError(f"Invalid torrent id or range: '{part}'. Use i.e. 12, 1-50 or 1-50,77")
+            if first > last:
+                raise ValueError(f"Invalid torrent id range: '{part}'. Start must not be greater than end")
+
+            torrent_ids.update(range(first, last + 1))
+
+    return sorted(torrent_ids)
+
+
+def verify_throttled(
+    controller: TransmissionRPCController,
+    torrent_ids: t.Iterable[int],
+    max_checking: int = 2,
+    poll_interval: float = 5.0,
+) -> int:
+    """Hash check torrents with at most `max_checking` of them waiting for or in a check at once.
+
+    Transmission queues every torrent it's asked to verify; on a large library that leaves
+    thousands of torrents in "check pending". Instead, ids are sent in windows: whenever polled
+    torrents finish their check, the same number of new ids is sent in one torrent-verify.
+
+    Params:
+        controller (TransmissionRPCController): An open controller.
+        torrent_ids (Iterable[int]): Torrents to verify.
+        max_checking (int): Max torrents checking (or waiting to) at once. 0 = send all at once.
+        poll_interval (float): Seconds between status checks of the verifying torrents.
+
+    Returns:
+        (int): Number of torrent-verify RPCs made.
+
+    """
+    pending: list[int] = list(torrent_ids)
+    if max_checking <= 0:
+        return controller.verify_torrents(torrent_ids=pending)
+
+    checking: set[int] = set()
+    calls: int = 0
+    done: int = 0
+    total: int = len(pending)
+
+    while pending or checking:
+        if pending and len(checking) < max_checking:
+            batch: list[int] = pending[:max_checking - len(checking)]
+            pending = pending[len(batch):]
+            calls += controller.verify_torrents(torrent_ids=batch)
+            checking.update(batch)
+
+        time.sleep(poll_interval)
+
+        still_checking: set[int] = {
+            torrent.id
+            for torrent in controller.get_multiple_torrents(ids=sorted(checking), arguments=["id", "status"])
+            if torrent.fields.get("status") in CHECKING_STATUS_CODES
+        }
+        ## Torrents removed while checking are dropped, too
+        finished: int = len(checking - still_checking)
+        if finished:
+            done += finished
+            log.info(f"Verified [{done}/{total}] torrent(s)")
+        checking = still_checking
+
+    return calls
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+import hashlib
+import typing as t
+
+from loguru import logger as log
+from transmission_rpc import Torrent
+
+## Fields for the size pre-filter, fetched for every torrent
+TORRENT_DUPLICATE_SIZE_FIELDS: list[str] = ["id", "totalSize"]
+## Fields fetched only for torrents sharing their totalSize with another torrent
+TORRENT_DUPLICATE_FIELDS: list[str] = [
+    "id",
+    "hashString",
+    "name",
+    "totalSize",
+    "files",
+    "downloadDir",
+    "percentDone",
+    "uploadedEver",
+    "trackerStats",
+]
+
+
+def _fields(torrent: t.Union[Torrent, dict]) -> dict:
+    return torrent.fields if isinstance(torrent, Torrent) else torrent
+
+
+def content_signature(torrent: t.Union[Torrent, dict]) -> str | None:
+    """Return a digest of a torrent's content: its totalSize and sorted (relative path, length) pairs.
+
+    Paths are relative to the torrent's top-level directory, so the same content added under
+    another name still matches. A single-file torrent has no top-level directory, so its file
+    name is kept, otherwise any two single-file torrents of the same size would match.
+    Torrents without a file list (magnets still fetching metadata) have no signature.
+    """
+    fields: dict = _fields(torrent)
+    files: list[dict] = fields.get("files") or []
+    if not files:
+        return None
+
+    entries: list[tuple[str, int]] = sorted(
+        (file["name"].split("/", 1)[1] if "/" in file["name"] else file["name"], file["length"]) for file in files
+    )
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(fields.get("totalSize", 0)).encode())
+    for path, length in entries:
+        digest.update(f"\n{path}\0{length}".encode())
+
+    return digest.hexdigest()
+
+
+def best_seeders(torrent: t.Union[Torrent, dict]) -> int:
+    """Return the highest seeder count any tracker reports for a torrent (0 if none are known)."""
+    tracker_stats: list[dict] = _fields(torrent).get("trackerStats") or []
+
+    return max([0, *(stat.get("seederCount", -1) for stat in tracker_stats)])
+
+
+def _keep_rank(fields: dict) -> tuple:
+    ## Complete copies first, then the best-seeded, then the one that uploaded the most
+    return (fields.get("percentDone", 0) >= 1, best_seeders(fields), fields.get("uploadedEver", 0))
+
+
+def _location(fields: dict) -> tuple[str, str]:
+    return (fields.get("downloadDir") or "").rstrip("/"), fields.get("name") or ""
+
+
+@dataclass
+class DuplicateGroup:
+    signature: str
+    total_size: int
+    ## Best copy (the one to keep) first
+    torrents: list[dict] = field(default_factory=list)
+
+    @property
+    def keep(self) -> dict:
+        return self.torrents[0]
+
+    @property
+    def duplicates(self) -> list[dict]:
+        return self.torrents[1:]
+
+    def shares_data(self, fields: dict) -> bool:
+        """True if a duplicate's data is stored at the same path as the kept copy's."""
+        return _location(fields) == _location(self.keep)
+
+    @property
+    def reclaimable_bytes(self) -> int:
+        """Bytes on disk freed by removing the duplicates' data. Copies sharing the kept copy's path free nothing."""
+        return sum(
+            int(self.total_size * fields.get("percentDone", 0)) for fields in self.duplicates if not self.shares_data(fields)
+        )
+
+
+def size_candidates(torrents: t.Iterable[t.Union[Torrent, dict]], min_size: int = 0) -> list[int]:
+    """Return ids of torrents whose totalSize is shared with at least one other torrent.
+
+    Duplicates always have the same totalSize, so only these need their file lists fetched.
+    """
+    sizes: list[tuple[int, int]] = [(fields["id"], fields.get("totalSize") or 0) for fields in map(_fields, torrents)]
+    counts: Counter = Counter(size for _, size in sizes)
+
+    return [torrent_id for torrent_id, size in sizes if size > 0 and size >= min_size and counts[size] > 1]
+
+
+def find_duplicate_groups(torrents: t.Iterable[t.Union[Torrent, dict]], min_size: int = 0) -> list[DuplicateGroup]:
+    """Group torrents by content signature in one pass, and keep groups with more than one torrent.
+
+    Params:
+        torrents (Iterable[Torrent|dict]): Torrents with the `TORRENT_DUPLICATE_FIELDS`.
+        min_size (int): Ignore torrents smaller than this many bytes.
+
+    Returns:
+        (list[DuplicateGroup]): Duplicate groups, most reclaimable bytes first.
+
+    """
+    by_signature: dict[str, list[dict]] = {}
+
+    for fields in map(_fields, torrents):
+        if (fields.get("totalSize") or 0) < min_size:
+            continue
+
+        signature: str | None = content_signature(fields)
+        if signature is not None:
+            by_signature.setdefault(signature, []).append(fields)
+
+    groups: list[DuplicateGroup] = [
+        DuplicateGroup(signature=signature, total_size=members[0].get("totalSize") or 0, torrents=sorted(members, key=_keep_rank, reverse=True))
+        for signature, members in by_signature.items()
+        if len(members) > 1
+    ]
+    groups.sort(key=lambda group: group.reclaimable_bytes, reverse=True)
+
+    log.debug(f"Found [{len(groups)}] duplicate group(s) across [{sum(len(group.torrents) for group in groups)}] torrent(s)")
+
+    return groups
+
+
+def removal_plan(groups: t.Iterable[DuplicateGroup]) -> list[dict]:
+    """List the torrents to remove so each group keeps only its best-seeded copy.
+
+    `remove_files` is False for copies whose data lives at the kept copy's path, so removing them
+    can never delete the data being kept.
+    """
+    plan: list[dict] = []
+
+    for group in groups:
+        for fields in group.duplicates:
+            shared: bool = group.shares_data(fields)
+            plan.append(
+                {
+                    "id": fields["id"],
+                    "hashString": fields.get("hashString"),
+                    "name": fields.get("name"),
+                    "downloadDir": fields.get("downloadDir"),
+                    "keep_id": group.keep["id"],
+                    "keep_hashString": group.keep.get("hashString"),
+                    "remove_files": not shared,
+                    "bytes": 0 if shared else int(group.total_size * fields.get("percentDone", 0)),
+                }
+            )
+
+    return plan
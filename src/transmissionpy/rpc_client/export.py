@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from contextlib import AbstractContextManager
+from itertools import islice
+import json
+from pathlib import Path
+import sys
+import typing as t
+
+from transmissionpy.domain.Transmission import torrent_pa_types_mapping
+
+from loguru import logger as log
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from transmission_rpc import Torrent
+
+## `table` is the pandas display of each command, the others stream machine-readable records
+OUTPUT_FORMATS: tuple[str, ...] = ("table", "jsonl", "csv", "parquet", "arrow")
+STREAM_FORMATS: tuple[str, ...] = OUTPUT_FORMATS[1:]
+## Records converted & written at once. Bounds the memory used for output, not for the fetched torrents.
+DEFAULT_EXPORT_CHUNK_SIZE: int = 5000
+
+## Compact, reused encoder. RPC values are plain JSON types, anything else (i.e. Timestamp) is written as a string.
+_JSON_ENCODER: json.JSONEncoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def iter_chunks(records: t.Iterable[t.Any], chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE) -> t.Iterator[list]:
+    """Yield lists of up to `chunk_size` items."""
+    iterator: t.Iterator = iter(records)
+    while chunk := list(islice(iterator, max(1, chunk_size))):
+        yield chunk
+
+
+def records_schema(records: list[dict], columns: list[str]) -> tuple[pa.Schema, set[str]]:
+    """Build the Arrow schema for torrent records, and the columns that must be written as JSON strings.
+
+    Known torrent fields use `torrent_pa_types_mapping`, so every chunk gets the same types.
+    Other fields are inferred from their first value in `records`; fields without a value
+    there can't be typed up front and are written as JSON strings.
+    """
+    schema_fields: list[pa.Field] = []
+    json_columns: set[str] = set()
+
+    for col in columns:
+        pa_type: pa.DataType | None = torrent_pa_types_mapping.get(col)
+        if pa_type is None:
+            sample: t.Any = next((record[col] for record in records if record.get(col) is not None), None)
+            pa_type = pa.array([sample]).type if sample is not None else pa.null()
+        if pa.types.is_null(pa_type):
+            json_columns.add(col)
+            pa_type = pa.string()
+        schema_fields.append(pa.field(col, pa_type))
+
+    return pa.schema(schema_fields), json_columns
+
+
+class RecordStreamWriter(AbstractContextManager):
+    """Write chunks of records (dicts) or DataFrames as JSON lines, CSV, Parquet or an Arrow IPC stream.
+
+    The schema (and CSV header) comes from the first chunk; later chunks are converted to it,
+    so the output is one consistent table however it's chunked.
+
+    Params:
+        fmt (str): One of `STREAM_FORMATS`.
+        output (str|Path): File to write. None writes to stdout.
+        columns (list[str]): Record keys to write. Default: the keys of the first record.
+        schema (pyarrow.Schema): Arrow schema for Parquet/Arrow output. Default: from the first chunk.
+    """
+
+    def __init__(self, fmt: str, output: t.Union[str, Path, None] = None, columns: list[str] | None = None, schema: pa.Schema | None = None) -> None:
+        if fmt not in STREAM_FORMATS:
+            raise ValueError(f"Invalid output format: '{fmt}'. Must be one of {STREAM_FORMATS}")
+
+        self.fmt: str = fmt
+        self.output: Path | None = Path(output) if output else None
+        self.columns: list[str] | None = list(columns) if columns else None
+        self.rows: int = 0
+
+        self.schema: pa.Schema | None = schema
+        self._json_columns: set[str] = set()
+        self._writer: pq.ParquetWriter | pa.ipc.RecordBatchStreamWriter | pa_csv.CSVWriter | None = None
+
+        if self.output is not None:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            self._sink: t.BinaryIO = open(self.output, "wb")
+        else:
+            ## Anything already printed must come first
+            sys.stdout.flush()
+            self._sink = sys.stdout.buffer
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _open(self, schema: pa.Schema) -> None:
+        self.schema = schema
+        match self.fmt:
+            case "parquet":
+                self._writer = pq.ParquetWriter(self._sink, schema)
+            case "arrow":
+                self._writer = pa.ipc.new_stream(self._sink, schema)
+            case "csv":
+                self._writer = pa_csv.CSVWriter(self._sink, schema)
+
+    def _write_batch(self, batch: pa.RecordBatch) -> None:
+        if self.fmt == "parquet":
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+
+    def write_records(self, records: list[dict]) -> None:
+        """Convert & write one chunk of records."""
+        if not records:
+            return
+        if self.columns is None:
+            self.columns = list(records[0])
+
+        if self.fmt == "jsonl":
+            lines: t.Iterable[str] = (_JSON_ENCODER.encode({col: record.get(col) for col in self.columns}) for record in records)
+            self._sink.write(("\n".join(lines) + "\n").encode("utf-8"))
+            self.rows += len(records)
+            return
+
+        if self._writer is None:
+            schema, self._json_columns = (self.schema, set()) if self.schema is not None else records_schema(records, self.columns)
+            if self.fmt == "csv":
+                ## CSV cells can't hold lists or structs (i.e. labels), those are written as JSON
+                for index, schema_field in enumerate(schema):
+                    if pa.types.is_nested(schema_field.type):
+                        self._json_columns.add(schema_field.name)
+                        schema = schema.set(index, pa.field(schema_field.name, pa.string()))
+            self._open(schema)
+
+        arrays: list[pa.Array] = []
+        for schema_field in self.schema:
+            values: list = [record.get(schema_field.name) for record in records]
+            if schema_field.name in self._json_columns:
+                values = [None if value is None else _JSON_ENCODER.encode(value) for value in values]
+            try:
+                arrays.append(pa.array(values, type=schema_field.type))
+            except Exception as exc:
+                msg = f"({type(exc)}) Error converting field '{schema_field.name}' to {schema_field.type}. Details: {exc}"
+                log.error(msg)
+
+                raise exc
+
+        self._write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.rows += len(records)
+
+    def write_frame(self, df: pd.DataFrame) -> None:
+        """Convert & write one chunk of a DataFrame (the index is not written)."""
+        if df.empty:
+            return
+
+        match self.fmt:
+            case "jsonl":
+                self._sink.write(df.to_json(orient="records", lines=True, date_format="iso").encode("utf-8"))
+            case "csv":
+                ## pandas writes timedelta & category columns that Arrow's CSV writer can't
+                self._sink.write(df.to_csv(index=False, header=self.rows == 0).encode("utf-8"))
+            case _:
+                if self._writer is None:
+                    self._open(self.schema or pa.Schema.from_pandas(df, preserve_index=False))
+                self._write_batch(pa.RecordBatch.from_pandas(df, schema=self.schema, preserve_index=False))
+
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+        if self._sink is sys.stdout.buffer:
+            self._sink.flush()
+        elif not self._sink.closed:
+            self._sink.close()
+
+
+def stream_torrents(
+    torrents: t.Iterable[t.Union[Torrent, dict]],
+    fmt: str,
+    output: t.Union[str, Path, None] = None,
+    columns: list[str] | None = None,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> int:
+    """Write torrent fields straight from the RPC response, `chunk_size` torrents at a time, without a DataFrame.
+
+    Params:
+        torrents (Iterable[Torrent|dict]): Torrents, or their field dicts.
+        fmt (str): One of `STREAM_FORMATS`.
+        output (str|Path): File to write. None writes to stdout.
+        columns (list[str]): Fields to write. Default: the fields of the first torrent.
+        chunk_size (int): Torrents converted & written at once.
+
+    Returns:
+        (int): Number of torrents written.
+
+    """
+    records: t.Iterator[dict] = (torrent.fields if isinstance(torrent, Torrent) else torrent for torrent in torrents)
+
+    with RecordStreamWriter(fmt=fmt, output=output, columns=columns) as writer:
+        for chunk in iter_chunks(records, chunk_size=chunk_size):
+            writer.write_records(chunk)
+
+    log.debug(f"Wrote [{writer.rows}] torrent(s) as {fmt} to {output or 'stdout'}")
+
+    return writer.rows
+
+
+def stream_frame(
+    df: pd.DataFrame,
+    fmt: str,
+    output: t.Union[str, Path, None] = None,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> int:
+    """Write a DataFrame `chunk_size` rows at a time. Returns the number of rows written."""
+    ## Schema of the whole frame, so object columns that are empty in the first chunk still get a type
+    schema: pa.Schema | None = pa.Schema.from_pandas(df, preserve_index=False) if fmt in ("parquet", "arrow") else None
+
+    with RecordStreamWriter(fmt=fmt, output=output, schema=schema) as writer:
+        for start in range(0, len(df), max(1, chunk_size)):
+            writer.write_frame(df.iloc[start:start + chunk_size])
+
+    return writer.rows
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from collections import Counter
+import typing as t
+
+from loguru import logger as log
+from transmission_rpc import Torrent
+
+## Fields needed to build a LabelIndex
+TORRENT_LABEL_FIELDS: list[str] = ["id", "labels"]
+
+
+def parse_label_selectors(selectors: t.Iterable[str]) -> list[tuple[frozenset[str], bool]]:
+    """Parse CLI label selectors.
+
+    Each selector is a comma-separated list of labels, matching torrents with ANY of them.
+    Separate selectors must ALL match. A leading "!" negates a selector.
+
+    i.e. `["tv,movies", "!keep"]` selects torrents labelled tv or movies, and not keep.
+
+    Returns:
+        (list[tuple[frozenset[str], bool]]): `(labels, negated)` per selector.
+
+    """
+    parsed: list[tuple[frozenset[str], bool]] = []
+
+    for selector in selectors:
+        selector = selector.strip()
+        negated: bool = selector.startswith("!")
+        labels: frozenset[str] = frozenset(label.strip() for label in selector.lstrip("!").split(",") if label.strip())
+        if not labels:
+            raise ValueError(f"Invalid label selector: '{selector}'")
+
+        parsed.append((labels, negated))
+
+    return parsed
+
+
+class LabelIndex:
+    """Inverted index from label to torrent ids, built from one torrent-get of ids & labels."""
+
+    def __init__(self, ids_by_label: dict[str, set[int]], labels_by_id: dict[int, tuple[str, ...]]) -> None:
+        self.ids_by_label: dict[str, set[int]] = ids_by_label
+        self.labels_by_id: dict[int, tuple[str, ...]] = labels_by_id
+        self.all_ids: set[int] = set(labels_by_id)
+
+    @classmethod
+    def from_torrents(cls, torrents: t.Iterable[t.Union[Torrent, dict]]) -> "LabelIndex":
+        ids_by_label: dict[str, set[int]] = {}
+        labels_by_id: dict[int, tuple[str, ...]] = {}
+
+        for torrent in torrents:
+            fields: dict = torrent.fields if isinstance(torrent, Torrent) else torrent
+            torrent_id: int = fields["id"]
+            labels: tuple[str, ...] = tuple(fields.get("labels") or ())
+
+            labels_by_id[torrent_id] = labels
+            for label in labels:
+                ids_by_label.setdefault(label, set()).add(torrent_id)
+
+        return cls(ids_by_label=ids_by_label, labels_by_id=labels_by_id)
+
+    def counts(self) -> Counter:
+        """Return the number of torrents per label, most common first."""
+        return Counter({label: len(ids) for label, ids in self.ids_by_label.items()})
+
+    def select(self, selectors: t.Iterable[str]) -> set[int]:
+        """Return the ids of torrents matching every selector (see `parse_label_selectors()`)."""
+        parsed: list[tuple[frozenset[str], bool]] = parse_label_selectors(selectors)
+        ## Intersect the smallest positive selectors first, so the working set shrinks fast
+        parsed.sort(key=lambda item: (item[1], sum(len(self.ids_by_label.get(label, ())) for label in item[0])))
+
+        selected: set[int] | None = None
+        for labels, negated in parsed:
+            matched: set[int] = set().union(*(self.ids_by_label.get(label, set()) for label in labels))
+
+            if negated:
+                selected = (self.all_ids if selected is None else selected) - matched
+            else:
+                selected = matched if selected is None else selected & matched
+
+            if not selected:
+                return set()
+
+        return set(self.all_ids) if selected is None else selected
+
+    def plan_label_change(
+        self,
+        torrent_ids: t.Iterable[int],
+        add: t.Iterable[str] = (),
+        remove: t.Iterable[str] = (),
+        replace: t.Iterable[str] | None = None,
+    ) -> dict[tuple[str, ...], list[int]]:
+        """Group torrents by their new label list, skipping torrents whose labels don't change.
+
+        torrent-set replaces a torrent's whole label list, so each distinct resulting list
+        needs its own call. Grouping keeps that to one call per distinct list.
+
+        Params:
+            torrent_ids (Iterable[int]): Torrents to change.
+            add (Iterable[str]): Labels to add.
+            remove (Iterable[str]): Labels to remove.
+            replace (Iterable[str]): Replace all labels with these, instead of adding/removing.
+
+        Returns:
+            (dict[tuple[str, ...], list[int]]): New label list -> ids of torrents that get it.
+
+        """
+        add = list(dict.fromkeys(add))
+        remove_set: set[str] = set(remove)
+        replacement: tuple[str, ...] | None = tuple(dict.fromkeys(replace)) if replace is not None else None
+        plan: dict[tuple[str, ...], list[int]] = {}
+
+        for torrent_id in torrent_ids:
+            current: tuple[str, ...] = self.labels_by_id.get(torrent_id, ())
+            if replacement is not None:
+                new: tuple[str, ...] = replacement
+            else:
+                new = tuple(label for label in current if label not in remove_set)
+                new += tuple(label for label in add if label not in new and label not in remove_set)
+
+            if new != current:
+                plan.setdefault(new, []).append(torrent_id)
+
+        log.debug(f"Label change touches [{sum(len(ids) for ids in plan.values())}] torrent(s) in [{len(plan)}] group(s)")
+
+        return plan
+
+    def apply_label_change(self, plan: dict[tuple[str, ...], list[int]]) -> None:
+        """Update the index after a planned label change was sent to Transmission."""
+        for new, torrent_ids in plan.items():
+            for torrent_id in torrent_ids:
+                for label in self.labels_by_id.get(torrent_id, ()):
+                    self.ids_by_label.get(label, set()).discard(torrent_id)
+                for label in new:
+                    self.ids_by_label.setdefault(label, set()).add(torrent_id)
+                self.labels_by_id[torrent_id] = new
+
+        self.ids_by_label = {label: ids for label, ids in self.ids_by_label.items() if ids}
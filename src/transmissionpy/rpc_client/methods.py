@@ -4,7 +4,10 @@ import json
 import typing as t
 
 from transmissionpy.core import transmission_lib
+from transmissionpy.core.db.search import SearchHit, TorrentSearchIndex
+from transmissionpy.core.depends import db_depends
 from transmissionpy.core.transmission_lib import (
+    TORRENT_SUMMARY_FIELDS,
     TransmissionClientSettings,
     TransmissionRPCController,
     transmission_settings,
@@ -16,16 +19,53 @@ from transmissionpy.domain.Transmission import (
     torrent_df_dtypes_mapping,
 )
 
+from .bandwidth import (
+    TORRENT_BANDWIDTH_FIELDS,
+    BandwidthBudget,
+    allocate_bandwidth,
+    bandwidth_frame,
+    diff_bandwidth,
+    push_bandwidth,
+)
+from .bulk import TORRENT_STATUS_FIELDS, parse_id_ranges, verify_throttled
+from .duplicates import (
+    TORRENT_DUPLICATE_FIELDS,
+    TORRENT_DUPLICATE_SIZE_FIELDS,
+    DuplicateGroup,
+    find_duplicate_groups,
+    size_candidates,
+)
+from .labels import TORRENT_LABEL_FIELDS, LabelIndex
+from .moves import (
+    TORRENT_MOVE_FIELDS,
+    MovePlan,
+    destination_for,
+    execute_moves,
+    free_space_or_none,
+    plan_moves,
+)
+from .pieces import TORRENT_PIECE_FIELDS, TORRENT_PIECE_FILE_FIELDS, piece_stats
+from .queue_order import (
+    TORRENT_QUEUE_FIELDS,
+    QueuePlan,
+    QueueWeights,
+    apply_queue_moves,
+    plan_queue_order,
+)
+from .search import sync_search_index
 from .snapshot import SnapshotManager
+from .trackers import TORRENT_TRACKER_FIELDS, TrackerIndex
 from .utils import (
     convert_multiple_torrents_to_torrentmetadata,
     convert_torrent_to_torrentmetadata,
     convert_torrents_to_df,
+    filter_torrents_by_status,
     select_random_torrent,
 )
 
 from loguru import logger as log
 import pandas as pd
+import sqlalchemy as sa
 from transmission_rpc import Torrent
 
 def write_torrent_to_json(torrent: Torrent, output: str):
@@ -84,7 +124,21 @@ def get_torrent_by_id(torrent_id: int, transmission_settings: TransmissionClient
 
 def list_all_torrents(
     transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
+    summary: bool = True,
 ):
+    """Return all torrents.
+
+    Params:
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        fresh (bool): Skip the torrent list cache.
+        summary (bool): Only fetch `TORRENT_SUMMARY_FIELDS`. Use `get_torrent_details()` for the
+            files, trackers & pieces of the torrents that need them.
+
+    Returns:
+        (list[Torrent]): The torrents, or an empty list on error.
+
+    """
     try:
         transmission_controller: TransmissionRPCController = (
             transmission_lib.get_transmission_controller(
@@ -100,7 +154,9 @@ def list_all_torrents(
     log.debug("Getting all torrents")
     try:
         with transmission_controller as torrent_ctl:
-            all_torrents: list[Torrent] = torrent_ctl.get_all_torrents()
+            all_torrents: list[Torrent] = torrent_ctl.get_all_torrents(
+                arguments=TORRENT_SUMMARY_FIELDS if summary else None, fresh=fresh
+            )
 
         return all_torrents
     except Exception as exc:
@@ -110,11 +166,324 @@ def list_all_torrents(
         return []
 
 
+def get_torrent_details(
+    torrents: list[Torrent | int | str],
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
+) -> dict[str, Torrent]:
+    """Fetch files, trackers & pieces for some torrents, in one batched request.
+
+    Params:
+        torrents (list[Torrent|int|str]): Summary torrents (from `list_all_torrents()`), IDs or hashStrings.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        fresh (bool): Ignore details memoized earlier in this process.
+
+    Returns:
+        (dict[str, Torrent]): Torrents with only the detail fields, keyed by hashString.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        return torrent_ctl.get_torrent_details(torrents=torrents, fresh=fresh)
+
+
+def get_tracker_index(
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
+) -> TrackerIndex:
+    """Fetch every torrent's trackerStats (and nothing else), and index them by tracker host.
+
+    Params:
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        fresh (bool): Skip the torrent list cache.
+
+    Returns:
+        (TrackerIndex): Tracker host -> torrent ids, with per-host health aggregates.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        torrents: list[Torrent] = torrent_ctl.get_all_torrents(arguments=TORRENT_TRACKER_FIELDS, fresh=fresh)
+
+    return TrackerIndex.from_torrents(torrents)
+
+
+def get_label_index(
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
+) -> LabelIndex:
+    """Fetch every torrent's id & labels, and index the ids by label.
+
+    Params:
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        fresh (bool): Skip the torrent list cache.
+
+    Returns:
+        (LabelIndex): Label -> torrent ids.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        torrents: list[Torrent] = torrent_ctl.get_all_torrents(arguments=TORRENT_LABEL_FIELDS, fresh=fresh)
+
+    return LabelIndex.from_torrents(torrents)
+
+
+def search_torrents(
+    query: str,
+    limit: int = 50,
+    names_only: bool = False,
+    refresh: bool = False,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    engine: sa.Engine | None = None,
+) -> list[SearchHit]:
+    """Search torrent & file names in the local search index.
+
+    Queries never contact Transmission. With `refresh`, the index is synced first; only
+    new or changed torrents (by hashString) have their file lists fetched.
+
+    Params:
+        query (str): Whitespace-separated terms, all of which must appear in the torrent name or one file path.
+        limit (int): Maximum number of torrents to return.
+        names_only (bool): Only match torrent names.
+        refresh (bool): Sync the index with Transmission before searching.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use when refreshing.
+        engine (sqlalchemy.Engine): Database engine. Default: the app database (`DB_DATABASE`).
+
+    Returns:
+        (list[SearchHit]): Matching torrents, best match first.
+
+    """
+    index: TorrentSearchIndex = TorrentSearchIndex(engine=engine or db_depends.get_db_engine())
+
+    if refresh:
+        try:
+            transmission_controller: TransmissionRPCController = (
+                transmission_lib.get_transmission_controller(
+                    transmission_settings=transmission_settings
+                )
+            )
+        except Exception as exc:
+            msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+        with transmission_controller as torrent_ctl:
+            sync_search_index(index=index, controller=torrent_ctl, fresh=True)
+
+    elif not len(index):
+        log.warning("The search index is empty. Run with --refresh to build it.")
+
+    return index.search(query=query, limit=limit, names_only=names_only)
+
+
+def select_torrent_ids(
+    trackers: list[str] | None = None,
+    labels: list[str] | None = None,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
+) -> list[int]:
+    """Resolve tracker and/or label selectors to torrent ids, through their indexes.
+
+    Params:
+        trackers (list[str]): Tracker hosts or domains, matching torrents on ANY of them.
+        labels (list[str]): Label selectors (see `labels.parse_label_selectors()`), ALL of which must match.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        fresh (bool): Skip the torrent list cache.
+
+    Returns:
+        (list[int]): Sorted ids matching both the tracker & label selectors.
+
+    """
+    selected: set[int] | None = None
+
+    if labels:
+        selected = get_label_index(transmission_settings=transmission_settings, fresh=fresh).select(labels)
+    if trackers and (selected is None or selected):
+        by_tracker: set[int] = set(get_tracker_index(transmission_settings=transmission_settings, fresh=fresh).torrent_ids_for(trackers))
+        selected = by_tracker if selected is None else selected & by_tracker
+
+    torrent_ids: list[int] = sorted(selected or ())
+    log.debug(f"Selectors (trackers: {trackers}, labels: {labels}) matched [{len(torrent_ids)}] torrent(s)")
+
+    return torrent_ids
+
+
+def list_selected_torrents(
+    trackers: list[str] | None = None,
+    labels: list[str] | None = None,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
+) -> list[Torrent]:
+    """Return summary torrents matching tracker and/or label selectors (see `select_torrent_ids()`).
+
+    Only the matching ids are requested with summary fields, after the index fetches.
+    """
+    torrent_ids: list[int] = select_torrent_ids(trackers=trackers, labels=labels, transmission_settings=transmission_settings, fresh=fresh)
+    if not torrent_ids:
+        return []
+
+    with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+        return torrent_ctl.get_multiple_torrents(ids=torrent_ids, arguments=TORRENT_SUMMARY_FIELDS)
+
+
+def resolve_torrent_ids(
+    ids: list[str | int] | None = None,
+    status: str | None = None,
+    trackers: list[str] | None = None,
+    labels: list[str] | None = None,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
+) -> list[int]:
+    """Resolve id specs, a status and tracker/label selectors to the ids matching ALL of them.
+
+    Selectors left empty don't narrow the result. The status filter fetches only
+    `TORRENT_STATUS_FIELDS`, for the already selected ids when there are any.
+
+    Params:
+        ids (list[str|int]): Ids & ranges (see `bulk.parse_id_ranges()`), i.e. ["1-50,77"].
+        status (str): A status (see `utils.filter_torrents_by_status()`). "all" alone selects every torrent.
+        trackers (list[str]): Tracker hosts or domains (see `select_torrent_ids()`).
+        labels (list[str]): Label selectors (see `select_torrent_ids()`).
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        fresh (bool): Skip the torrent list cache.
+
+    Returns:
+        (list[int]): Sorted matching ids.
+
+    """
+    selected: set[int] | None = set(parse_id_ranges(ids)) if ids else None
+
+    if trackers or labels:
+        by_selectors: set[int] = set(select_torrent_ids(trackers=trackers, labels=labels, transmission_settings=transmission_settings, fresh=fresh))
+        selected = by_selectors if selected is None else selected & by_selectors
+
+    if status and (selected is None or (status != "all" and selected)):
+        with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+            if selected is None:
+                torrents: list[Torrent] = torrent_ctl.get_all_torrents(arguments=TORRENT_STATUS_FIELDS, fresh=fresh)
+            else:
+                torrents = torrent_ctl.get_multiple_torrents(ids=sorted(selected), arguments=TORRENT_STATUS_FIELDS)
+        selected = {torrent.id for torrent in filter_torrents_by_status(torrents, status=status)}
+    elif selected is not None and ids:
+        ## Drop ids that don't exist, so counts & logs are honest
+        with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+            selected = {torrent.id for torrent in torrent_ctl.get_multiple_torrents(ids=sorted(selected), arguments=["id"])}
+
+    torrent_ids: list[int] = sorted(selected or ())
+    log.debug(f"Selectors (ids: {ids}, status: {status}, trackers: {trackers}, labels: {labels}) matched [{len(torrent_ids)}] torrent(s)")
+
+    return torrent_ids
+
+
+def start_torrents_by_id(torrent_ids: list[int], transmission_settings: TransmissionClientSettings = transmission_settings, bypass_queue: bool = False) -> int:
+    """Start torrents in batched torrent-start calls. Returns the number of RPCs made."""
+    log.info(f"Starting [{len(torrent_ids)}] torrent(s)")
+    with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+        return torrent_ctl.start_torrents(torrent_ids=torrent_ids, bypass_queue=bypass_queue)
+
+
+def stop_torrents_by_id(torrent_ids: list[int], transmission_settings: TransmissionClientSettings = transmission_settings) -> int:
+    """Stop torrents in batched torrent-stop calls. Returns the number of RPCs made."""
+    log.info(f"Stopping [{len(torrent_ids)}] torrent(s)")
+    with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+        return torrent_ctl.stop_torrents(torrent_ids=torrent_ids)
+
+
+def verify_torrents_by_id(
+    torrent_ids: list[int],
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    max_checking: int = 2,
+    poll_interval: float = 5.0,
+) -> int:
+    """Hash check torrents, at most `max_checking` at once (see `bulk.verify_throttled()`). Returns the number of RPCs made."""
+    log.info(f"Verifying [{len(torrent_ids)}] torrent(s), {max_checking or 'all'} at a time")
+    with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+        return verify_throttled(controller=torrent_ctl, torrent_ids=torrent_ids, max_checking=max_checking, poll_interval=poll_interval)
+
+
+def reannounce_torrents_by_id(torrent_ids: list[int], transmission_settings: TransmissionClientSettings = transmission_settings) -> int:
+    """Reannounce torrents to their trackers in batched torrent-reannounce calls. Returns the number of RPCs made."""
+    log.info(f"Reannouncing [{len(torrent_ids)}] torrent(s)")
+    with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+        return torrent_ctl.reannounce_torrents(torrent_ids=torrent_ids)
+
+
+def set_torrent_labels(
+    index: LabelIndex,
+    torrent_ids: list[int],
+    add: list[str] | None = None,
+    remove: list[str] | None = None,
+    replace: list[str] | None = None,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+) -> int:
+    """Add, remove or replace labels on torrents, with one torrent-set per distinct resulting label list.
+
+    Params:
+        index (LabelIndex): Index with the torrents' current labels, from `get_label_index()`.
+        torrent_ids (list[int]): Torrents to change.
+        add (list[str]): Labels to add.
+        remove (list[str]): Labels to remove.
+        replace (list[str]): Replace all labels with these.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+
+    Returns:
+        (int): Number of torrents whose labels changed.
+
+    """
+    plan: dict[tuple[str, ...], list[int]] = index.plan_label_change(torrent_ids, add=add or (), remove=remove or (), replace=replace)
+    if not plan:
+        return 0
+
+    with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+        for labels, ids in plan.items():
+            torrent_ctl.set_torrents(torrent_ids=ids, labels=list(labels))
+
+    index.apply_label_change(plan)
+
+    return sum(len(ids) for ids in plan.values())
+
+
 def list_finished_torrents(
     transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
 ):
     all_torrents: list[Torrent] = list_all_torrents(
-        transmission_settings=transmission_settings
+        transmission_settings=transmission_settings, fresh=fresh
     )
 
     if all_torrents is None or len(all_torrents) == 0:
@@ -131,9 +500,10 @@ def list_finished_torrents(
 
 def list_stalled_torrents(
     transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
 ):
     all_torrents: list[Torrent] = list_all_torrents(
-        transmission_settings=transmission_settings
+        transmission_settings=transmission_settings, fresh=fresh
     )
 
     if all_torrents is None or len(all_torrents) == 0:
@@ -150,9 +520,10 @@ def list_stalled_torrents(
 
 def list_paused_torrents(
     transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
 ):
     all_torrents: list[Torrent] = list_all_torrents(
-        transmission_settings=transmission_settings
+        transmission_settings=transmission_settings, fresh=fresh
     )
 
     if all_torrents is None or len(all_torrents) == 0:
@@ -269,18 +640,304 @@ def delete_torrents_by_transmission_id(torrent_ids: list[t.Union[str, int]], tra
 
         raise exc
     
-    log.info(f"Deleting torrents by IDs: '{torrent_ids}'")
+    log.info(f"Deleting [{len(torrent_ids)}] torrent(s) by ID")
     try:
         with transmission_controller as torrent_ctl:
-            torrent_ctl.delete_torrent_by_id(torrent_id=torrent_ids, remove_files=remove_files)
+            torrent_ctl.delete_torrents(torrent_ids=torrent_ids, remove_files=remove_files)
     except Exception as exc:
         msg = f"({type(exc)}) Error deleting torrents by IDs: '{torrent_ids}'. Details: {exc}"
         log.error(msg)
 
         raise exc
 
+def get_piece_stats(
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    nearly_done: float = 0.95,
+    stuck_after: float = 3600,
+    fresh: bool = False,
+) -> pd.DataFrame:
+    """Analyze every torrent's piece bitfield (see `pieces.piece_stats()`).
+
+    Bitfields are fetched for all torrents, file lists only for partially complete ones.
+
+    Params:
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        nearly_done (float): Fraction of pieces above which an incomplete torrent is "nearly done".
+        stuck_after (float): Seconds without activity before a nearly done torrent is stuck.
+        fresh (bool): Skip the torrent list cache.
+
+    Returns:
+        (pandas.DataFrame): Piece & file completion stats, one row per torrent.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        torrents: list[Torrent] = torrent_ctl.get_all_torrents(arguments=TORRENT_PIECE_FIELDS, fresh=fresh)
+
+        def load_files(torrent_ids: list[int]) -> dict[int, list[dict]]:
+            files_by_id: dict[int, list[dict]] = {}
+            for start in range(0, len(torrent_ids), transmission_lib.DEFAULT_ID_CHUNK_SIZE):
+                chunk: list[int] = torrent_ids[start:start + transmission_lib.DEFAULT_ID_CHUNK_SIZE]
+                for torrent in torrent_ctl.get_multiple_torrents(ids=chunk, arguments=TORRENT_PIECE_FILE_FIELDS):
+                    files_by_id[torrent.id] = torrent.fields.get("files") or []
+
+            return files_by_id
+
+        return piece_stats(torrents=torrents, load_files=load_files, nearly_done=nearly_done, stuck_after=stuck_after)
+
+
+def find_duplicate_torrents(
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    min_size: int = 0,
+    fresh: bool = False,
+) -> list[DuplicateGroup]:
+    """Find torrents with the same content, i.e. added twice under another name or tracker.
+
+    Every torrent's totalSize is fetched first. File lists are only fetched for torrents
+    sharing their totalSize with another torrent, in chunked requests.
+
+    Params:
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        min_size (int): Ignore torrents smaller than this many bytes.
+        fresh (bool): Skip the torrent list cache.
+
+    Returns:
+        (list[DuplicateGroup]): Duplicate groups, most reclaimable bytes first.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        candidate_ids: list[int] = size_candidates(
+            torrent_ctl.get_all_torrents(arguments=TORRENT_DUPLICATE_SIZE_FIELDS, fresh=fresh), min_size=min_size
+        )
+        log.debug(f"[{len(candidate_ids)}] torrent(s) share their size with another torrent")
+
+        candidates: list[Torrent] = []
+        for start in range(0, len(candidate_ids), transmission_lib.DEFAULT_ID_CHUNK_SIZE):
+            candidates.extend(
+                torrent_ctl.get_multiple_torrents(
+                    ids=candidate_ids[start:start + transmission_lib.DEFAULT_ID_CHUNK_SIZE], arguments=TORRENT_DUPLICATE_FIELDS
+                )
+            )
+
+    return find_duplicate_groups(torrents=candidates, min_size=min_size)
+
+
+def remove_duplicate_torrents(
+    plan: list[dict],
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    remove_files: bool = False,
+) -> int:
+    """Remove the torrents in a duplicate removal plan (see `duplicates.removal_plan()`).
+
+    At most two batched removals are made: one for entries whose data may be deleted, and one
+    for entries sharing their data with the kept copy, which are never removed with data.
+
+    Params:
+        plan (list[dict]): Removal plan entries.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        remove_files (bool): Also delete data of duplicates stored apart from the kept copy.
+
+    Returns:
+        (int): Number of torrents removed.
+
+    """
+    with_data: list[int] = [entry["id"] for entry in plan if remove_files and entry["remove_files"]]
+    without_data: list[int] = [entry["id"] for entry in plan if not (remove_files and entry["remove_files"])]
+
+    with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+        if with_data:
+            log.info(f"Removing [{len(with_data)}] duplicate torrent(s) and their data")
+            torrent_ctl.delete_torrents(torrent_ids=with_data, remove_files=True)
+        if without_data:
+            log.info(f"Removing [{len(without_data)}] duplicate torrent(s), keeping data")
+            torrent_ctl.delete_torrents(torrent_ids=without_data, remove_files=False)
+
+    return len(with_data) + len(without_data)
+
+
+def rebalance_bandwidth(
+    budget: BandwidthBudget,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    apply: bool = False,
+) -> tuple[pd.DataFrame, list[tuple[dict[str, t.Any], list[int]]]]:
+    """Allocate per-torrent speed limits & priorities from a global budget (see `bandwidth.allocate_bandwidth()`).
+
+    Params:
+        budget (BandwidthBudget): Budgets & label weights.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        apply (bool): Push the changed settings. False only computes them.
+
+    Returns:
+        (tuple[pandas.DataFrame, list]): The allocation, and the grouped torrent-set calls it takes.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        ## Rates change every second, a cached list would allocate against stale rates
+        df: pd.DataFrame = bandwidth_frame(torrent_ctl.get_all_torrents(arguments=TORRENT_BANDWIDTH_FIELDS, fresh=True))
+        alloc: pd.DataFrame = allocate_bandwidth(df, budget)
+        calls: list[tuple[dict[str, t.Any], list[int]]] = diff_bandwidth(df, alloc)
+
+        if apply and calls:
+            log.info(f"Updating bandwidth settings of [{sum(len(ids) for _, ids in calls)}] torrent(s) in [{len(calls)}] group(s)")
+            push_bandwidth(controller=torrent_ctl, calls=calls)
+
+    return alloc, calls
+
+
+def optimize_queue(
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    weights: QueueWeights | None = None,
+    apply: bool = False,
+) -> QueuePlan:
+    """Reorder the download queue by score (see `queue_order.score_queue()`).
+
+    Params:
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        weights (QueueWeights): Score weights.
+        apply (bool): Send the queuePosition changes. False only plans them.
+
+    Returns:
+        (QueuePlan): The scored queue & its moves.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        ## Positions are only valid for the queue as it is now
+        plan: QueuePlan = plan_queue_order(torrents=torrent_ctl.get_all_torrents(arguments=TORRENT_QUEUE_FIELDS, fresh=True), weights=weights)
+
+        if apply and plan.moves:
+            log.info(f"Moving [{len(plan.moves)}] of [{len(plan.order)}] queued torrent(s)")
+            apply_queue_moves(controller=torrent_ctl, moves=plan.moves)
+
+    return plan
+
+
+def plan_torrent_moves(
+    dest: str,
+    torrent_ids: list[int] | None = None,
+    status: str = "all",
+    reserve_bytes: int = 0,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+    fresh: bool = False,
+) -> MovePlan:
+    """Plan moving torrents' data to `dest` (see `moves.plan_moves()`).
+
+    Free space is asked once per destination.
+
+    Params:
+        dest (str): Destination directory on the Transmission host. `{label}` is replaced with a torrent's first label.
+        torrent_ids (list[int]): Only plan these torrents. None plans every torrent.
+        status (str): Only plan torrents with this status (see `utils.filter_torrents_by_status()`).
+        reserve_bytes (int): Free space to leave on every destination.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+        fresh (bool): Skip the torrent list cache.
+
+    Returns:
+        (MovePlan): The planned moves.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        if torrent_ids is None:
+            torrents: list[Torrent] = torrent_ctl.get_all_torrents(arguments=TORRENT_MOVE_FIELDS, fresh=fresh)
+        else:
+            torrents = torrent_ctl.get_multiple_torrents(ids=torrent_ids, arguments=TORRENT_MOVE_FIELDS) if torrent_ids else []
+
+        return plan_moves(
+            torrents=filter_torrents_by_status(torrents, status=status),
+            destination=destination_for(dest),
+            free_space=lambda path: free_space_or_none(torrent_ctl, path),
+            reserve_bytes=reserve_bytes,
+        )
+
+
+def run_torrent_moves(
+    plan: MovePlan,
+    state_path: str | None = None,
+    chunk_size: int = 50,
+    concurrency: int = 2,
+    max_bytes_in_flight: int = 0,
+    poll_interval: float = 5.0,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+) -> dict[str, int]:
+    """Run a move plan (see `moves.execute_moves()`), saving progress to `state_path` for `MovePlan.load()`.
+
+    Returns:
+        (dict[str, int]): Number of torrents per final state.
+
+    """
+    with transmission_lib.get_transmission_controller(transmission_settings=transmission_settings) as torrent_ctl:
+        return execute_moves(
+            controller=torrent_ctl,
+            plan=plan,
+            state_path=state_path,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            max_bytes_in_flight=max_bytes_in_flight,
+            poll_interval=poll_interval,
+        )
+
+
 def snapshot_torrents(transmission_settings: TransmissionClientSettings = transmission_settings) -> list[Torrent]:
-    all_torrents: list[Torrent] = list_all_torrents(transmission_settings=transmission_settings)
+    ## Snapshots keep files & trackers, so history queries can group by tracker
+    all_torrents: list[Torrent] = list_all_torrents(transmission_settings=transmission_settings, summary=False)
     
     log.info(f"Snapshotting [{len(all_torrents)}] torrents")
     snapshot_manager = SnapshotManager(snapshot_filename="all_torrents_snapshot")
@@ -301,11 +958,10 @@ def delete_oldest_torrents(delete_count: int = 1):
         msg = f"({type(exc)}) Error getting all torrents with a snapshot. Details: {exc}"
     
     log.info("Sorting torrents by date ascending (oldest first)")
+    ## Epoch ints sort the same as datetimes, so the DataFrame is not converted (and back) here
     sorted_df = all_torrents_df.sort_values(by=["addedDate", "startDate", "secondsDownloading"], ascending=[True, True, False])
-    sorted_df = df_utils.convert_df_col_dtypes(df=sorted_df, dtype_mapping=torrent_df_dtypes_mapping)
     
     log.debug(f"Sorted all_torrents_df:\n{sorted_df[['id', 'name', 'isStalled', 'isFinished', 'addedDate', 'startDate', 'secondsDownloading']]}")
-    sorted_df = df_utils.convert_df_datetimes_to_timestamp(df=sorted_df)
     
     log.info(f"Deleting [{delete_count}] oldest torrent(s)")
     
@@ -401,3 +1057,74 @@ def delete_finished_torrents():
     log.info(f"Deleted [{len(deleted_torrents)}] torrent(s)")
     
     return deleted_torrents
+
+
+def get_session_info(
+    fields: list[str] | None = None,
+    fresh: bool = False,
+    stats: bool = True,
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+) -> tuple[dict[str, t.Any], dict[str, t.Any] | None]:
+    """Return Transmission's session settings, and optionally its session statistics.
+
+    Both are served from the session cache while younger than `TRANSMISSION_SESSION_CACHE_TTL`.
+
+    Params:
+        fields (list[str]): Only return these session settings (`download_dir` or `download-dir`).
+        fresh (bool): Skip the session cache.
+        stats (bool): Also return session-stats.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+
+    Returns:
+        (tuple[dict, dict|None]): Session settings, and session statistics (None when `stats=False`).
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        session: dict[str, t.Any] = torrent_ctl.get_session(fields=fields, fresh=fresh)
+        session_stats: dict[str, t.Any] | None = torrent_ctl.get_session_stats(fresh=fresh) if stats else None
+
+    return session, session_stats
+
+
+def set_session_values(
+    changes: dict[str, t.Any],
+    transmission_settings: TransmissionClientSettings = transmission_settings,
+) -> dict[str, t.Any]:
+    """Change session settings, and return the changed settings as Transmission now reports them.
+
+    Params:
+        changes (dict[str, Any]): `Client.set_session()` keyword arguments, i.e. `{"speed_limit_down": 500}`.
+        transmission_settings (TransmissionClientSettings): The transmission settings to use.
+
+    Returns:
+        (dict[str, Any]): The changed session settings, read back after the change.
+
+    """
+    try:
+        transmission_controller: TransmissionRPCController = (
+            transmission_lib.get_transmission_controller(
+                transmission_settings=transmission_settings
+            )
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error getting TransmissionRPCController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    with transmission_controller as torrent_ctl:
+        torrent_ctl.set_session(**changes)
+        ## set_session() cleared the cache, so this reads the new values
+        return torrent_ctl.get_session(fields=list(changes))
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+import json
+from pathlib import Path
+import time
+import typing as t
+
+from transmissionpy.core.transmission_lib import TransmissionRPCController
+
+from loguru import logger as log
+from transmission_rpc import Torrent
+
+## Fields needed to plan moves (doneDate, isStalled & status for status filters)
+TORRENT_MOVE_FIELDS: list[str] = [
+    "id",
+    "hashString",
+    "name",
+    "downloadDir",
+    "sizeWhenDone",
+    "leftUntilDone",
+    "labels",
+    "doneDate",
+    "isStalled",
+    "status",
+]
+## Fields polled to tell when a move finished: Transmission updates downloadDir once the data is moved
+TORRENT_MOVE_POLL_FIELDS: list[str] = ["id", "downloadDir", "error", "errorString"]
+## Transmission's `error` for local (disk) errors. 1 & 2 are tracker warnings/errors, unrelated to moving data.
+LOCAL_ERROR: int = 3
+
+## MoveItem states
+PENDING: str = "pending"
+IN_FLIGHT: str = "in_flight"
+DONE: str = "done"
+FAILED: str = "failed"
+## Planned, but the destination doesn't have room for it
+DEFERRED: str = "deferred"
+
+
+@dataclass
+class MoveItem:
+    id: int
+    hash_string: str
+    name: str
+    source: str
+    dest: str
+    ## Bytes on disk (sizeWhenDone - leftUntilDone)
+    size: int
+    state: str = field(default=PENDING)
+    error: str | None = field(default=None)
+
+
+@dataclass
+class MovePlan:
+    items: list[MoveItem] = field(default_factory=list)
+    ## Destination -> free bytes reported by Transmission when the plan was made (None = unknown)
+    free_space: dict[str, int | None] = field(default_factory=dict)
+    reserve_bytes: int = field(default=0)
+
+    def by_state(self, *states: str) -> list[MoveItem]:
+        return [item for item in self.items if item.state in states]
+
+    def bytes_in(self, *states: str) -> int:
+        return sum(item.size for item in self.by_state(*states))
+
+    def summary(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for item in self.items:
+            counts[item.state] = counts.get(item.state, 0) + 1
+
+        return counts
+
+    def save(self, path: t.Union[str, Path]) -> None:
+        """Write the plan & item states to a JSON file (atomically), for resuming."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path: Path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"items": [asdict(item) for item in self.items], "free_space": self.free_space, "reserve_bytes": self.reserve_bytes}))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: t.Union[str, Path]) -> "MovePlan":
+        state: dict = json.loads(Path(path).read_text())
+
+        return cls(
+            items=[MoveItem(**item) for item in state["items"]],
+            free_space=state.get("free_space", {}),
+            reserve_bytes=state.get("reserve_bytes", 0),
+        )
+
+
+def destination_for(dest: str, unlabelled: str = "unlabelled") -> t.Callable[[dict], str]:
+    """Return a destination function for `plan_moves()`.
+
+    `dest` may contain `{label}`, replaced with a torrent's first label, so one run can sort
+    torrents into a directory per label.
+    """
+    if "{label}" not in dest:
+        return lambda fields: dest
+
+    return lambda fields: dest.replace("{label}", (fields.get("labels") or [unlabelled])[0])
+
+
+def free_space_or_none(controller: TransmissionRPCController, path: str) -> int | None:
+    """Free bytes at a path on the Transmission host, None if Transmission can't tell (i.e. path doesn't exist yet)."""
+    try:
+        return controller.get_free_space(remote_path=path)
+    except Exception as exc:
+        log.warning(f"({type(exc)}) Could not get free space at '{path}'. Details: {exc}")
+        return None
+
+
+def plan_moves(
+    torrents: t.Iterable[t.Union[Torrent, dict]],
+    destination: t.Callable[[dict], str | None],
+    free_space: t.Callable[[str], int | None],
+    reserve_bytes: int = 0,
+) -> MovePlan:
+    """Group torrents by destination and accept moves while each destination has room for them.
+
+    Within a destination, smaller torrents are planned first, so the most torrents fit. Torrents
+    that would push a destination below `reserve_bytes` free are `DEFERRED`.
+
+    Params:
+        torrents (Iterable[Torrent|dict]): Torrents with the `TORRENT_MOVE_FIELDS`.
+        destination (Callable[[dict], str|None]): Destination dir for a torrent's fields, None to leave it.
+        free_space (Callable[[str], int|None]): Free bytes at a destination (i.e. `get_free_space`), None if unknown.
+        reserve_bytes (int): Free space to leave on every destination.
+
+    Returns:
+        (MovePlan): The planned moves.
+
+    """
+    by_dest: dict[str, list[MoveItem]] = {}
+
+    for torrent in torrents:
+        fields: dict = torrent.fields if isinstance(torrent, Torrent) else torrent
+        dest: str | None = destination(fields)
+        source: str = fields.get("downloadDir") or ""
+        if not dest or dest.rstrip("/") == source.rstrip("/"):
+            continue
+
+        by_dest.setdefault(dest, []).append(
+            MoveItem(
+                id=fields["id"],
+                hash_string=fields.get("hashString") or "",
+                name=fields.get("name") or "",
+                source=source,
+                dest=dest,
+                size=max(0, (fields.get("sizeWhenDone") or 0) - (fields.get("leftUntilDone") or 0)),
+            )
+        )
+
+    plan = MovePlan(reserve_bytes=reserve_bytes)
+    for dest, items in by_dest.items():
+        available: int | None = free_space(dest)
+        plan.free_space[dest] = available
+        if available is None:
+            log.warning(f"Free space at '{dest}' is unknown, planning [{len(items)}] move(s) there without a capacity check")
+
+        budget: float = float("inf") if available is None else available - reserve_bytes
+        for item in sorted(items, key=lambda item: item.size):
+            if item.size <= budget:
+                budget -= item.size
+            else:
+                item.state = DEFERRED
+                item.error = "Not enough free space at destination"
+            plan.items.append(item)
+
+    return plan
+
+
+def make_batches(items: t.Iterable[MoveItem], chunk_size: int = 50, max_batch_bytes: int = 0) -> list[list[MoveItem]]:
+    """Split items into batches of one destination, at most `chunk_size` torrents and `max_batch_bytes` bytes.
+
+    A single torrent larger than `max_batch_bytes` gets a batch of its own.
+    """
+    batches: list[list[MoveItem]] = []
+    by_dest: dict[str, list[MoveItem]] = {}
+    for item in items:
+        by_dest.setdefault(item.dest, []).append(item)
+
+    for dest_items in by_dest.values():
+        batch: list[MoveItem] = []
+        batch_bytes: int = 0
+        for item in dest_items:
+            if batch and (len(batch) >= chunk_size or (max_batch_bytes and batch_bytes + item.size > max_batch_bytes)):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(item)
+            batch_bytes += item.size
+        if batch:
+            batches.append(batch)
+
+    return batches
+
+
+def execute_moves(
+    controller: TransmissionRPCController,
+    plan: MovePlan,
+    state_path: t.Union[str, Path] | None = None,
+    chunk_size: int = 50,
+    concurrency: int = 2,
+    max_bytes_in_flight: int = 0,
+    poll_interval: float = 5.0,
+) -> dict[str, int]:
+    """Run a move plan with chunked torrent-set-location calls.
+
+    At most `concurrency` batches, and `max_bytes_in_flight` bytes (0 = unlimited), are moving at
+    once. A batch is finished when Transmission reports every torrent's downloadDir as the
+    destination. Before each batch, the destination's free space is checked again; batches that
+    no longer fit are deferred. Item states are saved to `state_path` on every change, so an
+    interrupted run continues with `MovePlan.load()` and another `execute_moves()`.
+
+    Params:
+        controller (TransmissionRPCController): An open controller.
+        plan (MovePlan): The plan to run. Pending & in-flight items are (re)submitted.
+        state_path (str|Path): Where to save progress. None disables resume state.
+        chunk_size (int): Max torrents per torrent-set-location call.
+        concurrency (int): Max batches moving at once.
+        max_bytes_in_flight (int): Max bytes moving at once. 0 = unlimited.
+        poll_interval (float): Seconds between checks of in-flight torrents.
+
+    Returns:
+        (dict[str, int]): Number of items per final state.
+
+    """
+    def save() -> None:
+        if state_path:
+            plan.save(state_path)
+
+    ## In-flight items of an interrupted run are submitted again; moving to the current location is a no-op
+    queue: deque[list[MoveItem]] = deque(make_batches(plan.by_state(PENDING, IN_FLIGHT), chunk_size=chunk_size, max_batch_bytes=max_bytes_in_flight))
+    in_flight: list[tuple[list[MoveItem], Future]] = []
+    moved_bytes: int = 0
+    started: float = time.monotonic()
+    total_bytes: int = sum(item.size for batch in queue for item in batch)
+
+    log.info(f"Moving [{sum(len(batch) for batch in queue)}] torrent(s), {total_bytes / 1024**3:.1f} GiB, in [{len(queue)}] batch(es)")
+
+    def bytes_moving() -> int:
+        return sum(item.size for batch, _ in in_flight for item in batch if item.state == IN_FLIGHT)
+
+    def has_room(batch: list[MoveItem]) -> bool:
+        free: int | None = free_space_or_none(controller, batch[0].dest)
+        if free is None:
+            return True
+        ## Moves still running to the same destination haven't used their space yet
+        pending_here: int = sum(item.size for running, _ in in_flight for item in running if item.dest == batch[0].dest and item.state == IN_FLIGHT)
+
+        return free - pending_here - plan.reserve_bytes >= sum(item.size for item in batch)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="move") as pool:
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < concurrency:
+                    batch: list[MoveItem] = queue[0]
+                    batch_bytes: int = sum(item.size for item in batch)
+                    if in_flight and max_bytes_in_flight and bytes_moving() + batch_bytes > max_bytes_in_flight:
+                        break
+
+                    queue.popleft()
+                    if not has_room(batch):
+                        log.warning(f"Deferring [{len(batch)}] move(s) to '{batch[0].dest}': not enough free space")
+                        for item in batch:
+                            item.state, item.error = DEFERRED, "Not enough free space at destination"
+                        save()
+                        continue
+
+                    for item in batch:
+                        item.state, item.error = IN_FLIGHT, None
+                    save()
+                    in_flight.append((batch, pool.submit(controller.move_torrent_data, ids=[item.id for item in batch], dest=batch[0].dest)))
+
+                time.sleep(poll_interval)
+
+                ## Only batches whose RPC returned are polled; a failed call fails the whole batch
+                polled: dict[int, MoveItem] = {}
+                for batch, future in in_flight:
+                    if not future.done():
+                        continue
+                    if future.exception() is not None or future.result() is False:
+                        for item in batch:
+                            item.state, item.error = FAILED, f"torrent-set-location failed: {future.exception() or 'see log'}"
+                        continue
+                    polled.update({item.id: item for item in batch if item.state == IN_FLIGHT})
+
+                if polled:
+                    seen: set[int] = set()
+                    for torrent in controller.get_multiple_torrents(ids=list(polled), arguments=TORRENT_MOVE_POLL_FIELDS):
+                        item: MoveItem = polled[torrent.id]
+                        seen.add(torrent.id)
+                        if (torrent.fields.get("downloadDir") or "").rstrip("/") == item.dest.rstrip("/"):
+                            item.state = DONE
+                            moved_bytes += item.size
+                        elif torrent.fields.get("error") == LOCAL_ERROR:
+                            item.state, item.error = FAILED, torrent.fields.get("errorString") or "Transmission reported an error"
+                    for torrent_id in set(polled) - seen:
+                        polled[torrent_id].state, polled[torrent_id].error = FAILED, "Torrent was removed"
+
+                finished: list[tuple[list[MoveItem], Future]] = [
+                    (batch, future) for batch, future in in_flight if all(item.state != IN_FLIGHT for item in batch)
+                ]
+                if finished:
+                    in_flight = [entry for entry in in_flight if entry not in finished]
+                    save()
+                    elapsed: float = time.monotonic() - started
+                    log.info(
+                        f"Moved {moved_bytes / 1024**3:.1f}/{total_bytes / 1024**3:.1f} GiB "
+                        f"({moved_bytes / max(elapsed, 1e-9) / 1024**2:.1f} MiB/s), [{len(queue)}] batch(es) queued"
+                    )
+        finally:
+            save()
+
+    controller.invalidate_cache()
+
+    return plan.summary()
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import binascii
+import time
+import typing as t
+
+from loguru import logger as log
+import numpy as np
+import pandas as pd
+from transmission_rpc import Torrent
+
+## Fields needed to analyze every torrent's piece bitfield
+TORRENT_PIECE_FIELDS: list[str] = [
+    "id",
+    "name",
+    "status",
+    "pieces",
+    "pieceCount",
+    "pieceSize",
+    "rateDownload",
+    "activityDate",
+]
+## Fetched only for partially complete torrents, to tell which files are complete
+TORRENT_PIECE_FILE_FIELDS: list[str] = ["id", "files", "pieceSize"]
+
+## Bits unpacked per analysis chunk, bounding memory at ~5 bytes per bit (bits + running sum)
+DEFAULT_MAX_CHUNK_BITS: int = 2**24
+
+## Set bits per byte value
+_POPCOUNT: np.ndarray = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def _fields(torrent: t.Union[Torrent, dict]) -> dict:
+    return torrent.fields if isinstance(torrent, Torrent) else torrent
+
+
+def decode_bitfields(bitfields: t.Sequence[str], piece_counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Decode many base64 piece bitfields into one packed byte buffer.
+
+    Each torrent gets exactly `ceil(pieceCount / 8)` bytes (missing bytes count as missing pieces),
+    so torrent `i`'s bits are `np.unpackbits(packed[offsets[i]:offsets[i + 1]], count=piece_counts[i])`.
+
+    Params:
+        bitfields (Sequence[str]): Base64 `pieces` strings, most significant bit = lowest piece.
+        piece_counts (numpy.ndarray): `pieceCount` per torrent.
+
+    Returns:
+        (tuple[numpy.ndarray, numpy.ndarray]): The packed uint8 buffer, and byte offsets (length n + 1).
+
+    """
+    byte_counts: np.ndarray = (np.asarray(piece_counts, dtype=np.int64) + 7) // 8
+    raw: list[bytes] = [binascii.a2b_base64(bitfield or "") for bitfield in bitfields]
+    packed: np.ndarray = np.frombuffer(
+        b"".join(data[:size].ljust(size, b"\0") for data, size in zip(raw, byte_counts.tolist())), dtype=np.uint8
+    )
+
+    return packed, np.concatenate(([0], np.cumsum(byte_counts)))
+
+
+def count_pieces(packed: np.ndarray, byte_offsets: np.ndarray, max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BITS // 8) -> np.ndarray:
+    """Return the number of completed pieces per torrent, without unpacking any bits."""
+    counts: np.ndarray = np.zeros(len(byte_offsets) - 1, dtype=np.int64)
+    starts: np.ndarray = byte_offsets[:-1]
+    ## reduceat sums from each start to the next one, so empty bitfields are left out of the starts
+    non_empty: np.ndarray = np.flatnonzero(byte_offsets[1:] > starts)
+
+    ## reduceat widens its input to the sum dtype, so go a bounded number of bytes at a time
+    chunk_ids: np.ndarray = starts[non_empty] // max(max_chunk_bytes, 1)
+    for chunk in np.unique(chunk_ids):
+        rows: np.ndarray = non_empty[chunk_ids == chunk]
+        first, last = byte_offsets[rows[0]], byte_offsets[rows[-1] + 1]
+        counts[rows] = np.add.reduceat(_POPCOUNT[packed[first:last]], starts[rows] - first, dtype=np.int64)
+
+    return counts
+
+
+def completed_ranges(bitfield: str, piece_count: int) -> np.ndarray:
+    """Return one torrent's contiguous completed piece ranges, as `(start, end)` rows (end exclusive)."""
+    bits: np.ndarray = np.unpackbits(np.frombuffer(binascii.a2b_base64(bitfield or ""), dtype=np.uint8), count=piece_count)
+    bits = np.pad(bits, (0, piece_count - len(bits)))
+    edges: np.ndarray = np.diff(np.concatenate(([0], bits.astype(np.int8), [0])))
+
+    return np.column_stack((np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+
+def file_piece_spans(files: list[dict], piece_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return each file's `[begin, end)` piece range, from beginPiece/endPiece or from file lengths."""
+    if files and "beginPiece" in files[0] and "endPiece" in files[0]:
+        return (
+            np.fromiter((file["beginPiece"] for file in files), dtype=np.int64, count=len(files)),
+            np.fromiter((file["endPiece"] for file in files), dtype=np.int64, count=len(files)),
+        )
+
+    lengths: np.ndarray = np.fromiter((file["length"] for file in files), dtype=np.int64, count=len(files))
+    offsets: np.ndarray = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    begin: np.ndarray = offsets // max(piece_size, 1)
+    ## Empty files cover no pieces, and always count as complete
+    end: np.ndarray = np.where(lengths > 0, (offsets + lengths - 1) // max(piece_size, 1) + 1, begin)
+
+    return begin, end
+
+
+def _analyze_chunk(
+    packed: np.ndarray,
+    byte_offsets: np.ndarray,
+    piece_counts: np.ndarray,
+    rows: np.ndarray,
+    files_by_row: dict[int, list[dict]],
+    piece_sizes: np.ndarray,
+    out: dict[str, np.ndarray],
+) -> None:
+    ## Unpack the chunk's torrents into one bit array, byte-aligned per torrent
+    sub: np.ndarray = np.concatenate([packed[byte_offsets[row]:byte_offsets[row + 1]] for row in rows])
+    sub_offsets: np.ndarray = np.concatenate(([0], np.cumsum(byte_offsets[rows + 1] - byte_offsets[rows]))) * 8
+    bits: np.ndarray = np.unpackbits(sub).view(bool)
+    starts: np.ndarray = sub_offsets[:-1]
+    ends: np.ndarray = starts + piece_counts[rows]
+
+    ## Ranges start on a set bit whose predecessor (in the same torrent) is unset, and end likewise
+    prev: np.ndarray = np.empty_like(bits)
+    prev[0] = False
+    prev[1:] = bits[:-1]
+    prev[starts] = False
+    following: np.ndarray = np.empty_like(bits)
+    following[-1] = False
+    following[:-1] = bits[1:]
+    following[ends - 1] = False
+
+    range_starts: np.ndarray = np.flatnonzero(bits & ~prev)
+    range_ends: np.ndarray = np.flatnonzero(bits & ~following) + 1
+    owner: np.ndarray = np.searchsorted(starts, range_starts, side="right") - 1
+
+    out["ranges"][rows] = np.bincount(owner, minlength=len(rows))
+    longest: np.ndarray = np.zeros(len(rows), dtype=np.int64)
+    np.maximum.at(longest, owner, range_ends - range_starts)
+    out["longestRange"][rows] = longest
+
+    ## Partial torrents miss at least one piece: the end of a range starting at piece 0, else piece 0
+    first_owner, first_index = np.unique(owner, return_index=True)
+    first_missing: np.ndarray = np.zeros(len(rows), dtype=np.int64)
+    leading: np.ndarray = range_starts[first_index] == starts[first_owner]
+    first_missing[first_owner[leading]] = (range_ends[first_index] - range_starts[first_index])[leading]
+    out["firstMissing"][rows] = first_missing
+
+    if not files_by_row:
+        return
+
+    ## A file is complete when every piece it touches is: one running sum answers all of them
+    running: np.ndarray = np.concatenate(([0], np.cumsum(bits, dtype=np.int32)))
+    for position, row in enumerate(rows.tolist()):
+        files: list[dict] | None = files_by_row.get(row)
+        if not files:
+            continue
+
+        begin, end = file_piece_spans(files, int(piece_sizes[row]))
+        begin = np.minimum(begin, piece_counts[row]) + starts[position]
+        end = np.minimum(end, piece_counts[row]) + starts[position]
+        out["filesComplete"][row] = np.count_nonzero(running[end] - running[begin] == end - begin)
+        out["fileCount"][row] = len(files)
+
+
+def piece_stats(
+    torrents: t.Sequence[t.Union[Torrent, dict]],
+    load_files: t.Callable[[list[int]], dict[int, list[dict]]] | None = None,
+    nearly_done: float = 0.95,
+    stuck_after: float = 3600,
+    now: float | None = None,
+    max_chunk_bits: int = DEFAULT_MAX_CHUNK_BITS,
+) -> pd.DataFrame:
+    """Analyze piece bitfields for many torrents.
+
+    Completed pieces are counted on the packed bytes, so only partially complete torrents are
+    unpacked, a chunk of at most `max_chunk_bits` bits at a time.
+
+    Params:
+        torrents (Sequence[Torrent|dict]): Torrents with the `TORRENT_PIECE_FIELDS`.
+        load_files (Callable[[list[int]], dict[int, list[dict]]]): Called once with the ids of partially
+            complete torrents, returns their file lists (id -> files) for `filesComplete`.
+        nearly_done (float): Fraction of pieces above which an incomplete torrent is "nearly done".
+        stuck_after (float): Seconds without activity before a nearly done, downloading torrent is stuck.
+        now (float): Unix time to measure inactivity from. Default: the current time.
+        max_chunk_bits (int): Maximum bits unpacked at once.
+
+    Returns:
+        (pandas.DataFrame): One row per torrent: `have`/`pieceCount` & `fraction`, number of
+            contiguous completed `ranges`, `longestRange`, `firstMissing` piece (-1 when complete),
+            `filesComplete`/`fileCount` & `completeFileFraction` (NaN without a file list), and `stuck`.
+
+    """
+    records: list[dict] = [_fields(torrent) for torrent in torrents]
+    n: int = len(records)
+    now = time.time() if now is None else now
+
+    piece_counts: np.ndarray = np.fromiter((fields.get("pieceCount") or 0 for fields in records), dtype=np.int64, count=n)
+    piece_sizes: np.ndarray = np.fromiter((fields.get("pieceSize") or 0 for fields in records), dtype=np.int64, count=n)
+    packed, byte_offsets = decode_bitfields([fields.get("pieces") or "" for fields in records], piece_counts)
+    have: np.ndarray = count_pieces(packed, byte_offsets)
+
+    complete: np.ndarray = (have == piece_counts) & (piece_counts > 0)
+    out: dict[str, np.ndarray] = {
+        "ranges": np.where(complete, 1, 0),
+        "longestRange": np.where(complete, piece_counts, 0),
+        "firstMissing": np.where(complete, -1, 0),
+        "filesComplete": np.full(n, -1, dtype=np.int64),
+        "fileCount": np.full(n, -1, dtype=np.int64),
+    }
+
+    partial: np.ndarray = np.flatnonzero((have > 0) & ~complete)
+    ids: list[int] = [fields["id"] for fields in records]
+    files_by_id: dict[int, list[dict]] = load_files([ids[row] for row in partial.tolist()]) if load_files and len(partial) else {}
+    files_by_row: dict[int, list[dict]] = {row: files_by_id[ids[row]] for row in partial.tolist() if ids[row] in files_by_id}
+
+    ## Split partial torrents into chunks of bounded unpacked size
+    chunk_ids: np.ndarray = np.cumsum(piece_counts[partial] + 8) // max(max_chunk_bits, 1)
+    for chunk in np.unique(chunk_ids):
+        _analyze_chunk(packed, byte_offsets, piece_counts, partial[chunk_ids == chunk], files_by_row, piece_sizes, out)
+
+    log.debug(f"Analyzed piece bitfields of [{n}] torrent(s), [{len(partial)}] partial, [{int(piece_counts[partial].sum())}] bits unpacked")
+
+    stats = pd.DataFrame(
+        {
+            "id": ids,
+            "name": [fields.get("name") for fields in records],
+            "status": [fields.get("status") for fields in records],
+            "pieceCount": piece_counts,
+            "have": have,
+            "fraction": np.divide(have, piece_counts, out=np.full(n, np.nan), where=piece_counts > 0),
+            **out,
+        }
+    )
+
+    ## Complete torrents have every file, empty ones none (empty files aside)
+    stats.loc[complete, "completeFileFraction"] = 1.0
+    stats.loc[(have == 0) & (piece_counts > 0), "completeFileFraction"] = 0.0
+    with_files: pd.Series = stats["fileCount"] > 0
+    stats.loc[with_files, "completeFileFraction"] = stats.loc[with_files, "filesComplete"] / stats.loc[with_files, "fileCount"]
+
+    idle: np.ndarray = now - np.fromiter((fields.get("activityDate") or 0 for fields in records), dtype=np.float64, count=n)
+    not_receiving: np.ndarray = np.fromiter((fields.get("rateDownload") or 0 for fields in records), dtype=np.int64, count=n) == 0
+    ## Stopped torrents (status 0) are paused on purpose, not stuck
+    stats["stuck"] = (
+        (stats["fraction"] >= nearly_done).to_numpy() & ~complete & not_receiving & (idle >= stuck_after) & (stats["status"] != 0).to_numpy()
+    )
+
+    return stats
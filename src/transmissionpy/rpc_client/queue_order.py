@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import time
+import typing as t
+
+from transmissionpy.core.transmission_lib import TransmissionRPCController
+
+from loguru import logger as log
+import numpy as np
+import pandas as pd
+from transmission_rpc import Torrent
+
+## Fields needed to score the download queue
+TORRENT_QUEUE_FIELDS: list[str] = [
+    "id",
+    "name",
+    "status",
+    "error",
+    "queuePosition",
+    "eta",
+    "leftUntilDone",
+    "desiredAvailable",
+    "peersConnected",
+    "isStalled",
+    "activityDate",
+    "addedDate",
+    "downloadedEver",
+    "secondsDownloading",
+]
+## RPC status codes of the download queue: queued to download, downloading
+QUEUE_STATUS_CODES: tuple[int, ...] = (3, 4)
+
+
+@dataclass
+class QueueWeights:
+    """Weights of the queue score components. Higher scores download first."""
+
+    ## Short expected time to completion
+    eta: float = field(default=1.0)
+    ## Large share of the remaining bytes available from connected peers
+    availability: float = field(default=1.0)
+    ## Long time without activity, or currently stalled (subtracted)
+    stall: float = field(default=1.0)
+    ## Idle time at which the stall component maxes out
+    stall_horizon_seconds: float = field(default=7 * 86_400)
+
+
+@dataclass
+class QueuePlan:
+    ## Scored download queue, in the new order
+    order: pd.DataFrame
+    ## (torrent id, queuePosition) changes, to apply in this order
+    moves: list[tuple[int, int]] = field(default_factory=list)
+
+
+def queue_frame(torrents: t.Iterable[t.Union[Torrent, dict]]) -> pd.DataFrame:
+    """Build a DataFrame of the download queue (queued & downloading torrents) with the `TORRENT_QUEUE_FIELDS`."""
+    records: list[dict] = [
+        {name: fields.get(name) for name in TORRENT_QUEUE_FIELDS}
+        for fields in (torrent.fields if isinstance(torrent, Torrent) else torrent for torrent in torrents)
+        if fields.get("status") in QUEUE_STATUS_CODES
+    ]
+
+    return pd.DataFrame.from_records(records, columns=TORRENT_QUEUE_FIELDS)
+
+
+def score_queue(df: pd.DataFrame, weights: QueueWeights | None = None, now: float | None = None) -> pd.DataFrame:
+    """Score download queue torrents, and return them best first (ties keep their queue order).
+
+    Components, each in [0, 1]:
+        - `eta_score`: 1 / (1 + ln(1 + expected hours left)). The expected time is Transmission's eta
+          when known, else leftUntilDone at the torrent's lifetime download rate. Torrents that
+          never downloaded anything get the stall horizon.
+        - `availability`: desiredAvailable / leftUntilDone. Queued torrents without peers have
+          no availability data and get 0.5.
+        - `stall`: idle time (since activityDate, or addedDate if never active) as a fraction of
+          the stall horizon, averaged with isStalled.
+
+    Torrents with an error sort last.
+
+    Params:
+        df (pandas.DataFrame): A `queue_frame()`.
+        weights (QueueWeights): Score weights.
+        now (float): Current unix time. Defaults to time.time().
+
+    Returns:
+        (pandas.DataFrame): `df` with score columns, sorted by score.
+
+    """
+    weights = weights or QueueWeights()
+    now = time.time() if now is None else now
+    df = df.copy()
+
+    left: np.ndarray = df["leftUntilDone"].fillna(0).to_numpy(dtype="float64")
+    eta: np.ndarray = df["eta"].fillna(-1).to_numpy(dtype="float64")
+    downloaded: np.ndarray = df["downloadedEver"].fillna(0).to_numpy(dtype="float64")
+    seconds_downloading: np.ndarray = df["secondsDownloading"].fillna(0).to_numpy(dtype="float64")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lifetime_rate: np.ndarray = np.where(seconds_downloading > 0, downloaded / seconds_downloading, 0.0)
+        expected: np.ndarray = np.where(eta >= 0, eta, np.where(lifetime_rate > 0, left / lifetime_rate, weights.stall_horizon_seconds))
+        availability: np.ndarray = np.where(left > 0, df["desiredAvailable"].fillna(0).to_numpy(dtype="float64") / left, 1.0)
+
+    no_peers: np.ndarray = (df["status"].to_numpy() == 3) & (df["peersConnected"].fillna(0).to_numpy() == 0)
+    df["availability"] = np.where(no_peers, 0.5, np.clip(availability, 0.0, 1.0))
+    df["expected_seconds"] = expected
+    df["eta_score"] = 1.0 / (1.0 + np.log1p(expected / 3600.0))
+
+    activity: np.ndarray = df["activityDate"].fillna(0).to_numpy(dtype="float64")
+    last_active: np.ndarray = np.where(activity > 0, activity, df["addedDate"].fillna(now).to_numpy(dtype="float64"))
+    idle: np.ndarray = np.clip((now - last_active) / weights.stall_horizon_seconds, 0.0, 1.0)
+    df["stall"] = (idle + df["isStalled"].fillna(False).to_numpy(dtype="float64")) / 2.0
+
+    df["score"] = weights.eta * df["eta_score"] + weights.availability * df["availability"] - weights.stall * df["stall"]
+    df.loc[df["error"].fillna(0).to_numpy() != 0, "score"] = -np.inf
+
+    return df.sort_values(["score", "queuePosition"], ascending=[False, True], kind="stable").reset_index(drop=True)
+
+
+def longest_increasing_subsequence(values: t.Sequence[int]) -> list[int]:
+    """Return the indices of one longest strictly increasing subsequence of `values`, in O(n log n)."""
+    tails: list[int] = []
+    tail_indices: list[int] = []
+    previous: list[int] = [-1] * len(values)
+
+    for index, value in enumerate(values):
+        slot: int = bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[slot] = value
+            tail_indices[slot] = index
+        previous[index] = tail_indices[slot - 1] if slot else -1
+
+    result: list[int] = []
+    index = tail_indices[-1] if tail_indices else -1
+    while index != -1:
+        result.append(index)
+        index = previous[index]
+
+    return result[::-1]
+
+
+def minimal_queue_moves(queue: t.Sequence[int], desired: t.Sequence[int]) -> list[tuple[int, int]]:
+    """Return the fewest queuePosition changes giving `desired` torrents that relative order in the queue.
+
+    Only the order among `desired` torrents matters: Transmission starts queued downloads by
+    queuePosition, so torrents outside the download queue are left where they are. Torrents on
+    a longest increasing subsequence of current positions keep their place, so the number of
+    moves is len(desired) - LIS.
+
+    Positions follow Transmission's torrent-set queuePosition: the torrent is taken out of the
+    queue and inserted at the position, shifting the torrents in between.
+
+    Params:
+        queue (Sequence[int]): Every torrent id, in current queuePosition order.
+        desired (Sequence[int]): Ids to reorder, in their new order.
+
+    Returns:
+        (list[tuple[int, int]]): (torrent id, queuePosition) changes, to apply in order.
+
+    """
+    desired_set: set[int] = set(desired)
+    position: dict[int, int] = {torrent_id: index for index, torrent_id in enumerate(queue)}
+    keep: set[int] = {desired[index] for index in longest_increasing_subsequence([position[torrent_id] for torrent_id in desired])}
+
+    ## Torrents outside `desired` never move, so only the desired ids are simulated, each with the
+    ## number of other torrents ahead of it: absolute position = index among desired + others ahead
+    order: list[int] = []
+    others_ahead: dict[int, int] = {}
+    for torrent_id in queue:
+        if torrent_id in desired_set:
+            others_ahead[torrent_id] = position[torrent_id] - len(order)
+            order.append(torrent_id)
+
+    moves: list[tuple[int, int]] = []
+
+    ## In new order, every torrent before the one being moved is already in place
+    for rank, torrent_id in enumerate(desired):
+        if torrent_id in keep:
+            continue
+
+        order.remove(torrent_id)
+        index: int = order.index(desired[rank - 1]) + 1 if rank else 0
+        ## Inserted right after its predecessor (or before the first desired torrent), so it has as many others ahead
+        others_ahead[torrent_id] = others_ahead[desired[rank - 1]] if rank else others_ahead[order[0]] if order else others_ahead[torrent_id]
+        order.insert(index, torrent_id)
+        moves.append((torrent_id, index + others_ahead[torrent_id]))
+
+    return moves
+
+
+def plan_queue_order(
+    torrents: t.Iterable[t.Union[Torrent, dict]],
+    weights: QueueWeights | None = None,
+    now: float | None = None,
+) -> QueuePlan:
+    """Score the download queue and plan the minimal queuePosition changes for its new order.
+
+    Params:
+        torrents (Iterable[Torrent|dict]): Every torrent (with at least id, status & queuePosition), so
+            positions can be computed. Queue torrents need the `TORRENT_QUEUE_FIELDS`.
+        weights (QueueWeights): Score weights.
+        now (float): Current unix time.
+
+    Returns:
+        (QueuePlan): The scored queue & the moves.
+
+    """
+    torrents = list(torrents)
+    order: pd.DataFrame = score_queue(queue_frame(torrents), weights=weights, now=now)
+    if order.empty:
+        return QueuePlan(order=order)
+
+    queue: list[int] = [
+        fields["id"]
+        for fields in sorted(
+            (torrent.fields if isinstance(torrent, Torrent) else torrent for torrent in torrents), key=lambda fields: fields["queuePosition"]
+        )
+    ]
+    moves: list[tuple[int, int]] = minimal_queue_moves(queue=queue, desired=order["id"].tolist())
+    log.debug(f"Reordering [{len(order)}] queued torrent(s) takes [{len(moves)}] move(s)")
+
+    return QueuePlan(order=order, moves=moves)
+
+
+def apply_queue_moves(controller: TransmissionRPCController, moves: t.Iterable[tuple[int, int]]) -> int:
+    """Send queuePosition changes, one torrent-set per move. Returns the number of RPCs made."""
+    calls: int = 0
+    for torrent_id, position in moves:
+        calls += controller.set_torrents(torrent_ids=[torrent_id], queue_position=position)
+
+    return calls
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import typing as t
+
+from transmissionpy.core.db.search import TorrentSearchIndex
+from transmissionpy.core.transmission_lib import (
+    DEFAULT_ID_CHUNK_SIZE,
+    TransmissionRPCController,
+)
+
+from loguru import logger as log
+from transmission_rpc import Torrent
+
+## Fields needed to tell which torrents changed since the search index was last synced
+TORRENT_SEARCH_FIELDS: list[str] = ["id", "hashString", "name", "totalSize"]
+## Fields fetched only for new/changed torrents
+TORRENT_SEARCH_FILE_FIELDS: list[str] = ["id", "hashString", "name", "totalSize", "files"]
+
+
+def sync_search_index(
+    index: TorrentSearchIndex,
+    controller: TransmissionRPCController,
+    torrents: t.Iterable[Torrent] | None = None,
+    fresh: bool = False,
+    chunk_size: int = DEFAULT_ID_CHUNK_SIZE,
+) -> dict[str, int]:
+    """Bring the search index up to date with Transmission, keyed by hashString.
+
+    Only torrents that are new, or whose totalSize changed (i.e. a magnet link got its metadata),
+    have their file lists fetched. Renamed torrents only get their name row rewritten, and
+    torrents no longer in Transmission are dropped.
+
+    Params:
+        index (TorrentSearchIndex): The index to update.
+        controller (TransmissionRPCController): An open controller.
+        torrents (Iterable[Torrent]): The complete torrent list, if the caller already fetched it.
+            Must include the `TORRENT_SEARCH_FIELDS`.
+        fresh (bool): Skip the torrent list cache.
+        chunk_size (int): File lists are fetched & indexed this many torrents at a time.
+
+    Returns:
+        (dict[str, int]): Counts of `renamed`, `indexed` & `removed` torrents.
+
+    """
+    if torrents is None:
+        torrents = controller.get_all_torrents(arguments=TORRENT_SEARCH_FIELDS, fresh=fresh)
+
+    changed, needs_files, removed = index.diff([torrent.fields for torrent in torrents], prune=True)
+
+    indexed: int = 0
+    if needs_files:
+        log.info(f"Fetching file lists for [{len(needs_files)}] new or changed torrent(s)")
+        ## File lists are the bulk of the payload, so only one chunk is held in memory at a time
+        for start in range(0, len(needs_files), chunk_size):
+            detailed: list[Torrent] = controller.get_multiple_torrents(
+                ids=[fields["id"] for fields in needs_files[start:start + chunk_size]], arguments=TORRENT_SEARCH_FILE_FIELDS
+            )
+            indexed += index.upsert(torrent.fields for torrent in detailed)
+
+    renamed: int = index.upsert(changed)
+    removed_count: int = index.remove(removed)
+
+    log.debug(f"Search index sync: {indexed} indexed, {renamed} renamed, {removed_count} removed")
+
+    return {"indexed": indexed, "renamed": renamed, "removed": removed_count}
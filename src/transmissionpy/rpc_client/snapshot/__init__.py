@@ -1,3 +1,15 @@
 from __future__ import annotations
 
+from .constants import (
+    SNAPSHOT_HISTORY_COLUMNS,
+    SNAPSHOT_HISTORY_PARTITION,
+    SNAPSHOT_QUERY_AGGREGATIONS,
+)
 from .controllers import SnapshotManager
+from .query import (
+    build_snapshot_query,
+    iter_snapshot_query,
+    open_snapshot_history,
+    query_snapshots,
+    write_snapshot_query,
+)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+## Scalar torrent fields kept in the columnar snapshot history dataset
+SNAPSHOT_HISTORY_COLUMNS: list[str] = [
+    "id",
+    "hashString",
+    "name",
+    "status",
+    "error",
+    "errorString",
+    "isFinished",
+    "isStalled",
+    "percentDone",
+    "uploadRatio",
+    "totalSize",
+    "sizeWhenDone",
+    "leftUntilDone",
+    "downloadedEver",
+    "uploadedEver",
+    "rateDownload",
+    "rateUpload",
+    "peersConnected",
+    "queuePosition",
+    "downloadDir",
+    "addedDate",
+    "activityDate",
+    "doneDate",
+    "secondsDownloading",
+    "secondsSeeding",
+]
+## Hive partition key (directory name) of the snapshot history dataset
+SNAPSHOT_HISTORY_PARTITION: str = "snapshot_day"
+## Aggregate functions accepted by snapshot queries, i.e. "mean(uploadRatio)"
+SNAPSHOT_QUERY_AGGREGATIONS: list[str] = ["count", "count_distinct", "sum", "mean", "min", "max", "stddev", "first", "last"]
@@ -6,34 +6,73 @@ import typing as t
 
 from transmissionpy.core.constants import SNAPSHOT_DIR
 from transmissionpy.core.utils import df_utils, path_utils
-from transmissionpy.domain.Transmission import TorrentMetadataIn, TorrentMetadataOut
+from transmissionpy.domain.Transmission import (
+    TorrentMetadataIn,
+    TorrentMetadataOut,
+    TorrentSummaryIn,
+)
+from transmissionpy.rpc_client.trackers import announce_host
 from transmissionpy.rpc_client.utils import (
     convert_multiple_torrents_to_torrentmetadata,
     convert_torrent_to_torrentmetadata,
+    convert_torrents_to_arrow_table,
     convert_torrents_to_df,
 )
 
+from .constants import SNAPSHOT_HISTORY_COLUMNS, SNAPSHOT_HISTORY_PARTITION
+
 from loguru import logger as log
 import msgpack
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from transmission_rpc import Torrent
 
+def _snapshot_record(torrent: t.Union[Torrent, TorrentMetadataIn, dict]) -> dict:
+    if isinstance(torrent, Torrent):
+        return torrent.fields
+    elif isinstance(torrent, (TorrentMetadataIn, TorrentSummaryIn)):
+        return torrent.model_dump()
+    elif isinstance(torrent, dict):
+        ## Legacy snapshots store Torrent.__dict__, i.e. {"fields": {...}}
+        return torrent["fields"] if isinstance(torrent.get("fields"), dict) else torrent
+
+    raise TypeError(f"Invalid type for torrent: ({type(torrent)})")
+
+
+def _tracker_host(record: dict) -> str | None:
+    ## Hostname of the first (primary) tracker, from trackerStats when available.
+    #  trackerStats[].host is 'scheme://host:port', so both branches go through announce_host()
+    #  to store the bare hostname the tracker index uses.
+    tracker_stats: list[dict] = record.get("trackerStats") or []
+    if tracker_stats and tracker_stats[0].get("host"):
+        return announce_host(tracker_stats[0]["host"])
+
+    trackers: list[dict] = record.get("trackers") or []
+    if trackers and trackers[0].get("announce"):
+        return announce_host(trackers[0]["announce"])
+
+    return None
+
 class SnapshotManager:
-    def __init__(self, snapshot_dir: t.Union[Path, str] = SNAPSHOT_DIR, snapshot_filename: str = "snapshots"):
+    def __init__(self, snapshot_dir: t.Union[Path, str] = SNAPSHOT_DIR, snapshot_filename: str = "snapshots", write_history: bool = True):
         self.snapshot_dir = Path(str(snapshot_dir))
         self.snapshot_parquet_file = self.snapshot_dir / f"{snapshot_filename}.parquet"
+        ## Columnar, one-row-per-torrent copy of every snapshot, partitioned by day, for queries
+        self.history_dir = self.snapshot_dir / snapshot_filename
+        self.write_history = write_history
 
     def save_snapshot(self, torrents: t.List[t.Union[Torrent, TorrentMetadataIn, dict]]) -> None:
         """Save a snapshot of torrents to the Parquet file."""
         ## Ensure input is a list of dictionaries
-        if not any(isinstance(t, dict) for t in torrents) and not any(isinstance(t, Torrent) for t in torrents) and not any(isinstance(t, TorrentMetadataIn)):
+        if not any(isinstance(t, dict) for t in torrents) and not any(isinstance(t, Torrent) for t in torrents) and not any(isinstance(t, (TorrentMetadataIn, TorrentSummaryIn)) for t in torrents):
             raise TypeError("torrents must be a list of dicts, TorrentMetadataIn, or transmission_rpc.Torrent objects.")
         
         ## Create list of torrent dicts
         torrents = [
             t.__dict__ if isinstance(t, Torrent)
             else t if isinstance(t, dict)
-            else t.model_dump() if isinstance(t, TorrentMetadataIn)
+            else t.model_dump() if isinstance(t, (TorrentMetadataIn, TorrentSummaryIn))
             else None
             for t in torrents
         ]
@@ -42,9 +81,11 @@ class SnapshotManager:
         if not self.snapshot_dir.exists():
             self.snapshot_dir.mkdir(parents=True, exist_ok=True)
 
+        snapshot_date: datetime = datetime.now()
+
         ## Create the snapshot row with msgpack-compressed data
         snapshot_row = {
-            "snapshot_date": datetime.now(),
+            "snapshot_date": snapshot_date,
             "count": len(torrents),
             "torrents": msgpack.dumps(torrents),
         }
@@ -68,6 +109,63 @@ class SnapshotManager:
             log.error(f"Failed to write snapshot to Parquet file: {e}")
             raise
 
+        if self.write_history and torrents:
+            self.save_history(torrents=torrents, snapshot_date=snapshot_date)
+
+    def save_history(self, torrents: t.List[t.Union[Torrent, TorrentMetadataIn, dict]], snapshot_date: datetime | None = None) -> Path:
+        """Write one snapshot to the columnar history dataset.
+
+        Each torrent becomes a row with the `SNAPSHOT_HISTORY_COLUMNS`, plus `snapshot_date`
+        and `trackerHost`. Files are written to `<history_dir>/snapshot_day=YYYY-MM-DD/`,
+        so queries over a date range only open the matching directories.
+
+        Returns:
+            (Path): Path to the written Parquet file.
+
+        """
+        snapshot_date = snapshot_date or datetime.now()
+        records: list[dict] = [_snapshot_record(t) for t in torrents]
+
+        table: pa.Table = convert_torrents_to_arrow_table(torrents=records, columns=SNAPSHOT_HISTORY_COLUMNS)
+        table = table.append_column("trackerHost", pa.array([_tracker_host(r) for r in records], type=pa.string()))
+        table = table.append_column("snapshot_date", pa.array([snapshot_date] * table.num_rows, type=pa.timestamp("ms")))
+
+        partition_dir: Path = self.history_dir / f"{SNAPSHOT_HISTORY_PARTITION}={snapshot_date:%Y-%m-%d}"
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        history_file: Path = partition_dir / f"{snapshot_date:%Y%m%dT%H%M%S%f}.parquet"
+
+        try:
+            pq.write_table(table, history_file)
+            log.debug(f"Snapshot history saved to {history_file}")
+        except Exception as e:
+            log.error(f"Failed to write snapshot history to Parquet file: {e}")
+            raise
+
+        return history_file
+
+    def backfill_history(self) -> int:
+        """Write history files for snapshots saved before the history dataset existed.
+
+        Returns:
+            (int): Number of snapshots written to the history dataset.
+
+        """
+        if self.history_dir.exists() and any(self.history_dir.glob("**/*.parquet")):
+            log.warning(f"History dataset already exists at {self.history_dir}, skipping backfill")
+            return 0
+
+        count: int = 0
+        for snapshot in self.get_snapshots():
+            if not snapshot["torrents"]:
+                continue
+
+            self.save_history(torrents=snapshot["torrents"], snapshot_date=pd.Timestamp(snapshot["snapshot_date"]).to_pydatetime())
+            count += 1
+
+        log.info(f"Backfilled [{count}] snapshot(s) to {self.history_dir}")
+
+        return count
+
     def get_snapshots(self) -> t.List[dict]:
         """Retrieve all snapshots from the Parquet file."""
         if not self.snapshot_parquet_file.exists():
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import re
+import typing as t
+
+from transmissionpy.core.constants import SNAPSHOT_DIR
+
+from .constants import SNAPSHOT_HISTORY_PARTITION, SNAPSHOT_QUERY_AGGREGATIONS
+
+from loguru import logger as log
+import pyarrow as pa
+import pyarrow.acero as ac
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+## i.e. "uploadRatio >= 1.5", "status in (4, 6)", "name contains 1080p"
+WHERE_CLAUSE_PATTERN: re.Pattern = re.compile(r"^\s*(\w+)\s*(==|!=|>=|<=|>|<|=|\s+in\s+|\s+contains\s+)\s*(.+?)\s*$", re.IGNORECASE)
+## i.e. "mean(uploadRatio)", "count(*) as torrents"
+AGGREGATION_PATTERN: re.Pattern = re.compile(r"^\s*(\w+)\s*\(\s*(\*|\w+)\s*\)\s*(?:as\s+(\w+))?\s*$", re.IGNORECASE)
+## i.e. "30d", "12h", "2w"
+RELATIVE_TIME_PATTERN: re.Pattern = re.compile(r"^\s*(\d+)\s*([mhdw])\s*$", re.IGNORECASE)
+
+_RELATIVE_TIME_UNITS: dict[str, str] = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def _parse_value(raw: str) -> t.Any:
+    raw = raw.strip()
+
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in "'\"":
+        return raw[1:-1]
+    if raw.lower() in ["true", "false"]:
+        return raw.lower() == "true"
+    if raw.lower() in ["null", "none"]:
+        return None
+
+    for _type in (int, float):
+        try:
+            return _type(raw)
+        except ValueError:
+            pass
+
+    return raw
+
+
+def parse_where_clause(clause: str) -> ds.Expression:
+    """Parse a `<column> <op> <value>` clause into a pyarrow filter expression.
+
+    Supported operators: `==` (or `=`), `!=`, `>`, `>=`, `<`, `<=`, `in (a, b, ...)` and
+    `contains <substring>`.
+
+    Params:
+        clause (str): The clause to parse, i.e. `"uploadRatio >= 1.5"`
+
+    Returns:
+        (pyarrow.dataset.Expression): The filter expression
+
+    """
+    match = WHERE_CLAUSE_PATTERN.match(clause or "")
+    if not match:
+        raise ValueError(f"Invalid where clause: '{clause}'. Expected '<column> <op> <value>'")
+
+    col, op, raw_value = match.group(1), match.group(2).strip().lower(), match.group(3)
+    field: ds.Expression = ds.field(col)
+
+    match op:
+        case "==" | "=":
+            return field == _parse_value(raw_value)
+        case "!=":
+            return field != _parse_value(raw_value)
+        case ">":
+            return field > _parse_value(raw_value)
+        case ">=":
+            return field >= _parse_value(raw_value)
+        case "<":
+            return field < _parse_value(raw_value)
+        case "<=":
+            return field <= _parse_value(raw_value)
+        case "in":
+            values = [_parse_value(v) for v in raw_value.strip().strip("()[]").split(",") if v.strip()]
+            return field.isin(values)
+        case "contains":
+            return pc.match_substring(field, str(_parse_value(raw_value)))
+
+    raise ValueError(f"Unsupported operator in where clause: '{op}'")
+
+
+def parse_aggregation(aggregation: str) -> tuple[str | list, str, str]:
+    """Parse an `<func>(<column>) [as <name>]` aggregation.
+
+    Params:
+        aggregation (str): The aggregation, i.e. `"mean(uploadRatio)"` or `"count(*) as torrents"`
+
+    Returns:
+        (tuple): `(target column(s), function, output name)`
+
+    """
+    match = AGGREGATION_PATTERN.match(aggregation or "")
+    if not match:
+        raise ValueError(f"Invalid aggregation: '{aggregation}'. Expected '<func>(<column>) [as <name>]'")
+
+    func, col, name = match.group(1).lower(), match.group(2), match.group(3)
+    if func not in SNAPSHOT_QUERY_AGGREGATIONS:
+        raise ValueError(f"Invalid aggregate function: '{func}'. Must be one of {SNAPSHOT_QUERY_AGGREGATIONS}")
+
+    if col == "*":
+        if func != "count":
+            raise ValueError(f"Only count(*) can be used with '*', got: '{aggregation}'")
+
+        return [], "count_all", name or "count"
+
+    return col, func, name or f"{col}_{func}"
+
+
+def parse_time_bound(value: str | datetime | None) -> datetime | None:
+    """Parse a relative (`"30d"`, `"12h"`, `"2w"`, `"90m"`) or ISO 8601 time bound."""
+    if value is None or isinstance(value, datetime):
+        return value
+
+    match = RELATIVE_TIME_PATTERN.match(value)
+    if match:
+        return datetime.now() - timedelta(**{_RELATIVE_TIME_UNITS[match.group(2).lower()]: int(match.group(1))})
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid time bound: '{value}'. Use i.e. '30d', '12h' or an ISO date") from exc
+
+
+def parse_order_by(order_by: str) -> tuple[str, str]:
+    """Parse a `<column>[:asc|:desc]` sort key into a `(column, "ascending"|"descending")` tuple."""
+    col, _, direction = order_by.partition(":")
+    direction = direction.strip().lower() or "asc"
+
+    if direction not in ["asc", "desc"]:
+        raise ValueError(f"Invalid sort direction in '{order_by}'. Must be 'asc' or 'desc'")
+
+    return col.strip(), "descending" if direction == "desc" else "ascending"
+
+
+def open_snapshot_history(snapshot_dir: t.Union[str, Path] = SNAPSHOT_DIR, snapshot_filename: str = "all_torrents_snapshot") -> ds.Dataset:
+    """Open the columnar snapshot history written by `SnapshotManager.save_history()`."""
+    history_dir: Path = Path(str(snapshot_dir)) / snapshot_filename
+
+    if not history_dir.exists() or not any(history_dir.glob("**/*.parquet")):
+        raise FileNotFoundError(f"No snapshot history found at '{history_dir}'. Save a snapshot, or run a backfill first.")
+
+    partitioning = ds.partitioning(pa.schema([(SNAPSHOT_HISTORY_PARTITION, pa.string())]), flavor="hive")
+
+    return ds.dataset(history_dir, format="parquet", partitioning=partitioning)
+
+
+def build_snapshot_query(
+    dataset: ds.Dataset,
+    select: list[str] | None = None,
+    where: list[str] | None = None,
+    group_by: list[str] | None = None,
+    aggregations: list[str] | None = None,
+    since: str | datetime | None = None,
+    until: str | datetime | None = None,
+    order_by: list[str] | None = None,
+) -> ac.Declaration:
+    """Build a streaming Acero plan (scan -> filter -> aggregate -> order) over snapshot history.
+
+    Only the columns the query needs are read, and `where`/`since`/`until` are pushed down
+    to the scan, so whole day partitions and Parquet row groups are skipped.
+
+    Params:
+        dataset (pyarrow.dataset.Dataset): Dataset returned by `open_snapshot_history()`
+        select (list[str]|None): Columns to return when not aggregating. Default: all columns
+        where (list[str]|None): Clauses for `parse_where_clause()`, combined with AND
+        group_by (list[str]|None): Columns to group by
+        aggregations (list[str]|None): Aggregations for `parse_aggregation()`
+        since (str|datetime|None): Only include snapshots taken at/after this time, i.e. `"30d"`
+        until (str|datetime|None): Only include snapshots taken before this time
+        order_by (list[str]|None): Columns to sort by, i.e. `"uploadRatio_mean:desc"`
+
+    Returns:
+        (pyarrow.acero.Declaration): The query plan
+
+    """
+    filters: list[ds.Expression] = [parse_where_clause(c) for c in (where or [])]
+    filter_columns: list[str] = [WHERE_CLAUSE_PATTERN.match(c).group(1) for c in (where or [])]
+
+    since_dt, until_dt = parse_time_bound(since), parse_time_bound(until)
+    if since_dt or until_dt:
+        filter_columns += [SNAPSHOT_HISTORY_PARTITION, "snapshot_date"]
+    if since_dt:
+        filters.append(ds.field(SNAPSHOT_HISTORY_PARTITION) >= f"{since_dt:%Y-%m-%d}")
+        filters.append(ds.field("snapshot_date") >= pa.scalar(since_dt, pa.timestamp("ms")))
+    if until_dt:
+        filters.append(ds.field(SNAPSHOT_HISTORY_PARTITION) <= f"{until_dt:%Y-%m-%d}")
+        filters.append(ds.field("snapshot_date") < pa.scalar(until_dt, pa.timestamp("ms")))
+
+    filter_expr: ds.Expression | None = None
+    for f in filters:
+        filter_expr = f if filter_expr is None else filter_expr & f
+
+    parsed_aggs: list[tuple] = [parse_aggregation(a) for a in (aggregations or [])]
+    group_by = group_by or []
+
+    ## Project only what the query touches, so other columns are never decoded
+    if parsed_aggs or group_by:
+        columns: list[str] = list(dict.fromkeys(group_by + [a[0] for a in parsed_aggs if a[0]]))
+    else:
+        columns = select or dataset.schema.names
+    unknown: list[str] = [c for c in columns + filter_columns if c not in dataset.schema.names]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {unknown}. Available: {dataset.schema.names}")
+
+    ## Filter-only columns are read for the filter node, then dropped by project/aggregate
+    scan_columns: list[str] = list(dict.fromkeys(columns + filter_columns))
+
+    plan: list[ac.Declaration] = [ac.Declaration("scan", ac.ScanNodeOptions(dataset, columns=scan_columns, filter=filter_expr))]
+    if filter_expr is not None:
+        ## The scan filter only prunes partitions/row groups, rows still need filtering
+        plan.append(ac.Declaration("filter", ac.FilterNodeOptions(filter_expr)))
+
+    if parsed_aggs or group_by:
+        if not parsed_aggs:
+            parsed_aggs = [([], "count_all", "count")]
+        ## Grouped aggregates use the "hash_" variants of the compute functions
+        prefix: str = "hash_" if group_by else ""
+        aggs = [(target, f"{prefix}{func}", None, name) for target, func, name in parsed_aggs]
+        plan.append(ac.Declaration("aggregate", ac.AggregateNodeOptions(aggs, keys=group_by)))
+    else:
+        plan.append(ac.Declaration("project", ac.ProjectNodeOptions([ds.field(c) for c in columns], names=columns)))
+
+    if order_by:
+        sort_keys = [parse_order_by(c) for c in order_by]
+        plan.append(ac.Declaration("order_by", ac.OrderByNodeOptions(sort_keys)))
+
+    return ac.Declaration.from_sequence(plan)
+
+
+def iter_snapshot_query(
+    snapshot_dir: t.Union[str, Path] = SNAPSHOT_DIR,
+    snapshot_filename: str = "all_torrents_snapshot",
+    limit: int | None = None,
+    **query: t.Any,
+) -> t.Iterator[pa.RecordBatch]:
+    """Run a snapshot query and yield result batches as they are produced.
+
+    Params:
+        snapshot_dir (str|Path): Directory containing snapshots
+        snapshot_filename (str): Name of the snapshot (see `SnapshotManager`)
+        limit (int|None): Stop after this many rows
+        **query: Arguments for `build_snapshot_query()`
+
+    Returns:
+        (Iterator[pyarrow.RecordBatch]): Result batches
+
+    """
+    dataset: ds.Dataset = open_snapshot_history(snapshot_dir=snapshot_dir, snapshot_filename=snapshot_filename)
+    plan: ac.Declaration = build_snapshot_query(dataset=dataset, **query)
+
+    remaining: int | None = limit
+    if remaining is not None and remaining <= 0:
+        return
+
+    reader: pa.RecordBatchReader = plan.to_reader()
+    try:
+        for batch in reader:
+            if remaining is not None:
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+
+            if batch.num_rows:
+                yield batch
+
+            if remaining == 0:
+                break
+    finally:
+        ## Stopping early cancels the plan; closing the reader keeps Arrow from logging that to stderr
+        reader.close()
+
+
+def query_snapshots(
+    snapshot_dir: t.Union[str, Path] = SNAPSHOT_DIR,
+    snapshot_filename: str = "all_torrents_snapshot",
+    limit: int | None = None,
+    **query: t.Any,
+) -> pa.Table:
+    """Run a snapshot query and return the full result as a pyarrow Table.
+
+    Example:
+        Average upload ratio per tracker over the last 30 days:
+
+        query_snapshots(group_by=["trackerHost"], aggregations=["mean(uploadRatio)"], since="30d")
+
+    """
+    batches: list[pa.RecordBatch] = list(iter_snapshot_query(snapshot_dir=snapshot_dir, snapshot_filename=snapshot_filename, limit=limit, **query))
+    if not batches:
+        dataset = open_snapshot_history(snapshot_dir=snapshot_dir, snapshot_filename=snapshot_filename)
+        return build_snapshot_query(dataset=dataset, **query).to_table().slice(0, 0)
+
+    return pa.Table.from_batches(batches)
+
+
+def write_snapshot_query(
+    output: t.Union[str, Path],
+    snapshot_dir: t.Union[str, Path] = SNAPSHOT_DIR,
+    snapshot_filename: str = "all_torrents_snapshot",
+    limit: int | None = None,
+    **query: t.Any,
+) -> int:
+    """Stream a snapshot query's results to a Parquet file.
+
+    Returns:
+        (int): Number of rows written
+
+    """
+    output = Path(str(output))
+    if output.suffix != ".parquet":
+        output = Path(f"{output}.parquet")
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    rows: int = 0
+    writer: pq.ParquetWriter | None = None
+    try:
+        for batch in iter_snapshot_query(snapshot_dir=snapshot_dir, snapshot_filename=snapshot_filename, limit=limit, **query):
+            if writer is None:
+                writer = pq.ParquetWriter(output, batch.schema)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    log.info(f"Wrote [{rows}] row(s) to {output}")
+
+    return rows
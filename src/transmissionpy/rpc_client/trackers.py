@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import time
+import typing as t
+from urllib.parse import urlparse
+
+from loguru import logger as log
+import numpy as np
+import pandas as pd
+from transmission_rpc import Torrent
+
+## Fields needed to build a TrackerIndex, much smaller than the full detail fields
+TORRENT_TRACKER_FIELDS: list[str] = ["id", "hashString", "trackerStats"]
+
+
+def announce_host(announce: str) -> str | None:
+    """Return the lowercase hostname of a tracker announce URL, i.e. 'tracker.example.org'."""
+    if not announce:
+        return None
+
+    try:
+        return urlparse(announce).hostname
+    except ValueError:
+        return None
+
+
+class TrackerIndex:
+    """Inverted index from tracker host to torrent ids, plus one flat array per trackerStats field.
+
+    Built in a single pass over every torrent's trackerStats. Host lookups return matching ids
+    without scanning torrents, and per-host aggregates are computed with numpy over the flat
+    arrays, one row per (torrent, tracker) entry.
+    """
+
+    def __init__(
+        self,
+        hosts: list[str],
+        host_codes: np.ndarray,
+        torrent_ids: np.ndarray,
+        has_announced: np.ndarray,
+        announce_succeeded: np.ndarray,
+        announce_timed_out: np.ndarray,
+        seeders: np.ndarray,
+        leechers: np.ndarray,
+        last_announce_time: np.ndarray,
+    ) -> None:
+        self.hosts: list[str] = hosts
+        self.host_codes: np.ndarray = host_codes
+        self.torrent_ids: np.ndarray = torrent_ids
+        self.has_announced: np.ndarray = has_announced
+        self.announce_succeeded: np.ndarray = announce_succeeded
+        self.announce_timed_out: np.ndarray = announce_timed_out
+        self.seeders: np.ndarray = seeders
+        self.leechers: np.ndarray = leechers
+        self.last_announce_time: np.ndarray = last_announce_time
+
+        ## host -> sorted, unique torrent ids. A torrent listing a host on several tiers appears once.
+        order: np.ndarray = np.lexsort((torrent_ids, host_codes))
+        sorted_codes: np.ndarray = host_codes[order]
+        sorted_ids: np.ndarray = torrent_ids[order]
+        bounds: np.ndarray = np.searchsorted(sorted_codes, np.arange(len(hosts) + 1))
+        self.ids_by_host: dict[str, np.ndarray] = {
+            host: np.unique(sorted_ids[bounds[code]:bounds[code + 1]]) for code, host in enumerate(hosts)
+        }
+
+    def __len__(self) -> int:
+        return len(self.hosts)
+
+    @classmethod
+    def from_torrents(cls, torrents: t.Iterable[t.Union[Torrent, dict]]) -> "TrackerIndex":
+        """Build the index from `Torrent`s (or raw field dicts) that include trackerStats."""
+        host_codes: dict[str, int] = {}
+        ## Announce URLs repeat across torrents, so each one is parsed once
+        announce_hosts: dict[str, str | None] = {}
+        rows: list[tuple] = []
+
+        for torrent in torrents:
+            fields: dict = torrent.fields if isinstance(torrent, Torrent) else torrent
+            torrent_id: int = fields.get("id", 0)
+
+            for stat in fields.get("trackerStats") or []:
+                announce: str = stat.get("announce") or ""
+                host: str | None = announce_hosts.get(announce)
+                if host is None and announce not in announce_hosts:
+                    host = announce_hosts[announce] = announce_host(announce)
+                if host is None:
+                    continue
+
+                code: int | None = host_codes.get(host)
+                if code is None:
+                    code = host_codes[host] = len(host_codes)
+
+                rows.append(
+                    (
+                        code,
+                        torrent_id,
+                        stat.get("hasAnnounced", False),
+                        stat.get("lastAnnounceSucceeded", False),
+                        stat.get("lastAnnounceTimedOut", False),
+                        stat.get("seederCount", -1),
+                        stat.get("leecherCount", -1),
+                        stat.get("lastAnnounceTime", 0),
+                    )
+                )
+
+        columns: np.ndarray = np.array(rows, dtype=np.int64).reshape(-1, 8)
+        log.debug(f"Indexed {columns.shape[0]} tracker entries across {len(host_codes)} host(s)")
+
+        return cls(
+            hosts=list(host_codes),
+            host_codes=columns[:, 0],
+            torrent_ids=columns[:, 1],
+            has_announced=columns[:, 2].astype(bool),
+            announce_succeeded=columns[:, 3].astype(bool),
+            announce_timed_out=columns[:, 4].astype(bool),
+            seeders=columns[:, 5],
+            leechers=columns[:, 6],
+            last_announce_time=columns[:, 7],
+        )
+
+    def match_hosts(self, tracker: str) -> list[str]:
+        """Return indexed hosts equal to `tracker`, or under it as a domain ('example.org' matches 'tracker.example.org').
+
+        `tracker` may also be an announce URL.
+        """
+        tracker = (announce_host(tracker) if "://" in tracker else tracker).lower().strip(".")
+        if tracker in self.ids_by_host:
+            return [tracker]
+
+        return [host for host in self.hosts if host.endswith(f".{tracker}")]
+
+    def torrent_ids_for(self, trackers: t.Iterable[str]) -> list[int]:
+        """Return the ids of torrents announcing to any of `trackers`, without scanning torrents."""
+        matched: list[np.ndarray] = [self.ids_by_host[host] for tracker in trackers for host in self.match_hosts(tracker)]
+        if not matched:
+            return []
+
+        return np.unique(np.concatenate(matched)).tolist()
+
+    def host_stats(self, now: float | None = None) -> pd.DataFrame:
+        """Aggregate tracker health per host.
+
+        Params:
+            now (float): Unix time to measure announce ages from. Default: the current time.
+
+        Returns:
+            (pandas.DataFrame): One row per host, with torrent & announce counts, `successRate`
+                (of torrents that announced), `timedOut`, summed `seeders`/`leechers` (unknown
+                counts excluded), and `lastAnnounceAge`/`oldestAnnounceAge` in seconds.
+
+        """
+        n_hosts: int = len(self.hosts)
+        codes: np.ndarray = self.host_codes
+        now = time.time() if now is None else now
+
+        announced: np.ndarray = np.bincount(codes, weights=self.has_announced, minlength=n_hosts)
+        succeeded: np.ndarray = np.bincount(codes, weights=self.has_announced & self.announce_succeeded, minlength=n_hosts)
+
+        announce_times: np.ndarray = np.where(self.has_announced & (self.last_announce_time > 0), self.last_announce_time, 0)
+        latest: np.ndarray = np.zeros(n_hosts, dtype=np.int64)
+        np.maximum.at(latest, codes, announce_times)
+        oldest: np.ndarray = np.full(n_hosts, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(oldest, codes, np.where(announce_times > 0, announce_times, np.iinfo(np.int64).max))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            success_rate: np.ndarray = np.where(announced > 0, succeeded / announced, np.nan)
+
+        stats = pd.DataFrame(
+            {
+                "host": self.hosts,
+                "torrents": [len(self.ids_by_host[host]) for host in self.hosts],
+                "announced": announced.astype(np.int64),
+                "succeeded": succeeded.astype(np.int64),
+                "successRate": success_rate,
+                "timedOut": np.bincount(codes, weights=self.announce_timed_out, minlength=n_hosts).astype(np.int64),
+                "seeders": np.bincount(codes, weights=np.clip(self.seeders, 0, None), minlength=n_hosts).astype(np.int64),
+                "leechers": np.bincount(codes, weights=np.clip(self.leechers, 0, None), minlength=n_hosts).astype(np.int64),
+                "lastAnnounceAge": np.where(latest > 0, now - latest, np.nan),
+                "oldestAnnounceAge": np.where(oldest < np.iinfo(np.int64).max, now - oldest, np.nan),
+            }
+        )
+
+        return stats.sort_values(["successRate", "torrents"], ascending=[True, False], na_position="last").reset_index(drop=True)
@@ -3,21 +3,47 @@ from __future__ import annotations
 import random
 import typing as t
 
-from transmissionpy.core.utils import df_utils, list_utils
-from transmissionpy.domain.Transmission import TorrentMetadataIn, TorrentMetadataOut
+from transmissionpy.core.transmission_lib import TORRENT_DETAIL_FIELDS
+from transmissionpy.core.utils import df_utils, list_utils, profile_utils, time_utils
+from transmissionpy.domain.Transmission import (
+    TORRENT_CATEGORICAL_FIELDNAMES,
+    TORRENT_FLOAT_FIELDNAMES,
+    TORRENT_INT_DATETIME_FIELDNAMES,
+    TORRENT_SECONDS_FIELDNAMES,
+    TorrentDetailsIn,
+    TorrentMetadataIn,
+    TorrentMetadataOut,
+    TorrentSummaryIn,
+    torrent_pa_types_mapping,
+)
 
 from loguru import logger as log
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from transmission_rpc import Torrent
 
-def convert_torrent_to_torrentmetadata(torrent: Torrent):
+## Detail fields besides the id/hashString/piece counts every summary also has
+_DETAIL_ONLY_FIELDS: frozenset[str] = frozenset(TORRENT_DETAIL_FIELDS) - {"id", "hashString", "pieceCount", "pieceSize"}
+
+
+def convert_torrent_to_torrentmetadata(torrent: Torrent) -> TorrentMetadataIn | TorrentSummaryIn:
+    """Validate a torrent's RPC fields.
+
+    Torrents fetched with file/tracker/piece fields validate as `TorrentMetadataIn`. Summary
+    torrents (`TORRENT_SUMMARY_FIELDS` only) validate as the lighter `TorrentSummaryIn`.
+    """
     if torrent is None:
         raise ValueError("Missing transmission_rpc.Torrent object")
     if not isinstance(torrent, Torrent):
         raise TypeError(f"Invalid type for torrent: ({type(torrent)}). Must be of type transmission_rpc.Torrent")
 
+    fields: dict = torrent.__dict__["fields"]
+    model: type[TorrentMetadataIn] | type[TorrentSummaryIn] = TorrentSummaryIn if _DETAIL_ONLY_FIELDS.isdisjoint(fields) else TorrentMetadataIn
+
     try:
-        torrent_metadata = TorrentMetadataIn.model_validate(torrent.__dict__["fields"])
+        torrent_metadata = model.model_validate(fields)
         return torrent_metadata
     except Exception as exc:
         msg = f"({type(exc)}) Error validating torrent metadata. Details: {exc}"
@@ -26,21 +52,71 @@ def convert_torrent_to_torrentmetadata(torrent: Torrent):
         raise exc
 
 
-def convert_multiple_torrents_to_torrentmetadata(torrents: list[Torrent]) -> list[TorrentMetadataIn]:
+@profile_utils.profiled("validate")
+def convert_multiple_torrents_to_torrentmetadata(torrents: list[Torrent]) -> list[TorrentMetadataIn | TorrentSummaryIn]:
     if torrents is None or (isinstance(torrents, list) and len(torrents) == 0):
         raise ValueError("torrents list must not be empty")
     if not isinstance(torrents, list):
         raise TypeError(f"Invalid type for torrents: ({type(torrents)}). Must be a list of transmission_rpc.Torrent objects")
     
-    torrents_out: list[TorrentMetadataIn] = []
+    torrents_out: list[TorrentMetadataIn | TorrentSummaryIn] = []
     
     for t in torrents:
-        _t: TorrentMetadataIn = convert_torrent_to_torrentmetadata(torrent=t)
+        _t: TorrentMetadataIn | TorrentSummaryIn = convert_torrent_to_torrentmetadata(torrent=t)
         torrents_out.append(_t)
-        
+
+    profile_utils.record_objects(len(torrents_out))
+
     return torrents_out
 
 
+def convert_torrent_details(details: dict[str, Torrent]) -> dict[str, TorrentDetailsIn]:
+    """Validate torrents returned by `TransmissionRPCController.get_torrent_details()`, keyed by hashString."""
+    try:
+        return {hash_string: TorrentDetailsIn.model_validate(torrent.fields) for hash_string, torrent in details.items()}
+    except Exception as exc:
+        msg = f"({type(exc)}) Error validating torrent details. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+
+## Statuses accepted by `filter_torrents_by_status()`
+TORRENT_STATUS_CHOICES: list[str] = ["all", "finished", "stalled", "paused", "downloading", "seeding", "checking", "error"]
+
+
+def filter_torrents_by_status(torrents: list[Torrent], status: str = "all") -> list[Torrent]:
+    """Return the torrents matching a CLI-style status.
+
+    Params:
+        torrents (list[Torrent]): Torrents to filter.
+        status (str): One of `TORRENT_STATUS_CHOICES`. downloading, seeding & checking include torrents queued for it.
+
+    Returns:
+        (list[Torrent]): The matching torrents.
+
+    """
+    match status.lower():
+        case "all":
+            return list(torrents)
+        case "finished":
+            return [torrent for torrent in torrents if torrent.done_date]
+        case "stalled":
+            return [torrent for torrent in torrents if torrent.is_stalled]
+        case "paused":
+            return [torrent for torrent in torrents if torrent.stopped]
+        case "downloading":
+            return [torrent for torrent in torrents if torrent.fields.get("status") in (3, 4)]
+        case "seeding":
+            return [torrent for torrent in torrents if torrent.fields.get("status") in (5, 6)]
+        case "checking":
+            return [torrent for torrent in torrents if torrent.fields.get("status") in (1, 2)]
+        case "error":
+            return [torrent for torrent in torrents if torrent.fields.get("error")]
+
+    raise ValueError(f"Invalid status: {status}. Must be one of {TORRENT_STATUS_CHOICES}")
+
+
 def select_random_torrent(torrents_list: list[t.Union[Torrent, TorrentMetadataIn, TorrentMetadataOut]]) -> t.Union[Torrent, TorrentMetadataIn, TorrentMetadataOut]:
     if torrents_list is None or (isinstance(torrents_list, list) and len(torrents_list) == 0):
         raise ValueError("torrents list must not be empty")
@@ -52,11 +128,144 @@ def select_random_torrent(torrents_list: list[t.Union[Torrent, TorrentMetadataIn
     return random_torrent
 
 
-def convert_torrents_to_df(torrents: list[t.Union[Torrent, TorrentMetadataIn, TorrentMetadataOut]] = None) -> pd.DataFrame:
+def _torrent_to_record(torrent: t.Union[Torrent, TorrentMetadataIn, TorrentMetadataOut, dict]) -> dict:
+    if isinstance(torrent, Torrent):
+        return torrent.fields
+    elif isinstance(torrent, (TorrentMetadataIn, TorrentMetadataOut, TorrentSummaryIn)):
+        return torrent.model_dump()
+    elif isinstance(torrent, dict):
+        return torrent
+
+    raise TypeError(f"Invalid type for torrent: ({type(torrent)}). Must be a transmission_rpc.Torrent, TorrentMetadataIn/Out, or dict")
+
+
+def convert_torrents_to_arrow_table(torrents: list[t.Union[Torrent, TorrentMetadataIn, TorrentMetadataOut, dict]] = None, columns: list[str] | None = None, normalize: bool = False) -> pa.Table:
+    """Build a pyarrow Table straight from torrent RPC fields, one column at a time.
+
+    Scalar fields use the types in `torrent_pa_types_mapping`, nested fields (files,
+    trackerStats, ...) are inferred. Strings are stored in Arrow buffers instead of as
+    Python objects.
+
+    Params:
+        torrents (list): `Torrent`s, `TorrentMetadataIn/Out` models, or raw field dicts.
+        columns (list[str]|None): Only build these columns. Default: every field present.
+        normalize (bool): Run `normalize_torrents_table()` on the result.
+
+    Returns:
+        (pyarrow.Table): A table with one row per torrent.
+
+    """
     if torrents is None or (isinstance(torrents, list) and len(torrents) == 0):
         raise ValueError("torrents list must not be empty")
     if not isinstance(torrents, list):
         raise TypeError(f"Invalid type for torrents: ({type(torrents)}). Must be a list of transmission_rpc.Torrent objects")
+
+    records: list[dict] = [_torrent_to_record(t) for t in torrents]
+
+    if columns is None:
+        ## Union of all keys, in first-seen order
+        columns = list(dict.fromkeys(k for r in records for k in r))
+
+    arrays: dict[str, pa.Array] = {}
+    for col in columns:
+        values: list = [r.get(col) for r in records]
+        if col in TORRENT_FLOAT_FIELDNAMES:
+            ## Decimal values (TorrentMetadataIn) cannot be converted to double by pyarrow
+            values = [None if v is None else float(v) for v in values]
+
+        try:
+            arrays[col] = pa.array(values, type=torrent_pa_types_mapping.get(col))
+        except Exception as exc:
+            msg = f"({type(exc)}) Error converting torrent field '{col}' to an Arrow array. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    table: pa.Table = pa.table(arrays)
+
+    if normalize:
+        table = normalize_torrents_table(table=table)
+
+    return table
+
+
+def normalize_torrents_table(table: pa.Table, categorical_threshold: float = 0.5) -> pa.Table:
+    """Arrow equivalent of `normalize_torrents_df()`.
+
+    Epochs become `timestamp[s]` (0 = null), fractions `float64`, seconds `duration[s]`, and
+    repeated strings are dictionary encoded (pandas `category` after conversion).
+
+    Params:
+        table (pyarrow.Table): A table created by `convert_torrents_to_arrow_table()`.
+        categorical_threshold (float): Only dictionary encode a string column when
+            `unique values / rows` is below this ratio.
+
+    Returns:
+        (pyarrow.Table): The normalized table.
+
+    """
+    if (table.schema.metadata or {}).get(b"normalized") == b"true":
+        return table
+
+    for col in TORRENT_INT_DATETIME_FIELDNAMES:
+        if col not in table.column_names or pa.types.is_timestamp(table.schema.field(col).type):
+            continue
+
+        epochs = table[col].cast(pa.int64())
+        datetimes = pc.if_else(pc.less_equal(epochs, 0), pa.scalar(None, pa.timestamp("s")), epochs.cast(pa.timestamp("s")))
+        table = table.set_column(table.schema.get_field_index(col), col, datetimes)
+
+    for col in TORRENT_FLOAT_FIELDNAMES:
+        if col not in table.column_names:
+            continue
+
+        table = table.set_column(table.schema.get_field_index(col), col, table[col].cast(pa.float64()))
+
+    for col in TORRENT_SECONDS_FIELDNAMES:
+        if col not in table.column_names or pa.types.is_duration(table.schema.field(col).type):
+            continue
+
+        table = table.set_column(table.schema.get_field_index(col), col, table[col].cast(pa.int64()).cast(pa.duration("s")))
+
+    for col in TORRENT_CATEGORICAL_FIELDNAMES:
+        if col not in table.column_names or table.num_rows == 0 or pa.types.is_dictionary(table.schema.field(col).type):
+            continue
+
+        if pc.count_distinct(table[col]).as_py() / table.num_rows < categorical_threshold:
+            table = table.set_column(table.schema.get_field_index(col), col, pc.dictionary_encode(table[col]))
+
+    return table.replace_schema_metadata({**(table.schema.metadata or {}), b"normalized": b"true"})
+
+
+@profile_utils.profiled("dataframe")
+def convert_torrents_to_df(torrents: list[t.Union[Torrent, TorrentMetadataIn, TorrentMetadataOut]] = None, normalize: bool = False, dtype_backend: str = "numpy") -> pd.DataFrame:
+    """Convert a list of torrents to a DataFrame.
+
+    Params:
+        torrents (list): `Torrent`s or `TorrentMetadataIn/Out` models.
+        normalize (bool): Convert dates, fractions, durations & repeated strings (see `normalize_torrents_df()`).
+        dtype_backend (str): "numpy" (default) for NumPy/object columns, or "pyarrow" for
+            `pd.ArrowDtype` columns built directly from the RPC fields.
+
+    Returns:
+        (pandas.DataFrame): A DataFrame with one row per torrent.
+
+    """
+    if torrents is None or (isinstance(torrents, list) and len(torrents) == 0):
+        raise ValueError("torrents list must not be empty")
+    if not isinstance(torrents, list):
+        raise TypeError(f"Invalid type for torrents: ({type(torrents)}). Must be a list of transmission_rpc.Torrent objects")
+    if dtype_backend not in df_utils.constants.PANDAS_DTYPE_BACKENDS:
+        raise ValueError(f"Invalid dtype_backend: '{dtype_backend}'. Must be one of {df_utils.constants.PANDAS_DTYPE_BACKENDS}")
+
+    if dtype_backend == "pyarrow":
+        table: pa.Table = convert_torrents_to_arrow_table(torrents=torrents, normalize=normalize)
+        df = df_utils.arrow_table_to_df(table=table)
+
+        if normalize:
+            df.attrs["normalized"] = True
+
+        return df
     
     _torrents: list[dict] = []
     
@@ -64,16 +273,99 @@ def convert_torrents_to_df(torrents: list[t.Union[Torrent, TorrentMetadataIn, To
         if isinstance(t, Torrent):
             t_dict = t.__dict__["fields"]
             _torrents.append(t_dict)
-        elif isinstance(t, (TorrentMetadataIn, TorrentMetadataOut)):
+        elif isinstance(t, (TorrentMetadataIn, TorrentMetadataOut, TorrentSummaryIn)):
             t_dict = t.model_dump()
             _torrents.append(t_dict)
 
     try:
         df = pd.DataFrame(_torrents)
-
-        return df
     except Exception as exc:
         msg = f"({type(exc)}) Error creating dataframe from torrent list. Details: {exc}"
         log.error(msg)
         
         raise exc
+
+    if normalize:
+        df = normalize_torrents_df(df=df)
+
+    return df
+
+
+def is_normalized_torrents_df(df: pd.DataFrame) -> bool:
+    """Return `True` if df was already passed through `normalize_torrents_df()`."""
+    return bool(df.attrs.get("normalized", False))
+
+
+@profile_utils.profiled("normalize")
+def normalize_torrents_df(df: pd.DataFrame, categorical_threshold: float = 0.5) -> pd.DataFrame:
+    """Convert a raw torrents DataFrame to analysis-ready dtypes in one vectorized pass.
+
+    - `TORRENT_INT_DATETIME_FIELDNAMES` epochs become `datetime64[s]` (0 = unset = `NaT`)
+    - `TORRENT_FLOAT_FIELDNAMES` (`Decimal` or float) become `float64`
+    - `TORRENT_SECONDS_FIELDNAMES` become `timedelta64[ns]`
+    - `TORRENT_CATEGORICAL_FIELDNAMES` become `category` when values repeat
+
+    The converted columns are assigned in a single step, and the result is marked so calling
+    this function again (or from a consumer) is a no-op.
+
+    Params:
+        df (pandas.DataFrame): A DataFrame created by `convert_torrents_to_df()`.
+        categorical_threshold (float): Only make a string column categorical when
+            `unique values / rows` is below this ratio.
+
+    Returns:
+        (pandas.DataFrame): A new, normalized DataFrame.
+
+    """
+    if is_normalized_torrents_df(df):
+        return df
+
+    converted: dict[str, pd.Series] = {}
+
+    for col in TORRENT_INT_DATETIME_FIELDNAMES:
+        if col not in df.columns:
+            continue
+
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            converted[col] = df[col].astype("datetime64[s]")
+            continue
+
+        epochs: np.ndarray = pd.to_numeric(df[col], errors="coerce").fillna(0).to_numpy(dtype="int64")
+        datetimes: np.ndarray = epochs.astype("datetime64[s]")
+        datetimes[epochs <= 0] = np.datetime64("NaT")
+
+        converted[col] = pd.Series(datetimes, index=df.index, name=col)
+
+    for col in TORRENT_FLOAT_FIELDNAMES:
+        if col not in df.columns:
+            continue
+
+        converted[col] = df[col].astype("float64")
+
+    for col in TORRENT_SECONDS_FIELDNAMES:
+        if col not in df.columns:
+            continue
+
+        if pd.api.types.is_timedelta64_dtype(df[col]):
+            continue
+
+        converted[col] = time_utils.convert_seconds_series_to_timedelta(df[col])
+
+    for col in TORRENT_CATEGORICAL_FIELDNAMES:
+        if col not in df.columns or len(df.index) == 0:
+            continue
+
+        if df[col].nunique(dropna=True) / len(df.index) < categorical_threshold:
+            converted[col] = df[col].astype("category")
+
+    try:
+        normalized_df: pd.DataFrame = df.assign(**converted)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error normalizing torrents DataFrame. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    normalized_df.attrs["normalized"] = True
+
+    return normalized_df
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from .bencode import BencodeError, bdecode, info_dict_span
+from .engine import (
+    ThroughputLimiter,
+    TorrentFileEntry,
+    TorrentLayout,
+    VerifyCheckpoint,
+    VerifyResult,
+    hash_pieces,
+    map_path,
+    plan_batches,
+    verify_torrent_data,
+)
+from .settings import VERIFY_SETTINGS, VerifySettings, verify_settings
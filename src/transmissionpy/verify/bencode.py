@@ -0,0 +1,81 @@
+"""Minimal bencode decoder, enough to read `.torrent` metainfo files."""
+
+from __future__ import annotations
+
+import typing as t
+
+class BencodeError(ValueError):
+    pass
+
+
+def _decode(data: bytes, index: int) -> tuple[t.Any, int]:
+    token: int = data[index]
+
+    if token == ord("i"):
+        end: int = data.index(b"e", index)
+        return int(data[index + 1:end]), end + 1
+
+    if token == ord("l"):
+        items: list = []
+        index += 1
+        while data[index] != ord("e"):
+            item, index = _decode(data, index)
+            items.append(item)
+        return items, index + 1
+
+    if token == ord("d"):
+        values: dict = {}
+        index += 1
+        while data[index] != ord("e"):
+            key, index = _decode(data, index)
+            values[key], index = _decode(data, index)
+        return values, index + 1
+
+    if ord("0") <= token <= ord("9"):
+        colon: int = data.index(b":", index)
+        start: int = colon + 1
+        end = start + int(data[index:colon])
+        if end > len(data):
+            raise BencodeError(f"String at offset {index} runs past the end of the data")
+        return data[start:end], end
+
+    raise BencodeError(f"Invalid bencode token {chr(token)!r} at offset {index}")
+
+
+def bdecode(data: bytes) -> t.Any:
+    """Decode bencoded data. Strings are returned as bytes."""
+    try:
+        value, end = _decode(data, 0)
+    except BencodeError:
+        raise
+    except (IndexError, ValueError) as exc:
+        raise BencodeError(f"Malformed bencode data. Details: {exc}") from exc
+
+    if end != len(data):
+        raise BencodeError(f"Trailing data after offset {end}")
+
+    return value
+
+
+def info_dict_span(data: bytes) -> tuple[int, int]:
+    """Return the `(start, end)` offsets of the raw `info` dict in a metainfo file.
+
+    The v1 info hash is the SHA-1 of exactly these bytes.
+    """
+    if not data or data[0] != ord("d"):
+        raise BencodeError("Metainfo is not a bencoded dict")
+
+    index: int = 1
+    try:
+        while data[index] != ord("e"):
+            key, index = _decode(data, index)
+            start: int = index
+            _, index = _decode(data, index)
+            if key == b"info":
+                return start, index
+    except BencodeError:
+        raise
+    except (IndexError, ValueError) as exc:
+        raise BencodeError(f"Malformed bencode data. Details: {exc}") from exc
+
+    raise BencodeError("Metainfo has no info dict")
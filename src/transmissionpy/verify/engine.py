@@ -0,0 +1,440 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+import signal
+import time
+import typing as t
+
+from .bencode import BencodeError, bdecode, info_dict_span
+
+from loguru import logger as log
+
+## Size of one SHA-1 piece hash in the metainfo `pieces` string
+PIECE_HASH_SIZE: int = 20
+
+## A piece's bytes within one file: (file index, offset in the file, length)
+Span = tuple[int, int, int]
+
+
+@dataclass
+class TorrentFileEntry:
+    ## Path relative to the torrent's download dir, including the torrent's top-level directory
+    path: str
+    length: int
+    ## Offset of the file's first byte in the torrent's concatenated data
+    offset: int
+    ## BEP 47 padding files are never on disk, and hash as zeros
+    padding: bool = field(default=False)
+
+
+@dataclass
+class TorrentLayout:
+    """Piece & file layout of a v1 torrent, read from its `.torrent` metainfo."""
+
+    info_hash: str
+    name: str
+    piece_length: int
+    piece_hashes: bytes
+    files: list[TorrentFileEntry]
+
+    def __post_init__(self) -> None:
+        self._offsets: list[int] = [entry.offset for entry in self.files]
+
+    @property
+    def piece_count(self) -> int:
+        return len(self.piece_hashes) // PIECE_HASH_SIZE
+
+    @property
+    def total_size(self) -> int:
+        return sum(entry.length for entry in self.files)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TorrentLayout":
+        start, end = info_dict_span(data)
+        info: dict = bdecode(data[start:end])
+
+        if b"pieces" not in info:
+            raise BencodeError("Only v1 (and hybrid) torrents have SHA-1 piece hashes, v2-only torrents are not supported")
+
+        name: str = (info.get(b"name.utf-8") or info[b"name"]).decode("utf-8", errors="replace")
+        files: list[TorrentFileEntry] = []
+        offset: int = 0
+
+        if b"files" in info:
+            for entry in info[b"files"]:
+                parts: list[bytes] = entry.get(b"path.utf-8") or entry[b"path"]
+                files.append(
+                    TorrentFileEntry(
+                        path="/".join([name, *(part.decode("utf-8", errors="replace") for part in parts)]),
+                        length=entry[b"length"],
+                        offset=offset,
+                        padding=b"p" in entry.get(b"attr", b""),
+                    )
+                )
+                offset += entry[b"length"]
+        else:
+            files.append(TorrentFileEntry(path=name, length=info[b"length"], offset=0))
+
+        layout = cls(
+            info_hash=hashlib.sha1(data[start:end]).hexdigest(),
+            name=name,
+            piece_length=info[b"piece length"],
+            piece_hashes=info[b"pieces"],
+            files=files,
+        )
+
+        expected_pieces: int = -(-layout.total_size // layout.piece_length)
+        if len(layout.piece_hashes) % PIECE_HASH_SIZE or layout.piece_count != expected_pieces:
+            raise BencodeError(f"Metainfo has {len(layout.piece_hashes)} bytes of piece hashes, expected {expected_pieces} pieces")
+
+        return layout
+
+    @classmethod
+    def from_file(cls, path: t.Union[str, Path]) -> "TorrentLayout":
+        return cls.from_bytes(Path(path).read_bytes())
+
+    def piece_hash(self, index: int) -> bytes:
+        return self.piece_hashes[index * PIECE_HASH_SIZE:(index + 1) * PIECE_HASH_SIZE]
+
+    def piece_size(self, index: int) -> int:
+        return min(self.piece_length, self.total_size - index * self.piece_length)
+
+    def piece_spans(self, index: int) -> list[Span]:
+        """Return the file slices that make up a piece, in order."""
+        start: int = index * self.piece_length
+        end: int = start + self.piece_size(index)
+        spans: list[Span] = []
+
+        file_index: int = bisect_right(self._offsets, start) - 1
+        while start < end and file_index < len(self.files):
+            entry: TorrentFileEntry = self.files[file_index]
+            length: int = min(end, entry.offset + entry.length) - start
+            if length > 0:
+                spans.append((file_index, start - entry.offset, length))
+                start += length
+            file_index += 1
+
+        return spans
+
+
+def map_path(path: str, path_map: dict[str, str] | None = None) -> str:
+    """Rewrite a path on the Transmission host to a local path, using the longest matching prefix."""
+    for remote in sorted(path_map or {}, key=len, reverse=True):
+        if path == remote or path.startswith(remote.rstrip("/") + "/"):
+            return path_map[remote] + path[len(remote):]
+
+    return path
+
+
+def _open_map(path: str, length: int) -> mmap.mmap | None:
+    ## None when the file is missing or shorter than the metainfo says
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < length:
+                return None
+            mapped: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, IsADirectoryError, PermissionError):
+        return None
+
+    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+    return mapped
+
+
+def _ignore_sigint() -> None:
+    ## Ctrl+C is handled by the parent, which checkpoints and shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def hash_pieces(data_dir: str, files: dict[int, tuple[str, int, bool]], pieces: list[tuple[int, bytes, list[Span]]]) -> tuple[list[int], list[int], int]:
+    """Hash pieces from memory-mapped files and compare them to their expected SHA-1. Runs in worker processes.
+
+    Params:
+        data_dir (str): Local directory the torrent's file paths are relative to.
+        files (dict[int, tuple[str, int, bool]]): File index -> (relative path, length, is padding), for files the pieces touch.
+        pieces (list[tuple[int, bytes, list[Span]]]): (piece index, expected SHA-1, spans) per piece.
+
+    Returns:
+        (tuple[list[int], list[int], int]): Bad piece indexes, missing piece indexes, and bytes read.
+
+    """
+    maps: dict[int, mmap.mmap | None] = {}
+    bad: list[int] = []
+    missing: list[int] = []
+    bytes_read: int = 0
+
+    try:
+        for index, expected, spans in pieces:
+            digest = hashlib.sha1()
+            available: bool = True
+
+            for file_index, offset, length in spans:
+                path, file_length, padding = files[file_index]
+                if padding:
+                    digest.update(bytes(length))
+                    continue
+
+                if file_index not in maps:
+                    maps[file_index] = _open_map(os.path.join(data_dir, path), file_length)
+                mapped: mmap.mmap | None = maps[file_index]
+                if mapped is None:
+                    available = False
+                    break
+
+                ## Hash straight from the mapping, without copying the piece
+                with memoryview(mapped) as view:
+                    digest.update(view[offset:offset + length])
+                bytes_read += length
+
+            if not available:
+                missing.append(index)
+            elif digest.digest() != expected:
+                bad.append(index)
+    finally:
+        for mapped in maps.values():
+            if mapped is not None:
+                mapped.close()
+
+    return bad, missing, bytes_read
+
+
+class ThroughputLimiter:
+    """Pace work submissions to an average of `bytes_per_second` (0 = unlimited)."""
+
+    def __init__(self, bytes_per_second: float = 0) -> None:
+        self.bytes_per_second: float = bytes_per_second
+        self._available_at: float = 0.0
+
+    def acquire(self, n_bytes: int) -> None:
+        if self.bytes_per_second <= 0:
+            return
+
+        now: float = time.monotonic()
+        if self._available_at > now:
+            time.sleep(self._available_at - now)
+            now = self._available_at
+
+        self._available_at = now + n_bytes / self.bytes_per_second
+
+
+class VerifyCheckpoint:
+    """Progress of an interrupted verification, stored as JSON next to other app data.
+
+    `frontier` is the first piece not known to be verified; everything before it was checked.
+    A checkpoint is only reused for the same torrent (info hash & piece count) and data dir.
+    """
+
+    def __init__(self, path: t.Union[str, Path], layout: TorrentLayout, data_dir: str) -> None:
+        self.path: Path = Path(path)
+        self.identity: dict[str, t.Any] = {"info_hash": layout.info_hash, "piece_count": layout.piece_count, "data_dir": data_dir}
+
+    def load(self) -> tuple[int, list[int], list[int]]:
+        """Return `(frontier, bad pieces, missing pieces)`, or `(0, [], [])` with no usable checkpoint."""
+        if not self.path.exists():
+            return 0, [], []
+
+        try:
+            state: dict = json.loads(self.path.read_text())
+        except (OSError, ValueError) as exc:
+            log.warning(f"Ignoring unreadable verify checkpoint '{self.path}'. Details: {exc}")
+            return 0, [], []
+
+        if any(state.get(key) != value for key, value in self.identity.items()):
+            log.warning(f"Verify checkpoint '{self.path}' is for another torrent or data dir, starting over")
+            return 0, [], []
+
+        frontier: int = state.get("frontier", 0)
+
+        return frontier, [i for i in state.get("bad", []) if i < frontier], [i for i in state.get("missing", []) if i < frontier]
+
+    def save(self, frontier: int, bad: t.Iterable[int], missing: t.Iterable[int]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path: Path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({**self.identity, "frontier": frontier, "bad": sorted(bad), "missing": sorted(missing), "saved_at": time.time()}))
+        tmp_path.replace(self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class VerifyResult:
+    info_hash: str
+    name: str
+    data_dir: str
+    piece_count: int
+    ## Pieces checked in this run; pieces before resumed_from were checked by an earlier run
+    checked_pieces: int
+    resumed_from: int
+    bad_pieces: list[int]
+    missing_pieces: list[int]
+    ## Relative file path -> number of bad or missing pieces touching it
+    bad_files: dict[str, int]
+    bytes_read: int
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return not self.bad_pieces and not self.missing_pieces
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_read / self.seconds if self.seconds > 0 else 0.0
+
+
+def plan_batches(layout: TorrentLayout, start_piece: int = 0, batch_bytes: int = 64 * 1024**2) -> list[tuple[int, int]]:
+    """Split pieces `[start_piece, piece_count)` into contiguous `(start, end)` ranges of about `batch_bytes`."""
+    pieces_per_batch: int = max(1, batch_bytes // layout.piece_length)
+
+    return [(start, min(start + pieces_per_batch, layout.piece_count)) for start in range(start_piece, layout.piece_count, pieces_per_batch)]
+
+
+def _batch_payload(layout: TorrentLayout, data_dir: str, start: int, end: int) -> tuple[str, dict[int, tuple[str, int, bool]], list[tuple[int, bytes, list[Span]]]]:
+    ## Only the files this batch touches are sent to the worker
+    pieces: list[tuple[int, bytes, list[Span]]] = [(index, layout.piece_hash(index), layout.piece_spans(index)) for index in range(start, end)]
+    files: dict[int, tuple[str, int, bool]] = {}
+    for _, _, spans in pieces:
+        for file_index, _, _ in spans:
+            entry: TorrentFileEntry = layout.files[file_index]
+            files[file_index] = (entry.path, entry.length, entry.padding)
+
+    return data_dir, files, pieces
+
+
+def verify_torrent_data(
+    layout: TorrentLayout,
+    data_dir: t.Union[str, Path],
+    workers: int = 0,
+    max_bytes_per_second: float = 0,
+    batch_bytes: int = 64 * 1024**2,
+    checkpoint: VerifyCheckpoint | None = None,
+    checkpoint_interval: float = 30.0,
+) -> VerifyResult:
+    """Verify a torrent's local data against its piece hashes, without involving the Transmission daemon.
+
+    Contiguous batches of pieces are hashed in a process pool. Submissions are paced to
+    `max_bytes_per_second`, and at most two batches per worker are in flight, so the cap bounds
+    disk reads. With a checkpoint, progress is saved every `checkpoint_interval` seconds and on
+    interrupt, and a later run resumes from the first unverified piece.
+
+    Params:
+        layout (TorrentLayout): Layout parsed from the torrent's metainfo.
+        data_dir (str|Path): Local download directory containing the torrent's files.
+        workers (int): Worker processes. 0 = one per CPU, 1 = hash in this process.
+        max_bytes_per_second (float): Average read throughput cap. 0 = unlimited.
+        batch_bytes (int): Approximate bytes hashed per worker task.
+        checkpoint (VerifyCheckpoint): Where to save & resume progress. None disables checkpoints.
+        checkpoint_interval (float): Seconds between checkpoint saves.
+
+    Returns:
+        (VerifyResult): Bad & missing pieces, the files they touch, and throughput.
+
+    """
+    data_dir = str(data_dir)
+    workers = workers or os.cpu_count() or 1
+    started: float = time.monotonic()
+
+    resumed_from, bad, missing = checkpoint.load() if checkpoint else (0, [], [])
+    if resumed_from:
+        log.info(f"Resuming verification of '{layout.name}' at piece {resumed_from}/{layout.piece_count}")
+    bad_set: set[int] = set(bad)
+    missing_set: set[int] = set(missing)
+
+    batches: list[tuple[int, int]] = plan_batches(layout, start_piece=resumed_from, batch_bytes=batch_bytes)
+    limiter = ThroughputLimiter(bytes_per_second=max_bytes_per_second)
+    executor: ProcessPoolExecutor | None = ProcessPoolExecutor(max_workers=workers, initializer=_ignore_sigint) if workers > 1 else None
+
+    completed: set[int] = set()
+    ## Index of the first batch that hasn't completed; pieces before it are all verified
+    frontier_batch: int = 0
+    bytes_read: int = 0
+    last_saved: float = time.monotonic()
+
+    def frontier() -> int:
+        return batches[frontier_batch][0] if frontier_batch < len(batches) else layout.piece_count
+
+    def submit(batch_no: int) -> Future:
+        start, end = batches[batch_no]
+        payload = _batch_payload(layout, data_dir, start, end)
+        limiter.acquire(sum(layout.piece_size(index) for index in range(start, end)))
+
+        if executor is None:
+            future: Future = Future()
+            future.set_result(hash_pieces(*payload))
+            return future
+
+        return executor.submit(hash_pieces, *payload)
+
+    in_flight: dict[Future, int] = {}
+    next_batch: int = 0
+
+    def collect(future: Future) -> None:
+        nonlocal bytes_read, frontier_batch
+        batch_no: int = in_flight.pop(future)
+        batch_bad, batch_missing, batch_bytes_read = future.result()
+        bad_set.update(batch_bad)
+        missing_set.update(batch_missing)
+        bytes_read += batch_bytes_read
+        completed.add(batch_no)
+
+        while frontier_batch in completed:
+            frontier_batch += 1
+
+    try:
+        while next_batch < len(batches) or in_flight:
+            while next_batch < len(batches) and len(in_flight) < workers * 2:
+                in_flight[submit(next_batch)] = next_batch
+                next_batch += 1
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                collect(future)
+
+            if checkpoint and time.monotonic() - last_saved >= checkpoint_interval:
+                checkpoint.save(frontier(), bad_set, missing_set)
+                last_saved = time.monotonic()
+                elapsed: float = time.monotonic() - started
+                log.info(f"Verified {frontier()}/{layout.piece_count} pieces ({bytes_read / max(elapsed, 1e-9) / 1024**2:.1f} MiB/s)")
+    except BaseException:
+        ## Interrupted or failed: keep what was verified so the next run can resume
+        if checkpoint:
+            ## Batches that finished while the interrupt was raised still count
+            for future in [future for future in in_flight if future.done() and not future.cancelled() and future.exception() is None]:
+                collect(future)
+            checkpoint.save(frontier(), bad_set, missing_set)
+            log.warning(f"Verification stopped at piece {frontier()}/{layout.piece_count}, checkpoint saved to {checkpoint.path}")
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    if checkpoint:
+        checkpoint.clear()
+
+    bad_files: dict[str, int] = {}
+    for index in sorted(bad_set | missing_set):
+        for file_index, _, _ in layout.piece_spans(index):
+            path: str = layout.files[file_index].path
+            bad_files[path] = bad_files.get(path, 0) + 1
+
+    return VerifyResult(
+        info_hash=layout.info_hash,
+        name=layout.name,
+        data_dir=data_dir,
+        piece_count=layout.piece_count,
+        checked_pieces=layout.piece_count - resumed_from,
+        resumed_from=resumed_from,
+        bad_pieces=sorted(bad_set),
+        missing_pieces=sorted(missing_set),
+        bad_files=bad_files,
+        bytes_read=bytes_read,
+        seconds=time.monotonic() - started,
+    )
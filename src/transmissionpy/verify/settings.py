@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import typing as t
+
+from transmissionpy.core.constants import DATA_DIR
+
+from dynaconf import Dynaconf
+
+VERIFY_SETTINGS = Dynaconf(environments=True, env="verify", envvar_prefix="VERIFY", settings_files=["settings.toml", ".secrets.toml"])
+
+@dataclass
+class VerifySettings:
+    """Options for `transmissionpy torrent verify-local`."""
+
+    ## Worker processes hashing pieces. 0 = one per CPU.
+    workers: int = field(default=0)
+    ## Average disk read cap, in MiB/s. 0 = unlimited.
+    max_mb_per_second: float = field(default=0)
+    ## Approximate MiB hashed per worker task
+    batch_mb: int = field(default=64)
+    checkpoint_dir: str = field(default=f"{DATA_DIR}/verify")
+    ## Seconds between checkpoint saves on long verifications
+    checkpoint_interval: float = field(default=30)
+    ## Transmission host path prefix -> local path prefix, for downloadDir & torrentFile,
+    #  i.e. {"/downloads": "/mnt/nas/downloads"}
+    path_map: dict[str, str] = field(default_factory=dict)
+
+verify_settings: VerifySettings = VerifySettings(
+    workers=VERIFY_SETTINGS.get("VERIFY_WORKERS", default=0),
+    max_mb_per_second=VERIFY_SETTINGS.get("VERIFY_MAX_MB_PER_SECOND", default=0),
+    batch_mb=VERIFY_SETTINGS.get("VERIFY_BATCH_MB", default=64),
+    checkpoint_dir=VERIFY_SETTINGS.get("VERIFY_CHECKPOINT_DIR", default=f"{DATA_DIR}/verify"),
+    checkpoint_interval=VERIFY_SETTINGS.get("VERIFY_CHECKPOINT_INTERVAL", default=30),
+    path_map=dict(VERIFY_SETTINGS.get("VERIFY_PATH_MAP", default={})),
+)
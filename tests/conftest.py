@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import typing as t
+
+from transmissionpy.core.transmission_lib import (
+    CircuitBreaker,
+    RetryPolicy,
+    TransmissionRPCController,
+)
+
+from .fake_server import FakeTransmissionServer
+
+import pytest
+
+@pytest.fixture
+def fake_server() -> t.Iterator[FakeTransmissionServer]:
+    with FakeTransmissionServer(n_torrents=50, seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def make_controller() -> t.Callable[..., TransmissionRPCController]:
+    """Return a factory for controllers pointed at a fake server, with fast retries & their own circuit breaker."""
+    def factory(server: FakeTransmissionServer, **kwargs: t.Any) -> TransmissionRPCController:
+        kwargs.setdefault("retry_policy", RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.02))
+        kwargs.setdefault("circuit_breaker", CircuitBreaker(name=f"test-{server.port}"))
+
+        return TransmissionRPCController(**server.controller_kwargs(), **kwargs)
+
+    return factory
@@ -0,0 +1,553 @@
+"""A local stand-in for a Transmission daemon's RPC endpoint.
+
+Serves synthetic torrents over the real RPC protocol (including the 409 session-id
+handshake), with configurable latency & fault injection. Used to exercise timeouts,
+retries and the circuit breaker, and for benchmarks, without a real daemon. Test/dev
+only, it is not part of the installed package.
+
+Usage:
+    with FakeTransmissionServer(n_torrents=1_000, faults=FaultConfig(error_rate=0.2)) as server:
+        controller = TransmissionRPCController(**server.controller_kwargs())
+"""
+
+from __future__ import annotations
+
+import base64
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import random
+import threading
+import time
+import typing as t
+import uuid
+
+log = logging.getLogger(__name__)
+
+RPC_VERSION: int = 17
+SERVER_VERSION: str = "4.0.6 (fake)"
+
+_TRACKER_HOSTS: list[str] = ["tracker.example.org", "open.tracker.example.net", "announce.example.com", "private.example.io"]
+## Share of announces that fail, per tracker host
+_TRACKER_FAILURE_RATES: dict[str, float] = {"tracker.example.org": 0.02, "open.tracker.example.net": 0.15, "announce.example.com": 0.05, "private.example.io": 0.4}
+_DOWNLOAD_DIRS: list[str] = ["/downloads/complete", "/downloads/movies", "/downloads/tv", "/downloads/music"]
+## Transmission status codes: 0 stopped, 1 check pending, 2 checking, 3 download pending, 4 downloading, 5 seed pending, 6 seeding
+_STATUS_WEIGHTS: dict[int, int] = {0: 20, 1: 1, 2: 1, 3: 3, 4: 25, 5: 2, 6: 48}
+
+
+@dataclass
+class FaultConfig:
+    """Faults injected into RPC responses. Rates are probabilities per request."""
+
+    ## Seconds added to every response (+/- latency_jitter)
+    latency: float = field(default=0.0)
+    latency_jitter: float = field(default=0.0)
+    ## Respond with HTTP 500 and a non-JSON body
+    error_rate: float = field(default=0.0)
+    ## Drop the connection without responding
+    reset_rate: float = field(default=0.0)
+    ## Rotate the session id and respond 409, forcing a new handshake
+    conflict_rate: float = field(default=0.0)
+    ## Fail the next N requests with HTTP 500, regardless of error_rate
+    fail_next: int = field(default=0)
+    ## Only inject faults into these RPC methods (None = all methods)
+    methods: list[str] | None = field(default=None)
+
+    def applies_to(self, method: str) -> bool:
+        return self.methods is None or method in self.methods
+
+
+def generate_torrents(n: int = 100, seed: int = 0, start_id: int = 1, duplicate_rate: float = 0.0) -> list[dict[str, t.Any]]:
+    """Generate `n` realistic torrent field dicts, as returned by torrent-get.
+
+    Params:
+        n (int): Number of torrents to generate.
+        seed (int): Random seed, the same seed always returns the same torrents.
+        start_id (int): ID of the first torrent.
+        duplicate_rate (float): Fraction of torrents that copy the file layout of an earlier torrent,
+            i.e. the same content added again under another name or tracker.
+
+    Returns:
+        (list[dict]): Torrent fields, keyed by RPC field name.
+
+    """
+    rng: random.Random = random.Random(seed)
+    ## Tracker announce results use their own generator, so the other fields stay the same per seed
+    tracker_rng: random.Random = random.Random(seed + 1)
+    duplicate_rng: random.Random = random.Random(seed + 2)
+    now: int = int(time.time())
+    statuses: list[int] = list(_STATUS_WEIGHTS)
+    weights: list[int] = list(_STATUS_WEIGHTS.values())
+
+    torrents: list[dict[str, t.Any]] = []
+    for torrent_id in range(start_id, start_id + n):
+        status: int = rng.choices(statuses, weights)[0]
+        piece_size: int = rng.choice([256, 512, 1024, 2048, 4096]) * 1024
+        n_files: int = rng.choice([1, 1, 1, 2, 3, 8, 20])
+        file_lengths: list[int] = [rng.randint(1, 4096) * 1024**2 // n_files for _ in range(n_files)]
+        if torrents and duplicate_rate and duplicate_rng.random() < duplicate_rate:
+            file_lengths = [file["length"] for file in duplicate_rng.choice(torrents)["files"]]
+        total_size: int = sum(file_lengths)
+        piece_count: int = max(1, -(-total_size // piece_size))
+
+        done: bool = status in (5, 6) or (status == 0 and rng.random() < 0.6)
+        percent_done: float = 1.0 if done else round(rng.random(), 4)
+        have_pieces: int = piece_count if done else int(piece_count * percent_done)
+        ## Bitfield of completed pieces, most significant bit first
+        bitfield: bytearray = bytearray(-(-piece_count // 8))
+        for piece in rng.sample(range(piece_count), have_pieces) if not done else range(piece_count):
+            bitfield[piece // 8] |= 0x80 >> (piece % 8)
+
+        added: int = now - rng.randint(86_400, 365 * 86_400)
+        done_date: int = rng.randint(added, now) if done else 0
+        downloaded: int = int(total_size * percent_done)
+        uploaded: int = int(downloaded * rng.uniform(0, 4)) if done else int(downloaded * rng.uniform(0, 0.5))
+        host: str = rng.choice(_TRACKER_HOSTS)
+        announce: str = f"https://{host}/announce"
+        downloading: bool = status == 4
+        seeding: bool = status == 6
+        hash_string: str = f"{rng.getrandbits(160):040x}"
+        name: str = f"Synthetic.Torrent.{torrent_id:06d}.{rng.choice(['1080p', '720p', '2160p', 'FLAC', 'ISO'])}"
+        announced: bool = status != 0 or tracker_rng.random() < 0.5
+        announce_ok: bool = announced and tracker_rng.random() >= _TRACKER_FAILURE_RATES[host]
+        last_announce: int = now - tracker_rng.randint(60, 3 * 3600) if announced else 0
+
+        files: list[dict] = []
+        file_stats: list[dict] = []
+        offset: int = 0
+        for index, length in enumerate(file_lengths):
+            completed: int = length if done else int(length * percent_done)
+            files.append(
+                {
+                    "name": f"{name}/file_{index:03d}.bin",
+                    "length": length,
+                    "bytesCompleted": completed,
+                    "beginPiece": offset // piece_size,
+                    "endPiece": (offset + max(length, 1) - 1) // piece_size + 1,
+                }
+            )
+            file_stats.append({"bytesCompleted": completed, "priority": 0, "wanted": True})
+            offset += length
+
+        torrents.append(
+            {
+                "id": torrent_id,
+                "hashString": hash_string,
+                "name": name,
+                "status": status,
+                "activityDate": now - rng.randint(0, 30 * 86_400),
+                "addedDate": added,
+                "startDate": added + rng.randint(0, 3_600),
+                "doneDate": done_date,
+                "dateCreated": added - rng.randint(0, 30 * 86_400),
+                "editDate": 0,
+                "bandwidthPriority": 0,
+                "comment": "",
+                "corruptEver": 0,
+                "creator": rng.choice(["mktorrent 1.1", "qBittorrent v4.6.2", "Transmission/4.0.5", ""]),
+                "desiredAvailable": 0 if done else total_size - downloaded,
+                "downloadDir": rng.choice(_DOWNLOAD_DIRS),
+                "downloadedEver": downloaded,
+                "downloadLimit": 100,
+                "downloadLimited": False,
+                "error": 0,
+                "errorString": "",
+                "eta": -1 if done or not downloading else rng.randint(60, 86_400),
+                "etaIdle": -1,
+                "file-count": n_files,
+                "files": files,
+                "fileStats": file_stats,
+                "group": "",
+                "haveUnchecked": 0,
+                "haveValid": downloaded,
+                "honorsSessionLimits": True,
+                "isFinished": done and rng.random() < 0.3,
+                "isPrivate": host.startswith("private"),
+                "isStalled": downloading and rng.random() < 0.15,
+                "labels": rng.sample(["movies", "tv", "music", "linux", "keep"], rng.randint(0, 2)),
+                "leftUntilDone": total_size - downloaded,
+                "magnetLink": f"magnet:?xt=urn:btih:{hash_string}",
+                "manualAnnounceTime": -1,
+                "maxConnectedPeers": 50,
+                "metadataPercentComplete": 1.0,
+                "peer-limit": 50,
+                "peers": [],
+                "peersConnected": rng.randint(0, 20) if (downloading or seeding) else 0,
+                "peersFrom": {"fromCache": 0, "fromDht": 0, "fromIncoming": 0, "fromLpd": 0, "fromLtep": 0, "fromPex": 0, "fromTracker": 0},
+                "peersGettingFromUs": rng.randint(0, 5) if seeding else 0,
+                "peersSendingToUs": rng.randint(0, 10) if downloading else 0,
+                "percentComplete": percent_done,
+                "percentDone": percent_done,
+                "pieces": base64.b64encode(bytes(bitfield)).decode("ascii"),
+                "pieceCount": piece_count,
+                "pieceSize": piece_size,
+                "priorities": [0] * n_files,
+                "primary-mime-type": "application/octet-stream",
+                "queuePosition": torrent_id - start_id,
+                "rateDownload": rng.randint(0, 5 * 1024**2) if downloading else 0,
+                "rateUpload": rng.randint(0, 1024**2) if (downloading or seeding) and rng.random() < 0.5 else 0,
+                "recheckProgress": 0.0,
+                "secondsDownloading": rng.randint(0, 86_400),
+                "secondsSeeding": rng.randint(0, 180 * 86_400) if done else 0,
+                "seedIdleLimit": 30,
+                "seedIdleMode": 0,
+                "seedRatioLimit": 2.0,
+                "seedRatioMode": 0,
+                "sizeWhenDone": total_size,
+                "torrentFile": f"/var/lib/transmission/torrents/{hash_string}.torrent",
+                "totalSize": total_size,
+                "trackers": [{"announce": announce, "id": 0, "scrape": announce.replace("announce", "scrape"), "sitename": host.split(".")[-2], "tier": 0}],
+                "trackerList": announce,
+                "trackerStats": [
+                    {
+                        "announce": announce,
+                        "host": f"https://{host}:443",
+                        "id": 0,
+                        "seederCount": rng.randint(0, 500),
+                        "leecherCount": rng.randint(0, 100),
+                        "hasAnnounced": announced,
+                        "lastAnnounceSucceeded": announce_ok,
+                        "lastAnnounceResult": "Success" if announce_ok else ("Connection timed out" if announced else ""),
+                        "lastAnnounceTimedOut": announced and not announce_ok,
+                        "lastAnnounceTime": last_announce,
+                        "lastAnnouncePeerCount": tracker_rng.randint(0, 50) if announce_ok else 0,
+                        "sitename": host.split(".")[-2],
+                        "tier": 0,
+                    }
+                ],
+                "uploadedEver": uploaded,
+                "uploadLimit": 100,
+                "uploadLimited": False,
+                "uploadRatio": round(uploaded / downloaded, 4) if downloaded else 0.0,
+                "wanted": [1] * n_files,
+                "webseeds": [],
+                "webseedsSendingToUs": 0,
+            }
+        )
+
+    return torrents
+
+
+class _RpcHandler(BaseHTTPRequestHandler):
+    server: "_FakeHTTPServer"
+    protocol_version = "HTTP/1.1"
+    ## Headers & body are separate writes; without TCP_NODELAY each response waits on a delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: t.Any) -> None:
+        log.debug(format % args)
+
+    def _send(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        fake: FakeTransmissionServer = self.server.fake
+        body: bytes = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        session_headers: dict[str, str] = {"X-Transmission-Session-Id": fake.session_id}
+
+        if self.headers.get("X-Transmission-Session-Id") != fake.session_id:
+            self._send(409, b"<h1>409: Conflict</h1>", session_headers)
+            return
+
+        try:
+            query: dict[str, t.Any] = json.loads(body)
+            method: str = query["method"]
+        except (ValueError, KeyError):
+            self._send(400, b"<h1>400: Bad Request</h1>")
+            return
+
+        fault: str | None = fake._pick_fault(method)
+        fake._sleep(method)
+
+        if fault == "reset":
+            self.close_connection = True
+            return
+        if fault == "error":
+            self._send(500, b"<h1>500: Internal Server Error</h1>")
+            return
+        if fault == "conflict":
+            fake.session_id = uuid.uuid4().hex
+            self._send(409, b"<h1>409: Conflict</h1>", {"X-Transmission-Session-Id": fake.session_id})
+            return
+
+        response: dict[str, t.Any] = fake.handle_rpc(method, query.get("arguments") or {})
+        if "tag" in query:
+            response["tag"] = query["tag"]
+
+        self._send(200, json.dumps(response).encode("utf-8"), {"Content-Type": "application/json", **session_headers})
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeTransmissionServer"
+
+
+class FakeTransmissionServer:
+    """In-process Transmission RPC server, running in a background thread."""
+
+    def __init__(
+        self,
+        torrents: list[dict[str, t.Any]] | None = None,
+        n_torrents: int = 0,
+        seed: int = 0,
+        faults: FaultConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        free_space_bytes: int = 500 * 1024**3,
+        verify_seconds: float = 0.0,
+    ) -> None:
+        if torrents is None:
+            torrents = generate_torrents(n=n_torrents, seed=seed)
+
+        self.torrents: dict[int, dict[str, t.Any]] = {torrent["id"]: torrent for torrent in torrents}
+        self.faults: FaultConfig = faults or FaultConfig()
+        self.free_space_bytes: int = free_space_bytes
+        ## How long a torrent-verify keeps a torrent checking, before it returns to its previous status
+        self.verify_seconds: float = verify_seconds
+        self._verifying: dict[int, tuple[float, int]] = {}
+        self.session: dict[str, t.Any] = {
+            "rpc-version": RPC_VERSION,
+            "rpc-version-minimum": 14,
+            "rpc-version-semver": "5.3.0",
+            "version": SERVER_VERSION,
+            "download-dir": "/downloads/complete",
+            "speed-limit-down": 100,
+            "speed-limit-down-enabled": False,
+            "speed-limit-up": 100,
+            "speed-limit-up-enabled": False,
+            "alt-speed-enabled": False,
+            "download-queue-enabled": True,
+            "download-queue-size": 5,
+            "seed-queue-enabled": False,
+            "seed-queue-size": 10,
+            "peer-limit-global": 200,
+            "peer-limit-per-torrent": 50,
+        }
+        self.session_id: str = uuid.uuid4().hex
+        self.request_counts: Counter[str] = Counter()
+        self.removed_ids: list[int] = []
+
+        self._host: str = host
+        self._port: int = port
+        self._lock: threading.Lock = threading.Lock()
+        self._rng: random.Random = random.Random(seed)
+        self._httpd: _FakeHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "FakeTransmissionServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1] if self._httpd else self._port
+
+    @property
+    def path(self) -> str:
+        return "/transmission/rpc"
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    def controller_kwargs(self) -> dict[str, t.Any]:
+        """Connection kwargs for `TransmissionRPCController` or `transmission_rpc.Client`."""
+        return {"host": self.host, "port": self.port, "path": self.path, "protocol": "http"}
+
+    def start(self) -> "FakeTransmissionServer":
+        self._httpd = _FakeHTTPServer((self._host, self._port), _RpcHandler)
+        self._httpd.fake = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-transmission", daemon=True)
+        self._thread.start()
+        log.debug(f"Fake Transmission server listening on {self.url}")
+
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is None:
+            return
+
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+
+    def _pick_fault(self, method: str) -> str | None:
+        faults: FaultConfig = self.faults
+        if not faults.applies_to(method):
+            return None
+
+        with self._lock:
+            self.request_counts[method] += 1
+
+            if faults.fail_next > 0:
+                faults.fail_next -= 1
+                return "error"
+
+            roll: float = self._rng.random()
+
+        for fault, rate in (("reset", faults.reset_rate), ("error", faults.error_rate), ("conflict", faults.conflict_rate)):
+            if roll < rate:
+                return fault
+            roll -= rate
+
+        return None
+
+    def _sleep(self, method: str) -> None:
+        if not self.faults.applies_to(method):
+            return
+
+        delay: float = self.faults.latency + self._rng.uniform(-self.faults.latency_jitter, self.faults.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _select(self, ids: t.Any) -> list[dict[str, t.Any]]:
+        if ids is None or ids == "recently-active":
+            return list(self.torrents.values())
+        if not isinstance(ids, list):
+            ids = [ids]
+
+        selected: list[dict[str, t.Any]] = [self.torrents[i] for i in ids if isinstance(i, int) and i in self.torrents]
+        wanted_hashes: set[str] = {i for i in ids if isinstance(i, str)}
+        if wanted_hashes:
+            selected.extend(torrent for torrent in self.torrents.values() if torrent["hashString"] in wanted_hashes)
+
+        return selected
+
+    def handle_rpc(self, method: str, arguments: dict[str, t.Any]) -> dict[str, t.Any]:
+        """Apply an RPC to the in-memory state and return the JSON response."""
+        handler = getattr(self, f"_rpc_{method.replace('-', '_')}", None)
+        if handler is None:
+            return {"result": "method name not recognized", "arguments": {}}
+
+        with self._lock:
+            try:
+                return {"result": "success", "arguments": handler(arguments) or {}}
+            except (KeyError, TypeError, ValueError) as exc:
+                return {"result": f"invalid argument: {exc}", "arguments": {}}
+
+    ## RPC methods
+
+    def _rpc_session_get(self, arguments: dict) -> dict:
+        fields: list[str] | None = arguments.get("fields")
+        return {k: v for k, v in self.session.items() if not fields or k in fields}
+
+    def _rpc_session_set(self, arguments: dict) -> dict:
+        self.session.update(arguments)
+
+    def _rpc_session_stats(self, arguments: dict) -> dict:
+        torrents: list[dict] = list(self.torrents.values())
+        stats: dict = {"uploadedBytes": 0, "downloadedBytes": 0, "filesAdded": 0, "sessionCount": 1, "secondsActive": 3_600}
+
+        return {
+            "activeTorrentCount": sum(1 for torrent in torrents if torrent["status"] in (4, 6)),
+            "pausedTorrentCount": sum(1 for torrent in torrents if torrent["status"] == 0),
+            "torrentCount": len(torrents),
+            "downloadSpeed": sum(torrent["rateDownload"] for torrent in torrents),
+            "uploadSpeed": sum(torrent["rateUpload"] for torrent in torrents),
+            "cumulative-stats": stats,
+            "current-stats": stats,
+        }
+
+    def _rpc_free_space(self, arguments: dict) -> dict:
+        return {"path": arguments["path"], "size-bytes": self.free_space_bytes, "total_size": self.free_space_bytes * 4}
+
+    def _finish_verifies(self) -> None:
+        now: float = time.monotonic()
+        for torrent_id, (started, previous_status) in list(self._verifying.items()):
+            if now - started >= self.verify_seconds:
+                del self._verifying[torrent_id]
+                if torrent_id in self.torrents:
+                    self.torrents[torrent_id]["status"] = previous_status
+
+    def _rpc_torrent_get(self, arguments: dict) -> dict:
+        self._finish_verifies()
+        fields: list[str] = arguments.get("fields") or ["id"]
+        selected: list[dict] = self._select(arguments.get("ids"))
+        response: dict = {"torrents": [{k: torrent[k] for k in fields if k in torrent} for torrent in selected]}
+
+        if arguments.get("ids") == "recently-active":
+            response["removed"] = list(self.removed_ids)
+
+        return response
+
+    def _rpc_torrent_remove(self, arguments: dict) -> None:
+        for torrent in self._select(arguments.get("ids")):
+            self.torrents.pop(torrent["id"], None)
+            self.removed_ids.append(torrent["id"])
+
+    def _set_status(self, arguments: dict, status: int) -> None:
+        for torrent in self._select(arguments.get("ids")):
+            torrent["status"] = status
+
+    def _rpc_torrent_start(self, arguments: dict) -> None:
+        for torrent in self._select(arguments.get("ids")):
+            torrent["status"] = 6 if torrent["percentDone"] >= 1 else 4
+
+    _rpc_torrent_start_now = _rpc_torrent_start
+
+    def _rpc_torrent_stop(self, arguments: dict) -> None:
+        self._set_status(arguments, 0)
+
+    def _rpc_torrent_verify(self, arguments: dict) -> None:
+        for torrent in self._select(arguments.get("ids")):
+            if torrent["id"] not in self._verifying:
+                ## A torrent that was checking already is left stopped once its check is done
+                self._verifying[torrent["id"]] = (time.monotonic(), 0 if torrent["status"] in (1, 2) else torrent["status"])
+            torrent["status"] = 2
+
+    def _rpc_torrent_reannounce(self, arguments: dict) -> None:
+        for torrent in self._select(arguments.get("ids")):
+            torrent["manualAnnounceTime"] = int(time.time())
+
+    def _rpc_torrent_set(self, arguments: dict) -> None:
+        changes: dict = {k: v for k, v in arguments.items() if k != "ids"}
+        selected: list[dict] = self._select(arguments.get("ids"))
+
+        if "queuePosition" in changes:
+            position: int = changes.pop("queuePosition")
+            for torrent in sorted(selected, key=lambda x: x["queuePosition"], reverse=True):
+                self._move_in_queue(torrent, position)
+        for torrent in selected:
+            torrent.update(changes)
+
+    def _rpc_torrent_set_location(self, arguments: dict) -> None:
+        for torrent in self._select(arguments.get("ids")):
+            torrent["downloadDir"] = arguments["location"]
+
+    def _move_in_queue(self, torrent: dict, position: int) -> None:
+        queue: list[dict] = sorted(self.torrents.values(), key=lambda x: x["queuePosition"])
+        queue.remove(torrent)
+        queue.insert(max(0, min(position, len(queue))), torrent)
+
+        for index, queued in enumerate(queue):
+            queued["queuePosition"] = index
+
+    def _queue_move(self, arguments: dict, to_position: t.Callable[[dict, int], int], reverse: bool = False) -> None:
+        ## Move in an order that keeps the selected torrents' relative order
+        for torrent in sorted(self._select(arguments.get("ids")), key=lambda x: x["queuePosition"], reverse=reverse):
+            self._move_in_queue(torrent, to_position(torrent, len(self.torrents)))
+
+    def _rpc_queue_move_top(self, arguments: dict) -> None:
+        self._queue_move(arguments, lambda torrent, n: 0, reverse=True)
+
+    def _rpc_queue_move_up(self, arguments: dict) -> None:
+        self._queue_move(arguments, lambda torrent, n: torrent["queuePosition"] - 1)
+
+    def _rpc_queue_move_down(self, arguments: dict) -> None:
+        self._queue_move(arguments, lambda torrent, n: torrent["queuePosition"] + 1, reverse=True)
+
+    def _rpc_queue_move_bottom(self, arguments: dict) -> None:
+        self._queue_move(arguments, lambda torrent, n: n - 1)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from transmissionpy.rpc_client.bandwidth import water_fill
+
+import numpy as np
+import pytest
+
+def test_short_budget_caps_small_demands_and_splits_the_rest_by_weight() -> None:
+    demand = np.array([10.0, 100.0, 100.0, 1000.0])
+    weights = np.array([1.0, 1.0, 2.0, 1.0])
+
+    shares = water_fill(300.0, demand, weights)
+
+    ## The first and third torrents are capped at their demand, the other 190 are split evenly
+    assert shares == pytest.approx([10.0, 95.0, 100.0, 95.0])
+    assert shares.sum() == pytest.approx(300.0)
+
+
+def test_leftover_budget_is_split_by_weight() -> None:
+    demand = np.array([10.0, 20.0, 30.0])
+    weights = np.array([1.0, 1.0, 2.0])
+
+    shares = water_fill(100.0, demand, weights)
+
+    assert shares == pytest.approx([20.0, 30.0, 50.0])
+
+
+def test_empty_demand() -> None:
+    assert water_fill(100.0, np.zeros(0), np.zeros(0)).size == 0
+
+
+def test_water_fill_random() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        n = int(rng.integers(1, 40))
+        demand = rng.uniform(0, 1000, n) * (rng.random(n) > 0.1)
+        weights = rng.uniform(0.1, 5, n)
+        budget = float(rng.uniform(0, 1.5 * demand.sum() + 1))
+
+        shares = water_fill(budget, demand, weights)
+
+        assert shares.sum() == pytest.approx(budget)
+        assert (shares >= -1e-9).all()
+        if budget < demand.sum():
+            assert (shares <= demand + 1e-9).all()
+            ## Torrents below their demand all sit at the same fill level, shares proportional to weight
+            uncapped = shares < demand - 1e-9
+            if uncapped.any():
+                levels = shares[uncapped] / weights[uncapped]
+                assert levels == pytest.approx(np.full(levels.size, levels[0]))
+                ## and no capped torrent would get more at that level
+                assert (demand[~uncapped] <= levels[0] * weights[~uncapped] + 1e-6).all()
+        else:
+            extra = shares - demand
+            assert extra == pytest.approx((budget - demand.sum()) * weights / weights.sum())
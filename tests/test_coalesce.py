@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from transmissionpy.core.transmission_lib import IdSetBatcher, SingleFlight
+
+from .fake_server import FakeTransmissionServer
+
+import pytest
+from transmission_rpc.torrent import Torrent
+
+N_CALLERS: int = 8
+
+
+def _torrent(torrent_id: int) -> Torrent:
+    return Torrent(fields={"id": torrent_id, "hashString": f"{torrent_id:040x}"})
+
+
+def test_single_flight_shares_one_call() -> None:
+    flight = SingleFlight()
+    calls: list[int] = []
+    barrier = threading.Barrier(N_CALLERS)
+
+    def slow_fetch() -> list[int]:
+        calls.append(1)
+        time.sleep(0.2)
+        return [1, 2, 3]
+
+    def caller() -> tuple[list[int], bool]:
+        barrier.wait()
+        return flight.do("all", slow_fetch)
+
+    with ThreadPoolExecutor(N_CALLERS) as pool:
+        results = list(pool.map(lambda _: caller(), range(N_CALLERS)))
+
+    assert len(calls) == 1
+    assert all(result == [1, 2, 3] for result, _ in results)
+    assert sum(shared for _, shared in results) == N_CALLERS - 1
+
+
+def test_single_flight_shares_errors_and_forgets_the_call() -> None:
+    flight = SingleFlight()
+    barrier = threading.Barrier(2)
+
+    def failing_fetch() -> None:
+        time.sleep(0.2)
+        raise ConnectionError("boom")
+
+    def caller() -> None:
+        barrier.wait()
+        flight.do("all", failing_fetch)
+
+    with ThreadPoolExecutor(2) as pool:
+        futures = [pool.submit(caller) for _ in range(2)]
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result()
+
+    ## Nothing is cached once the call returns
+    assert flight.do("all", lambda: "fresh") == ("fresh", False)
+
+
+def test_id_batcher_merges_and_splits_results() -> None:
+    batcher = IdSetBatcher(window=0.2)
+    fetched: list[list[int]] = []
+    barrier = threading.Barrier(N_CALLERS)
+
+    def fetch(ids: list[int]) -> list[Torrent]:
+        fetched.append(ids)
+        return [_torrent(i) for i in ids]
+
+    def caller(n: int) -> tuple[list[int], list[Torrent], bool]:
+        ids = [n, n + 1, 100]
+        barrier.wait()
+        torrents, merged = batcher.get(ids, fetch)
+        return ids, torrents, merged
+
+    with ThreadPoolExecutor(N_CALLERS) as pool:
+        results = list(pool.map(caller, range(0, 2 * N_CALLERS, 2)))
+
+    assert len(fetched) == 1
+    assert sorted(fetched[0]) == sorted({i for ids, _, _ in results for i in ids})
+    for ids, torrents, _ in results:
+        assert [torrent.id for torrent in torrents] == ids
+    assert sum(merged for _, _, merged in results) == N_CALLERS - 1
+
+
+def test_controller_merges_concurrent_id_requests(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server, merge_window=0.2)
+    controller.client
+    barrier = threading.Barrier(N_CALLERS)
+
+    def caller(torrent_id: int) -> list[int]:
+        barrier.wait()
+        return [torrent.id for torrent in controller.get_multiple_torrents(ids=[torrent_id], arguments=["id", "name"])]
+
+    with ThreadPoolExecutor(N_CALLERS) as pool:
+        results = list(pool.map(caller, range(1, N_CALLERS + 1)))
+
+    assert results == [[torrent_id] for torrent_id in range(1, N_CALLERS + 1)]
+    assert fake_server.request_counts["torrent-get"] == 1
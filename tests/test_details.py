@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from transmissionpy.core.transmission_lib import TORRENT_SUMMARY_FIELDS
+
+from .fake_server import FakeTransmissionServer
+
+def test_summaries_reuse_details_until_they_change(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server)
+    summaries = controller.get_all_torrents(arguments=TORRENT_SUMMARY_FIELDS)[:3]
+
+    first = controller.get_torrent_details(summaries)
+    gets_after_first = fake_server.request_counts["torrent-get"]
+    second = controller.get_torrent_details(summaries)
+
+    assert second == first
+    assert fake_server.request_counts["torrent-get"] == gets_after_first
+
+    fake_server.torrents[summaries[0].id]["activityDate"] += 60
+    changed = controller.get_all_torrents(arguments=TORRENT_SUMMARY_FIELDS)[:3]
+    gets_before_refetch = fake_server.request_counts["torrent-get"]
+    controller.get_torrent_details(changed)
+
+    assert fake_server.request_counts["torrent-get"] == gets_before_refetch + 1
+
+
+def test_ids_always_fetch_details(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server)
+    controller.client
+
+    controller.get_torrent_details([1, 2])
+    fake_server.torrents[1]["files"][0]["bytesCompleted"] = 0
+    details = controller.get_torrent_details([1, 2])
+
+    assert fake_server.request_counts["torrent-get"] == 2
+    hash_string = fake_server.torrents[1]["hashString"]
+    assert details[hash_string].fields["files"][0]["bytesCompleted"] == 0
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from transmissionpy.core.utils.df_utils import read_file_to_table
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+@pytest.fixture(params=[".csv", ".parquet"])
+def data_file(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    table = pa.table({"id": [1, 2, 3], "name": ["a", "b", "c"], "status": [0, 6, 6]})
+    path = tmp_path / f"torrents{request.param}"
+
+    if request.param == ".csv":
+        path.write_text("id,name,status\n1,a,0\n2,b,6\n3,c,6\n")
+    else:
+        pq.write_table(table, path)
+
+    return path
+
+
+def test_filter_on_unprojected_column(data_file: Path) -> None:
+    table = read_file_to_table(data_file, columns=["name"], filters=[("status", "==", 6)])
+
+    assert table.column_names == ["name"]
+    assert table.column("name").to_pylist() == ["b", "c"]
+
+
+def test_missing_columns_are_skipped(data_file: Path) -> None:
+    table = read_file_to_table(data_file, columns=["id", "missing"])
+
+    assert table.column_names == ["id"]
+
+
+def test_no_matching_columns_reads_no_columns(data_file: Path) -> None:
+    table = read_file_to_table(data_file, columns=["missing"])
+
+    assert table.column_names == []
+    assert table.num_rows == 3
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from transmissionpy.rpc_client.duplicates import (
+    content_signature,
+    find_duplicate_groups,
+)
+
+def _torrent(torrent_id: int, name: str, files: list[tuple[str, int]]) -> dict:
+    return {
+        "id": torrent_id,
+        "name": name,
+        "totalSize": sum(length for _, length in files),
+        "files": [{"name": path, "length": length} for path, length in files],
+        "downloadDir": "/downloads",
+    }
+
+
+def test_single_file_torrents_of_the_same_size_are_not_duplicates() -> None:
+    torrents = [
+        _torrent(1, "debian.iso", [("debian.iso", 1024)]),
+        _torrent(2, "ubuntu.iso", [("ubuntu.iso", 1024)]),
+    ]
+
+    assert content_signature(torrents[0]) != content_signature(torrents[1])
+    assert find_duplicate_groups(torrents) == []
+
+
+def test_same_single_file_is_a_duplicate() -> None:
+    torrents = [
+        _torrent(1, "debian.iso", [("debian.iso", 1024)]),
+        _torrent(2, "debian.iso", [("debian.iso", 1024)]),
+    ]
+
+    assert [sorted(t["id"] for t in group.torrents) for group in find_duplicate_groups(torrents)] == [[1, 2]]
+
+
+def test_multi_file_content_matches_under_another_name() -> None:
+    torrents = [
+        _torrent(1, "Album", [("Album/01.flac", 300), ("Album/02.flac", 400)]),
+        _torrent(2, "Album [FLAC]", [("Album [FLAC]/02.flac", 400), ("Album [FLAC]/01.flac", 300)]),
+    ]
+
+    assert content_signature(torrents[0]) == content_signature(torrents[1])
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections import Counter
+import urllib.request
+
+from transmissionpy.metrics import (
+    STATUS_NAMES,
+    MetricsCollector,
+    MetricsServer,
+    MetricsSettings,
+    aggregate_torrents,
+)
+
+from .fake_server import FakeTransmissionServer, FaultConfig
+
+from transmission_rpc import Torrent
+
+def _collector(fake_server: FakeTransmissionServer, make_controller) -> MetricsCollector:
+    return MetricsCollector(controller=make_controller(fake_server), settings=MetricsSettings(free_space_paths=["/downloads"]))
+
+
+def test_aggregate_torrents_counts_per_status() -> None:
+    torrents = [
+        Torrent(fields={"id": 1, "status": 6, "error": 0, "rateUpload": 100, "sizeWhenDone": 10}),
+        Torrent(fields={"id": 2, "status": 6, "error": 2, "rateUpload": 50, "sizeWhenDone": 20}),
+        Torrent(fields={"id": 3, "status": 4, "error": 0, "rateDownload": 7, "leftUntilDone": 5, "sizeWhenDone": 30}),
+        ## Unknown status codes count as stopped
+        Torrent(fields={"id": 4, "status": 99}),
+    ]
+
+    aggregates = aggregate_torrents(torrents)
+
+    assert aggregates["count"] == 4
+    assert aggregates["errored"] == 1
+    assert aggregates["upload_rate"] == 150
+    assert aggregates["download_rate"] == 7
+    assert aggregates["by_status"]["seeding"] == {"count": 2, "left_until_done": 0, "size_when_done": 30}
+    assert aggregates["by_status"]["downloading"] == {"count": 1, "left_until_done": 5, "size_when_done": 30}
+    assert aggregates["by_status"]["stopped"]["count"] == 1
+    assert aggregate_torrents([])["count"] == 0
+
+
+def test_poll_renders_openmetrics(fake_server: FakeTransmissionServer, make_controller) -> None:
+    collector = _collector(fake_server, make_controller)
+
+    assert collector.poll()
+    text = collector.scrape(openmetrics=True).decode("utf-8")
+    lines = text.splitlines()
+
+    assert lines[-1] == "# EOF"
+    assert "transmission_up 1" in lines
+    statuses = Counter(torrent["status"] for torrent in fake_server.torrents.values())
+    for code, name in enumerate(STATUS_NAMES):
+        assert f'transmission_torrents{{status="{name}"}} {statuses.get(code, 0)}' in lines
+    assert 'transmission_free_space_bytes{path="/downloads"}' in text
+    ## Counters are typed without their suffix, and sampled with it
+    assert "# TYPE transmissionpy_poll_failures counter" in lines
+    assert "transmissionpy_poll_failures_total 0" in lines
+    assert 'transmissionpy_rpc_retries_total{operation="torrent-get"} 0' in lines
+    ## Histograms have a sample per bucket, ending with +Inf, then _sum & _count
+    assert 'transmissionpy_poll_duration_seconds_bucket{le="+Inf"} 1' in lines
+    assert "transmissionpy_poll_duration_seconds_count 1" in lines
+    assert 'transmissionpy_rpc_duration_seconds_bucket{operation="torrent-get",le="+Inf"} 1' in lines
+
+    prometheus = collector.scrape(openmetrics=False).decode("utf-8")
+    assert "# EOF" not in prometheus
+    assert "# TYPE transmissionpy_poll_failures_total counter" in prometheus
+
+
+def test_scrapes_never_call_transmission(fake_server: FakeTransmissionServer, make_controller) -> None:
+    collector = _collector(fake_server, make_controller)
+    collector.poll()
+    requests_after_poll = sum(fake_server.request_counts.values())
+
+    server = MetricsServer(collector, port=0).start()
+    try:
+        for _ in range(5):
+            with urllib.request.urlopen(urllib.request.Request(server.url, headers={"Accept": "application/openmetrics-text"})) as response:
+                assert response.read().decode("utf-8").endswith("# EOF\n")
+    finally:
+        server.stop()
+
+    assert collector.scrapes == 5
+    assert sum(fake_server.request_counts.values()) == requests_after_poll
+
+
+def test_failed_poll_reports_down(fake_server: FakeTransmissionServer, make_controller) -> None:
+    collector = _collector(fake_server, make_controller)
+    assert collector.poll()
+
+    fake_server.faults = FaultConfig(error_rate=1.0, methods=["torrent-get"])
+    assert not collector.poll()
+    lines = collector.scrape().decode("utf-8").splitlines()
+
+    assert "transmission_up 0" in lines
+    assert "transmissionpy_poll_failures_total 1" in lines
+    ## The last successful poll's torrent counts are still reported
+    assert any(line.startswith("transmission_torrents{") for line in lines)
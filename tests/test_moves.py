@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from transmissionpy.rpc_client.moves import (
+    DONE,
+    FAILED,
+    MoveItem,
+    MovePlan,
+    execute_moves,
+)
+
+from transmission_rpc import Torrent
+
+class _SlowMoveController:
+    """Reports each torrent at its old location (with `error`) for one poll, then at the destination."""
+
+    def __init__(self, error: int) -> None:
+        self.error: int = error
+        self.polls: dict[int, int] = {}
+
+    def get_free_space(self, remote_path: str = "/") -> int | None:
+        return None
+
+    def move_torrent_data(self, ids: list[int], dest: str) -> bool:
+        return True
+
+    def get_multiple_torrents(self, ids: list[int], arguments: list[str] | None = None) -> list[Torrent]:
+        torrents: list[Torrent] = []
+        for torrent_id in ids:
+            self.polls[torrent_id] = self.polls.get(torrent_id, 0) + 1
+            moved: bool = self.polls[torrent_id] > 1
+            torrents.append(
+                Torrent(fields={"id": torrent_id, "downloadDir": "/new" if moved else "/old", "error": 0 if moved else self.error, "errorString": "boom"})
+            )
+
+        return torrents
+
+    def invalidate_cache(self) -> None:
+        pass
+
+
+def _run(error: int) -> MoveItem:
+    plan = MovePlan(items=[MoveItem(id=1, hash_string="a" * 40, name="a", source="/old", dest="/new", size=10)])
+    execute_moves(_SlowMoveController(error=error), plan, poll_interval=0)
+
+    return plan.items[0]
+
+
+def test_tracker_errors_do_not_fail_a_move() -> None:
+    for tracker_error in (1, 2):
+        assert _run(tracker_error).state == DONE
+
+
+def test_local_error_fails_a_move() -> None:
+    item: MoveItem = _run(3)
+
+    assert item.state == FAILED
+    assert item.error == "boom"
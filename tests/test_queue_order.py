@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import random
+
+from transmissionpy.rpc_client.queue_order import minimal_queue_moves
+
+import pytest
+
+def _apply(queue: list[int], moves: list[tuple[int, int]]) -> list[int]:
+    """Apply moves like Transmission's torrent-set queuePosition: remove the torrent, then insert it at the position."""
+    queue = list(queue)
+    for torrent_id, position in moves:
+        queue.remove(torrent_id)
+        queue.insert(position, torrent_id)
+
+    return queue
+
+
+def _lis_length(values: list[int]) -> int:
+    ## Quadratic reference, independent of the implementation under test
+    lengths: list[int] = []
+    for i, value in enumerate(values):
+        lengths.append(1 + max([lengths[j] for j in range(i) if values[j] < value], default=0))
+
+    return max(lengths, default=0)
+
+
+def _check(queue: list[int], desired: list[int]) -> list[tuple[int, int]]:
+    moves = minimal_queue_moves(queue, desired)
+    result = _apply(queue, moves)
+    desired_set = set(desired)
+
+    assert [torrent_id for torrent_id in result if torrent_id in desired_set] == desired
+    ## Torrents outside the download queue keep their relative order
+    assert [torrent_id for torrent_id in result if torrent_id not in desired_set] == [torrent_id for torrent_id in queue if torrent_id not in desired_set]
+    assert len(moves) == len(desired) - _lis_length([queue.index(torrent_id) for torrent_id in desired])
+    assert all(0 <= position < len(queue) for _, position in moves)
+
+    return moves
+
+
+@pytest.mark.parametrize(
+    ("queue", "desired"),
+    [
+        ([1, 2, 3, 4], [1, 2, 3, 4]),
+        ([1, 2, 3, 4], [4, 3, 2, 1]),
+        ([1, 2, 3, 4], [4, 1, 2, 3]),
+        ([1, 2, 3, 4], [2, 3, 4, 1]),
+        ## Seeding / stopped torrents (10, 11, 12) interleaved with the queue
+        ([10, 1, 11, 2, 12, 3], [3, 1, 2]),
+        ([1, 10, 11, 2, 3, 12], [2, 3, 1]),
+        ([10, 11, 1], [1]),
+        ([10, 11], []),
+    ],
+)
+def test_minimal_queue_moves(queue: list[int], desired: list[int]) -> None:
+    _check(queue, desired)
+
+
+def test_already_ordered_needs_no_moves() -> None:
+    assert minimal_queue_moves([5, 1, 6, 2, 3], [1, 2, 3]) == []
+
+
+def test_minimal_queue_moves_random() -> None:
+    rng = random.Random(0)
+    for _ in range(2_000):
+        queue = list(range(rng.randint(0, 25)))
+        rng.shuffle(queue)
+        desired = rng.sample(queue, rng.randint(0, len(queue)))
+        _check(queue, desired)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from transmissionpy.core.transmission_lib.replay import request_key
+
+from .fake_server import FakeTransmissionServer
+
+## Runs in a fresh interpreter, so transmission_rpc's set-built 'fields' list gets that process's hash order
+_COUNT_TORRENTS = """
+import sys
+from transmissionpy.core.transmission_lib import TransmissionRPCController
+
+kwargs = {"host": sys.argv[1], "port": int(sys.argv[2]), "path": sys.argv[3], "protocol": "http", sys.argv[4]: sys.argv[5]}
+with TransmissionRPCController(**kwargs) as controller:
+    print(len(controller.get_all_torrents(arguments=["id", "name", "status", "percentDone", "totalSize"])))
+"""
+
+
+def _count_torrents(server: FakeTransmissionServer, mode: str, recording: Path, hash_seed: int) -> int:
+    env = {**os.environ, "PYTHONHASHSEED": str(hash_seed)}
+    args = [server.host, str(server.port), server.path, mode, str(recording)]
+    result = subprocess.run([sys.executable, "-c", _COUNT_TORRENTS, *args], env=env, capture_output=True, text=True, check=True, timeout=60)
+
+    return int(result.stdout.strip().splitlines()[-1])
+
+
+def test_recording_replays_in_a_new_process(fake_server: FakeTransmissionServer, tmp_path: Path) -> None:
+    recording = tmp_path / "rec.jsonl.gz"
+
+    assert _count_torrents(fake_server, "record_path", recording, hash_seed=1) == 50
+    recorded_requests = sum(fake_server.request_counts.values())
+
+    for hash_seed in range(2, 5):
+        assert _count_torrents(fake_server, "replay_path", recording, hash_seed=hash_seed) == 50
+
+    ## Replays never reach the server
+    assert sum(fake_server.request_counts.values()) == recorded_requests
+
+
+def test_request_key_ignores_field_and_id_order() -> None:
+    first = json.dumps({"method": "torrent-get", "arguments": {"fields": ["id", "name"], "ids": [2, 1]}})
+    second = json.dumps({"method": "torrent-get", "arguments": {"ids": [1, 2], "fields": ["name", "id"]}})
+
+    assert request_key(first) == request_key(second)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import uuid
+
+from transmissionpy.core.transmission_lib import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+)
+
+from .fake_server import FakeTransmissionServer, FaultConfig
+
+import pytest
+from transmission_rpc.error import TransmissionError
+
+def test_5xx_on_read_is_retried(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server)
+    controller.client
+    fake_server.faults = FaultConfig(fail_next=2, methods=["torrent-get"])
+
+    torrents = controller.get_all_torrents(arguments=["id", "name"])
+
+    assert len(torrents) == 50
+    assert fake_server.request_counts["torrent-get"] == 3
+    assert controller.get_metrics()["operations"]["torrent-get"]["retries"] == 2
+
+
+def test_5xx_on_write_is_not_retried(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server)
+    controller.client
+    fake_server.faults = FaultConfig(fail_next=1, methods=["torrent-remove"])
+
+    with pytest.raises(TransmissionError):
+        controller.delete_torrents(torrent_ids=[1, 2])
+
+    assert fake_server.request_counts["torrent-remove"] == 1
+    assert fake_server.removed_ids == []
+
+
+def test_timeout_is_retried_then_raised(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server, timeout=0.2, retry_policy=RetryPolicy(max_attempts=2, base_delay=0.01))
+    controller.client
+    fake_server.faults = FaultConfig(latency=0.5, methods=["torrent-get"])
+
+    with pytest.raises(TransmissionError):
+        controller.get_all_torrents(arguments=["id"])
+
+    assert fake_server.request_counts["torrent-get"] == 2
+    assert controller.get_metrics()["operations"]["torrent-get"]["failures"] == 2
+
+
+def test_session_id_rotation_is_handled(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server)
+    controller.client
+
+    for _ in range(3):
+        ## As after a daemon restart: the next request gets a 409 with the new id, and is sent again
+        fake_server.session_id = uuid.uuid4().hex
+        assert len(controller.get_all_torrents(arguments=["id"])) == 50
+
+    operations = controller.get_metrics()["operations"]["torrent-get"]
+    assert operations["failures"] == 0
+    assert operations["retries"] == 0
+
+
+def test_repeated_409s_are_retried(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server, retry_policy=RetryPolicy(max_attempts=5, base_delay=0.01, max_delay=0.02))
+    controller.client
+    initial_session_id: str = fake_server.session_id
+    fake_server.faults = FaultConfig(conflict_rate=0.5, methods=["torrent-get"])
+
+    ## transmission_rpc gives up after 3 handshakes in one call, those calls are retried as transient
+    for _ in range(10):
+        assert len(controller.get_all_torrents(arguments=["id"])) == 50
+
+    assert fake_server.session_id != initial_session_id
+
+
+def test_circuit_opens_after_repeated_failures(fake_server: FakeTransmissionServer, make_controller) -> None:
+    breaker = CircuitBreaker(name="test-open", failure_threshold=2, reset_seconds=60)
+    controller = make_controller(fake_server, circuit_breaker=breaker, retry_policy=RetryPolicy(max_attempts=1))
+    controller.client
+    fake_server.faults = FaultConfig(error_rate=1.0, methods=["torrent-get"])
+
+    for _ in range(2):
+        with pytest.raises(TransmissionError):
+            controller.get_all_torrents(arguments=["id"])
+
+    with pytest.raises(CircuitOpenError):
+        controller.get_all_torrents(arguments=["id"])
+    assert breaker.state == "open"
+    assert fake_server.request_counts["torrent-get"] == 2
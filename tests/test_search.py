@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from transmissionpy.core.db.search import TorrentSearchIndex
+from transmissionpy.rpc_client.search import sync_search_index
+
+from .fake_server import FakeTransmissionServer
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.pool import StaticPool
+
+def _engine() -> sa.Engine:
+    ## One shared connection, so every session sees the same in-memory database
+    return sa.create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+
+def _torrent(torrent_id: int, hash_char: str, name: str, files: list[str] | None = None, total_size: int = 100) -> dict:
+    fields: dict = {"id": torrent_id, "hashString": hash_char * 40, "name": name, "totalSize": total_size}
+    if files is not None:
+        fields["files"] = [{"name": f"{name}/{path}", "length": 1} for path in files]
+
+    return fields
+
+
+def _names(index: TorrentSearchIndex, query: str, **kwargs) -> list[str]:
+    return sorted(hit.name for hit in index.search(query, **kwargs))
+
+
+@pytest.fixture
+def index() -> TorrentSearchIndex:
+    index = TorrentSearchIndex(_engine())
+    index.upsert(
+        [
+            _torrent(1, "a", "Ubuntu.24.04.Desktop", ["ubuntu-24.04-desktop-amd64.iso"]),
+            _torrent(2, "b", "Debian.12.Netinst", ["debian-12-netinst.iso", "SHA256SUMS"]),
+            _torrent(3, "c", "Album.FLAC", ["01 - Intro.flac", "02 - Ab.flac"]),
+        ]
+    )
+
+    return index
+
+
+def test_diff_finds_new_renamed_removed_and_magnet_torrents(index: TorrentSearchIndex) -> None:
+    ## A magnet without metadata yet: no files, totalSize 0
+    index.upsert([_torrent(4, "d", "magnet", total_size=0)])
+
+    current = [
+        _torrent(1, "a", "Ubuntu.24.04.Desktop"),
+        ## Renamed, and Transmission gave it a new id
+        _torrent(20, "b", "Debian.Bookworm.Netinst"),
+        ## The magnet's metadata arrived
+        _torrent(4, "d", "Some.Linux.ISO", total_size=4096),
+        _torrent(5, "e", "New.Torrent"),
+    ]
+    changed, needs_files, removed = index.diff(current)
+
+    assert [fields["hashString"] for fields in changed] == ["b" * 40]
+    assert sorted(fields["hashString"] for fields in needs_files) == ["d" * 40, "e" * 40]
+    assert removed == ["c" * 40]
+    assert index.diff(current, prune=False)[2] == []
+
+
+def test_name_only_upsert_keeps_file_rows(index: TorrentSearchIndex) -> None:
+    index.upsert([_torrent(20, "b", "Debian.Bookworm.Netinst")])
+
+    assert _names(index, "bookworm") == ["Debian.Bookworm.Netinst"]
+    assert _names(index, "Debian.12", names_only=True) == []
+    ## File rows written before the rename still match, and keep their count
+    assert _names(index, "SHA256SUMS") == ["Debian.Bookworm.Netinst"]
+    assert index.stamps()["b" * 40] == (20, "Debian.Bookworm.Netinst", 100, 2)
+
+
+def test_remove(index: TorrentSearchIndex) -> None:
+    assert index.remove(["c" * 40]) == 1
+
+    assert len(index) == 2
+    assert _names(index, "flac") == []
+
+
+def test_search_terms_files_and_names_only(index: TorrentSearchIndex) -> None:
+    assert _names(index, "UBUNTU amd64") == ["Ubuntu.24.04.Desktop"]
+    assert _names(index, "iso") == ["Debian.12.Netinst", "Ubuntu.24.04.Desktop"]
+    assert _names(index, "iso", names_only=True) == []
+    assert index.search("amd64")[0].files == ["Ubuntu.24.04.Desktop/ubuntu-24.04-desktop-amd64.iso"]
+    assert len(index.search("iso", limit=1)) == 1
+
+
+def test_short_terms_fall_back_to_like(index: TorrentSearchIndex) -> None:
+    if not index.trigram:
+        pytest.skip("SQLite has no trigram tokenizer")
+
+    ## Only short terms: scans the text table
+    assert _names(index, "ab") == ["Album.FLAC"]
+    ## Short terms are combined with an FTS match on the long ones
+    assert _names(index, "flac ab") == ["Album.FLAC"]
+    assert _names(index, "12 iso") == ["Debian.12.Netinst"]
+    ## LIKE wildcards in the query are matched literally
+    assert _names(index, "%") == []
+
+
+def test_word_tokenizer_uses_prefix_queries() -> None:
+    engine = _engine()
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE VIRTUAL TABLE torrent_search_fts USING fts5(text, content='torrent_search_text', content_rowid='id')"
+        )
+    index = TorrentSearchIndex(engine)
+    index.upsert([_torrent(1, "a", "Ubuntu Desktop", ["ubuntu desktop amd64.iso"])])
+
+    assert not index.trigram
+    assert _names(index, "ubu desk") == ["Ubuntu Desktop"]
+    assert _names(index, "buntu") == []
+
+
+def test_sync_with_transmission(fake_server: FakeTransmissionServer, make_controller) -> None:
+    controller = make_controller(fake_server)
+    index = TorrentSearchIndex(_engine())
+
+    assert sync_search_index(index, controller) == {"indexed": 50, "renamed": 0, "removed": 0}
+    assert sync_search_index(index, controller) == {"indexed": 0, "renamed": 0, "removed": 0}
+
+    fake_server.torrents[1]["name"] = "Renamed.Torrent"
+    del fake_server.torrents[2]
+    file_gets = fake_server.request_counts["torrent-get"]
+
+    assert sync_search_index(index, controller) == {"indexed": 0, "renamed": 1, "removed": 1}
+    ## Only the summary list was fetched, no file lists
+    assert fake_server.request_counts["torrent-get"] == file_gets + 1
+    assert [hit.torrent_id for hit in index.search("Renamed.Torrent")] == [1]
+    assert len(index) == 49
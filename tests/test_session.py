@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from pathlib import Path
+import warnings
+
+from transmissionpy.core.transmission_lib import SessionCache
+
+from .fake_server import FakeTransmissionServer
+
+def test_first_get_session_reuses_the_client_handshake(fake_server: FakeTransmissionServer, make_controller, tmp_path: Path) -> None:
+    controller = make_controller(fake_server, session_cache=SessionCache(cache_dir=tmp_path, ttl=60))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        controller.client
+
+    assert controller.get_session()["version"] == fake_server.session["version"]
+    assert fake_server.request_counts["session-get"] == 1
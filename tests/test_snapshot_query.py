@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+from transmissionpy.rpc_client.snapshot import (
+    SnapshotManager,
+    iter_snapshot_query,
+    query_snapshots,
+)
+
+import pytest
+
+@pytest.fixture
+def snapshot_dir(tmp_path: Path) -> Path:
+    torrents = [
+        {"id": 1, "name": "a", "status": 6, "trackerStats": [{"host": "https://private.example.io:443"}]},
+        {"id": 2, "name": "b", "status": 6, "trackers": [{"announce": "https://private.example.io/announce"}]},
+        {"id": 3, "name": "c", "status": 0, "trackers": [{"announce": "udp://open.example.org:6969/announce"}]},
+    ]
+    manager = SnapshotManager(snapshot_dir=tmp_path, snapshot_filename="snapshots")
+    for day in range(1, 4):
+        manager.save_history(torrents=torrents, snapshot_date=datetime(2026, 10, day))
+
+    return tmp_path
+
+
+def test_tracker_host_is_bare_hostname(snapshot_dir: Path) -> None:
+    table = query_snapshots(snapshot_dir=snapshot_dir, snapshot_filename="snapshots", select=["id", "trackerHost"], where=["trackerHost=private.example.io"])
+
+    assert sorted(set(table.column("id").to_pylist())) == [1, 2]
+
+
+def test_limit_stops_early_without_arrow_noise(tmp_path: Path, capfd: pytest.CaptureFixture[str]) -> None:
+    manager = SnapshotManager(snapshot_dir=tmp_path, snapshot_filename="snapshots")
+    for day in range(1, 29):
+        manager.save_history(torrents=[{"id": i, "name": str(i)} for i in range(1_000)], snapshot_date=datetime(2026, 10, day))
+
+    batches = list(iter_snapshot_query(snapshot_dir=tmp_path, snapshot_filename="snapshots", select=["id"], limit=2))
+
+    assert sum(b.num_rows for b in batches) == 2
+    assert "cancelled" not in capfd.readouterr().err.lower()
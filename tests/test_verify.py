@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+import typing as t
+
+from transmissionpy.verify import TorrentLayout, VerifyCheckpoint, verify_torrent_data
+
+import pytest
+
+PIECE_LENGTH: int = 1024
+## (path parts, length, is padding). The padding file aligns b.bin to a piece boundary.
+FILES: list[tuple[list[str], int, bool]] = [
+    (["a.bin"], 3000, False),
+    ([".pad", "72"], 72, True),
+    (["sub", "b.bin"], 2000, False),
+    (["c.bin"], 700, False),
+]
+
+
+def bencode(value: t.Any) -> bytes:
+    if isinstance(value, int):
+        return b"i%de" % value
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    if isinstance(value, bytes):
+        return b"%d:%s" % (len(value), value)
+    if isinstance(value, list):
+        return b"l" + b"".join(bencode(item) for item in value) + b"e"
+    if isinstance(value, dict):
+        items = sorted((key.encode("utf-8") if isinstance(key, str) else key, item) for key, item in value.items())
+        return b"d" + b"".join(bencode(key) + bencode(item) for key, item in items) + b"e"
+
+    raise TypeError(type(value))
+
+
+def _piece_of(path: str, offset: int) -> int:
+    for parts, length, _ in FILES:
+        if "/".join(parts) == path:
+            return offset // PIECE_LENGTH
+        offset += length
+
+    raise KeyError(path)
+
+
+@pytest.fixture
+def torrent(tmp_path: Path) -> tuple[TorrentLayout, Path]:
+    """Write a multi-file torrent's data under tmp_path/data, and return its layout & data dir."""
+    data_dir = tmp_path / "data"
+    blob = b""
+    file_entries: list[dict] = []
+
+    for i, (parts, length, padding) in enumerate(FILES):
+        content = bytes(length) if padding else bytes((i * 31 + n) % 251 for n in range(length))
+        blob += content
+        entry: dict = {"path": parts, "length": length}
+        if padding:
+            entry["attr"] = "p"
+        else:
+            path = data_dir / "pack" / Path(*parts)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        file_entries.append(entry)
+
+    pieces = b"".join(hashlib.sha1(blob[i:i + PIECE_LENGTH]).digest() for i in range(0, len(blob), PIECE_LENGTH))
+    metainfo = bencode({"announce": "https://tracker.example.org/announce", "info": {"name": "pack", "piece length": PIECE_LENGTH, "pieces": pieces, "files": file_entries}})
+
+    return TorrentLayout.from_bytes(metainfo), data_dir
+
+
+@pytest.fixture(params=[1, 2], ids=["workers=1", "workers=2"])
+def workers(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+def _verify(layout: TorrentLayout, data_dir: Path, workers: int, **kwargs: t.Any):
+    ## Small batches, so a run is several tasks
+    return verify_torrent_data(layout, data_dir, workers=workers, batch_bytes=2 * PIECE_LENGTH, **kwargs)
+
+
+def test_layout(torrent: tuple[TorrentLayout, Path]) -> None:
+    layout, _ = torrent
+
+    assert layout.piece_count == 6
+    assert layout.total_size == 5772
+    assert [entry.path for entry in layout.files] == ["pack/a.bin", "pack/.pad/72", "pack/sub/b.bin", "pack/c.bin"]
+    assert [entry.padding for entry in layout.files] == [False, True, False, False]
+    ## Piece 2 ends a.bin and covers the whole padding file
+    assert layout.piece_spans(2) == [(0, 2048, 952), (1, 0, 72)]
+
+
+def test_clean_data(torrent: tuple[TorrentLayout, Path], workers: int) -> None:
+    layout, data_dir = torrent
+    result = _verify(layout, data_dir, workers)
+
+    assert result.ok
+    assert result.checked_pieces == layout.piece_count
+    ## Padding is hashed as zeros, never read from disk
+    assert result.bytes_read == layout.total_size - 72
+
+
+def test_flipped_byte_is_a_bad_piece(torrent: tuple[TorrentLayout, Path], workers: int) -> None:
+    layout, data_dir = torrent
+    path = data_dir / "pack" / "sub" / "b.bin"
+    data = bytearray(path.read_bytes())
+    data[500] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    result = _verify(layout, data_dir, workers)
+
+    assert result.bad_pieces == [_piece_of("sub/b.bin", 500)]
+    assert result.missing_pieces == []
+    assert result.bad_files == {"pack/sub/b.bin": 1}
+
+
+def test_deleted_file_is_missing_pieces(torrent: tuple[TorrentLayout, Path], workers: int) -> None:
+    layout, data_dir = torrent
+    (data_dir / "pack" / "c.bin").unlink()
+
+    result = _verify(layout, data_dir, workers)
+
+    ## c.bin shares its first piece with the end of b.bin
+    assert result.missing_pieces == [4, 5]
+    assert result.bad_pieces == []
+    assert result.bad_files == {"pack/sub/b.bin": 1, "pack/c.bin": 2}
+
+
+def test_resume_from_checkpoint(torrent: tuple[TorrentLayout, Path], workers: int, tmp_path: Path) -> None:
+    layout, data_dir = torrent
+    checkpoint = VerifyCheckpoint(tmp_path / "checkpoint.json", layout, str(data_dir))
+    ## An earlier run got through piece 3, and found piece 1 bad
+    checkpoint.save(frontier=4, bad=[1], missing=[])
+    ## Pieces before the frontier are not read again, so this corruption goes unnoticed
+    (data_dir / "pack" / "a.bin").write_bytes(bytes(3000))
+
+    result = _verify(layout, data_dir, workers, checkpoint=checkpoint)
+
+    assert result.resumed_from == 4
+    assert result.checked_pieces == 2
+    assert result.bad_pieces == [1]
+    assert result.bytes_read == layout.total_size - 4 * PIECE_LENGTH
+    ## A finished run removes its checkpoint
+    assert not checkpoint.path.exists()
+
+
+def test_checkpoint_for_other_data_dir_is_ignored(torrent: tuple[TorrentLayout, Path], tmp_path: Path) -> None:
+    layout, data_dir = torrent
+    VerifyCheckpoint(tmp_path / "checkpoint.json", layout, "/elsewhere").save(frontier=4, bad=[1], missing=[])
+
+    result = _verify(layout, data_dir, 1, checkpoint=VerifyCheckpoint(tmp_path / "checkpoint.json", layout, str(data_dir)))
+
+    assert result.resumed_from == 0
+    assert result.ok